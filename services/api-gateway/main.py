@@ -4,16 +4,19 @@ Aggregates data from microservices using Strawberry GraphQL
 """
 import os
 import uuid
+import asyncio
+from collections import defaultdict
 from contextlib import asynccontextmanager
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 import httpx
 import strawberry
 from fastapi import FastAPI
+from strawberry.dataloader import DataLoader
 from strawberry.fastapi import GraphQLRouter
 from strawberry.types import Info
-from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient
 
 
 # ============================================
@@ -22,9 +25,15 @@ from pymongo import MongoClient
 
 MONGODB_URL = os.getenv('MONGODB_URL', 'mongodb://localhost:27017')
 
+# One Motor client for the app lifespan (created lazily outside of it)
+mongo_client: Optional[AsyncIOMotorClient] = None
+
+
 def get_db():
     """Get MongoDB database instance"""
-    mongo_client = MongoClient(MONGODB_URL)
+    global mongo_client
+    if mongo_client is None:
+        mongo_client = AsyncIOMotorClient(MONGODB_URL)
     return mongo_client['skillforge']
 
 
@@ -65,6 +74,12 @@ class Universe:
     max_content_rating: Optional[str]
     description: Optional[str]
 
+    @strawberry.field
+    async def worlds(self, info: Info) -> List["World"]:
+        """Worlds in this universe"""
+        docs = await info.context["loaders"]["worlds_by_universe"].load(str(self.universe_id))
+        return [world_from_doc(w) for w in docs]
+
 
 @strawberry.type
 class World:
@@ -75,6 +90,24 @@ class World:
     themes: Optional[List[str]]
     visual_style: Optional[List[str]]
 
+    @strawberry.field
+    async def regions(self, info: Info) -> List["Region"]:
+        """Regions in this world"""
+        docs = await info.context["loaders"]["regions_by_world"].load(str(self.world_id))
+        return [region_from_doc(r) for r in docs]
+
+    @strawberry.field
+    async def locations(self, info: Info) -> List["Location"]:
+        """Locations in this world"""
+        docs = await info.context["loaders"]["locations_by_world"].load(str(self.world_id))
+        return [location_from_doc(l) for l in docs]
+
+    @strawberry.field
+    async def species(self, info: Info) -> List["Species"]:
+        """Species in this world"""
+        docs = await info.context["loaders"]["species_by_world"].load(str(self.world_id))
+        return [species_from_doc(s) for s in docs]
+
 
 @strawberry.type
 class Region:
@@ -85,6 +118,18 @@ class Region:
     description: Optional[str]
     world_id: strawberry.ID
 
+    @strawberry.field
+    async def world(self, info: Info) -> Optional[World]:
+        """World this region belongs to"""
+        w = await info.context["loaders"]["world"].load(str(self.world_id))
+        return world_from_doc(w) if w else None
+
+    @strawberry.field
+    async def locations(self, info: Info) -> List["Location"]:
+        """Locations in this region"""
+        docs = await info.context["loaders"]["locations_by_region"].load(str(self.region_id))
+        return [location_from_doc(l) for l in docs]
+
 
 @strawberry.type
 class Location:
@@ -95,6 +140,18 @@ class Location:
     region_id: strawberry.ID
     world_id: strawberry.ID
 
+    @strawberry.field
+    async def region(self, info: Info) -> Optional[Region]:
+        """Region this location belongs to"""
+        r = await info.context["loaders"]["region"].load(str(self.region_id))
+        return region_from_doc(r) if r else None
+
+    @strawberry.field
+    async def world(self, info: Info) -> Optional[World]:
+        """World this location belongs to"""
+        w = await info.context["loaders"]["world"].load(str(self.world_id))
+        return world_from_doc(w) if w else None
+
 
 @strawberry.type
 class Species:
@@ -107,6 +164,80 @@ class Species:
     character_traits: Optional[List[str]]
     world_id: strawberry.ID
 
+    @strawberry.field
+    async def world(self, info: Info) -> Optional[World]:
+        """World this species belongs to"""
+        w = await info.context["loaders"]["world"].load(str(self.world_id))
+        return world_from_doc(w) if w else None
+
+
+def account_from_data(data: Dict[str, Any]) -> Account:
+    return Account(
+        account_id=data["account_id"],
+        account_type=data["account_type"],
+        subscription_tier=data.get("subscription_tier"),
+        subscription_status=data["subscription_status"],
+        max_members=data["max_members"],
+        current_member_count=data["current_member_count"],
+        created_at=datetime.fromisoformat(data["created_at"]),
+        updated_at=datetime.fromisoformat(data["updated_at"])
+    )
+
+
+def universe_from_doc(u: Dict[str, Any]) -> Universe:
+    return Universe(
+        universe_id=u["_id"],
+        universe_name=u.get("universe_name", ""),
+        max_content_rating=u.get("max_content_rating"),
+        description=u.get("description")
+    )
+
+
+def world_from_doc(w: Dict[str, Any]) -> World:
+    return World(
+        world_id=w["_id"],
+        world_name=w.get("world_name", ""),
+        description=w.get("description"),
+        genre=w.get("genre"),
+        themes=w.get("themes", []),
+        visual_style=w.get("visual_style", [])
+    )
+
+
+def region_from_doc(r: Dict[str, Any]) -> Region:
+    return Region(
+        region_id=r["_id"],
+        region_name=r.get("region_name", ""),
+        region_type=r.get("region_type"),
+        climate=r.get("climate"),
+        description=r.get("description"),
+        world_id=r.get("world_id", "")
+    )
+
+
+def location_from_doc(l: Dict[str, Any]) -> Location:
+    return Location(
+        location_id=l["_id"],
+        location_name=l.get("location_name", ""),
+        location_type=l.get("location_type"),
+        description=l.get("description"),
+        region_id=l.get("region_id", ""),
+        world_id=l.get("world_id", "")
+    )
+
+
+def species_from_doc(s: Dict[str, Any]) -> Species:
+    return Species(
+        species_id=s["_id"],
+        species_name=s.get("species_name", ""),
+        species_type=s.get("species_type"),
+        category=s.get("category"),
+        description=s.get("description"),
+        backstory=s.get("backstory"),
+        character_traits=s.get("character_traits", []),
+        world_id=s.get("world_id", "")
+    )
+
 
 # ============================================
 # Service Clients
@@ -114,10 +245,90 @@ class Species:
 
 ACCOUNT_SERVICE_URL = os.getenv("ACCOUNT_SERVICE_URL", "http://account-service:8000")
 
+# One HTTP client (and connection pool) for the app lifespan
+http_client: Optional[httpx.AsyncClient] = None
+
 
-async def get_http_client() -> httpx.AsyncClient:
+def get_http_client() -> httpx.AsyncClient:
     """Get HTTP client for service communication"""
-    return httpx.AsyncClient(timeout=10.0)
+    global http_client
+    if http_client is None:
+        http_client = httpx.AsyncClient(timeout=10.0)
+    return http_client
+
+
+# ============================================
+# DataLoaders
+# ============================================
+
+def make_id_loader(collection: str, max_batch_size: Optional[int] = None) -> DataLoader:
+    """Batch find_one({'_id': ...}) calls into one {'_id': {'$in': ...}} query"""
+    async def load(ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        docs = await get_db()[collection].find({'_id': {'$in': list(ids)}}).to_list(length=None)
+        by_id = {d["_id"]: d for d in docs}
+        return [by_id.get(i) for i in ids]
+
+    return DataLoader(load_fn=load, max_batch_size=max_batch_size)
+
+
+def make_children_loader(collection: str, field: str, max_batch_size: Optional[int] = None) -> DataLoader:
+    """Batch find({field: parent_id}) calls into one {field: {'$in': ...}} query"""
+    async def load(parent_ids: List[str]) -> List[List[Dict[str, Any]]]:
+        docs = await get_db()[collection].find({field: {'$in': list(parent_ids)}}).to_list(length=None)
+        grouped = defaultdict(list)
+        for d in docs:
+            value = d.get(field)
+            # Array fields (e.g. universe_ids) match every parent they contain
+            for parent_id in (value if isinstance(value, list) else [value]):
+                grouped[parent_id].append(d)
+        return [grouped.get(parent_id, []) for parent_id in parent_ids]
+
+    return DataLoader(load_fn=load, max_batch_size=max_batch_size)
+
+
+def make_account_loader(max_batch_size: Optional[int] = None) -> DataLoader:
+    """
+    Dedupe account lookups within a request. The account service has no
+    batch endpoint, so distinct ids are fetched concurrently over the
+    shared client.
+    """
+    async def load(account_ids: List[str]) -> List[Optional[Account]]:
+        client = get_http_client()
+
+        async def fetch(account_id: str) -> Optional[Account]:
+            try:
+                response = await client.get(f"{ACCOUNT_SERVICE_URL}/accounts/{account_id}")
+                if response.status_code == 200:
+                    return account_from_data(response.json())
+                return None
+            except Exception as e:
+                print(f"Error fetching account: {e}")
+                return None
+
+        return list(await asyncio.gather(*(fetch(account_id) for account_id in account_ids)))
+
+    return DataLoader(load_fn=load, max_batch_size=max_batch_size)
+
+
+def build_loaders(max_batch_size: Optional[int] = None) -> Dict[str, DataLoader]:
+    """Fresh loaders for one GraphQL request (their caches must not outlive it)"""
+    return {
+        "universe": make_id_loader("universe_definitions", max_batch_size),
+        "world": make_id_loader("world_definitions", max_batch_size),
+        "region": make_id_loader("region_definitions", max_batch_size),
+        "location": make_id_loader("location_definitions", max_batch_size),
+        "species": make_id_loader("species_definitions", max_batch_size),
+        "account": make_account_loader(max_batch_size),
+        "worlds_by_universe": make_children_loader("world_definitions", "universe_ids", max_batch_size),
+        "regions_by_world": make_children_loader("region_definitions", "world_id", max_batch_size),
+        "locations_by_region": make_children_loader("location_definitions", "region_id", max_batch_size),
+        "locations_by_world": make_children_loader("location_definitions", "world_id", max_batch_size),
+        "species_by_world": make_children_loader("species_definitions", "world_id", max_batch_size)
+    }
+
+
+async def get_context() -> Dict[str, Any]:
+    return {"loaders": build_loaders()}
 
 
 # ============================================
@@ -132,313 +343,119 @@ class Query:
         return "Hello from SkillForge GraphQL API!"
 
     @strawberry.field
-    async def account(self, account_id: strawberry.ID) -> Optional[Account]:
+    async def account(self, info: Info, account_id: strawberry.ID) -> Optional[Account]:
         """Get account by ID"""
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(f"{ACCOUNT_SERVICE_URL}/accounts/{account_id}")
-                if response.status_code == 200:
-                    data = response.json()
-                    return Account(
-                        account_id=data["account_id"],
-                        account_type=data["account_type"],
-                        subscription_tier=data.get("subscription_tier"),
-                        subscription_status=data["subscription_status"],
-                        max_members=data["max_members"],
-                        current_member_count=data["current_member_count"],
-                        created_at=datetime.fromisoformat(data["created_at"]),
-                        updated_at=datetime.fromisoformat(data["updated_at"])
-                    )
-                return None
-            except Exception as e:
-                print(f"Error fetching account: {e}")
-                return None
+        return await info.context["loaders"]["account"].load(str(account_id))
 
     @strawberry.field
     async def accounts(self, skip: int = 0, limit: int = 100) -> List[Account]:
         """List all accounts"""
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{ACCOUNT_SERVICE_URL}/accounts",
-                    params={"skip": skip, "limit": limit}
-                )
-                if response.status_code == 200:
-                    data = response.json()
-                    return [
-                        Account(
-                            account_id=item["account_id"],
-                            account_type=item["account_type"],
-                            subscription_tier=item.get("subscription_tier"),
-                            subscription_status=item["subscription_status"],
-                            max_members=item["max_members"],
-                            current_member_count=item["current_member_count"],
-                            created_at=datetime.fromisoformat(item["created_at"]),
-                            updated_at=datetime.fromisoformat(item["updated_at"])
-                        )
-                        for item in data
-                    ]
-                return []
-            except Exception as e:
-                print(f"Error fetching accounts: {e}")
-                return []
+        try:
+            response = await get_http_client().get(
+                f"{ACCOUNT_SERVICE_URL}/accounts",
+                params={"skip": skip, "limit": limit}
+            )
+            if response.status_code == 200:
+                return [account_from_data(item) for item in response.json()]
+            return []
+        except Exception as e:
+            print(f"Error fetching accounts: {e}")
+            return []
 
     # Universe queries
     @strawberry.field
-    def universes(self) -> List[Universe]:
+    async def universes(self) -> List[Universe]:
         """Get all universes"""
-        db = get_db()
-        universes = list(db.universe_definitions.find())
-        return [
-            Universe(
-                universe_id=u["_id"],
-                universe_name=u.get("universe_name", ""),
-                max_content_rating=u.get("max_content_rating"),
-                description=u.get("description")
-            )
-            for u in universes
-        ]
+        universes = await get_db().universe_definitions.find().to_list(length=None)
+        return [universe_from_doc(u) for u in universes]
 
     @strawberry.field
-    def universe(self, universe_id: strawberry.ID) -> Optional[Universe]:
+    async def universe(self, info: Info, universe_id: strawberry.ID) -> Optional[Universe]:
         """Get universe by ID"""
-        db = get_db()
-        u = db.universe_definitions.find_one({'_id': str(universe_id)})
-        if u:
-            return Universe(
-                universe_id=u["_id"],
-                universe_name=u.get("universe_name", ""),
-                max_content_rating=u.get("max_content_rating"),
-                description=u.get("description")
-            )
-        return None
+        u = await info.context["loaders"]["universe"].load(str(universe_id))
+        return universe_from_doc(u) if u else None
 
     # World queries
     @strawberry.field
-    def worlds(self) -> List[World]:
+    async def worlds(self) -> List[World]:
         """Get all worlds"""
-        db = get_db()
-        worlds = list(db.world_definitions.find())
-        return [
-            World(
-                world_id=w["_id"],
-                world_name=w.get("world_name", ""),
-                description=w.get("description"),
-                genre=w.get("genre"),
-                themes=w.get("themes", []),
-                visual_style=w.get("visual_style", [])
-            )
-            for w in worlds
-        ]
+        worlds = await get_db().world_definitions.find().to_list(length=None)
+        return [world_from_doc(w) for w in worlds]
 
     @strawberry.field
-    def world(self, world_id: strawberry.ID) -> Optional[World]:
+    async def world(self, info: Info, world_id: strawberry.ID) -> Optional[World]:
         """Get world by ID"""
-        db = get_db()
-        w = db.world_definitions.find_one({'_id': str(world_id)})
-        if w:
-            return World(
-                world_id=w["_id"],
-                world_name=w.get("world_name", ""),
-                description=w.get("description"),
-                genre=w.get("genre"),
-                themes=w.get("themes", []),
-                visual_style=w.get("visual_style", [])
-            )
-        return None
+        w = await info.context["loaders"]["world"].load(str(world_id))
+        return world_from_doc(w) if w else None
 
     @strawberry.field
-    def worlds_by_universe(self, universe_id: strawberry.ID) -> List[World]:
+    async def worlds_by_universe(self, info: Info, universe_id: strawberry.ID) -> List[World]:
         """Get all worlds in a universe"""
-        db = get_db()
-        worlds = list(db.world_definitions.find({'universe_ids': str(universe_id)}))
-        return [
-            World(
-                world_id=w["_id"],
-                world_name=w.get("world_name", ""),
-                description=w.get("description"),
-                genre=w.get("genre"),
-                themes=w.get("themes", []),
-                visual_style=w.get("visual_style", [])
-            )
-            for w in worlds
-        ]
+        worlds = await info.context["loaders"]["worlds_by_universe"].load(str(universe_id))
+        return [world_from_doc(w) for w in worlds]
 
     # Region queries
     @strawberry.field
-    def regions(self) -> List[Region]:
+    async def regions(self) -> List[Region]:
         """Get all regions"""
-        db = get_db()
-        regions = list(db.region_definitions.find())
-        return [
-            Region(
-                region_id=r["_id"],
-                region_name=r.get("region_name", ""),
-                region_type=r.get("region_type"),
-                climate=r.get("climate"),
-                description=r.get("description"),
-                world_id=r.get("world_id", "")
-            )
-            for r in regions
-        ]
+        regions = await get_db().region_definitions.find().to_list(length=None)
+        return [region_from_doc(r) for r in regions]
 
     @strawberry.field
-    def region(self, region_id: strawberry.ID) -> Optional[Region]:
+    async def region(self, info: Info, region_id: strawberry.ID) -> Optional[Region]:
         """Get region by ID"""
-        db = get_db()
-        r = db.region_definitions.find_one({'_id': str(region_id)})
-        if r:
-            return Region(
-                region_id=r["_id"],
-                region_name=r.get("region_name", ""),
-                region_type=r.get("region_type"),
-                climate=r.get("climate"),
-                description=r.get("description"),
-                world_id=r.get("world_id", "")
-            )
-        return None
+        r = await info.context["loaders"]["region"].load(str(region_id))
+        return region_from_doc(r) if r else None
 
     @strawberry.field
-    def regions_by_world(self, world_id: strawberry.ID) -> List[Region]:
+    async def regions_by_world(self, info: Info, world_id: strawberry.ID) -> List[Region]:
         """Get all regions in a world"""
-        db = get_db()
-        regions = list(db.region_definitions.find({'world_id': str(world_id)}))
-        return [
-            Region(
-                region_id=r["_id"],
-                region_name=r.get("region_name", ""),
-                region_type=r.get("region_type"),
-                climate=r.get("climate"),
-                description=r.get("description"),
-                world_id=r.get("world_id", "")
-            )
-            for r in regions
-        ]
+        regions = await info.context["loaders"]["regions_by_world"].load(str(world_id))
+        return [region_from_doc(r) for r in regions]
 
     # Location queries
     @strawberry.field
-    def locations(self) -> List[Location]:
+    async def locations(self) -> List[Location]:
         """Get all locations"""
-        db = get_db()
-        locations = list(db.location_definitions.find())
-        return [
-            Location(
-                location_id=l["_id"],
-                location_name=l.get("location_name", ""),
-                location_type=l.get("location_type"),
-                description=l.get("description"),
-                region_id=l.get("region_id", ""),
-                world_id=l.get("world_id", "")
-            )
-            for l in locations
-        ]
+        locations = await get_db().location_definitions.find().to_list(length=None)
+        return [location_from_doc(l) for l in locations]
 
     @strawberry.field
-    def location(self, location_id: strawberry.ID) -> Optional[Location]:
+    async def location(self, info: Info, location_id: strawberry.ID) -> Optional[Location]:
         """Get location by ID"""
-        db = get_db()
-        l = db.location_definitions.find_one({'_id': str(location_id)})
-        if l:
-            return Location(
-                location_id=l["_id"],
-                location_name=l.get("location_name", ""),
-                location_type=l.get("location_type"),
-                description=l.get("description"),
-                region_id=l.get("region_id", ""),
-                world_id=l.get("world_id", "")
-            )
-        return None
+        l = await info.context["loaders"]["location"].load(str(location_id))
+        return location_from_doc(l) if l else None
 
     @strawberry.field
-    def locations_by_region(self, region_id: strawberry.ID) -> List[Location]:
+    async def locations_by_region(self, info: Info, region_id: strawberry.ID) -> List[Location]:
         """Get all locations in a region"""
-        db = get_db()
-        locations = list(db.location_definitions.find({'region_id': str(region_id)}))
-        return [
-            Location(
-                location_id=l["_id"],
-                location_name=l.get("location_name", ""),
-                location_type=l.get("location_type"),
-                description=l.get("description"),
-                region_id=l.get("region_id", ""),
-                world_id=l.get("world_id", "")
-            )
-            for l in locations
-        ]
+        locations = await info.context["loaders"]["locations_by_region"].load(str(region_id))
+        return [location_from_doc(l) for l in locations]
 
     @strawberry.field
-    def locations_by_world(self, world_id: strawberry.ID) -> List[Location]:
+    async def locations_by_world(self, info: Info, world_id: strawberry.ID) -> List[Location]:
         """Get all locations in a world"""
-        db = get_db()
-        locations = list(db.location_definitions.find({'world_id': str(world_id)}))
-        return [
-            Location(
-                location_id=l["_id"],
-                location_name=l.get("location_name", ""),
-                location_type=l.get("location_type"),
-                description=l.get("description"),
-                region_id=l.get("region_id", ""),
-                world_id=l.get("world_id", "")
-            )
-            for l in locations
-        ]
+        locations = await info.context["loaders"]["locations_by_world"].load(str(world_id))
+        return [location_from_doc(l) for l in locations]
 
     # Species queries
     @strawberry.field
-    def all_species(self) -> List[Species]:
+    async def all_species(self) -> List[Species]:
         """Get all species"""
-        db = get_db()
-        species_list = list(db.species_definitions.find())
-        return [
-            Species(
-                species_id=s["_id"],
-                species_name=s.get("species_name", ""),
-                species_type=s.get("species_type"),
-                category=s.get("category"),
-                description=s.get("description"),
-                backstory=s.get("backstory"),
-                character_traits=s.get("character_traits", []),
-                world_id=s.get("world_id", "")
-            )
-            for s in species_list
-        ]
+        species_list = await get_db().species_definitions.find().to_list(length=None)
+        return [species_from_doc(s) for s in species_list]
 
     @strawberry.field
-    def species(self, species_id: strawberry.ID) -> Optional[Species]:
+    async def species(self, info: Info, species_id: strawberry.ID) -> Optional[Species]:
         """Get species by ID"""
-        db = get_db()
-        s = db.species_definitions.find_one({'_id': str(species_id)})
-        if s:
-            return Species(
-                species_id=s["_id"],
-                species_name=s.get("species_name", ""),
-                species_type=s.get("species_type"),
-                category=s.get("category"),
-                description=s.get("description"),
-                backstory=s.get("backstory"),
-                character_traits=s.get("character_traits", []),
-                world_id=s.get("world_id", "")
-            )
-        return None
+        s = await info.context["loaders"]["species"].load(str(species_id))
+        return species_from_doc(s) if s else None
 
     @strawberry.field
-    def species_by_world(self, world_id: strawberry.ID) -> List[Species]:
+    async def species_by_world(self, info: Info, world_id: strawberry.ID) -> List[Species]:
         """Get all species in a world"""
-        db = get_db()
-        species_list = list(db.species_definitions.find({'world_id': str(world_id)}))
-        return [
-            Species(
-                species_id=s["_id"],
-                species_name=s.get("species_name", ""),
-                species_type=s.get("species_type"),
-                category=s.get("category"),
-                description=s.get("description"),
-                backstory=s.get("backstory"),
-                character_traits=s.get("character_traits", []),
-                world_id=s.get("world_id", "")
-            )
-            for s in species_list
-        ]
+        species_list = await info.context["loaders"]["species_by_world"].load(str(world_id))
+        return [species_from_doc(s) for s in species_list]
 
 
 @strawberry.type
@@ -446,27 +463,16 @@ class Mutation:
     @strawberry.mutation
     async def create_account(self, input: CreateAccountInput) -> Account:
         """Create a new account"""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{ACCOUNT_SERVICE_URL}/accounts",
-                json={
-                    "account_type": input.account_type,
-                    "subscription_tier": input.subscription_tier,
-                    "max_members": input.max_members
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-            return Account(
-                account_id=data["account_id"],
-                account_type=data["account_type"],
-                subscription_tier=data.get("subscription_tier"),
-                subscription_status=data["subscription_status"],
-                max_members=data["max_members"],
-                current_member_count=data["current_member_count"],
-                created_at=datetime.fromisoformat(data["created_at"]),
-                updated_at=datetime.fromisoformat(data["updated_at"])
-            )
+        response = await get_http_client().post(
+            f"{ACCOUNT_SERVICE_URL}/accounts",
+            json={
+                "account_type": input.account_type,
+                "subscription_tier": input.subscription_tier,
+                "max_members": input.max_members
+            }
+        )
+        response.raise_for_status()
+        return account_from_data(response.json())
 
     @strawberry.mutation
     async def update_account(
@@ -475,37 +481,25 @@ class Mutation:
         input: UpdateAccountInput
     ) -> Optional[Account]:
         """Update an existing account"""
-        async with httpx.AsyncClient() as client:
-            update_data = {}
-            if input.subscription_tier is not None:
-                update_data["subscription_tier"] = input.subscription_tier
-            if input.subscription_status is not None:
-                update_data["subscription_status"] = input.subscription_status
-
-            response = await client.patch(
-                f"{ACCOUNT_SERVICE_URL}/accounts/{account_id}",
-                json=update_data
-            )
-            if response.status_code == 200:
-                data = response.json()
-                return Account(
-                    account_id=data["account_id"],
-                    account_type=data["account_type"],
-                    subscription_tier=data.get("subscription_tier"),
-                    subscription_status=data["subscription_status"],
-                    max_members=data["max_members"],
-                    current_member_count=data["current_member_count"],
-                    created_at=datetime.fromisoformat(data["created_at"]),
-                    updated_at=datetime.fromisoformat(data["updated_at"])
-                )
-            return None
+        update_data = {}
+        if input.subscription_tier is not None:
+            update_data["subscription_tier"] = input.subscription_tier
+        if input.subscription_status is not None:
+            update_data["subscription_status"] = input.subscription_status
+
+        response = await get_http_client().patch(
+            f"{ACCOUNT_SERVICE_URL}/accounts/{account_id}",
+            json=update_data
+        )
+        if response.status_code == 200:
+            return account_from_data(response.json())
+        return None
 
     @strawberry.mutation
     async def delete_account(self, account_id: strawberry.ID) -> bool:
         """Delete an account"""
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(f"{ACCOUNT_SERVICE_URL}/accounts/{account_id}")
-            return response.status_code == 204
+        response = await get_http_client().delete(f"{ACCOUNT_SERVICE_URL}/accounts/{account_id}")
+        return response.status_code == 204
 
 
 # ============================================
@@ -521,11 +515,21 @@ schema = strawberry.Schema(query=Query, mutation=Mutation)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global mongo_client, http_client
+
     # Startup
     print("🚀 GraphQL API Gateway starting up...")
+    get_db()
+    get_http_client()
     yield
     # Shutdown
     print("🛑 GraphQL API Gateway shutting down...")
+    if http_client is not None:
+        await http_client.aclose()
+        http_client = None
+    if mongo_client is not None:
+        mongo_client.close()
+        mongo_client = None
 
 
 app = FastAPI(
@@ -552,7 +556,7 @@ async def health_check():
 
 
 # GraphQL endpoint
-graphql_app = GraphQLRouter(schema)
+graphql_app = GraphQLRouter(schema, context_getter=get_context)
 app.include_router(graphql_app, prefix="/graphql")
 
 
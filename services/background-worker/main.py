@@ -6,7 +6,12 @@ import os
 import sys
 import json
 import time
+import queue
+import zlib
 import logging
+import threading
+import itertools
+from collections import deque
 import pika
 from pymongo import MongoClient
 from neo4j import GraphDatabase
@@ -25,6 +30,16 @@ NEO4J_URI = os.getenv('NEO4J_URI', 'bolt://neo4j:7687')
 NEO4J_USER = os.getenv('NEO4J_USER', 'neo4j')
 NEO4J_PASSWORD = os.getenv('NEO4J_PASSWORD', 'neo4j_dev_pass_2024')
 
+# Neo4j sync batching
+NEO4J_SYNC_WORKERS = int(os.getenv('NEO4J_SYNC_WORKERS', '4'))
+NEO4J_SYNC_BATCH_SIZE = int(os.getenv('NEO4J_SYNC_BATCH_SIZE', '100'))
+NEO4J_SYNC_BATCH_WAIT_MS = int(os.getenv('NEO4J_SYNC_BATCH_WAIT_MS', '200'))
+NEO4J_SYNC_PREFETCH = int(os.getenv('NEO4J_SYNC_PREFETCH', str(NEO4J_SYNC_WORKERS * NEO4J_SYNC_BATCH_SIZE)))
+NEO4J_SYNC_MAX_RETRIES = int(os.getenv('NEO4J_SYNC_MAX_RETRIES', '10'))
+NEO4J_SYNC_RETRY_BASE_MS = int(os.getenv('NEO4J_SYNC_RETRY_BASE_MS', '1000'))
+NEO4J_SYNC_RETRY_MAX_MS = int(os.getenv('NEO4J_SYNC_RETRY_MAX_MS', '60000'))
+NEO4J_SYNC_RETRY_QUEUE = 'neo4j.sync.retry'
+
 # Database connections
 mongo_client = MongoClient(MONGODB_URL)
 db = mongo_client['skillforge']
@@ -32,366 +47,536 @@ neo4j_driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD)
 
 
 # ============================================
-# Neo4j Sync Handlers (with retry logic)
+# Neo4j Sync Statements
 # ============================================
 
-def sync_species_to_neo4j(entity_id, entity_data, action, max_retries=3):
-    """Sync species to Neo4j with retry logic"""
-    for attempt in range(max_retries):
-        try:
-            with neo4j_driver.session() as session:
-                if action == 'created':
-                    # Create Species node first
-                    session.run("""
-                        MERGE (s:Species {id: $species_id})
-                        ON CREATE SET s.name = $species_name,
-                                     s.type = $species_type,
-                                     s.category = $category
-                    """, species_id=entity_id,
-                       species_name=entity_data.get('species_name', ''),
-                       species_type=entity_data.get('species_type', ''),
-                       category=entity_data.get('category', ''))
-
-                    # Link to world if it exists
-                    world_id = entity_data.get('world_id')
-                    if world_id:
-                        session.run("""
-                            MATCH (s:Species {id: $species_id})
-                            MATCH (w:World {id: $world_id})
-                            MERGE (s)-[:IN_WORLD]->(w)
-                        """, species_id=entity_id, world_id=world_id)
-
-                    # Link to regions if they exist
-                    for region_id in entity_data.get('regions', []):
-                        session.run("""
-                            MATCH (s:Species {id: $species_id})
-                            MATCH (r:Region {id: $region_id})
-                            MERGE (s)-[:INHABITS]->(r)
-                        """, species_id=entity_id, region_id=region_id)
-
-                    logger.info(f"Created Species in Neo4j: {entity_id}")
-
-                elif action == 'updated':
-                    # Update Species node
-                    session.run("""
-                        MATCH (s:Species {id: $species_id})
-                        SET s.name = $species_name,
-                            s.type = $species_type,
-                            s.category = $category
-                    """, species_id=entity_id,
-                       species_name=entity_data.get('species_name', ''),
-                       species_type=entity_data.get('species_type', ''),
-                       category=entity_data.get('category', ''))
-
-                    # Update region relationships
-                    session.run("""
-                        MATCH (s:Species {id: $species_id})-[r:INHABITS]->()
-                        DELETE r
-                    """, species_id=entity_id)
-
-                    for region_id in entity_data.get('regions', []):
-                        session.run("""
-                            MATCH (s:Species {id: $species_id})
-                            MATCH (r:Region {id: $region_id})
-                            MERGE (s)-[:INHABITS]->(r)
-                        """, species_id=entity_id, region_id=region_id)
-
-                    logger.info(f"Updated Species in Neo4j: {entity_id}")
-
-                elif action == 'deleted':
-                    # Delete Species node
-                    session.run("""
-                        MATCH (s:Species {id: $species_id})
-                        DETACH DELETE s
-                    """, species_id=entity_id)
-
-                    logger.info(f"Deleted Species from Neo4j: {entity_id}")
-
-            return True  # Success
+# Each (entity_type, action) maps to UNWIND statements run in order inside one
+# transaction. Nodes are written before relationships so rows in the same batch
+# can link to each other (e.g. a child location to a parent created alongside it).
+#
+# Parents and children can be synced by different workers, so a child may land
+# before its parent. Nodes keep their parent ids (world_id, region_id, ...) and
+# a newly created parent adopts any children that are already waiting for it.
+SYNC_STATEMENTS = {
+    ('universe', 'created'): [
+        """
+        UNWIND $rows AS row
+        MERGE (u:Universe {id: row.id})
+        ON CREATE SET u.name = row.name,
+                      u.content_rating = row.content_rating
+        """,
+        """
+        UNWIND $rows AS row
+        MATCH (u:Universe {id: row.id})
+        MATCH (w:World)
+        WHERE row.id IN w.universe_ids
+        MERGE (w)-[:IN_UNIVERSE]->(u)
+        """
+    ],
+    ('universe', 'updated'): [
+        """
+        UNWIND $rows AS row
+        MATCH (u:Universe {id: row.id})
+        SET u.name = row.name,
+            u.content_rating = row.content_rating
+        """
+    ],
+    ('world', 'created'): [
+        """
+        UNWIND $rows AS row
+        MERGE (w:World {id: row.id})
+        ON CREATE SET w.name = row.name, w.genre = row.genre
+        SET w.universe_ids = row.universe_ids
+        """,
+        """
+        UNWIND $rows AS row
+        MATCH (w:World {id: row.id})
+        UNWIND row.universe_ids AS universe_id
+        MATCH (u:Universe {id: universe_id})
+        MERGE (w)-[:IN_UNIVERSE]->(u)
+        """,
+        """
+        UNWIND $rows AS row
+        MATCH (w:World {id: row.id})
+        MATCH (r:Region {world_id: row.id})
+        MERGE (r)-[:IN_WORLD]->(w)
+        """,
+        """
+        UNWIND $rows AS row
+        MATCH (w:World {id: row.id})
+        MATCH (s:Species {world_id: row.id})
+        MERGE (s)-[:IN_WORLD]->(w)
+        """
+    ],
+    ('world', 'updated'): [
+        """
+        UNWIND $rows AS row
+        MATCH (w:World {id: row.id})
+        SET w.name = row.name,
+            w.genre = row.genre,
+            w.universe_ids = row.universe_ids
+        WITH w
+        OPTIONAL MATCH (w)-[r:IN_UNIVERSE]->()
+        DELETE r
+        """,
+        """
+        UNWIND $rows AS row
+        MATCH (w:World {id: row.id})
+        UNWIND row.universe_ids AS universe_id
+        MATCH (u:Universe {id: universe_id})
+        MERGE (w)-[:IN_UNIVERSE]->(u)
+        """
+    ],
+    ('region', 'created'): [
+        """
+        UNWIND $rows AS row
+        MERGE (r:Region {id: row.id})
+        ON CREATE SET r.name = row.name,
+                      r.type = row.type,
+                      r.climate = row.climate
+        SET r.world_id = row.world_id
+        """,
+        """
+        UNWIND $rows AS row
+        MATCH (r:Region {id: row.id})
+        MATCH (w:World {id: row.world_id})
+        MERGE (r)-[:IN_WORLD]->(w)
+        """,
+        """
+        UNWIND $rows AS row
+        MATCH (r:Region {id: row.id})
+        MATCH (l:Location {region_id: row.id})
+        MERGE (l)-[:IN_REGION]->(r)
+        """,
+        """
+        UNWIND $rows AS row
+        MATCH (r:Region {id: row.id})
+        MATCH (s:Species)
+        WHERE row.id IN s.regions
+        MERGE (s)-[:INHABITS]->(r)
+        """
+    ],
+    ('region', 'updated'): [
+        """
+        UNWIND $rows AS row
+        MATCH (r:Region {id: row.id})
+        SET r.name = row.name,
+            r.type = row.type,
+            r.climate = row.climate
+        """
+    ],
+    ('location', 'created'): [
+        """
+        UNWIND $rows AS row
+        MERGE (l:Location {id: row.id})
+        ON CREATE SET l.name = row.name,
+                      l.type = row.type
+        SET l.region_id = row.region_id,
+            l.parent_location_id = row.parent_location_id
+        """,
+        """
+        UNWIND $rows AS row
+        MATCH (l:Location {id: row.id})
+        MATCH (r:Region {id: row.region_id})
+        MERGE (l)-[:IN_REGION]->(r)
+        """,
+        """
+        UNWIND $rows AS row
+        MATCH (child:Location {id: row.id})
+        MATCH (parent:Location {id: row.parent_location_id})
+        MERGE (child)-[:CHILD_OF]->(parent)
+        """,
+        """
+        UNWIND $rows AS row
+        MATCH (parent:Location {id: row.id})
+        MATCH (child:Location {parent_location_id: row.id})
+        MERGE (child)-[:CHILD_OF]->(parent)
+        """
+    ],
+    ('location', 'updated'): [
+        """
+        UNWIND $rows AS row
+        MATCH (l:Location {id: row.id})
+        SET l.name = row.name,
+            l.type = row.type
+        """
+    ],
+    ('species', 'created'): [
+        """
+        UNWIND $rows AS row
+        MERGE (s:Species {id: row.id})
+        ON CREATE SET s.name = row.name,
+                      s.type = row.type,
+                      s.category = row.category
+        SET s.world_id = row.world_id,
+            s.regions = row.regions
+        """,
+        """
+        UNWIND $rows AS row
+        MATCH (s:Species {id: row.id})
+        MATCH (w:World {id: row.world_id})
+        MERGE (s)-[:IN_WORLD]->(w)
+        """,
+        """
+        UNWIND $rows AS row
+        MATCH (s:Species {id: row.id})
+        UNWIND row.regions AS region_id
+        MATCH (r:Region {id: region_id})
+        MERGE (s)-[:INHABITS]->(r)
+        """
+    ],
+    ('species', 'updated'): [
+        """
+        UNWIND $rows AS row
+        MATCH (s:Species {id: row.id})
+        SET s.name = row.name,
+            s.type = row.type,
+            s.category = row.category,
+            s.regions = row.regions
+        WITH s
+        OPTIONAL MATCH (s)-[r:INHABITS]->()
+        DELETE r
+        """,
+        """
+        UNWIND $rows AS row
+        MATCH (s:Species {id: row.id})
+        UNWIND row.regions AS region_id
+        MATCH (r:Region {id: region_id})
+        MERGE (s)-[:INHABITS]->(r)
+        """
+    ]
+}
+
+ENTITY_LABELS = {
+    'universe': 'Universe',
+    'world': 'World',
+    'region': 'Region',
+    'location': 'Location',
+    'species': 'Species'
+}
+
+for _entity_type, _label in ENTITY_LABELS.items():
+    SYNC_STATEMENTS[(_entity_type, 'deleted')] = [
+        f"""
+        UNWIND $rows AS row
+        MATCH (n:{_label} {{id: row.id}})
+        DETACH DELETE n
+        """
+    ]
+
+# Groups within one round are applied parents-first
+SYNC_GROUP_ORDER = [
+    (entity_type, action)
+    for action in ('created', 'updated')
+    for entity_type in ('universe', 'world', 'region', 'location', 'species')
+] + [
+    (entity_type, 'deleted')
+    for entity_type in ('species', 'location', 'region', 'world', 'universe')
+]
+
+
+def build_sync_row(entity_type, entity_id, entity_data):
+    """Parameters for one entity's row in the UNWIND statements"""
+    if entity_type == 'universe':
+        return {
+            'id': entity_id,
+            'name': entity_data.get('universe_name', ''),
+            'content_rating': entity_data.get('max_content_rating', 'PG')
+        }
+    if entity_type == 'world':
+        return {
+            'id': entity_id,
+            'name': entity_data.get('world_name', ''),
+            'genre': entity_data.get('genre', ''),
+            'universe_ids': entity_data.get('universe_ids', [])
+        }
+    if entity_type == 'region':
+        return {
+            'id': entity_id,
+            'name': entity_data.get('region_name', ''),
+            'type': entity_data.get('region_type', ''),
+            'climate': entity_data.get('climate', ''),
+            'world_id': entity_data.get('world_id')
+        }
+    if entity_type == 'location':
+        return {
+            'id': entity_id,
+            'name': entity_data.get('location_name', ''),
+            'type': entity_data.get('location_type', ''),
+            'region_id': entity_data.get('region_id'),
+            'parent_location_id': entity_data.get('parent_location_id')
+        }
+    return {
+        'id': entity_id,
+        'name': entity_data.get('species_name', ''),
+        'type': entity_data.get('species_type', ''),
+        'category': entity_data.get('category', ''),
+        'world_id': entity_data.get('world_id'),
+        'regions': entity_data.get('regions', [])
+    }
+
+
+def apply_sync_group(entity_type, action, rows):
+    """Apply one (entity_type, action) group with its UNWIND statements in a single transaction"""
+    with neo4j_driver.session() as session:
+        with session.begin_transaction() as tx:
+            for query in SYNC_STATEMENTS[(entity_type, action)]:
+                tx.run(query, rows=rows).consume()
+            tx.commit()
+
+
+def plan_sync_rounds(messages):
+    """
+    Split a batch into rounds where every entity appears at most once, grouped
+    by (entity_type, action). Rounds are applied in order, so several events
+    for the same entity keep their arrival order.
+    """
+    rounds = []
+    seen = set()
+    for message in messages:
+        key = (message['entity_type'], message['entity_id'])
+        if not rounds or key in seen:
+            rounds.append({})
+            seen = set()
+        seen.add(key)
+        rounds[-1].setdefault((message['entity_type'], message['action']), []).append(message)
+
+    return [
+        [(group, round_groups[group]) for group in SYNC_GROUP_ORDER if group in round_groups]
+        for round_groups in rounds
+    ]
 
-        except Exception as e:
-            logger.error(f"Neo4j sync attempt {attempt + 1}/{max_retries} failed for Species {entity_id}: {e}")
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)  # Exponential backoff
-            else:
-                logger.error(f"Failed to sync Species {entity_id} to Neo4j after {max_retries} attempts")
-                return False
 
+# ============================================
+# Neo4j Sync Engine
+# ============================================
 
-def sync_universe_to_neo4j(entity_id, entity_data, action, max_retries=3):
-    """Sync universe to Neo4j with retry logic"""
-    for attempt in range(max_retries):
+class Neo4jSyncEngine:
+    """
+    Batched consumer for the neo4j.sync queue.
+
+    The connection thread routes each message to one of NEO4J_SYNC_WORKERS
+    worker threads by entity id, so events for one entity are handled in order
+    by the same worker. A worker collects up to NEO4J_SYNC_BATCH_SIZE messages
+    (waiting at most NEO4J_SYNC_BATCH_WAIT_MS), applies each entity type/action
+    group with one UNWIND transaction and acks the group's messages together.
+
+    Failed groups are not retried in place: their messages are republished to
+    neo4j.sync.retry with an exponential per-message TTL, which dead-letters
+    them back onto neo4j.sync. pika channels are not thread-safe, so acks and
+    publishes are handed back to the connection thread.
+
+    An entity with a message in the retry queue stays blocked until that
+    message has been applied: its later events are parked in the retry queue
+    behind it instead of being applied first. Parked messages carry a sequence
+    number, and the engine keeps each blocked entity's parked sequence numbers
+    in order; a message that comes back out of turn is parked again and keeps
+    its place.
+    """
+
+    def __init__(self, connection, channel):
+        self.connection = connection
+        self.channel = channel
+        self.queues = [queue.Queue() for _ in range(NEO4J_SYNC_WORKERS)]
+        self.threads = [
+            threading.Thread(target=self._run_worker, args=(work_queue,), name=f'neo4j-sync-{index}', daemon=True)
+            for index, work_queue in enumerate(self.queues)
+        ]
+        self.stopped = threading.Event()
+        # (entity_type, entity_id) -> parked sequence numbers, oldest event first
+        self.parked = {}
+        self.parked_lock = threading.Lock()
+        self.park_sequence = itertools.count(1)
+
+    def start(self):
+        for thread in self.threads:
+            thread.start()
+
+    def stop(self):
+        """Stop the workers; unacked messages are redelivered by the broker"""
+        self.stopped.set()
+        for work_queue in self.queues:
+            work_queue.put(None)
+        for thread in self.threads:
+            thread.join(timeout=10)
+
+    def on_message(self, ch, method, properties, body):
+        """Route a neo4j.sync message to the worker that owns its entity"""
         try:
-            with neo4j_driver.session() as session:
-                if action == 'created':
-                    session.run("""
-                        CREATE (u:Universe {
-                            id: $universe_id,
-                            name: $universe_name,
-                            content_rating: $content_rating
-                        })
-                    """, universe_id=entity_id,
-                       universe_name=entity_data.get('universe_name', ''),
-                       content_rating=entity_data.get('max_content_rating', 'PG'))
-                    logger.info(f"Created Universe in Neo4j: {entity_id}")
-
-                elif action == 'updated':
-                    session.run("""
-                        MATCH (u:Universe {id: $universe_id})
-                        SET u.name = $universe_name,
-                            u.content_rating = $content_rating
-                    """, universe_id=entity_id,
-                       universe_name=entity_data.get('universe_name', ''),
-                       content_rating=entity_data.get('max_content_rating', 'PG'))
-                    logger.info(f"Updated Universe in Neo4j: {entity_id}")
-
-                elif action == 'deleted':
-                    session.run("""
-                        MATCH (u:Universe {id: $universe_id})
-                        DETACH DELETE u
-                    """, universe_id=entity_id)
-                    logger.info(f"Deleted Universe from Neo4j: {entity_id}")
-
-            return True
-
+            event = json.loads(body)
+            message = {
+                'delivery_tag': method.delivery_tag,
+                'body': body,
+                'headers': properties.headers or {},
+                'entity_type': event.get('entity_type'),
+                'action': event.get('action'),
+                'entity_id': event.get('entity_id'),
+                'entity_data': event.get('data') or {}
+            }
+            if not isinstance(message['entity_data'], dict):
+                raise ValueError(f"event data must be an object, got {type(message['entity_data']).__name__}")
         except Exception as e:
-            logger.error(f"Neo4j sync attempt {attempt + 1}/{max_retries} failed for Universe {entity_id}: {e}")
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)
+            logger.error(f"Error processing entity event: {e}")
+            ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
+            return
+
+        worker = zlib.crc32(str(message['entity_id']).encode()) % len(self.queues)
+        self.queues[worker].put(message)
+
+    def _run_worker(self, work_queue):
+        while not self.stopped.is_set():
+            message = work_queue.get()
+            if message is None:
+                return
+
+            batch = [message]
+            deadline = time.monotonic() + NEO4J_SYNC_BATCH_WAIT_MS / 1000
+            while len(batch) < NEO4J_SYNC_BATCH_SIZE:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    message = work_queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if message is None:
+                    work_queue.put(None)
+                    break
+                batch.append(message)
+
+            try:
+                self._process_batch(batch)
+            except Exception as e:
+                logger.error(f"Error processing Neo4j sync batch of {len(batch)}: {e}")
+                self._schedule_retry(batch)
+
+    def _process_batch(self, batch):
+        supported = []
+        for message in batch:
+            if (message['entity_type'], message['action']) not in SYNC_STATEMENTS:
+                if message['entity_type'] not in ENTITY_LABELS:
+                    logger.warning(f"Unknown entity type: {message['entity_type']}")
+                self._settle(self._ack, [message])  # Ack anyway
+            elif self._take_turn(message):
+                supported.append(message)
             else:
-                logger.error(f"Failed to sync Universe {entity_id} to Neo4j after {max_retries} attempts")
+                # Entity is waiting on an earlier event in the retry queue
+                self._schedule_retry([message], attempt_failed=False)
+
+        failed_entities = set()
+        for sync_round in plan_sync_rounds(supported):
+            for (entity_type, action), messages in sync_round:
+                # Later events for an entity whose earlier event failed follow it into the retry queue
+                blocked = [m for m in messages if (entity_type, m['entity_id']) in failed_entities]
+                pending = [m for m in messages if (entity_type, m['entity_id']) not in failed_entities]
+                if blocked:
+                    self._schedule_retry(blocked, attempt_failed=False)
+                if not pending:
+                    continue
+
+                rows = [build_sync_row(entity_type, m['entity_id'], m['entity_data']) for m in pending]
+                try:
+                    apply_sync_group(entity_type, action, rows)
+                except Exception as e:
+                    logger.error(f"Neo4j sync failed for {len(rows)} {entity_type} {action} event(s): {e}")
+                    failed_entities.update((entity_type, m['entity_id']) for m in pending)
+                    self._schedule_retry(pending)
+                    continue
+
+                logger.info(f"Synced {len(rows)} {entity_type} {action} event(s) to Neo4j")
+                self._settle(self._ack, pending)
+
+    def _take_turn(self, message):
+        """Whether a message may be applied now, given its entity's parked events"""
+        key = (message['entity_type'], message['entity_id'])
+        with self.parked_lock:
+            parked = self.parked.get(key)
+            if not parked:
+                return True
+            if message['headers'].get('x-sync-parked-seq') != parked[0]:
                 return False
-
-
-def sync_world_to_neo4j(entity_id, entity_data, action, max_retries=3):
-    """Sync world to Neo4j with retry logic"""
-    for attempt in range(max_retries):
-        try:
-            with neo4j_driver.session() as session:
-                if action == 'created':
-                    # Create the World node first (even if no universes)
-                    session.run("""
-                        MERGE (w:World {id: $world_id})
-                        ON CREATE SET w.name = $world_name, w.genre = $genre
-                    """, world_id=entity_id,
-                       world_name=entity_data.get('world_name', ''),
-                       genre=entity_data.get('genre', ''))
-
-                    # Then link to universes if any exist
-                    for universe_id in entity_data.get('universe_ids', []):
-                        session.run("""
-                            MATCH (w:World {id: $world_id})
-                            MATCH (u:Universe {id: $universe_id})
-                            MERGE (w)-[:IN_UNIVERSE]->(u)
-                        """, world_id=entity_id, universe_id=universe_id)
-
-                    logger.info(f"Created World in Neo4j: {entity_id}")
-
-                elif action == 'updated':
-                    session.run("""
-                        MATCH (w:World {id: $world_id})
-                        SET w.name = $world_name,
-                            w.genre = $genre
-                    """, world_id=entity_id,
-                       world_name=entity_data.get('world_name', ''),
-                       genre=entity_data.get('genre', ''))
-
-                    # Update universe relationships
-                    session.run("""
-                        MATCH (w:World {id: $world_id})
-                        OPTIONAL MATCH (w)-[r:IN_UNIVERSE]->()
-                        DELETE r
-                    """, world_id=entity_id)
-
-                    for universe_id in entity_data.get('universe_ids', []):
-                        session.run("""
-                            MATCH (w:World {id: $world_id})
-                            MATCH (u:Universe {id: $universe_id})
-                            MERGE (w)-[:IN_UNIVERSE]->(u)
-                        """, world_id=entity_id, universe_id=universe_id)
-
-                    logger.info(f"Updated World in Neo4j: {entity_id}")
-
-                elif action == 'deleted':
-                    session.run("""
-                        MATCH (w:World {id: $world_id})
-                        DETACH DELETE w
-                    """, world_id=entity_id)
-                    logger.info(f"Deleted World from Neo4j: {entity_id}")
-
+            parked.popleft()
+            if not parked:
+                del self.parked[key]
             return True
 
-        except Exception as e:
-            logger.error(f"Neo4j sync attempt {attempt + 1}/{max_retries} failed for World {entity_id}: {e}")
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)
-            else:
-                logger.error(f"Failed to sync World {entity_id} to Neo4j after {max_retries} attempts")
-                return False
-
-
-def sync_region_to_neo4j(entity_id, entity_data, action, max_retries=3):
-    """Sync region to Neo4j with retry logic"""
-    for attempt in range(max_retries):
+    def _schedule_retry(self, messages, attempt_failed=True):
+        """
+        Park messages in the retry queue and block their entities until they are applied
+
+        A failed message is the oldest unapplied event of its entity, so it goes
+        ahead of the entity's other parked events; others queue up behind them.
+        """
+        parked_messages = []
+        abandoned = []
+        front = {}
+        with self.parked_lock:
+            for message in messages:
+                attempt = message['headers'].get('x-sync-attempt', 0) + (1 if attempt_failed else 0)
+                if attempt > NEO4J_SYNC_MAX_RETRIES:
+                    abandoned.append(message)
+                    continue
+
+                key = (message['entity_type'], message['entity_id'])
+                parked = self.parked.setdefault(key, deque())
+                seq = message['headers'].get('x-sync-parked-seq')
+                if attempt_failed:
+                    seq = next(self.park_sequence)
+                    front.setdefault(key, []).append(seq)
+                elif seq is None or seq not in parked:
+                    seq = next(self.park_sequence)
+                    parked.append(seq)
+                # else: came back out of turn, keeps its place
+                parked_messages.append((message, attempt, seq))
+
+            for key, seqs in front.items():
+                self.parked.setdefault(key, deque()).extendleft(reversed(seqs))
+
+        if abandoned:
+            self._settle(self._abandon, abandoned)
+        if parked_messages:
+            self._settle(self._retry, parked_messages)
+
+    def _settle(self, callback, *args):
+        """Run a channel operation on the connection thread"""
         try:
-            with neo4j_driver.session() as session:
-                if action == 'created':
-                    # Create Region node first
-                    session.run("""
-                        MERGE (r:Region {id: $region_id})
-                        ON CREATE SET r.name = $region_name,
-                                     r.type = $region_type,
-                                     r.climate = $climate
-                    """, region_id=entity_id,
-                       region_name=entity_data.get('region_name', ''),
-                       region_type=entity_data.get('region_type', ''),
-                       climate=entity_data.get('climate', ''))
-
-                    # Link to world if it exists
-                    world_id = entity_data.get('world_id')
-                    if world_id:
-                        session.run("""
-                            MATCH (r:Region {id: $region_id})
-                            MATCH (w:World {id: $world_id})
-                            MERGE (r)-[:IN_WORLD]->(w)
-                        """, region_id=entity_id, world_id=world_id)
-
-                    logger.info(f"Created Region in Neo4j: {entity_id}")
-
-                elif action == 'updated':
-                    session.run("""
-                        MATCH (r:Region {id: $region_id})
-                        SET r.name = $region_name,
-                            r.type = $region_type,
-                            r.climate = $climate
-                    """, region_id=entity_id,
-                       region_name=entity_data.get('region_name', ''),
-                       region_type=entity_data.get('region_type', ''),
-                       climate=entity_data.get('climate', ''))
-                    logger.info(f"Updated Region in Neo4j: {entity_id}")
-
-                elif action == 'deleted':
-                    session.run("""
-                        MATCH (r:Region {id: $region_id})
-                        DETACH DELETE r
-                    """, region_id=entity_id)
-                    logger.info(f"Deleted Region from Neo4j: {entity_id}")
-
-            return True
-
+            self.connection.add_callback_threadsafe(lambda: callback(*args))
         except Exception as e:
-            logger.error(f"Neo4j sync attempt {attempt + 1}/{max_retries} failed for Region {entity_id}: {e}")
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)
-            else:
-                logger.error(f"Failed to sync Region {entity_id} to Neo4j after {max_retries} attempts")
-                return False
-
-
-def sync_location_to_neo4j(entity_id, entity_data, action, max_retries=3):
-    """Sync location to Neo4j with retry logic"""
-    for attempt in range(max_retries):
-        try:
-            with neo4j_driver.session() as session:
-                if action == 'created':
-                    # Create Location node first
-                    session.run("""
-                        MERGE (l:Location {id: $location_id})
-                        ON CREATE SET l.name = $location_name,
-                                     l.type = $location_type
-                    """, location_id=entity_id,
-                       location_name=entity_data.get('location_name', ''),
-                       location_type=entity_data.get('location_type', ''))
-
-                    # Link to region if it exists
-                    region_id = entity_data.get('region_id')
-                    if region_id:
-                        session.run("""
-                            MATCH (l:Location {id: $location_id})
-                            MATCH (r:Region {id: $region_id})
-                            MERGE (l)-[:IN_REGION]->(r)
-                        """, location_id=entity_id, region_id=region_id)
-
-                    # Create parent-child relationship if parent exists
-                    parent_location_id = entity_data.get('parent_location_id')
-                    if parent_location_id:
-                        session.run("""
-                            MATCH (child:Location {id: $child_id})
-                            MATCH (parent:Location {id: $parent_id})
-                            MERGE (child)-[:CHILD_OF]->(parent)
-                        """, child_id=entity_id, parent_id=parent_location_id)
-
-                    logger.info(f"Created Location in Neo4j: {entity_id}")
-
-                elif action == 'updated':
-                    session.run("""
-                        MATCH (l:Location {id: $location_id})
-                        SET l.name = $location_name,
-                            l.type = $location_type
-                    """, location_id=entity_id,
-                       location_name=entity_data.get('location_name', ''),
-                       location_type=entity_data.get('location_type', ''))
-                    logger.info(f"Updated Location in Neo4j: {entity_id}")
-
-                elif action == 'deleted':
-                    session.run("""
-                        MATCH (l:Location {id: $location_id})
-                        DETACH DELETE l
-                    """, location_id=entity_id)
-                    logger.info(f"Deleted Location from Neo4j: {entity_id}")
-
-            return True
-
-        except Exception as e:
-            logger.error(f"Neo4j sync attempt {attempt + 1}/{max_retries} failed for Location {entity_id}: {e}")
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)
-            else:
-                logger.error(f"Failed to sync Location {entity_id} to Neo4j after {max_retries} attempts")
-                return False
+            # Connection is gone - the broker redelivers anything left unacked
+            logger.error(f"Could not settle Neo4j sync messages: {e}")
+
+    def _ack(self, messages):
+        for message in messages:
+            self.channel.basic_ack(delivery_tag=message['delivery_tag'])
+
+    def _abandon(self, messages):
+        for message in messages:
+            logger.error(
+                f"Failed to sync {message['entity_type']} {message['entity_id']} to Neo4j "
+                f"after {NEO4J_SYNC_MAX_RETRIES} retries"
+            )
+            self.channel.basic_nack(delivery_tag=message['delivery_tag'], requeue=False)
+
+    def _retry(self, parked_messages):
+        for message, attempt, seq in parked_messages:
+            delay_ms = min(NEO4J_SYNC_RETRY_BASE_MS * 2 ** max(attempt - 1, 0), NEO4J_SYNC_RETRY_MAX_MS)
+            self.channel.basic_publish(
+                exchange='',
+                routing_key=NEO4J_SYNC_RETRY_QUEUE,
+                body=message['body'],
+                properties=pika.BasicProperties(
+                    delivery_mode=2,
+                    expiration=str(delay_ms),
+                    headers={**message['headers'], 'x-sync-attempt': attempt, 'x-sync-parked-seq': seq}
+                )
+            )
+            self.channel.basic_ack(delivery_tag=message['delivery_tag'])
 
 
 # ============================================
 # Event Handlers
 # ============================================
 
-def handle_entity_event(ch, method, properties, body):
-    """Handle entity lifecycle events"""
-    try:
-        event = json.loads(body)
-        entity_type = event.get('entity_type')
-        action = event.get('action')
-        entity_id = event.get('entity_id')
-        entity_data = event.get('data', {})
-
-        logger.info(f"Processing {action} event for {entity_type}: {entity_id}")
-
-        # Route to appropriate handler
-        if entity_type == 'universe':
-            success = sync_universe_to_neo4j(entity_id, entity_data, action)
-        elif entity_type == 'species':
-            success = sync_species_to_neo4j(entity_id, entity_data, action)
-        elif entity_type == 'world':
-            success = sync_world_to_neo4j(entity_id, entity_data, action)
-        elif entity_type == 'region':
-            success = sync_region_to_neo4j(entity_id, entity_data, action)
-        elif entity_type == 'location':
-            success = sync_location_to_neo4j(entity_id, entity_data, action)
-        else:
-            logger.warning(f"Unknown entity type: {entity_type}")
-            success = True  # Ack anyway
-
-        if success:
-            ch.basic_ack(delivery_tag=method.delivery_tag)
-        else:
-            # Reject and requeue for retry
-            ch.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
-
-    except Exception as e:
-        logger.error(f"Error processing entity event: {e}")
-        ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
-
-
 def handle_ai_task(ch, method, properties, body):
     """Handle AI generation tasks"""
     try:
@@ -416,6 +601,7 @@ def start_worker():
     logger.info("Starting Background Worker...")
 
     while True:
+        sync_engine = None
         try:
             # Connect to RabbitMQ
             params = pika.URLParameters(RABBITMQ_URL)
@@ -433,6 +619,16 @@ def start_worker():
             channel.queue_declare(queue='neo4j.sync', durable=True)
             channel.queue_declare(queue='ai.generation', durable=True)
 
+            # Failed syncs wait here for their per-message TTL, then dead-letter back to neo4j.sync
+            channel.queue_declare(
+                queue=NEO4J_SYNC_RETRY_QUEUE,
+                durable=True,
+                arguments={
+                    'x-dead-letter-exchange': '',
+                    'x-dead-letter-routing-key': 'neo4j.sync'
+                }
+            )
+
             # Bind queues to exchange
             channel.queue_bind(
                 exchange='skillforge.events',
@@ -447,13 +643,15 @@ def start_worker():
 
             logger.info("Queues and bindings configured")
 
-            # Set QoS - process one message at a time
-            channel.basic_qos(prefetch_count=1)
+            # Set QoS - enough unacked messages to fill every sync worker's batch
+            channel.basic_qos(prefetch_count=NEO4J_SYNC_PREFETCH)
 
             # Consume from neo4j.sync queue
+            sync_engine = Neo4jSyncEngine(connection, channel)
+            sync_engine.start()
             channel.basic_consume(
                 queue='neo4j.sync',
-                on_message_callback=handle_entity_event,
+                on_message_callback=sync_engine.on_message,
                 auto_ack=False
             )
 
@@ -474,6 +672,9 @@ def start_worker():
             logger.error(f"Worker error: {e}")
             logger.info("Reconnecting in 5 seconds...")
             time.sleep(5)
+        finally:
+            if sync_engine:
+                sync_engine.stop()
 
 
 if __name__ == '__main__':
@@ -11,6 +11,7 @@ from database import db_manager
 from state_manager import state_manager
 from message_publisher import message_publisher
 from workflow import create_campaign_workflow
+from workflow.progress_publisher import progress_publisher
 
 logger = logging.getLogger(__name__)
 
@@ -97,16 +98,29 @@ class CampaignRequestHandler:
                 str(e)
             )
 
+    async def _run_workflow(self, state):
+        """
+        Run the workflow until its next gate or the end, then save the state it
+        stopped at (progress updates only snapshot at phase boundaries)
+        """
+        try:
+            result_state = await campaign_workflow.ainvoke(
+                state,
+                {"recursion_limit": Config.WORKFLOW_RECURSION_LIMIT}
+            )
+        finally:
+            await progress_publisher.finish(state["request_id"])
+
+        await state_manager.save_campaign_state(result_state)
+        return result_state
+
     async def _handle_start(self, request_data: dict):
         """Handle 'start' workflow action"""
         # Initialize new workflow state
         state = await state_manager.initialize_campaign_state(request_data)
 
         # Run workflow (will pause at first human-in-the-loop gate)
-        result_state = await campaign_workflow.ainvoke(
-            state,
-            {"recursion_limit": Config.WORKFLOW_RECURSION_LIMIT}
-        )
+        result_state = await self._run_workflow(state)
 
         # Publish story ideas to user for selection
         await message_publisher.publish_story_ideas(result_state)
@@ -118,10 +132,7 @@ class CampaignRequestHandler:
         state["selected_story_id"] = request_data["selected_story_id"]
 
         # Continue workflow
-        result_state = await campaign_workflow.ainvoke(
-            state,
-            {"recursion_limit": Config.WORKFLOW_RECURSION_LIMIT}
-        )
+        result_state = await self._run_workflow(state)
 
         # Publish campaign core to user for approval
         await message_publisher.publish_campaign_core(result_state)
@@ -133,10 +144,7 @@ class CampaignRequestHandler:
         state["regenerate_stories"] = True
 
         # Continue workflow
-        result_state = await campaign_workflow.ainvoke(
-            state,
-            {"recursion_limit": Config.WORKFLOW_RECURSION_LIMIT}
-        )
+        result_state = await self._run_workflow(state)
 
         # Publish new story ideas
         await message_publisher.publish_story_ideas(result_state)
@@ -152,10 +160,10 @@ class CampaignRequestHandler:
         state["generate_images"] = request_data.get("generate_images", True)
 
         # Continue workflow (will run to completion)
-        result_state = await campaign_workflow.ainvoke(
-            state,
-            {"recursion_limit": Config.WORKFLOW_RECURSION_LIMIT}
-        )
+        result_state = await self._run_workflow(state)
+
+        # Invalidate game-engine caches built from the previous campaign graph
+        await state_manager.bump_campaign_version(result_state.get("final_campaign_id"))
 
         # Publish final campaign result
         await message_publisher.publish_campaign_completion(result_state)
@@ -167,13 +175,7 @@ class CampaignRequestHandler:
         state["user_approved_quests"] = request_data.get("user_approved_quests", True)
 
         # Continue workflow
-        result_state = await campaign_workflow.ainvoke(
-            state,
-            {"recursion_limit": Config.WORKFLOW_RECURSION_LIMIT}
-        )
-
-        # Save updated state
-        await state_manager.save_campaign_state(result_state)
+        await self._run_workflow(state)
 
     async def _handle_approve_places(self, request_data: dict):
         """Handle 'approve_places' workflow action"""
@@ -182,13 +184,7 @@ class CampaignRequestHandler:
         state["user_approved_places"] = request_data.get("user_approved_places", True)
 
         # Continue workflow
-        result_state = await campaign_workflow.ainvoke(
-            state,
-            {"recursion_limit": Config.WORKFLOW_RECURSION_LIMIT}
-        )
-
-        # Save updated state
-        await state_manager.save_campaign_state(result_state)
+        await self._run_workflow(state)
 
     async def _handle_finalize(self, request_data: dict):
         """Handle 'finalize' workflow action - manually trigger finalization"""
@@ -199,11 +195,17 @@ class CampaignRequestHandler:
         from workflow.nodes_finalize import finalize_campaign_node
 
         # Run finalization
-        result_state = await finalize_campaign_node(state)
+        try:
+            result_state = await finalize_campaign_node(state)
+        finally:
+            await progress_publisher.finish(state["request_id"])
 
         # Save updated state
         await state_manager.save_campaign_state(result_state)
 
+        # Invalidate game-engine caches built from the previous campaign graph
+        await state_manager.bump_campaign_version(result_state.get("final_campaign_id"))
+
         # Publish completion
         await message_publisher.publish_campaign_completion(result_state)
 
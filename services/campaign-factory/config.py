@@ -52,5 +52,6 @@ class Config:
             'state': 'campaign:state:',
             'progress': 'campaign:progress:',
             'deletion_state': 'campaign:deletion:state:',
-            'deletion_progress': 'campaign:deletion:progress:'
+            'deletion_progress': 'campaign:deletion:progress:',
+            'campaign_version': 'campaign:version:'
         }
@@ -62,6 +62,9 @@ class CampaignDeletionHandler:
             # Run deletion workflow
             result_state = await self._run_deletion_with_progress(state)
 
+            # Invalidate game-engine caches for the deleted campaign
+            await state_manager.bump_campaign_version(campaign_id)
+
             # Publish completion
             await message_publisher.publish_deletion_completion(result_state)
 
@@ -14,6 +14,7 @@ from database import db_manager
 from state_manager import state_manager
 from campaign_handlers import campaign_request_handler
 from deletion_handlers import deletion_request_handler
+from workflow.progress_publisher import progress_publisher
 
 # Configure logging
 logging.basicConfig(
@@ -82,6 +83,9 @@ async def main():
         raise
 
     finally:
+        # Flush coalesced progress updates and close the progress channel
+        await progress_publisher.close()
+
         # Cleanup database connections
         await db_manager.close()
 
@@ -261,6 +261,25 @@ class StateManager:
         except Exception as e:
             logger.error(f"Error saving deletion state: {e}")
 
+    async def bump_campaign_version(self, campaign_id: str):
+        """
+        Bump a campaign's content version so game-engine caches keyed on it
+        (e.g. the objective requirement index) are rebuilt
+
+        Args:
+            campaign_id: Campaign ID that was finalized, updated or deleted
+        """
+        if not campaign_id:
+            return
+
+        try:
+            version_key = f"{self.key_prefixes['campaign_version']}{campaign_id}"
+            version = await self.redis.incr(version_key)
+            logger.info(f"Bumped campaign version: {campaign_id} -> {version}")
+
+        except Exception as e:
+            logger.error(f"Error bumping campaign version: {e}")
+
 
 # Global state manager instance
 state_manager = StateManager()
@@ -29,6 +29,28 @@ POSTGRES_DB = os.getenv('POSTGRES_DB', 'skillforge')
 POSTGRES_USER = os.getenv('POSTGRES_USER', 'postgres')
 POSTGRES_PASSWORD = os.getenv('POSTGRES_PASSWORD', 'postgres')
 
+# Nodes deleted per inner transaction (CALL { ... } IN TRANSACTIONS)
+NEO4J_DELETE_BATCH_SIZE = int(os.getenv('NEO4J_DELETE_BATCH_SIZE', '1000'))
+
+# Campaign-scoped nodes by kind. All matches are collected before the first delete,
+# so CampaignObjectives are still reachable through the Campaign node.
+CAMPAIGN_NODE_MATCHES = [
+    ('quests', "MATCH (n:Quest) WHERE n.campaign_id = $campaign_id"),
+    ('places', "MATCH (n:Place) WHERE n.campaign_id = $campaign_id"),
+    ('scenes', "MATCH (n:Scene) WHERE n.campaign_id = $campaign_id"),
+    ('npcs', "MATCH (n:NPC) WHERE n.campaign_id = $campaign_id"),
+    ('challenges', "MATCH (n:Challenge) WHERE n.campaign_id = $campaign_id"),
+    ('discoveries', "MATCH (n:Discovery) WHERE n.campaign_id = $campaign_id"),
+    ('events', "MATCH (n:Event) WHERE n.campaign_id = $campaign_id"),
+    ('knowledge', "MATCH (n:Knowledge) WHERE n.campaign_id = $campaign_id"),
+    ('items', "MATCH (n:Item) WHERE n.campaign_id = $campaign_id"),
+    ('rubrics', "MATCH (n:Rubric) WHERE n.campaign_id = $campaign_id"),
+    ('campaign_objectives', "MATCH (:Campaign {id: $campaign_id})-[:HAS_OBJECTIVE]->(n:CampaignObjective)"),
+    ('quest_objectives', "MATCH (n:QuestObjective) WHERE n.campaign_id = $campaign_id OR n.id CONTAINS $campaign_id"),
+    ('dimensions', "MATCH (n:Dimension) WHERE n.campaign_id = $campaign_id"),
+    ('campaign', "MATCH (n:Campaign {id: $campaign_id})"),
+]
+
 
 class CampaignDeletionState(TypedDict, total=False):
     """State for campaign deletion workflow"""
@@ -58,6 +80,7 @@ class CampaignDeletionState(TypedDict, total=False):
     locations_to_remove: List[str]  # Locations with no other campaign dependencies
     species_dependencies: Dict[str, List[str]]  # Species ID -> List of campaign IDs using it
     location_dependencies: Dict[str, List[str]]  # Location ID -> List of campaign IDs using it
+    dependency_index_built: bool  # Dependencies above were computed before deletion
 
     # Status tracking
     mongodb_deleted: bool
@@ -81,6 +104,141 @@ class CampaignDeletionState(TypedDict, total=False):
     deletion_log: List[Dict[str, Any]]
 
 
+def delete_campaign_nodes(session, campaign_id: str) -> Dict[str, int]:
+    """
+    Delete every campaign-scoped node with one set-based query, committing
+    every NEO4J_DELETE_BATCH_SIZE nodes so large campaigns stay within the
+    transaction memory limit. Must run as an auto-commit query (session.run).
+
+    Returns:
+        Deleted node count per CAMPAIGN_NODE_MATCHES key
+    """
+    branches = "\n            UNION\n            ".join(
+        f"{match} RETURN n, '{key}' AS kind" for key, match in CAMPAIGN_NODE_MATCHES
+    )
+    result = session.run(f"""
+        CALL {{
+            {branches}
+        }}
+        // A node matched by several branches is deleted once, counted under its first kind
+        WITH n, head(collect(kind)) AS kind
+        CALL {{
+            WITH n
+            DETACH DELETE n
+        }} IN TRANSACTIONS OF $batch_size ROWS
+        RETURN kind, count(*) AS deleted_count
+    """, campaign_id=campaign_id, batch_size=NEO4J_DELETE_BATCH_SIZE)
+
+    counts = {key: 0 for key, _ in CAMPAIGN_NODE_MATCHES}
+    for record in result:
+        counts[record['kind']] = record['deleted_count']
+    return counts
+
+
+def delete_nodes_by_id(session, label: str, node_ids: List[str]) -> int:
+    """Batched DETACH DELETE of `label` nodes whose id is in node_ids (auto-commit query)"""
+    if not node_ids:
+        return 0
+    result = session.run(f"""
+        MATCH (n:{label})
+        WHERE n.id IN $node_ids
+        CALL {{
+            WITH n
+            DETACH DELETE n
+        }} IN TRANSACTIONS OF $batch_size ROWS
+        RETURN count(*) AS deleted_count
+    """, node_ids=node_ids, batch_size=NEO4J_DELETE_BATCH_SIZE)
+    return result.single()['deleted_count']
+
+
+def _group_campaigns(pipeline_results) -> Dict[str, set]:
+    """{_id: key, campaigns: [...]} aggregation rows -> key -> set of (truthy) campaign IDs"""
+    grouped: Dict[str, set] = {}
+    for row in pipeline_results:
+        grouped.setdefault(row['_id'], set()).update(c for c in row['campaigns'] if c)
+    return grouped
+
+
+def build_dependency_index(
+    campaign_id: str,
+    species_ids: List[str],
+    created_locations: List[Dict[str, Any]]
+) -> Dict[str, Dict[str, List[str]]]:
+    """
+    Find which other campaigns still use the species and locations this campaign
+    created, with one aggregation per kind of reference instead of queries per entity.
+
+    Species are used by another campaign that lists them in new_species_ids or has
+    NPCs of that species. Level 1 locations are used by other campaigns' quests,
+    Level 2 by their places and Level 3 by their scenes (resolved to the campaign
+    through place -> quest).
+
+    Returns:
+        {"species": species_id -> campaign IDs, "locations": location_id -> campaign IDs}
+    """
+    species_deps: Dict[str, set] = {species_id: set() for species_id in species_ids}
+    if species_ids:
+        for grouped in (
+            _group_campaigns(db.campaigns.aggregate([
+                {'$match': {'_id': {'$ne': campaign_id}, 'new_species_ids': {'$in': species_ids}}},
+                {'$unwind': '$new_species_ids'},
+                {'$match': {'new_species_ids': {'$in': species_ids}}},
+                {'$group': {'_id': '$new_species_ids', 'campaigns': {'$addToSet': '$_id'}}}
+            ])),
+            _group_campaigns(db.npcs.aggregate([
+                {'$match': {'species_id': {'$in': species_ids}, 'campaign_id': {'$ne': campaign_id}}},
+                {'$group': {'_id': '$species_id', 'campaigns': {'$addToSet': '$campaign_id'}}}
+            ]))
+        ):
+            for species_id, campaigns in grouped.items():
+                species_deps[species_id].update(campaigns)
+
+    ids_by_level: Dict[int, List[str]] = {1: [], 2: [], 3: []}
+    for loc in created_locations:
+        if loc.get('id'):
+            ids_by_level[loc.get('level', 3)].append(loc['id'])
+    location_deps: Dict[str, set] = {loc_id: set() for ids in ids_by_level.values() for loc_id in ids}
+
+    # Places/scenes reference their parent as quest_id/place_id (older documents)
+    # or parent_quest_id/parent_place_id
+    lookup_quest = [
+        {'$lookup': {'from': 'quests', 'localField': 'quest_ref', 'foreignField': '_id', 'as': 'quest'}},
+        {'$unwind': '$quest'},
+        {'$match': {'quest.campaign_id': {'$ne': campaign_id}}}
+    ]
+    pipelines = []
+    if ids_by_level[1]:
+        pipelines.append(db.quests.aggregate([
+            {'$match': {'level_1_location_id': {'$in': ids_by_level[1]}, 'campaign_id': {'$ne': campaign_id}}},
+            {'$group': {'_id': '$level_1_location_id', 'campaigns': {'$addToSet': '$campaign_id'}}}
+        ]))
+    if ids_by_level[2]:
+        pipelines.append(db.places.aggregate([
+            {'$match': {'level_2_location_id': {'$in': ids_by_level[2]}}},
+            {'$addFields': {'quest_ref': {'$ifNull': ['$quest_id', '$parent_quest_id']}}},
+            *lookup_quest,
+            {'$group': {'_id': '$level_2_location_id', 'campaigns': {'$addToSet': '$quest.campaign_id'}}}
+        ]))
+    if ids_by_level[3]:
+        pipelines.append(db.scenes.aggregate([
+            {'$match': {'level_3_location_id': {'$in': ids_by_level[3]}}},
+            {'$addFields': {'place_ref': {'$ifNull': ['$place_id', '$parent_place_id']}}},
+            {'$lookup': {'from': 'places', 'localField': 'place_ref', 'foreignField': '_id', 'as': 'place'}},
+            {'$unwind': '$place'},
+            {'$addFields': {'quest_ref': {'$ifNull': ['$place.quest_id', '$place.parent_quest_id']}}},
+            *lookup_quest,
+            {'$group': {'_id': '$level_3_location_id', 'campaigns': {'$addToSet': '$quest.campaign_id'}}}
+        ]))
+    for pipeline in pipelines:
+        for loc_id, campaigns in _group_campaigns(pipeline).items():
+            location_deps[loc_id].update(campaigns)
+
+    return {
+        'species': {species_id: sorted(deps) for species_id, deps in species_deps.items()},
+        'locations': {loc_id: sorted(deps) for loc_id, deps in location_deps.items()}
+    }
+
+
 async def fetch_campaign_data_node(state: CampaignDeletionState) -> CampaignDeletionState:
     """
     Fetch campaign data to determine format and structure
@@ -151,6 +309,56 @@ async def fetch_campaign_data_node(state: CampaignDeletionState) -> CampaignDele
     return state
 
 
+async def build_dependency_index_node(state: CampaignDeletionState) -> CampaignDeletionState:
+    """
+    Index which other campaigns depend on the species and locations this campaign created
+    """
+    try:
+        state['current_phase'] = 'fetch'
+        state['progress_percentage'] = 10
+        state['step_progress'] = 50
+        state['status_message'] = 'Checking species and location dependencies...'
+
+        index = build_dependency_index(
+            state['campaign_id'],
+            state.get('campaign_created_species', []),
+            state.get('campaign_created_locations', [])
+        )
+        state['species_dependencies'] = index['species']
+        state['location_dependencies'] = index['locations']
+        state['dependency_index_built'] = True
+
+        logger.info(
+            f"Dependency index: {sum(1 for deps in index['species'].values() if deps)}/{len(index['species'])} species "
+            f"and {sum(1 for deps in index['locations'].values() if deps)}/{len(index['locations'])} locations used by other campaigns"
+        )
+        state['deletion_log'] = state.get('deletion_log', []) + [{
+            'timestamp': datetime.utcnow().isoformat(),
+            'action': 'build_dependency_index',
+            'status': 'success',
+            'details': {
+                'species_checked': len(index['species']),
+                'locations_checked': len(index['locations'])
+            }
+        }]
+
+    except Exception as e:
+        # Without the index nothing shared can be proven unused, so cleanup keeps everything
+        logger.error(f"Error building dependency index: {e}")
+        state['dependency_index_built'] = False
+        state['warnings'] = state.get('warnings', []) + [
+            f"Dependency check failed, created species and locations will be kept: {str(e)}"
+        ]
+        state['deletion_log'] = state.get('deletion_log', []) + [{
+            'timestamp': datetime.utcnow().isoformat(),
+            'action': 'build_dependency_index',
+            'status': 'error',
+            'details': {'error': str(e)}
+        }]
+
+    return state
+
+
 async def delete_mongodb_campaign_node(state: CampaignDeletionState) -> CampaignDeletionState:
     """
     Delete campaign and all related entities from MongoDB
@@ -305,163 +513,14 @@ async def delete_neo4j_entities_node(state: CampaignDeletionState) -> CampaignDe
         campaign_id = state['campaign_id']
         logger.info(f"Starting Neo4j deletion for campaign: {campaign_id}")
 
-        total_deleted = 0
-
         with neo4j_driver.session() as session:
             # Delete all campaign entities by campaign_id property
             # This works regardless of whether relationships were created properly
+            deleted_counts = delete_campaign_nodes(session, campaign_id)
 
-            # 1. Delete Quest nodes
-            result = session.run("""
-                MATCH (q:Quest)
-                WHERE q.campaign_id = $campaign_id
-                DETACH DELETE q
-                RETURN count(q) as deleted_count
-            """, campaign_id=campaign_id)
-            quest_count = result.single()['deleted_count']
-            total_deleted += quest_count
-            logger.info(f"Deleted {quest_count} Quest nodes from Neo4j")
-
-            # 2. Delete Place nodes
-            result = session.run("""
-                MATCH (p:Place)
-                WHERE p.campaign_id = $campaign_id
-                DETACH DELETE p
-                RETURN count(p) as deleted_count
-            """, campaign_id=campaign_id)
-            place_count = result.single()['deleted_count']
-            total_deleted += place_count
-            logger.info(f"Deleted {place_count} Place nodes from Neo4j")
-
-            # 3. Delete Scene nodes
-            result = session.run("""
-                MATCH (s:Scene)
-                WHERE s.campaign_id = $campaign_id
-                DETACH DELETE s
-                RETURN count(s) as deleted_count
-            """, campaign_id=campaign_id)
-            scene_count = result.single()['deleted_count']
-            total_deleted += scene_count
-            logger.info(f"Deleted {scene_count} Scene nodes from Neo4j")
-
-            # 4. Delete NPC nodes
-            result = session.run("""
-                MATCH (n:NPC)
-                WHERE n.campaign_id = $campaign_id
-                DETACH DELETE n
-                RETURN count(n) as deleted_count
-            """, campaign_id=campaign_id)
-            npc_count = result.single()['deleted_count']
-            total_deleted += npc_count
-            logger.info(f"Deleted {npc_count} NPC nodes from Neo4j")
-
-            # 5. Delete Challenge nodes
-            result = session.run("""
-                MATCH (c:Challenge)
-                WHERE c.campaign_id = $campaign_id
-                DETACH DELETE c
-                RETURN count(c) as deleted_count
-            """, campaign_id=campaign_id)
-            challenge_count = result.single()['deleted_count']
-            total_deleted += challenge_count
-            logger.info(f"Deleted {challenge_count} Challenge nodes from Neo4j")
-
-            # 6. Delete Discovery nodes
-            result = session.run("""
-                MATCH (d:Discovery)
-                WHERE d.campaign_id = $campaign_id
-                DETACH DELETE d
-                RETURN count(d) as deleted_count
-            """, campaign_id=campaign_id)
-            discovery_count = result.single()['deleted_count']
-            total_deleted += discovery_count
-            logger.info(f"Deleted {discovery_count} Discovery nodes from Neo4j")
-
-            # 7. Delete Event nodes
-            result = session.run("""
-                MATCH (e:Event)
-                WHERE e.campaign_id = $campaign_id
-                DETACH DELETE e
-                RETURN count(e) as deleted_count
-            """, campaign_id=campaign_id)
-            event_count = result.single()['deleted_count']
-            total_deleted += event_count
-            logger.info(f"Deleted {event_count} Event nodes from Neo4j")
-
-            # 8. Delete Knowledge nodes
-            result = session.run("""
-                MATCH (k:Knowledge)
-                WHERE k.campaign_id = $campaign_id
-                DETACH DELETE k
-                RETURN count(k) as deleted_count
-            """, campaign_id=campaign_id)
-            knowledge_count = result.single()['deleted_count']
-            total_deleted += knowledge_count
-            logger.info(f"Deleted {knowledge_count} Knowledge nodes from Neo4j")
-
-            # 9. Delete Item nodes
-            result = session.run("""
-                MATCH (i:Item)
-                WHERE i.campaign_id = $campaign_id
-                DETACH DELETE i
-                RETURN count(i) as deleted_count
-            """, campaign_id=campaign_id)
-            item_count = result.single()['deleted_count']
-            total_deleted += item_count
-            logger.info(f"Deleted {item_count} Item nodes from Neo4j")
-
-            # 10. Delete Rubric nodes
-            result = session.run("""
-                MATCH (r:Rubric)
-                WHERE r.campaign_id = $campaign_id
-                DETACH DELETE r
-                RETURN count(r) as deleted_count
-            """, campaign_id=campaign_id)
-            rubric_count = result.single()['deleted_count']
-            total_deleted += rubric_count
-            logger.info(f"Deleted {rubric_count} Rubric nodes from Neo4j")
-
-            # 11. Delete CampaignObjective nodes (NEW - from objective cascade system)
-            result = session.run("""
-                MATCH (c:Campaign {id: $campaign_id})-[:HAS_OBJECTIVE]->(co:CampaignObjective)
-                DETACH DELETE co
-                RETURN count(co) as deleted_count
-            """, campaign_id=campaign_id)
-            campaign_obj_count = result.single()['deleted_count']
-            total_deleted += campaign_obj_count
-            logger.info(f"Deleted {campaign_obj_count} CampaignObjective nodes from Neo4j")
-
-            # 12. Delete QuestObjective nodes (NEW - from objective cascade system)
-            result = session.run("""
-                MATCH (qo:QuestObjective)
-                WHERE qo.campaign_id = $campaign_id OR qo.id CONTAINS $campaign_id
-                DETACH DELETE qo
-                RETURN count(qo) as deleted_count
-            """, campaign_id=campaign_id)
-            quest_obj_count = result.single()['deleted_count']
-            total_deleted += quest_obj_count
-            logger.info(f"Deleted {quest_obj_count} QuestObjective nodes from Neo4j")
-
-            # 13. Delete Dimension nodes
-            result = session.run("""
-                MATCH (d:Dimension)
-                WHERE d.campaign_id = $campaign_id
-                DETACH DELETE d
-                RETURN count(d) as deleted_count
-            """, campaign_id=campaign_id)
-            dimension_count = result.single()['deleted_count']
-            total_deleted += dimension_count
-            logger.info(f"Deleted {dimension_count} Dimension nodes from Neo4j")
-
-            # 14. Finally, delete the Campaign node itself
-            result = session.run("""
-                MATCH (c:Campaign {id: $campaign_id})
-                DETACH DELETE c
-                RETURN count(c) as deleted_count
-            """, campaign_id=campaign_id)
-            campaign_count = result.single()['deleted_count']
-            total_deleted += campaign_count
-            logger.info(f"Deleted {campaign_count} Campaign node from Neo4j")
+        for kind, count in deleted_counts.items():
+            logger.info(f"Deleted {count} {kind} nodes from Neo4j")
+        total_deleted = sum(deleted_counts.values())
 
         logger.info(f"Neo4j deletion complete: {total_deleted} total nodes deleted")
 
@@ -472,20 +531,7 @@ async def delete_neo4j_entities_node(state: CampaignDeletionState) -> CampaignDe
             'status': 'success',
             'details': {
                 'total_nodes_deleted': total_deleted,
-                'quests': quest_count,
-                'places': place_count,
-                'scenes': scene_count,
-                'npcs': npc_count,
-                'challenges': challenge_count,
-                'discoveries': discovery_count,
-                'events': event_count,
-                'knowledge': knowledge_count,
-                'items': item_count,
-                'rubrics': rubric_count,
-                'campaign_objectives': campaign_obj_count,
-                'quest_objectives': quest_obj_count,
-                'dimensions': dimension_count,
-                'campaign': campaign_count
+                **deleted_counts
             }
         }]
 
@@ -576,34 +622,22 @@ async def cleanup_species_node(state: CampaignDeletionState) -> CampaignDeletion
 
         logger.info(f"Checking {len(species_ids)} species for cleanup")
 
-        # Check which species are used by other campaigns
+        # Dependencies come from the index built before anything was deleted
+        if not state.get('dependency_index_built'):
+            logger.warning("No dependency index - keeping all species created by this campaign")
+        species_dependencies = {
+            species_id: state.get('species_dependencies', {}).get(species_id, []) for species_id in species_ids
+        }
         species_to_remove = []
-        species_dependencies = {}
 
         for species_id in species_ids:
-            # Find all campaigns that reference this species
-            campaigns_using_species = list(db.campaigns.find({
-                '_id': {'$ne': state['campaign_id']},  # Exclude current campaign
-                'new_species_ids': species_id
-            }))
-
-            # Also check if NPCs in other campaigns use this species
-            npcs_in_other_campaigns = list(db.npcs.find({
-                'species_id': species_id,
-                'campaign_id': {'$ne': state['campaign_id']}
-            }))
-
-            dependent_campaigns = [c['_id'] for c in campaigns_using_species]
-            npc_campaign_ids = list(set([n.get('campaign_id') for n in npcs_in_other_campaigns if n.get('campaign_id')]))
-            all_dependencies = list(set(dependent_campaigns + npc_campaign_ids))
-
-            species_dependencies[species_id] = all_dependencies
+            all_dependencies = species_dependencies[species_id]
 
-            if not all_dependencies:
+            if not all_dependencies and state.get('dependency_index_built'):
                 # No other campaigns use this species, safe to remove
                 species_to_remove.append(species_id)
                 logger.info(f"Species {species_id} has no dependencies, will be removed")
-            else:
+            elif all_dependencies:
                 logger.info(f"Species {species_id} is used by {len(all_dependencies)} other campaign(s), keeping it")
                 state['warnings'] = state.get('warnings', []) + [
                     f"Species {species_id} is used by other campaigns and will not be removed"
@@ -628,13 +662,7 @@ async def cleanup_species_node(state: CampaignDeletionState) -> CampaignDeletion
 
             # Delete from Neo4j
             with neo4j_driver.session() as session:
-                result = session.run("""
-                    MATCH (s:Species)
-                    WHERE s.id IN $species_ids
-                    DETACH DELETE s
-                    RETURN count(s) as deleted_count
-                """, species_ids=species_to_remove)
-                count = result.single()['deleted_count']
+                count = delete_nodes_by_id(session, 'Species', species_to_remove)
                 logger.info(f"Deleted {count} Species nodes from Neo4j")
 
         state['species_cleaned'] = True
@@ -688,148 +716,57 @@ async def cleanup_locations_node(state: CampaignDeletionState) -> CampaignDeleti
 
         logger.info(f"Checking {len(created_locations)} locations for cleanup")
 
-        # Organize locations by level
-        locations_by_level = {1: [], 2: [], 3: []}
-        for loc in created_locations:
-            level = loc.get('level', 3)  # Default to level 3 if not specified
-            locations_by_level[level].append(loc)
+        # Dependencies come from the index built before anything was deleted
+        if not state.get('dependency_index_built'):
+            logger.warning("No dependency index - keeping all locations created by this campaign")
+        indexed_dependencies = state.get('location_dependencies', {})
 
         locations_to_remove = []
         location_dependencies = {}
 
-        # Check Level 1 locations (regions)
-        for loc in locations_by_level[1]:
-            loc_id = loc.get('id')
-            if not loc_id:
-                continue
-
-            # Check if used by other campaigns' quests
-            quests_in_other_campaigns = list(db.quests.find({
-                'level_1_location_id': loc_id,
-                'campaign_id': {'$ne': state['campaign_id']}
-            }))
-
-            dependent_campaigns = list(set([q.get('campaign_id') for q in quests_in_other_campaigns if q.get('campaign_id')]))
-            location_dependencies[loc_id] = dependent_campaigns
-
-            if not dependent_campaigns:
-                locations_to_remove.append(loc)
-                logger.info(f"Level 1 location {loc_id} ({loc.get('name')}) has no dependencies, will be removed")
-            else:
-                logger.info(f"Level 1 location {loc_id} is used by {len(dependent_campaigns)} other campaign(s), keeping it")
-
-        # Check Level 2 locations (places)
-        for loc in locations_by_level[2]:
-            loc_id = loc.get('id')
-            if not loc_id:
-                continue
-
-            # Check if used by other campaigns' places
-            places_in_other_campaigns = list(db.places.find({
-                'level_2_location_id': loc_id,
-                'quest_id': {'$exists': True}
-            }))
-
-            # Filter to only places from other campaigns
-            dependent_places = []
-            for place in places_in_other_campaigns:
-                quest = db.quests.find_one({'_id': place.get('quest_id')})
-                if quest and quest.get('campaign_id') != state['campaign_id']:
-                    dependent_places.append(place)
-
-            dependent_campaigns = list(set([
-                db.quests.find_one({'_id': p.get('quest_id')}).get('campaign_id')
-                for p in dependent_places
-                if db.quests.find_one({'_id': p.get('quest_id')})
-            ]))
-
-            location_dependencies[loc_id] = dependent_campaigns
-
-            if not dependent_campaigns:
-                locations_to_remove.append(loc)
-                logger.info(f"Level 2 location {loc_id} ({loc.get('name')}) has no dependencies, will be removed")
-            else:
-                logger.info(f"Level 2 location {loc_id} is used by {len(dependent_campaigns)} other campaign(s), keeping it")
-
-        # Check Level 3 locations (scenes)
-        for loc in locations_by_level[3]:
+        for loc in created_locations:
             loc_id = loc.get('id')
             if not loc_id:
                 continue
+            level = loc.get('level', 3)  # Default to level 3 if not specified
 
-            # Check if used by other campaigns' scenes
-            scenes_in_other_campaigns = list(db.scenes.find({
-                'level_3_location_id': loc_id,
-                'place_id': {'$exists': True}
-            }))
-
-            # Filter to only scenes from other campaigns
-            dependent_scenes = []
-            for scene in scenes_in_other_campaigns:
-                place = db.places.find_one({'_id': scene.get('place_id')})
-                if place:
-                    quest = db.quests.find_one({'_id': place.get('quest_id')})
-                    if quest and quest.get('campaign_id') != state['campaign_id']:
-                        dependent_scenes.append(scene)
-
-            dependent_campaigns = []
-            for scene in dependent_scenes:
-                place = db.places.find_one({'_id': scene.get('place_id')})
-                if place:
-                    quest = db.quests.find_one({'_id': place.get('quest_id')})
-                    if quest:
-                        dependent_campaigns.append(quest.get('campaign_id'))
-
-            dependent_campaigns = list(set([c for c in dependent_campaigns if c]))
+            dependent_campaigns = indexed_dependencies.get(loc_id, [])
             location_dependencies[loc_id] = dependent_campaigns
 
-            if not dependent_campaigns:
+            if not dependent_campaigns and state.get('dependency_index_built'):
                 locations_to_remove.append(loc)
-                logger.info(f"Level 3 location {loc_id} ({loc.get('name')}) has no dependencies, will be removed")
-            else:
-                logger.info(f"Level 3 location {loc_id} is used by {len(dependent_campaigns)} other campaign(s), keeping it")
+                logger.info(f"Level {level} location {loc_id} ({loc.get('name')}) has no dependencies, will be removed")
+            elif dependent_campaigns:
+                logger.info(f"Level {level} location {loc_id} is used by {len(dependent_campaigns)} other campaign(s), keeping it")
 
         state['locations_to_remove'] = [loc.get('id') for loc in locations_to_remove]
         state['location_dependencies'] = location_dependencies
 
         # Remove locations from world and MongoDB
         if locations_to_remove:
-            for loc in locations_to_remove:
-                loc_id = loc.get('id')
-                level = loc.get('level', 3)
-
-                # Delete from MongoDB based on level
-                if level == 1:
-                    # Remove from world's regions list
-                    if world_id:
-                        db.world_definitions.update_one(
-                            {'_id': world_id},
-                            {'$pull': {'regions': loc_id}}
-                        )
-                    # Delete region document
-                    db.region_definitions.delete_one({'_id': loc_id})
-                    logger.info(f"Deleted Level 1 location {loc_id} from world and MongoDB")
-
-                elif level == 2:
-                    # Delete location document
-                    db.location_definitions.delete_one({'_id': loc_id})
-                    logger.info(f"Deleted Level 2 location {loc_id} from MongoDB")
-
-                elif level == 3:
-                    # Delete location document
-                    db.location_definitions.delete_one({'_id': loc_id})
-                    logger.info(f"Deleted Level 3 location {loc_id} from MongoDB")
-
-                # Delete from Neo4j
-                with neo4j_driver.session() as session:
-                    result = session.run("""
-                        MATCH (l:Location {id: $location_id})
-                        DETACH DELETE l
-                        RETURN count(l) as deleted_count
-                    """, location_id=loc_id)
-                    count = result.single()['deleted_count']
-                    if count > 0:
-                        logger.info(f"Deleted Location node {loc_id} from Neo4j")
+            region_ids = [loc.get('id') for loc in locations_to_remove if loc.get('level', 3) == 1]
+            location_ids = [loc.get('id') for loc in locations_to_remove if loc.get('level', 3) in (2, 3)]
+
+            if region_ids:
+                # Remove Level 1 locations from world's regions list
+                if world_id:
+                    db.world_definitions.update_one(
+                        {'_id': world_id},
+                        {'$pull': {'regions': {'$in': region_ids}}}
+                    )
+                # Delete region documents
+                result = db.region_definitions.delete_many({'_id': {'$in': region_ids}})
+                logger.info(f"Deleted {result.deleted_count} Level 1 locations from world and MongoDB")
+
+            if location_ids:
+                # Delete Level 2/3 location documents
+                result = db.location_definitions.delete_many({'_id': {'$in': location_ids}})
+                logger.info(f"Deleted {result.deleted_count} Level 2/3 locations from MongoDB")
+
+            # Delete from Neo4j
+            with neo4j_driver.session() as session:
+                count = delete_nodes_by_id(session, 'Location', region_ids + location_ids)
+                logger.info(f"Deleted {count} Location nodes from Neo4j")
 
         state['locations_cleaned'] = True
         state['deletion_log'] = state.get('deletion_log', []) + [{
@@ -868,7 +805,7 @@ def route_after_fetch(state: CampaignDeletionState) -> str:
     """Route after fetching campaign data"""
     if state.get('errors'):
         return 'failed'
-    return 'delete_mongodb'
+    return 'build_dependency_index'
 
 
 def route_after_mongodb(state: CampaignDeletionState) -> str:
@@ -915,16 +852,18 @@ def create_campaign_deletion_workflow() -> StateGraph:
 
     Workflow Steps:
     1. Fetch campaign data and determine format
-    2. Delete from MongoDB (all collections, cascade)
-    3. Delete from Neo4j (all entities and relationships)
-    4. Delete from PostgreSQL (player associations)
-    5. Cleanup Species (remove species created by campaign if not used elsewhere)
-    6. Cleanup Locations (remove locations created by campaign if not used elsewhere)
+    2. Build the species/location dependency index (other campaigns using them)
+    3. Delete from MongoDB (all collections, cascade)
+    4. Delete from Neo4j (all entities and relationships, batched transactions)
+    5. Delete from PostgreSQL (player associations)
+    6. Cleanup Species (remove species created by campaign if not used elsewhere)
+    7. Cleanup Locations (remove locations created by campaign if not used elsewhere)
     """
     workflow = StateGraph(CampaignDeletionState)
 
     # Add nodes
     workflow.add_node('fetch_campaign', fetch_campaign_data_node)
+    workflow.add_node('build_dependency_index', build_dependency_index_node)
     workflow.add_node('delete_mongodb', delete_mongodb_campaign_node)
     workflow.add_node('delete_neo4j', delete_neo4j_entities_node)
     workflow.add_node('delete_postgres', delete_postgres_records_node)
@@ -939,11 +878,13 @@ def create_campaign_deletion_workflow() -> StateGraph:
         'fetch_campaign',
         route_after_fetch,
         {
-            'delete_mongodb': 'delete_mongodb',
+            'build_dependency_index': 'build_dependency_index',
             'failed': END
         }
     )
 
+    workflow.add_edge('build_dependency_index', 'delete_mongodb')
+
     workflow.add_conditional_edges(
         'delete_mongodb',
         route_after_mongodb,
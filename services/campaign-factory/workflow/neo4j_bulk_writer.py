@@ -0,0 +1,779 @@
+"""
+Neo4j Bulk Graph Writer
+Writes the campaign graph with one UNWIND statement per node/relationship type
+
+build_campaign_graph_rows() walks the workflow state once and produces a
+parameter list per statement; write_graph_rows() sends each list as a single
+`UNWIND $rows AS row ...` query inside one explicit transaction, so a
+campaign costs a fixed number of round-trips instead of one per entity.
+Statements run in the order of the statement list because later types MATCH
+nodes merged by earlier ones (scenes -> NPCs -> rubrics).
+"""
+import os
+import logging
+from typing import Dict, Any, List, Tuple
+
+from neo4j import Driver
+
+from .state import CampaignWorkflowState
+
+logger = logging.getLogger(__name__)
+
+# Rows per UNWIND query; larger lists are split across queries in the same transaction
+NEO4J_UNWIND_BATCH_SIZE = int(os.getenv('NEO4J_UNWIND_BATCH_SIZE', '1000'))
+
+CAMPAIGN_GRAPH_STATEMENTS: List[Tuple[str, str]] = [
+    ("campaign", """
+        UNWIND $rows AS row
+        MERGE (camp:Campaign {id: row.campaign_id})
+        SET camp.name = row.campaign_name,
+            camp.campaign_id = row.campaign_id,
+            camp.status = row.status,
+            camp.created_at = row.created_at
+    """),
+    ("character_campaign", """
+        UNWIND $rows AS row
+        MATCH (camp:Campaign {id: row.campaign_id})
+        MERGE (c:Character {id: row.character_id})
+        MERGE (c)-[:PARTICIPATES_IN]->(camp)
+    """),
+    ("campaign_world_region", """
+        UNWIND $rows AS row
+        MATCH (camp:Campaign {id: row.campaign_id})
+        MATCH (w:World {id: row.world_id})
+        MATCH (r:Region {id: row.region_id})
+        MERGE (camp)-[:TAKES_PLACE_IN]->(w)
+        MERGE (camp)-[:LOCATED_IN]->(r)
+    """),
+    ("quests", """
+        UNWIND $rows AS row
+        MATCH (camp:Campaign {id: row.campaign_id})
+        MATCH (r:Region {id: row.region_id})
+        MERGE (q:Quest {id: row.quest_id})
+        SET q.name = row.quest_name,
+            q.campaign_id = row.campaign_id,
+            q.order_sequence = row.order_sequence,
+            q.difficulty_level = row.difficulty,
+            q.estimated_duration_minutes = row.duration
+        MERGE (camp)-[:CONTAINS]->(q)
+
+        // MERGE Level 1 Location by name + world to avoid duplicates
+        MERGE (loc:Location {name: row.location_name, world_id: row.world_id})
+        ON CREATE SET loc.id = row.location_id
+        ON MATCH SET loc.id = COALESCE(loc.id, row.location_id)
+        // Level 1 locations are children of the Region, not directly connected to World
+        MERGE (loc)-[:CHILD_OF]->(r)
+        MERGE (q)-[:LOCATED_AT]->(loc)
+    """),
+    ("places", """
+        UNWIND $rows AS row
+        MATCH (q:Quest {id: row.quest_id})
+        MERGE (p:Place {id: row.place_id})
+        SET p.name = row.place_name,
+            p.campaign_id = row.campaign_id,
+            p.order_sequence = row.order_sequence
+        MERGE (q)-[:CONTAINS]->(p)
+
+        // MERGE Level 2 Location by name + world to avoid duplicates
+        MERGE (loc:Location {name: row.location_name, world_id: row.world_id})
+        ON CREATE SET loc.id = row.location_id
+        ON MATCH SET loc.id = COALESCE(loc.id, row.location_id)
+        MERGE (p)-[:LOCATED_AT]->(loc)
+
+        // Link Level 2 Location to parent Level 1 Location (NOT to World)
+        WITH row, loc
+        MERGE (parent:Location {name: row.parent_location_name, world_id: row.world_id})
+        ON CREATE SET parent.id = row.parent_location_id
+        MERGE (loc)-[:CHILD_OF]->(parent)
+    """),
+    ("scenes", """
+        UNWIND $rows AS row
+        MATCH (p:Place {id: row.place_id})
+        MERGE (sc:Scene {id: row.scene_id})
+        SET sc.name = row.scene_name,
+            sc.campaign_id = row.campaign_id,
+            sc.order_sequence = row.order_sequence,
+            sc.mongodb_id = row.mongodb_id
+        MERGE (p)-[:CONTAINS]->(sc)
+
+        // MERGE Level 3 Location by name + world to avoid duplicates
+        MERGE (loc:Location {name: row.location_name, world_id: row.world_id})
+        ON CREATE SET loc.id = row.location_id
+        ON MATCH SET loc.id = COALESCE(loc.id, row.location_id)
+        MERGE (sc)-[:LOCATED_AT]->(loc)
+
+        // Link Level 3 Location to parent Level 2 Location (NOT to World)
+        WITH row, loc
+        MERGE (parent:Location {name: row.parent_location_name, world_id: row.world_id})
+        ON CREATE SET parent.id = row.parent_location_id
+        MERGE (loc)-[:CHILD_OF]->(parent)
+    """),
+    ("scene_npcs", """
+        UNWIND $rows AS row
+        MATCH (sc:Scene {id: row.scene_id})
+        MERGE (npc:NPC {id: row.npc_id})
+        SET npc.name = row.npc_name,
+            npc.role = row.role,
+            npc.description = row.description,
+            npc.species_id = row.species_id,
+            npc.species_name = row.species_name,
+            npc.campaign_id = row.campaign_id,
+            npc.mongodb_id = row.mongodb_id
+        MERGE (sc)-[:FEATURES]->(npc)
+    """),
+    ("scene_npcs_minimal", """
+        UNWIND $rows AS row
+        MATCH (sc:Scene {id: row.scene_id})
+        MERGE (npc:NPC {id: row.npc_id})
+        SET npc.name = 'Unknown NPC',
+            npc.role = 'unknown',
+            npc.description = 'An NPC whose details are yet to be discovered.',
+            npc.mongodb_id = row.mongodb_id
+        MERGE (sc)-[:FEATURES]->(npc)
+    """),
+    ("npcs", """
+        UNWIND $rows AS row
+        MATCH (w:World {id: row.world_id})
+        MERGE (npc:NPC {id: row.npc_id})
+        SET npc.name = row.npc_name,
+            npc.role = row.role,
+            npc.description = row.description,
+            npc.species_id = row.species_id,
+            npc.species_name = row.species_name,
+            npc.campaign_id = row.campaign_id,
+            npc.mongodb_id = row.mongodb_id
+
+        // MERGE Species by name to avoid duplicates
+        MERGE (s:Species {name: row.species_name, world_id: row.world_id})
+        ON CREATE SET s.id = row.species_id
+        ON MATCH SET s.id = COALESCE(s.id, row.species_id)
+        MERGE (s)-[:IN_WORLD]->(w)
+
+        // NPC location is Level 3 (Scene location) - should already exist from scene creation
+        MERGE (loc:Location {name: row.location_name, world_id: row.world_id})
+        ON CREATE SET loc.id = row.location_id
+        ON MATCH SET loc.id = COALESCE(loc.id, row.location_id)
+
+        MERGE (npc)-[:IS_SPECIES]->(s)
+        MERGE (npc)-[:LOCATED_AT]->(loc)
+    """),
+    ("knowledge", """
+        UNWIND $rows AS row
+        MERGE (k:Knowledge {id: row.knowledge_id})
+        SET k.name = row.name,
+            k.knowledge_type = row.knowledge_type,
+            k.primary_dimension = row.primary_dimension,
+            k.bloom_level_target = row.bloom_level_target,
+            k.description = row.description,
+            k.campaign_id = row.campaign_id,
+            k.mongodb_id = row.mongodb_id,
+            k.supports_objectives = row.supports_objectives
+    """),
+    ("knowledge_scenes", """
+        UNWIND $rows AS row
+        MATCH (sc:Scene {id: row.scene_id})
+        MATCH (k:Knowledge {id: row.knowledge_id})
+        MERGE (sc)-[:PROVIDES]->(k)
+    """),
+    ("knowledge_acquisition", """
+        UNWIND $rows AS row
+        MATCH (k:Knowledge {id: row.knowledge_id})
+        OPTIONAL MATCH (npc:NPC {id: row.entity_id})
+        OPTIONAL MATCH (ch:Challenge {id: row.entity_id})
+        OPTIONAL MATCH (e:Event {id: row.entity_id})
+        FOREACH (_ IN CASE WHEN npc IS NOT NULL THEN [1] ELSE [] END |
+            MERGE (npc)-[:TEACHES]->(k)
+        )
+        FOREACH (_ IN CASE WHEN ch IS NOT NULL THEN [1] ELSE [] END |
+            MERGE (ch)-[:GRANTS]->(k)
+        )
+        FOREACH (_ IN CASE WHEN e IS NOT NULL THEN [1] ELSE [] END |
+            MERGE (e)-[:GRANTS]->(k)
+        )
+    """),
+    ("items", """
+        UNWIND $rows AS row
+        MERGE (i:Item {id: row.item_id})
+        SET i.name = row.name,
+            i.item_type = row.item_type,
+            i.is_quest_critical = row.is_quest_critical,
+            i.description = row.description,
+            i.campaign_id = row.campaign_id,
+            i.mongodb_id = row.mongodb_id
+    """),
+    ("item_scenes", """
+        UNWIND $rows AS row
+        MATCH (sc:Scene {id: row.scene_id})
+        MATCH (i:Item {id: row.item_id})
+        MERGE (sc)-[:CONTAINS_ITEM]->(i)
+    """),
+    ("item_acquisition", """
+        UNWIND $rows AS row
+        MATCH (i:Item {id: row.item_id})
+        OPTIONAL MATCH (npc:NPC {id: row.entity_id})
+        OPTIONAL MATCH (ch:Challenge {id: row.entity_id})
+        FOREACH (_ IN CASE WHEN npc IS NOT NULL THEN [1] ELSE [] END |
+            MERGE (npc)-[:GIVES]->(i)
+        )
+        FOREACH (_ IN CASE WHEN ch IS NOT NULL THEN [1] ELSE [] END |
+            MERGE (ch)-[:REWARDS]->(i)
+        )
+    """),
+    ("challenges", """
+        UNWIND $rows AS row
+        MERGE (ch:Challenge {id: row.challenge_id})
+        SET ch.name = row.name,
+            ch.challenge_type = row.challenge_type,
+            ch.difficulty = row.difficulty,
+            ch.blooms_level = row.blooms_level,
+            ch.description = row.description,
+            ch.campaign_id = row.campaign_id,
+            ch.mongodb_id = row.mongodb_id
+    """),
+    ("challenge_scenes", """
+        UNWIND $rows AS row
+        MATCH (sc:Scene {id: row.scene_id})
+        MATCH (ch:Challenge {id: row.challenge_id})
+        MERGE (sc)-[:CONTAINS_CHALLENGE]->(ch)
+    """),
+    ("discoveries", """
+        UNWIND $rows AS row
+        MERGE (d:Discovery {id: row.discovery_id})
+        SET d.name = row.name,
+            d.knowledge_type = row.knowledge_type,
+            d.blooms_level = row.blooms_level,
+            d.description = row.description,
+            d.campaign_id = row.campaign_id,
+            d.mongodb_id = row.mongodb_id
+    """),
+    ("discovery_scenes", """
+        UNWIND $rows AS row
+        MATCH (sc:Scene {id: row.scene_id})
+        MATCH (d:Discovery {id: row.discovery_id})
+        MERGE (sc)-[:CONTAINS_DISCOVERY]->(d)
+    """),
+    ("events", """
+        UNWIND $rows AS row
+        MERGE (e:Event {id: row.event_id})
+        SET e.name = row.name,
+            e.event_type = row.event_type,
+            e.description = row.description,
+            e.campaign_id = row.campaign_id,
+            e.mongodb_id = row.mongodb_id
+    """),
+    ("event_scenes", """
+        UNWIND $rows AS row
+        MATCH (sc:Scene {id: row.scene_id})
+        MATCH (e:Event {id: row.event_id})
+        MERGE (sc)-[:CONTAINS_EVENT]->(e)
+    """),
+    # Rubrics run last and are only created when their entity exists (no orphaned rubrics).
+    # Returns the ids that were linked so the caller can report the skipped ones.
+    ("rubrics", """
+        UNWIND $rows AS row
+        OPTIONAL MATCH (npc:NPC {id: row.entity_id})
+        OPTIONAL MATCH (ch:Challenge {id: row.entity_id})
+        OPTIONAL MATCH (d:Discovery {id: row.entity_id})
+        OPTIONAL MATCH (e:Event {id: row.entity_id})
+        WITH row, npc, ch, d, e
+        WHERE npc IS NOT NULL OR ch IS NOT NULL OR d IS NOT NULL OR e IS NOT NULL
+
+        MERGE (r:Rubric {id: row.rubric_id})
+        SET r.rubric_type = row.rubric_type,
+            r.campaign_id = row.campaign_id,
+            r.interaction_name = row.interaction_name,
+            r.primary_dimension = row.primary_dimension
+
+        FOREACH (_ IN CASE WHEN npc IS NOT NULL THEN [1] ELSE [] END |
+            MERGE (npc)-[:EVALUATED_BY]->(r)
+        )
+        FOREACH (_ IN CASE WHEN ch IS NOT NULL THEN [1] ELSE [] END |
+            MERGE (ch)-[:EVALUATED_BY]->(r)
+        )
+        FOREACH (_ IN CASE WHEN d IS NOT NULL THEN [1] ELSE [] END |
+            MERGE (d)-[:EVALUATED_BY]->(r)
+        )
+        FOREACH (_ IN CASE WHEN e IS NOT NULL THEN [1] ELSE [] END |
+            MERGE (e)-[:EVALUATED_BY]->(r)
+        )
+        RETURN DISTINCT row.rubric_id AS rubric_id
+    """),
+]
+
+ELEMENT_RESOURCE_STATEMENTS: List[Tuple[str, str]] = [
+    ("discovery_knowledge", """
+        UNWIND $rows AS row
+        MATCH (d:Discovery {id: row.source_id})
+        MATCH (k:Knowledge {id: row.target_id})
+        MERGE (d)-[:REVEALS {
+            created_at: datetime(),
+            source: 'element_generation'
+        }]->(k)
+    """),
+    ("discovery_items", """
+        UNWIND $rows AS row
+        MATCH (d:Discovery {id: row.source_id})
+        MATCH (i:Item {id: row.target_id})
+        MERGE (d)-[:CONTAINS {
+            created_at: datetime(),
+            source: 'element_generation'
+        }]->(i)
+    """),
+    ("challenge_knowledge", """
+        UNWIND $rows AS row
+        MATCH (c:Challenge {id: row.source_id})
+        MATCH (k:Knowledge {id: row.target_id})
+        MERGE (c)-[:REWARDS {
+            on_success: true,
+            created_at: datetime(),
+            source: 'element_generation'
+        }]->(k)
+    """),
+    ("challenge_items", """
+        UNWIND $rows AS row
+        MATCH (c:Challenge {id: row.source_id})
+        MATCH (i:Item {id: row.target_id})
+        MERGE (c)-[:REWARDS {
+            on_success: true,
+            created_at: datetime(),
+            source: 'element_generation'
+        }]->(i)
+    """),
+    ("npc_knowledge", """
+        UNWIND $rows AS row
+        MATCH (n:NPC {id: row.source_id})
+        MATCH (k:Knowledge {id: row.target_id})
+        MERGE (n)-[:TEACHES {
+            created_at: datetime(),
+            source: 'element_generation'
+        }]->(k)
+    """),
+    ("npc_items", """
+        UNWIND $rows AS row
+        MATCH (n:NPC {id: row.source_id})
+        MATCH (i:Item {id: row.target_id})
+        MERGE (n)-[:GIVES {
+            created_at: datetime(),
+            source: 'element_generation'
+        }]->(i)
+    """),
+    ("scene_resource_ids", """
+        UNWIND $rows AS row
+        MATCH (s:Scene {id: row.scene_id})
+        SET s.knowledge_ids = row.knowledge_ids,
+            s.item_ids = row.item_ids
+    """),
+]
+
+
+def _role_str(npc: Dict[str, Any]) -> str:
+    """NPC role as a string (roles come as either a dict or a plain value)"""
+    npc_role = npc["role"]
+    if isinstance(npc_role, dict):
+        return npc_role.get("type", str(npc_role))
+    return str(npc_role)
+
+
+def build_campaign_graph_rows(state: CampaignWorkflowState, campaign_id: str) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Build the UNWIND parameter lists for CAMPAIGN_GRAPH_STATEMENTS
+
+    Returns:
+        statement name -> list of row dicts (statements without rows are omitted)
+    """
+    rows: Dict[str, List[Dict[str, Any]]] = {name: [] for name, _ in CAMPAIGN_GRAPH_STATEMENTS}
+    world_id = state["world_id"]
+    request_id = state["request_id"]
+
+    rows["campaign"].append({
+        "campaign_id": campaign_id,
+        "campaign_name": state["campaign_core"]["name"],
+        "status": "active",
+        "created_at": state["created_at"]
+    })
+
+    # Character participates in Campaign (optional - only if character_id exists)
+    if state.get("character_id"):
+        rows["character_campaign"].append({"character_id": state["character_id"], "campaign_id": campaign_id})
+
+    rows["campaign_world_region"].append({
+        "campaign_id": campaign_id,
+        "world_id": world_id,
+        "region_id": state["region_id"]
+    })
+
+    # Group places/scenes by parent once instead of rescanning per quest/place
+    places_by_quest: Dict[str, List[Dict[str, Any]]] = {}
+    for place in state["places"]:
+        places_by_quest.setdefault(place.get("parent_quest_id"), []).append(place)
+    scenes_by_place: Dict[str, List[Dict[str, Any]]] = {}
+    for scene in state["scenes"]:
+        scenes_by_place.setdefault(scene.get("parent_place_id"), []).append(scene)
+    npcs_by_id: Dict[str, Dict[str, Any]] = {}
+    for npc in state.get("npcs", []):
+        npcs_by_id.setdefault(npc.get("npc_id"), npc)
+
+    # Use same ID generation as MongoDB (flat counters, not nested indices)
+    global_place_counter = 0
+    global_scene_counter = 0
+    scene_id_map: Dict[str, str] = {}  # internal scene_id -> persisted scene_id
+
+    for quest_idx, quest in enumerate(state["quests"]):
+        quest_id = quest.get("quest_id", f"quest_{request_id}_{quest_idx}")
+        quest_location_name = quest.get("level_1_location_name", "Unknown Location")
+
+        rows["quests"].append({
+            "campaign_id": campaign_id,
+            "region_id": state["region_id"],
+            "world_id": world_id,
+            "quest_id": quest_id,
+            "quest_name": quest["name"],
+            "order_sequence": quest["order_sequence"],
+            "difficulty": quest.get("difficulty_level", "Medium"),
+            "duration": quest.get("estimated_duration_minutes", 0),
+            "location_id": quest["level_1_location_id"],
+            "location_name": quest_location_name
+        })
+
+        for place in places_by_quest.get(quest.get("quest_id", ""), []):
+            place_id = place.get("place_id", f"place_{request_id}_{global_place_counter}")
+            global_place_counter += 1
+            place_location_name = place.get("level_2_location_name", "Unknown Location")
+
+            rows["places"].append({
+                "quest_id": quest_id,
+                "world_id": world_id,
+                "campaign_id": campaign_id,
+                "place_id": place_id,
+                "place_name": place["name"],
+                "order_sequence": place.get("order_sequence", 0),
+                "location_id": place["level_2_location_id"],
+                "location_name": place_location_name,
+                "parent_location_id": quest["level_1_location_id"],
+                "parent_location_name": quest_location_name
+            })
+
+            for scene in scenes_by_place.get(place.get("place_id", ""), []):
+                scene_id = scene.get("scene_id", f"scene_{request_id}_{global_scene_counter}")
+                global_scene_counter += 1
+                if scene.get("scene_id"):
+                    scene_id_map[scene["scene_id"]] = scene["scene_id"]
+
+                rows["scenes"].append({
+                    "place_id": place_id,
+                    "world_id": world_id,
+                    "campaign_id": campaign_id,
+                    "scene_id": scene_id,
+                    "mongodb_id": scene_id,  # MongoDB _id is same as scene_id
+                    "scene_name": scene["name"],
+                    "order_sequence": scene.get("order_sequence", 0),
+                    "location_id": scene["level_3_location_id"],
+                    "location_name": scene.get("level_3_location_name", "Unknown Location"),
+                    "parent_location_id": place["level_2_location_id"],
+                    "parent_location_name": place_location_name
+                })
+
+                # Link NPCs to this scene with full NPC data
+                for npc_id in scene.get("npc_ids", []):
+                    if not npc_id or npc_id == "None":
+                        continue
+                    npc_data = npcs_by_id.get(npc_id)
+                    if npc_data:
+                        rows["scene_npcs"].append({
+                            "scene_id": scene_id,
+                            "npc_id": npc_id,
+                            "mongodb_id": npc_id,  # MongoDB _id is same as npc_id
+                            "npc_name": npc_data.get("name", "Unknown NPC"),
+                            "role": _role_str(npc_data),
+                            "description": npc_data.get("backstory", f"A {npc_data.get('species_name', 'character')} in this location."),
+                            "species_id": npc_data.get("species_id", ""),
+                            "species_name": npc_data.get("species_name", ""),
+                            "campaign_id": campaign_id
+                        })
+                    else:
+                        # Fallback: create NPC node with just ID (should not happen)
+                        logger.warning(f"NPC {npc_id} not found in state, creating with minimal data")
+                        rows["scene_npcs_minimal"].append({
+                            "scene_id": scene_id,
+                            "npc_id": npc_id,
+                            "mongodb_id": npc_id
+                        })
+
+    # NPCs relationships with species and locations
+    for npc in state["npcs"]:
+        npc_id = npc.get("npc_id")
+        if not npc_id:
+            # Fallback if somehow missing
+            npc_id = f"npc_{request_id}_{npc['name'].replace(' ', '_').lower()}"
+        role_str = _role_str(npc)
+
+        # Skip if species_id or location_id is empty
+        if not npc["species_id"] or not npc["level_3_location_id"]:
+            logger.warning(f"Skipping Neo4j relationships for NPC {npc_id} - missing species_id or location_id")
+            continue
+
+        # Ensure backstory/description is not empty
+        backstory = npc.get("backstory", "").strip()
+        if not backstory:
+            backstory = f"A {npc.get('species_name', 'character')} {role_str} whose story is connected to {npc.get('level_3_location_name', 'this location')}."
+
+        rows["npcs"].append({
+            "world_id": world_id,
+            "npc_id": npc_id,
+            "mongodb_id": npc_id,  # MongoDB _id is same as npc_id
+            "npc_name": npc["name"],
+            "role": role_str,
+            "description": backstory,
+            "campaign_id": campaign_id,
+            "species_id": npc["species_id"],
+            "species_name": npc.get("species_name", "Unknown Species"),
+            "location_id": npc["level_3_location_id"],
+            "location_name": npc.get("level_3_location_name", "Unknown Location")
+        })
+
+    # Knowledge Entities - nodes, scene links and acquisition links
+    for knowledge in state.get("knowledge_entities", []):
+        knowledge_id = knowledge.get("knowledge_id")
+        if not knowledge_id:
+            continue
+
+        rows["knowledge"].append({
+            "knowledge_id": knowledge_id,
+            "campaign_id": campaign_id,
+            "mongodb_id": knowledge_id,  # MongoDB _id is same as knowledge_id
+            "name": knowledge.get("name", "Unknown Knowledge"),
+            "knowledge_type": knowledge.get("knowledge_type", "skill"),
+            "primary_dimension": knowledge.get("primary_dimension", "intellectual"),
+            "bloom_level_target": knowledge.get("bloom_level_target", 3),
+            "description": knowledge.get("description", "")[:500],  # Truncate for Neo4j
+            "supports_objectives": knowledge.get("supports_objectives", [])  # Required for objective linking
+        })
+
+        if knowledge.get("scene_id") in scene_id_map:
+            rows["knowledge_scenes"].append({
+                "scene_id": scene_id_map[knowledge["scene_id"]],
+                "knowledge_id": knowledge_id
+            })
+
+        for acq_method in knowledge.get("acquisition_methods", []):
+            if acq_method.get("entity_id"):
+                rows["knowledge_acquisition"].append({
+                    "knowledge_id": knowledge_id,
+                    "entity_id": acq_method["entity_id"]
+                })
+
+    # Items - skip items without ids or names (incomplete data would leave orphaned items)
+    for item in state.get("item_entities", []):
+        item_id = item.get("item_id")
+        if not item_id:
+            logger.warning("Item missing item_id, skipping")
+            continue
+        if not item.get("name"):
+            logger.warning(f"Item {item_id} missing name - SKIPPING to prevent orphaned item")
+            continue
+
+        rows["items"].append({
+            "item_id": item_id,
+            "campaign_id": campaign_id,
+            "mongodb_id": item_id,  # MongoDB _id is same as item_id
+            "name": item.get("name", "Unknown Item"),
+            "item_type": item.get("item_type", "tool"),
+            "is_quest_critical": item.get("is_quest_critical", False),
+            "description": item.get("description", "")[:500]  # Truncate for Neo4j
+        })
+
+        if item.get("scene_id") in scene_id_map:
+            rows["item_scenes"].append({
+                "scene_id": scene_id_map[item["scene_id"]],
+                "item_id": item_id
+            })
+
+        for acq_method in item.get("acquisition_methods", []):
+            if acq_method.get("entity_id"):
+                rows["item_acquisition"].append({
+                    "item_id": item_id,
+                    "entity_id": acq_method["entity_id"]
+                })
+
+    for idx, challenge in enumerate(state.get("challenges", [])):
+        challenge_id = challenge.get("challenge_id", f"challenge_{request_id}_{idx}")
+        rows["challenges"].append({
+            "challenge_id": challenge_id,
+            "campaign_id": campaign_id,
+            "mongodb_id": challenge_id,  # MongoDB _id is same as challenge_id
+            "name": challenge.get("name", "Unknown Challenge"),
+            "challenge_type": challenge.get("challenge_type", "combat"),
+            "difficulty": challenge.get("difficulty", "Medium"),
+            "blooms_level": challenge.get("blooms_level", 3),
+            "description": challenge.get("description", "")[:500]
+        })
+        if challenge.get("scene_id") in scene_id_map:
+            rows["challenge_scenes"].append({
+                "scene_id": scene_id_map[challenge["scene_id"]],
+                "challenge_id": challenge_id
+            })
+
+    for idx, discovery in enumerate(state.get("discoveries", [])):
+        discovery_id = discovery.get("discovery_id", f"discovery_{request_id}_{idx}")
+        rows["discoveries"].append({
+            "discovery_id": discovery_id,
+            "campaign_id": campaign_id,
+            "mongodb_id": discovery_id,  # MongoDB _id is same as discovery_id
+            "name": discovery.get("name", "Unknown Discovery"),
+            "knowledge_type": discovery.get("knowledge_type", "lore"),
+            "blooms_level": discovery.get("blooms_level", 2),
+            "description": discovery.get("description", "")[:500]
+        })
+        if discovery.get("scene_id") in scene_id_map:
+            rows["discovery_scenes"].append({
+                "scene_id": scene_id_map[discovery["scene_id"]],
+                "discovery_id": discovery_id
+            })
+
+    for idx, event in enumerate(state.get("events", [])):
+        event_id = event.get("event_id", f"event_{request_id}_{idx}")
+        rows["events"].append({
+            "event_id": event_id,
+            "campaign_id": campaign_id,
+            "mongodb_id": event_id,  # MongoDB _id is same as event_id
+            "name": event.get("name", "Unknown Event"),
+            "event_type": event.get("event_type", "story"),
+            "description": event.get("description", "")[:500]
+        })
+        if event.get("scene_id") in scene_id_map:
+            rows["event_scenes"].append({
+                "scene_id": scene_id_map[event["scene_id"]],
+                "event_id": event_id
+            })
+
+    for rubric in state.get("rubrics", []):
+        rubric_id = rubric.get("rubric_id")
+        if not rubric_id:
+            logger.warning("Rubric missing rubric_id, skipping")
+            continue
+        if not rubric.get("entity_id"):
+            logger.warning(f"Rubric {rubric_id} ({rubric.get('interaction_name', 'unknown')}) missing entity_id - SKIPPING to prevent orphaned rubric")
+            continue
+
+        rows["rubrics"].append({
+            "rubric_id": rubric_id,
+            "entity_id": rubric["entity_id"],
+            "campaign_id": campaign_id,
+            "rubric_type": rubric.get("rubric_type", "evaluation"),
+            "interaction_name": rubric.get("interaction_name", "Unknown Interaction"),
+            "primary_dimension": rubric.get("primary_dimension", "intellectual")
+        })
+
+    return {name: batch for name, batch in rows.items() if batch}
+
+
+def build_element_resource_rows(state: CampaignWorkflowState) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Build the UNWIND parameter lists for ELEMENT_RESOURCE_STATEMENTS
+    (provides_knowledge_ids / provides_item_ids on discoveries, challenges and NPCs,
+    plus the knowledge_ids / item_ids arrays shown on Scene nodes)
+    """
+    rows: Dict[str, List[Dict[str, Any]]] = {name: [] for name, _ in ELEMENT_RESOURCE_STATEMENTS}
+    scene_knowledge: Dict[str, set] = {}
+    scene_items: Dict[str, set] = {}
+    npc_knowledge: Dict[str, set] = {}
+    npc_items: Dict[str, set] = {}
+
+    sources = [
+        ("discovery", "discovery_id", state.get("discoveries", [])),
+        ("challenge", "challenge_id", state.get("challenges", [])),
+        ("npc", "npc_id", state.get("npcs", []))
+    ]
+    for prefix, id_key, elements in sources:
+        for element in elements:
+            knowledge_ids = element.get("provides_knowledge_ids", [])
+            item_ids = element.get("provides_item_ids", [])
+
+            # Scene arrays include elements even when they have no id of their own
+            if prefix == "npc":
+                npc_knowledge.setdefault(element.get("npc_id"), set()).update(knowledge_ids)
+                npc_items.setdefault(element.get("npc_id"), set()).update(item_ids)
+            elif element.get("scene_id"):
+                scene_knowledge.setdefault(element["scene_id"], set()).update(knowledge_ids)
+                scene_items.setdefault(element["scene_id"], set()).update(item_ids)
+
+            source_id = element.get(id_key)
+            if not source_id:
+                continue
+            rows[f"{prefix}_knowledge"].extend({"source_id": source_id, "target_id": kg_id} for kg_id in knowledge_ids)
+            rows[f"{prefix}_items"].extend({"source_id": source_id, "target_id": item_id} for item_id in item_ids)
+
+    for scene in state.get("scenes", []):
+        scene_id = scene.get("scene_id")
+        if not scene_id:
+            continue
+        knowledge_ids = set(scene_knowledge.get(scene_id, ()))
+        item_ids = set(scene_items.get(scene_id, ()))
+        for npc_id in scene.get("npc_ids", []):
+            knowledge_ids.update(npc_knowledge.get(npc_id, ()))
+            item_ids.update(npc_items.get(npc_id, ()))
+        rows["scene_resource_ids"].append({
+            "scene_id": scene_id,
+            "knowledge_ids": list(knowledge_ids),
+            "item_ids": list(item_ids)
+        })
+
+    return {name: batch for name, batch in rows.items() if batch}
+
+
+def write_graph_rows(
+    driver: Driver,
+    statements: List[Tuple[str, str]],
+    rows: Dict[str, List[Dict[str, Any]]],
+    batch_size: int = NEO4J_UNWIND_BATCH_SIZE
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run each statement once per batch of its rows inside one explicit transaction.
+    The transaction is rolled back (and the error re-raised) if any statement fails.
+
+    Returns:
+        statement name -> {"rows", "nodes_created", "relationships_created",
+        "properties_set", "returned"} for every statement that had rows
+    """
+    stats: Dict[str, Dict[str, Any]] = {}
+
+    with driver.session() as session:
+        with session.begin_transaction() as tx:
+            for name, query in statements:
+                batch_rows = rows.get(name)
+                if not batch_rows:
+                    continue
+
+                type_stats = stats[name] = {
+                    "rows": len(batch_rows),
+                    "nodes_created": 0,
+                    "relationships_created": 0,
+                    "properties_set": 0,
+                    "returned": []
+                }
+                for start in range(0, len(batch_rows), batch_size):
+                    try:
+                        result = tx.run(query, rows=batch_rows[start:start + batch_size])
+                        type_stats["returned"].extend(record.value() for record in result)
+                        counters = result.consume().counters
+                    except Exception as e:
+                        logger.error(f"Bulk Neo4j write '{name}' failed ({len(batch_rows)} rows): {str(e)}")
+                        raise
+                    type_stats["nodes_created"] += counters.nodes_created
+                    type_stats["relationships_created"] += counters.relationships_created
+                    type_stats["properties_set"] += counters.properties_set
+
+            tx.commit()
+
+    return stats
+
+
+def log_write_stats(label: str, stats: Dict[str, Dict[str, Any]]) -> None:
+    """Log one line per statement with its row and counter totals"""
+    for name, type_stats in stats.items():
+        logger.info(
+            f"  {label} {name}: {type_stats['rows']} rows, "
+            f"{type_stats['nodes_created']} nodes, "
+            f"{type_stats['relationships_created']} relationships, "
+            f"{type_stats['properties_set']} properties"
+        )
@@ -3,17 +3,18 @@ Scene Element Generation Nodes
 Phase 7: Generate NPCs, discoveries, events, challenges for scenes
 """
 import os
+import asyncio
 import logging
 import json
 import uuid
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from langchain_anthropic import ChatAnthropic
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
 
 from .state import CampaignWorkflowState, NPCData, DiscoveryData, EventData, ChallengeData, KnowledgeData, ItemData
-from .utils import extract_json_from_llm_response,  add_audit_entry, publish_progress, create_checkpoint, get_blooms_level_description
+from .utils import extract_json_from_llm_response,  add_audit_entry, publish_progress, mark_state_dirty, create_checkpoint, get_blooms_level_description
 from .subgraph_npc import create_npc_subgraph
 from .objective_system import map_knowledge_to_scenes, map_items_to_scenes
 from .rubric_engine import generate_rubric_for_interaction
@@ -90,6 +91,120 @@ anthropic_client = ChatAnthropic(
 # Create NPC subgraph instance
 npc_subgraph = create_npc_subgraph()
 
+# Max concurrent LLM-backed generation calls (size to the Anthropic rate limit)
+ELEMENT_GEN_MAX_CONCURRENCY = int(os.getenv('ELEMENT_GEN_MAX_CONCURRENCY', '4'))
+
+
+async def _run_limited(semaphore: asyncio.Semaphore, func, *args):
+    """Run one generation call while holding an LLM concurrency slot"""
+    async with semaphore:
+        return await func(*args)
+
+
+async def _generate_scene_npcs(
+    scene: dict,
+    state: CampaignWorkflowState,
+    needs_task: asyncio.Task,
+    previous_npcs_task: Optional[asyncio.Task],
+    initial_npc_names: List[str],
+    semaphore: asyncio.Semaphore
+) -> Tuple[List[Tuple[Any, dict]], List[str]]:
+    """
+    Generate a scene's NPCs after every earlier scene's NPCs are done.
+
+    NPCs are chained in scene order so each one sees exactly the names a
+    sequential run would have passed as existing_npc_names.
+
+    Returns:
+        ([(npc_role, subgraph result state), ...], NPC names so far)
+    """
+    elements_needed = await needs_task
+    if previous_npcs_task is not None:
+        _, npc_names = await previous_npcs_task
+        npc_names = list(npc_names)
+    else:
+        npc_names = list(initial_npc_names)
+
+    results = []
+    for npc_role in elements_needed.get("npcs", []):
+        npc_state = {
+            "npc_role": npc_role,
+            "narrative_context": scene["description"],
+            "location_name": scene["level_3_location_name"],
+            "level_3_location_id": scene["level_3_location_id"],
+            "world_id": state["world_id"],
+            "region_id": state["region_id"],
+            "region_name": state["region_name"],
+            "region_data": state.get("region_data", {}),  # Pass region inhabitants
+            "existing_npc_names": list(npc_names),  # Pass existing names to avoid duplicates
+            "errors": [],
+            "rubrics": []  # Initialize rubrics list for subgraph
+        }
+
+        # Run NPC subgraph
+        result_state = await _run_limited(semaphore, npc_subgraph.ainvoke, npc_state)
+        results.append((npc_role, result_state))
+        if "npc" in result_state:
+            npc_names.append(result_state["npc"]["name"])
+
+    return results, npc_names
+
+
+async def _generate_scene_static_elements(
+    scene: dict,
+    state: CampaignWorkflowState,
+    needs_task: asyncio.Task,
+    semaphore: asyncio.Semaphore
+) -> Tuple[
+    List[Tuple[DiscoveryData, Optional[dict]]],
+    List[Tuple[EventData, Optional[dict]]],
+    List[Tuple[ChallengeData, Optional[dict]]]
+]:
+    """
+    Generate a scene's discoveries, events and challenges concurrently (results keep spec order)
+
+    Each result is an (element, rubric) pair; nothing is written to state here,
+    so rubrics are only stored when the scene is committed, in scene order.
+    """
+    elements_needed = await needs_task
+
+    discovery_specs = elements_needed.get("discoveries", [])
+    event_specs = elements_needed.get("events", [])
+    challenge_specs = elements_needed.get("challenges", [])
+
+    results = await asyncio.gather(
+        *[_run_limited(semaphore, generate_discovery, spec, scene, state) for spec in discovery_specs],
+        *[_run_limited(semaphore, generate_event, spec, scene, state) for spec in event_specs],
+        *[_run_limited(semaphore, generate_challenge, spec, scene, state) for spec in challenge_specs]
+    )
+
+    num_discoveries = len(discovery_specs)
+    num_events = len(event_specs)
+    return (
+        list(results[:num_discoveries]),
+        list(results[num_discoveries:num_discoveries + num_events]),
+        list(results[num_discoveries + num_events:])
+    )
+
+
+def _add_rubric(state: CampaignWorkflowState, rubric: Optional[dict], kind: str, name: str) -> None:
+    """Store a generated element's rubric unless one exists for the same interaction"""
+    if rubric is None:
+        return
+
+    # Check for duplicate rubrics (by interaction_name + rubric_type)
+    dedup_key = f"{rubric.get('rubric_type')}:{rubric.get('interaction_name')}"
+    existing_keys = [
+        f"{r.get('rubric_type')}:{r.get('interaction_name')}"
+        for r in state["rubrics"]
+    ]
+
+    if dedup_key not in existing_keys:
+        state["rubrics"].append(rubric)
+        logger.info(f"Generated rubric for {kind}: {name}")
+    else:
+        logger.warning(f"Skipping duplicate rubric: {name} (interaction already exists)")
+
 
 async def auto_assign_orphans_to_scenes(
     state: CampaignWorkflowState,
@@ -408,9 +523,9 @@ async def generate_scene_elements_node(state: CampaignWorkflowState) -> Campaign
         knowledge_tracker = {}  # knowledge_name -> {scenes, acquisition_methods, dimension}
         item_tracker = {}  # item_name -> {scenes, acquisition_methods}
 
-        # Generate elements for each scene (starting from resume point)
-        for scene_idx, scene in enumerate(state["scenes"][start_scene_idx:], start=start_scene_idx):
-            # Ensure scene has all required list fields initialized (defensive programming)
+        # Ensure scenes have all required list fields initialized (defensive programming)
+        scenes_to_generate = list(enumerate(state["scenes"][start_scene_idx:], start=start_scene_idx))
+        for _, scene in scenes_to_generate:
             if "npc_ids" not in scene or scene["npc_ids"] is None:
                 scene["npc_ids"] = []
             if "discovery_ids" not in scene or scene["discovery_ids"] is None:
@@ -420,109 +535,135 @@ async def generate_scene_elements_node(state: CampaignWorkflowState) -> Campaign
             if "challenge_ids" not in scene or scene["challenge_ids"] is None:
                 scene["challenge_ids"] = []
 
-            # FIX: Save current scene index BEFORE processing (for resume on error)
-            state["element_gen_start_scene"] = scene_idx
-
-            # Update progress for each scene (95% to 98% range)
-            scene_progress = 95 + int((scene_idx / total_scenes) * 3)  # 95% to 98%
-            state["progress_percentage"] = scene_progress
-
-            # Update step progress based on scene completion
-            state["step_progress"] = int(((scene_idx + 1) / total_scenes) * 100)  # 0-100% within this phase
-
-            state["status_message"] = f"Generating elements for scene {scene_idx + 1} of {total_scenes}..."
-            await publish_progress(state, f"Scene: {scene['name']}")
-
-            logger.info(f"Generating elements for scene {scene_idx + 1}/{total_scenes}: {scene['name']}")
-
-            # Step 1: Determine what elements this scene needs
-            elements_needed = await determine_scene_elements(scene, state)
-            logger.info(f"DEBUG: elements_needed = {json.dumps(elements_needed, indent=2)[:500]}")
-
-            # Step 2: Generate NPCs using subgraph
-            for npc_role in elements_needed.get("npcs", []):
-                # Collect existing NPC names to avoid duplicates
-                existing_npc_names = [npc["name"] for npc in all_npcs]
-
-                npc_state = {
-                    "npc_role": npc_role,
-                    "narrative_context": scene["description"],
-                    "location_name": scene["level_3_location_name"],
-                    "level_3_location_id": scene["level_3_location_id"],
-                    "world_id": state["world_id"],
-                    "region_id": state["region_id"],
-                    "region_name": state["region_name"],
-                    "region_data": state.get("region_data", {}),  # Pass region inhabitants
-                    "existing_npc_names": existing_npc_names,  # Pass existing names to avoid duplicates
-                    "errors": [],
-                    "rubrics": []  # Initialize rubrics list for subgraph
-                }
-
-                # Run NPC subgraph
-                result_state = await npc_subgraph.ainvoke(npc_state)
-
-                if "npc" in result_state:
-                    npc = result_state["npc"]
-                    all_npcs.append(npc)
-                    npc_id = npc.get("npc_id", "")
-                    scene["npc_ids"].append(npc_id)
-
-                    # Track knowledge/items provided by this NPC
-                    if isinstance(npc_role, dict):
-                        _track_knowledge_from_spec(npc_role, npc_id, "npc_conversation", scene, knowledge_tracker)
-                        _track_items_from_spec(npc_role, npc_id, "npc_conversation", scene, item_tracker)
-
-                    # Add NPC rubric to main state if generated
-                    if "npc_rubric" in result_state:
-                        if "rubrics" not in state:
-                            state["rubrics"] = []
-                        state["rubrics"].append(result_state["npc_rubric"])
-                        logger.info(f"Added rubric for NPC: {npc['name']}")
-
-                    # Track new species if created
-                    if result_state.get("new_species_created", False):
-                        species_id = result_state.get("species_id", "")
-                        if species_id not in state["new_species_ids"]:
-                            state["new_species_ids"].append(species_id)
-
-            # Step 3: Generate discoveries
-            for discovery_spec in elements_needed.get("discoveries", []):
-                discovery = await generate_discovery(discovery_spec, scene, state)
-                all_discoveries.append(discovery)
-                discovery_id = discovery.get("discovery_id", "")
-                scene["discovery_ids"].append(discovery_id)
-
-                # DEBUG: Log what we're tracking (from the generated discovery entity)
-                logger.info(f"DEBUG: Discovery provides_knowledge_ids={discovery.get('provides_knowledge_ids', [])}, provides_item_ids={discovery.get('provides_item_ids', [])}")
-
-                # Track knowledge/items from discovery entity
-                _track_knowledge_from_spec(discovery, discovery_id, "environmental_discovery", scene, knowledge_tracker)
-                _track_items_from_spec(discovery, discovery_id, "environmental_discovery", scene, item_tracker)
-
-            # Step 4: Generate events
-            for event_spec in elements_needed.get("events", []):
-                event = await generate_event(event_spec, scene, state)
-                all_events.append(event)
-                event_id = event.get("event_id", "")
-                scene["event_ids"].append(event_id)
-
-                # Track knowledge/items from event
-                _track_knowledge_from_spec(event_spec, event_id, "dynamic_event", scene, knowledge_tracker)
-                _track_items_from_spec(event_spec, event_id, "dynamic_event", scene, item_tracker)
-
-            # Step 5: Generate challenges
-            for challenge_spec in elements_needed.get("challenges", []):
-                challenge = await generate_challenge(challenge_spec, scene, state)
-                all_challenges.append(challenge)
-                challenge_id = challenge.get("challenge_id", "")
-                scene["challenge_ids"].append(challenge_id)
-
-                # DEBUG: Log what we're tracking (from the generated challenge entity)
-                logger.info(f"DEBUG: Challenge provides_knowledge_ids={challenge.get('provides_knowledge_ids', [])}, provides_item_ids={challenge.get('provides_item_ids', [])}")
-
-                # Track knowledge/items from challenge entity
-                _track_knowledge_from_spec(challenge, challenge_id, "challenge", scene, knowledge_tracker)
-                _track_items_from_spec(challenge, challenge_id, "challenge", scene, item_tracker)
+        # Generate all scenes concurrently, bounded by the LLM concurrency limit:
+        # - Step 1 (determine elements) runs per scene
+        # - Steps 3-5 (discoveries/events/challenges) run concurrently within and across scenes
+        # - Step 2 (NPCs) is chained in scene order so name deduplication stays deterministic
+        # Results are committed strictly in scene order below, so a failure leaves
+        # every earlier scene committed and element_gen_start_scene at the failed one.
+        semaphore = asyncio.Semaphore(ELEMENT_GEN_MAX_CONCURRENCY)
+        logger.info(f"Element generation concurrency: {ELEMENT_GEN_MAX_CONCURRENCY} concurrent LLM calls")
+
+        needs_tasks: Dict[int, asyncio.Task] = {}
+        npc_tasks: Dict[int, asyncio.Task] = {}
+        static_tasks: Dict[int, asyncio.Task] = {}
+        previous_npcs_task = None
+        initial_npc_names = [npc["name"] for npc in all_npcs]
+
+        for scene_idx, scene in scenes_to_generate:
+            needs_tasks[scene_idx] = asyncio.create_task(
+                _run_limited(semaphore, determine_scene_elements, scene, state)
+            )
+            npc_tasks[scene_idx] = asyncio.create_task(
+                _generate_scene_npcs(scene, state, needs_tasks[scene_idx], previous_npcs_task, initial_npc_names, semaphore)
+            )
+            static_tasks[scene_idx] = asyncio.create_task(
+                _generate_scene_static_elements(scene, state, needs_tasks[scene_idx], semaphore)
+            )
+            previous_npcs_task = npc_tasks[scene_idx]
+
+        all_tasks = [*needs_tasks.values(), *npc_tasks.values(), *static_tasks.values()]
+
+        try:
+            # Commit each scene's elements in order (starting from resume point)
+            for scene_idx, scene in scenes_to_generate:
+                # FIX: Save current scene index BEFORE committing (for resume on error)
+                state["element_gen_start_scene"] = scene_idx
+
+                elements_needed = await needs_tasks[scene_idx]
+                logger.info(f"DEBUG: elements_needed = {json.dumps(elements_needed, indent=2)[:500]}")
+
+                npc_results, _ = await npc_tasks[scene_idx]
+                discoveries, events, challenges = await static_tasks[scene_idx]
+
+                logger.info(f"Generated elements for scene {scene_idx + 1}/{total_scenes}: {scene['name']}")
+
+                # Step 2: NPCs
+                for npc_role, result_state in npc_results:
+                    if "npc" in result_state:
+                        npc = result_state["npc"]
+                        all_npcs.append(npc)
+                        npc_id = npc.get("npc_id", "")
+                        scene["npc_ids"].append(npc_id)
+
+                        # Track knowledge/items provided by this NPC
+                        if isinstance(npc_role, dict):
+                            _track_knowledge_from_spec(npc_role, npc_id, "npc_conversation", scene, knowledge_tracker)
+                            _track_items_from_spec(npc_role, npc_id, "npc_conversation", scene, item_tracker)
+
+                        # Add NPC rubric to main state if generated
+                        if "npc_rubric" in result_state:
+                            if "rubrics" not in state:
+                                state["rubrics"] = []
+                            state["rubrics"].append(result_state["npc_rubric"])
+                            logger.info(f"Added rubric for NPC: {npc['name']}")
+
+                        # Track new species if created
+                        if result_state.get("new_species_created", False):
+                            species_id = result_state.get("species_id", "")
+                            if species_id not in state["new_species_ids"]:
+                                state["new_species_ids"].append(species_id)
+
+                # Step 3: Discoveries
+                for discovery, _ in discoveries:
+                    all_discoveries.append(discovery)
+                    discovery_id = discovery.get("discovery_id", "")
+                    scene["discovery_ids"].append(discovery_id)
+
+                    # DEBUG: Log what we're tracking (from the generated discovery entity)
+                    logger.info(f"DEBUG: Discovery provides_knowledge_ids={discovery.get('provides_knowledge_ids', [])}, provides_item_ids={discovery.get('provides_item_ids', [])}")
+
+                    # Track knowledge/items from discovery entity
+                    _track_knowledge_from_spec(discovery, discovery_id, "environmental_discovery", scene, knowledge_tracker)
+                    _track_items_from_spec(discovery, discovery_id, "environmental_discovery", scene, item_tracker)
+
+                # Step 4: Events
+                for event_spec, (event, _) in zip(elements_needed.get("events", []), events):
+                    all_events.append(event)
+                    event_id = event.get("event_id", "")
+                    scene["event_ids"].append(event_id)
+
+                    # Track knowledge/items from event
+                    _track_knowledge_from_spec(event_spec, event_id, "dynamic_event", scene, knowledge_tracker)
+                    _track_items_from_spec(event_spec, event_id, "dynamic_event", scene, item_tracker)
+
+                # Step 5: Challenges
+                for challenge, _ in challenges:
+                    all_challenges.append(challenge)
+                    challenge_id = challenge.get("challenge_id", "")
+                    scene["challenge_ids"].append(challenge_id)
+
+                    # DEBUG: Log what we're tracking (from the generated challenge entity)
+                    logger.info(f"DEBUG: Challenge provides_knowledge_ids={challenge.get('provides_knowledge_ids', [])}, provides_item_ids={challenge.get('provides_item_ids', [])}")
+
+                    # Track knowledge/items from challenge entity
+                    _track_knowledge_from_spec(challenge, challenge_id, "challenge", scene, knowledge_tracker)
+                    _track_items_from_spec(challenge, challenge_id, "challenge", scene, item_tracker)
+
+                # Rubrics of this scene's discoveries, events and challenges
+                for kind, generated in (("discovery", discoveries), ("event", events), ("challenge", challenges)):
+                    for element, rubric in generated:
+                        _add_rubric(state, rubric, kind, element["name"])
+
+                # Keep committed scenes in state so a resume after an error can skip them
+                state["npcs"] = all_npcs
+                state["discoveries"] = all_discoveries
+                state["events"] = all_events
+                state["challenges"] = all_challenges
+                state["element_gen_start_scene"] = scene_idx + 1
+                mark_state_dirty(state)
+
+                # Update progress for each scene (95% to 98% range)
+                state["progress_percentage"] = 95 + int(((scene_idx + 1) / total_scenes) * 3)
+                state["step_progress"] = int(((scene_idx + 1) / total_scenes) * 100)  # 0-100% within this phase
+                state["status_message"] = f"Generated elements for scene {scene_idx + 1} of {total_scenes}..."
+                await publish_progress(state, f"Scene: {scene['name']}")
+        finally:
+            # Stop in-flight generation if a scene failed; retrieve every outcome
+            for task in all_tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*all_tasks, return_exceptions=True)
 
         # Step 6: Merge acquisition methods into existing knowledge entities using IDs
         logger.info(f"DEBUG: knowledge_tracker has {len(knowledge_tracker)} knowledge IDs")
@@ -970,7 +1111,7 @@ Determine what elements this scene needs. Remember to create REDUNDANCY (2-3 way
     return response.model_dump()
 
 
-async def generate_discovery(spec: dict, scene: dict, state: CampaignWorkflowState) -> DiscoveryData:
+async def generate_discovery(spec: dict, scene: dict, state: CampaignWorkflowState) -> Tuple[DiscoveryData, Optional[dict]]:
     """Generate a discovery element with AI-enhanced details"""
     prompt = ChatPromptTemplate.from_messages([
         ("system", """You are a master RPG designer creating discovery elements.
@@ -1034,42 +1175,24 @@ Create a compelling discovery element with importance and usage information.""")
         "acquisition_from_whom": None
     }
 
-    # Generate rubric for this discovery
+    # Generate rubric for this discovery (stored when its scene is committed)
+    rubric = None
     try:
         rubric = get_template_for_interaction(
             "environmental_discovery",
             spec.get("type", "information"),
             {"id": discovery_id, "name": discovery["name"], "discovery_type": spec.get("type", "information")}
         )
-
-        # Only store rubric if it was successfully generated
-        if rubric is not None:
-            # Check for duplicate rubrics (by interaction_name + rubric_type)
-            if "rubrics" not in state:
-                state["rubrics"] = []
-
-            # Create dedup key
-            dedup_key = f"{rubric.get('rubric_type')}:{rubric.get('interaction_name')}"
-            existing_keys = [
-                f"{r.get('rubric_type')}:{r.get('interaction_name')}"
-                for r in state["rubrics"]
-            ]
-
-            if dedup_key not in existing_keys:
-                state["rubrics"].append(rubric)
-                logger.info(f"Generated rubric for discovery: {discovery['name']}")
-            else:
-                logger.warning(f"Skipping duplicate rubric: {discovery['name']} (interaction already exists)")
-        else:
+        if rubric is None:
             logger.warning(f"Rubric generation returned None for discovery: {discovery['name']}")
 
     except Exception as e:
         logger.error(f"Error generating rubric for discovery: {str(e)}")
 
-    return discovery
+    return discovery, rubric
 
 
-async def generate_event(spec: dict, scene: dict, state: CampaignWorkflowState) -> EventData:
+async def generate_event(spec: dict, scene: dict, state: CampaignWorkflowState) -> Tuple[EventData, Optional[dict]]:
     """Generate an event element with AI-enhanced details"""
     prompt = ChatPromptTemplate.from_messages([
         ("system", """You are a master RPG designer creating dynamic event elements.
@@ -1134,48 +1257,30 @@ Create a compelling event element with importance and usage information.""")
         "completion_from_whom": None
     }
 
-    # Generate rubric for this event
+    # Generate rubric for this event (stored when its scene is committed)
+    rubric = None
     try:
         rubric = get_template_for_interaction(
             "dynamic_event",
             spec.get("type", "scripted"),
             {"id": event_id, "name": event["name"], "event_type": spec.get("type", "scripted")}
         )
-
-        # Only store rubric if it was successfully generated
-        if rubric is not None:
-            # Check for duplicate rubrics (by interaction_name + rubric_type)
-            if "rubrics" not in state:
-                state["rubrics"] = []
-
-            # Create dedup key
-            dedup_key = f"{rubric.get('rubric_type')}:{rubric.get('interaction_name')}"
-            existing_keys = [
-                f"{r.get('rubric_type')}:{r.get('interaction_name')}"
-                for r in state["rubrics"]
-            ]
-
-            if dedup_key not in existing_keys:
-                state["rubrics"].append(rubric)
-                logger.info(f"Generated rubric for event: {event['name']}")
-            else:
-                logger.warning(f"Skipping duplicate rubric: {event['name']} (interaction already exists)")
-        else:
+        if rubric is None:
             logger.warning(f"Rubric generation returned None for event: {event['name']}")
 
     except Exception as e:
         logger.error(f"Error generating rubric for event: {str(e)}")
 
-    return event
+    return event, rubric
 
 
-async def generate_challenge(spec: dict, scene: dict, state: CampaignWorkflowState) -> ChallengeData:
+async def generate_challenge(spec: dict, scene: dict, state: CampaignWorkflowState) -> Tuple[ChallengeData, Optional[dict]]:
     """
     Generate a challenge element with AI-enhanced details.
 
     NEW (Phase 4):
     - Uses enhanced ChallengeData structure with dimensions
-    - Generates rubric for challenge evaluation
+    - Generates rubric for challenge evaluation (returned with the challenge)
     - Links knowledge/items that can be obtained
     """
     prompt = ChatPromptTemplate.from_messages([
@@ -1266,39 +1371,21 @@ Create a compelling challenge element with importance and usage information.""")
         "completion_from_whom": None
     }
 
-    # Generate rubric for this challenge
+    # Generate rubric for this challenge (stored when its scene is committed)
+    rubric = None
     try:
         rubric = get_template_for_interaction(
             "challenge",
             challenge_type,
             {"id": challenge_id, "name": challenge["name"], "difficulty": challenge["difficulty"]}
         )
-
-        # Only store rubric if it was successfully generated
-        if rubric is not None:
-            # Check for duplicate rubrics (by interaction_name + rubric_type)
-            if "rubrics" not in state:
-                state["rubrics"] = []
-
-            # Create dedup key
-            dedup_key = f"{rubric.get('rubric_type')}:{rubric.get('interaction_name')}"
-            existing_keys = [
-                f"{r.get('rubric_type')}:{r.get('interaction_name')}"
-                for r in state["rubrics"]
-            ]
-
-            if dedup_key not in existing_keys:
-                state["rubrics"].append(rubric)
-                logger.info(f"Generated rubric for challenge: {challenge['name']}")
-            else:
-                logger.warning(f"Skipping duplicate rubric: {challenge['name']} (interaction already exists)")
-        else:
+        if rubric is None:
             logger.warning(f"Rubric generation returned None for challenge: {challenge['name']}")
 
     except Exception as e:
         logger.error(f"Error generating rubric for challenge: {str(e)}")
 
-    return challenge
+    return challenge, rubric
 
 
 def _map_challenge_to_dimensions(challenge_type: str) -> tuple:
@@ -0,0 +1,192 @@
+"""
+Campaign Progress Publisher
+Publishes workflow progress over one long-lived RabbitMQ connection/channel
+and decides when the heavy Redis state snapshot needs to be rewritten.
+
+Every update refreshes the small progress fields of the Redis record the
+status API polls; the heavy fields and the full state snapshot are only
+rewritten when the phase changes, when errors or the final campaign id
+appear, or when a node marks the state dirty. AMQP updates for the same
+request arriving faster than PROGRESS_MIN_INTERVAL_MS are coalesced (the
+latest one is sent when the interval elapses).
+"""
+import os
+import json
+import time
+import asyncio
+import logging
+from typing import Dict, Any, Optional
+from datetime import datetime
+import aio_pika
+
+from .state import CampaignWorkflowState
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_MIN_INTERVAL_MS = int(os.getenv('PROGRESS_MIN_INTERVAL_MS', '500'))
+
+
+class ProgressPublisher:
+    """Shared progress publisher for all campaign workflows in this process"""
+
+    def __init__(self, min_interval_ms: int = PROGRESS_MIN_INTERVAL_MS):
+        self.min_interval = min_interval_ms / 1000
+        self._connection: Optional[aio_pika.abc.AbstractRobustConnection] = None
+        self._channel: Optional[aio_pika.abc.AbstractChannel] = None
+        self._connect_lock = asyncio.Lock()
+        # request_id -> publish/snapshot bookkeeping
+        self._requests: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def _rabbitmq_url() -> str:
+        return (
+            f"amqp://{os.getenv('RABBITMQ_USER')}:{os.getenv('RABBITMQ_PASS')}@"
+            f"{os.getenv('RABBITMQ_HOST', 'localhost')}:{os.getenv('RABBITMQ_PORT', '5672')}/"
+        )
+
+    async def _get_channel(self) -> aio_pika.abc.AbstractChannel:
+        """Open the connection and channel on first use; reopen them if closed"""
+        async with self._connect_lock:
+            if self._connection is None or self._connection.is_closed:
+                self._connection = await aio_pika.connect_robust(self._rabbitmq_url())
+                self._channel = None
+            if self._channel is None or self._channel.is_closed:
+                self._channel = await self._connection.channel()
+            return self._channel
+
+    def _tracker(self, request_id: str) -> Dict[str, Any]:
+        if request_id not in self._requests:
+            self._requests[request_id] = {
+                "snapshot_phase": None,
+                "snapshot_errors": 0,
+                "snapshot_final_id": None,
+                "dirty": False,
+                "detail": None,
+                "last_sent": 0.0,
+                "pending": None,
+                "timer": None
+            }
+        return self._requests[request_id]
+
+    def mark_dirty(self, request_id: str):
+        """Force a state snapshot on the next progress update for this request"""
+        self._tracker(request_id)["dirty"] = True
+
+    @staticmethod
+    def _needs_snapshot(state: CampaignWorkflowState, tracker: Dict[str, Any]) -> bool:
+        return (
+            tracker["dirty"]
+            or state.get("current_phase") != tracker["snapshot_phase"]
+            or len(state.get("errors", [])) != tracker["snapshot_errors"]
+            or state.get("final_campaign_id") != tracker["snapshot_final_id"]
+        )
+
+    async def publish(self, state: CampaignWorkflowState, message: str = None):
+        """
+        Publish a progress update, writing the Redis snapshot if it is due
+
+        Args:
+            state: Current workflow state
+            message: Optional custom message (uses state.status_message if None)
+        """
+        from .utils import save_campaign_state, save_campaign_progress
+
+        request_id = state["request_id"]
+        tracker = self._tracker(request_id)
+
+        snapshot = self._needs_snapshot(state, tracker)
+        if snapshot:
+            detail = await save_campaign_state(state)
+            if detail is not None:
+                tracker["detail"] = detail
+            tracker["snapshot_phase"] = state.get("current_phase")
+            tracker["snapshot_errors"] = len(state.get("errors", []))
+            tracker["snapshot_final_id"] = state.get("final_campaign_id")
+            tracker["dirty"] = False
+        elif tracker["detail"] is not None:
+            # Keep the polled status current even when the AMQP update is coalesced
+            await save_campaign_progress(state, tracker["detail"])
+
+        progress_data = {
+            "request_id": request_id,
+            "user_id": state["user_id"],
+            "phase": state["current_phase"],
+            "node": state["current_node"],
+            "progress": state["progress_percentage"],
+            "step_progress": state.get("step_progress", 0),
+            "message": message or state["status_message"],
+            "timestamp": datetime.utcnow().isoformat(),
+            "errors": list(state["errors"]),
+            "warnings": list(state["warnings"])
+        }
+
+        # Snapshots mark milestones, so they (and anything pending) go out at once
+        elapsed = time.monotonic() - tracker["last_sent"]
+        if snapshot or elapsed >= self.min_interval:
+            self._cancel_timer(tracker)
+            tracker["pending"] = None
+            await self._send(tracker, progress_data)
+            return
+
+        tracker["pending"] = progress_data
+        if tracker["timer"] is None:
+            tracker["timer"] = asyncio.create_task(
+                self._send_pending_after(request_id, self.min_interval - elapsed)
+            )
+
+    async def _send_pending_after(self, request_id: str, delay: float):
+        await asyncio.sleep(delay)
+        tracker = self._requests.get(request_id)
+        if tracker is None:
+            return
+        tracker["timer"] = None
+        progress_data, tracker["pending"] = tracker["pending"], None
+        if progress_data:
+            await self._send(tracker, progress_data)
+
+    @staticmethod
+    def _cancel_timer(tracker: Dict[str, Any]):
+        if tracker["timer"] is not None and tracker["timer"] is not asyncio.current_task():
+            tracker["timer"].cancel()
+        tracker["timer"] = None
+
+    async def _send(self, tracker: Dict[str, Any], progress_data: Dict[str, Any]):
+        tracker["last_sent"] = time.monotonic()
+        try:
+            channel = await self._get_channel()
+            await channel.default_exchange.publish(
+                aio_pika.Message(
+                    body=json.dumps(progress_data, default=str).encode(),
+                    content_type="application/json"
+                ),
+                routing_key=f"campaign.progress.{progress_data['request_id']}"
+            )
+            logger.info(f"Published progress: {progress_data['phase']} - {progress_data['progress']}%")
+        except Exception as e:
+            logger.error(f"Error publishing progress: {e}")
+            # Don't fail workflow on progress publish errors
+
+    async def finish(self, request_id: str):
+        """
+        Send any coalesced update and forget the request's bookkeeping.
+        Call once a workflow run returns (the caller saves the final state).
+        """
+        tracker = self._requests.pop(request_id, None)
+        if tracker is None:
+            return
+        self._cancel_timer(tracker)
+        if tracker["pending"]:
+            await self._send(tracker, tracker["pending"])
+
+    async def close(self):
+        """Flush pending updates and close the connection"""
+        for request_id in list(self._requests):
+            await self.finish(request_id)
+        if self._connection is not None and not self._connection.is_closed:
+            await self._connection.close()
+        self._connection = None
+        self._channel = None
+
+
+# Global progress publisher instance
+progress_publisher = ProgressPublisher()
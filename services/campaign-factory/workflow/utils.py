@@ -5,12 +5,13 @@ Progress publishing, audit trail management, checkpointing
 import os
 import json
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import aio_pika
 from redis.asyncio import Redis
 from pymongo import MongoClient
 from .state import CampaignWorkflowState, AuditEntry
+from .progress_publisher import progress_publisher
 
 logger = logging.getLogger(__name__)
 
@@ -85,16 +86,62 @@ def set_redis_client(client: Redis):
     redis_client = client
 
 
-async def save_campaign_state(state: CampaignWorkflowState):
+def _progress_summary(state: CampaignWorkflowState) -> Dict[str, Any]:
+    """Small, frequently changing fields of the campaign:progress record"""
+    return {
+        "request_id": state["request_id"],
+        "progress_percentage": state.get("progress_percentage", 0),
+        "step_progress": state.get("step_progress", 0),
+        "status_message": state.get("status_message", "Processing..."),
+        "current_phase": state.get("current_phase", "init"),
+        "current_node": state.get("current_node", ""),
+        "errors": state.get("errors", []),
+        "warnings": state.get("warnings", [])
+    }
+
+
+def _progress_detail(state: CampaignWorkflowState) -> Dict[str, Any]:
+    """Heavy campaign:progress fields, captured at state snapshots"""
+    return {
+        "story_ideas": state.get("story_ideas", []),
+        "campaign_core": state.get("campaign_core"),
+        "quests": state.get("quests", []),
+        "places": state.get("places", []),
+        "scenes": state.get("scenes", []),
+        "npcs": state.get("npcs", []),
+        "discoveries": state.get("discoveries", []),
+        "events": state.get("events", []),
+        "challenges": state.get("challenges", []),
+        "new_location_ids": state.get("new_location_ids", []),  # DEPRECATED
+        "new_locations": state.get("new_locations", []),  # Full location details
+        "final_campaign_id": state.get("final_campaign_id")
+    }
+
+
+async def _write_progress(state: CampaignWorkflowState, detail: Dict[str, Any]):
+    """Write the campaign:progress record from fresh summary fields and snapshot detail"""
+    progress_data = {**detail, **_progress_summary(state)}
+    await redis_client.setex(
+        f"campaign:progress:{state['request_id']}",
+        86400,
+        json.dumps(progress_data, default=str)
+    )
+
+
+async def save_campaign_state(state: CampaignWorkflowState) -> Optional[Dict[str, Any]]:
     """
     Save campaign workflow state to Redis for resumption
 
     Args:
         state: Campaign workflow state
+
+    Returns:
+        The progress detail written with the snapshot (pass it to
+        save_campaign_progress), or None if nothing was saved
     """
     if redis_client is None:
         logger.warning("Redis client not initialized, skipping state save")
-        return
+        return None
 
     try:
         request_id = state['request_id']
@@ -104,86 +151,64 @@ async def save_campaign_state(state: CampaignWorkflowState):
         await redis_client.setex(state_key, 86400, json.dumps(state, default=str))
 
         # Save progress data for status API
-        progress_key = f"campaign:progress:{request_id}"
-        progress_data = {
-            "request_id": request_id,
-            "progress_percentage": state.get("progress_percentage", 0),
-            "step_progress": state.get("step_progress", 0),
-            "status_message": state.get("status_message", "Processing..."),
-            "current_phase": state.get("current_phase", "init"),
-            "current_node": state.get("current_node", ""),
-            "story_ideas": state.get("story_ideas", []),
-            "campaign_core": state.get("campaign_core"),
-            "quests": state.get("quests", []),
-            "places": state.get("places", []),
-            "scenes": state.get("scenes", []),
-            "npcs": state.get("npcs", []),
-            "discoveries": state.get("discoveries", []),
-            "events": state.get("events", []),
-            "challenges": state.get("challenges", []),
-            "new_location_ids": state.get("new_location_ids", []),  # DEPRECATED
-            "new_locations": state.get("new_locations", []),  # Full location details
-            "final_campaign_id": state.get("final_campaign_id"),
-            "errors": state.get("errors", []),
-            "warnings": state.get("warnings", [])
-        }
-        await redis_client.setex(progress_key, 86400, json.dumps(progress_data, default=str))
+        detail = _progress_detail(state)
+        await _write_progress(state, detail)
 
         logger.info(f"Saved campaign state to Redis: {request_id}")
+        return detail
 
     except Exception as e:
         logger.error(f"Error saving campaign state to Redis: {e}")
+        return None
 
 
-async def publish_progress(state: CampaignWorkflowState, message: str = None):
+async def save_campaign_progress(state: CampaignWorkflowState, detail: Dict[str, Any]):
     """
-    Publish workflow progress to RabbitMQ for real-time UI updates
-    Also saves state to Redis
+    Refresh the progress fields the status API polls between state snapshots.
+    The small fields come from the current state; the heavy ones are the
+    ones captured by the last save_campaign_state call.
 
     Args:
         state: Current workflow state
-        message: Optional custom message (uses state.status_message if None)
+        detail: Value returned by the last save_campaign_state call
     """
-    try:
-        # Save state to Redis first
-        await save_campaign_state(state)
-
-        connection = await aio_pika.connect_robust(
-            f"amqp://{os.getenv('RABBITMQ_USER')}:{os.getenv('RABBITMQ_PASS')}@"
-            f"{os.getenv('RABBITMQ_HOST', 'localhost')}:{os.getenv('RABBITMQ_PORT', '5672')}/"
-        )
+    if redis_client is None:
+        return
 
-        async with connection:
-            channel = await connection.channel()
+    try:
+        await _write_progress(state, detail)
+    except Exception as e:
+        logger.error(f"Error saving campaign progress to Redis: {e}")
 
-            progress_data = {
-                "request_id": state["request_id"],
-                "user_id": state["user_id"],
-                "phase": state["current_phase"],
-                "node": state["current_node"],
-                "progress": state["progress_percentage"],
-                "step_progress": state.get("step_progress", 0),
-                "message": message or state["status_message"],
-                "timestamp": datetime.utcnow().isoformat(),
-                "errors": state["errors"],
-                "warnings": state["warnings"]
-            }
-
-            await channel.default_exchange.publish(
-                aio_pika.Message(
-                    body=json.dumps(progress_data).encode(),
-                    content_type="application/json"
-                ),
-                routing_key=f"campaign.progress.{state['request_id']}"
-            )
 
-            logger.info(f"Published progress: {state['current_phase']} - {state['progress_percentage']}%")
+async def publish_progress(state: CampaignWorkflowState, message: str = None):
+    """
+    Publish workflow progress to RabbitMQ for real-time UI updates
+    Refreshes the Redis progress record on every call and saves the full
+    state at phase boundaries or when marked dirty
 
+    Args:
+        state: Current workflow state
+        message: Optional custom message (uses state.status_message if None)
+    """
+    try:
+        await progress_publisher.publish(state, message)
     except Exception as e:
         logger.error(f"Error publishing progress: {e}")
         # Don't fail workflow on progress publish errors
 
 
+def mark_state_dirty(state: CampaignWorkflowState):
+    """
+    Make the next publish_progress call rewrite the Redis state snapshot.
+    Use after committing results a resume depends on mid-phase.
+
+    Args:
+        state: Current workflow state
+    """
+    progress_publisher.mark_dirty(state["request_id"])
+
+
 def add_audit_entry(state: CampaignWorkflowState, node: str, action: str,
                     details: Dict[str, Any], status: str = "success"):
     """
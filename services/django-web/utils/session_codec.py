@@ -0,0 +1,37 @@
+"""
+Reader for game engine session payloads
+Mirrors the wire format of the game engine's StateCodec (app/core/codec.py):
+plain JSON text, or a format byte followed by the body:
+    0x01  msgpack
+    0x02  JSON, zstd-compressed
+    0x03  msgpack, zstd-compressed
+"""
+import json
+
+import msgpack
+import zstandard
+
+FORMAT_MSGPACK = 0x01
+FORMAT_JSON_ZSTD = 0x02
+FORMAT_MSGPACK_ZSTD = 0x03
+
+_decompressor = zstandard.ZstdDecompressor()
+
+
+def decode_session_value(value):
+    """Decode a session state payload written by the game engine (None if empty)"""
+    if not value:
+        return None
+
+    header = value[0]
+    if header not in (FORMAT_MSGPACK, FORMAT_JSON_ZSTD, FORMAT_MSGPACK_ZSTD):
+        return json.loads(value)
+
+    body = value[1:]
+    if header in (FORMAT_JSON_ZSTD, FORMAT_MSGPACK_ZSTD):
+        # The engine compresses with a one-shot compressor, so the frame size is known
+        body = _decompressor.decompress(body)
+
+    if header == FORMAT_JSON_ZSTD:
+        return json.loads(body)
+    return msgpack.unpackb(body, raw=False, strict_map_key=False)
@@ -0,0 +1,114 @@
+"""
+WebSocket Connection Outbox
+Bounded per-connection send queue drained by a dedicated writer task, so a
+slow client only delays its own messages instead of the whole broadcast.
+"""
+from typing import Callable, Optional
+from fastapi import WebSocket
+import asyncio
+
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Overflow policies for a full outbox
+POLICY_DISCONNECT = "disconnect"    # Close the slow client; it resyncs state on reconnect
+POLICY_DROP_OLDEST = "drop_oldest"  # Discard the oldest queued message to make room
+
+
+class ConnectionOutbox:
+    """
+    Outbound queue and writer task for one WebSocket
+
+    Args:
+        websocket: Accepted WebSocket connection
+        max_queue_size: Messages that may wait before the overflow policy applies
+        send_timeout: Seconds a single send may take before the client is dropped
+        overflow_policy: POLICY_DISCONNECT or POLICY_DROP_OLDEST
+        on_close: Called with the websocket once the outbox shuts down
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_queue_size: int = 256,
+        send_timeout: float = 10.0,
+        overflow_policy: str = POLICY_DISCONNECT,
+        on_close: Optional[Callable[[WebSocket], None]] = None
+    ):
+        self.websocket = websocket
+        self.send_timeout = send_timeout
+        self.overflow_policy = overflow_policy
+        self.on_close = on_close
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self.dropped_messages = 0
+        self.closed = False
+        self._writer_task = asyncio.create_task(self._writer())
+
+    def enqueue(self, payload: str) -> bool:
+        """
+        Queue a serialized message without waiting
+
+        Returns:
+            False if the connection is closed (or was closed by the overflow policy)
+        """
+        if self.closed:
+            return False
+
+        try:
+            self.queue.put_nowait(payload)
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        if self.overflow_policy == POLICY_DROP_OLDEST:
+            self.queue.get_nowait()
+            self.queue.put_nowait(payload)
+            self.dropped_messages += 1
+            if self.dropped_messages == 1 or self.dropped_messages % 100 == 0:
+                logger.warning("websocket_outbox_dropping", dropped_messages=self.dropped_messages)
+            return True
+
+        logger.warning(
+            "websocket_slow_consumer_disconnected",
+            queued_messages=self.queue.qsize()
+        )
+        self.close(reason="slow consumer")
+        return False
+
+    async def _writer(self):
+        """Drain the queue in order, one send at a time"""
+        try:
+            while True:
+                payload = await self.queue.get()
+                await asyncio.wait_for(
+                    self.websocket.send_text(payload),
+                    timeout=self.send_timeout
+                )
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error("websocket_outbox_send_failed", error=str(e) or type(e).__name__)
+            self.close(reason="send failed")
+
+    def close(self, reason: Optional[str] = None):
+        """Stop the writer and close the socket (best effort)"""
+        if self.closed:
+            return
+        self.closed = True
+
+        if self._writer_task is not asyncio.current_task():
+            self._writer_task.cancel()
+
+        if reason:
+            # 1013 = try again later; the client reconnects and gets fresh state
+            asyncio.create_task(self._close_socket(code=1013, reason=reason))
+
+        if self.on_close:
+            self.on_close(self.websocket)
+
+    async def _close_socket(self, code: int, reason: str):
+        try:
+            await self.websocket.close(code=code, reason=reason)
+        except Exception:
+            pass
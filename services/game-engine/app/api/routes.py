@@ -3,7 +3,7 @@ FastAPI Routes for Game Engine
 Includes WebSocket endpoints and REST API
 """
 from typing import Dict, Any, List, Optional
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Depends, File, UploadFile, Query, Body
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Depends, File, UploadFile, Query, Body, Header, Response
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
@@ -26,6 +26,8 @@ from ..services.mcp_client import mcp_client
 from ..services.tts_service import tts_service
 from ..services.stt_service import stt_service
 from ..services.mongo_persistence import mongo_persistence
+from ..services.objective_read_model import objective_read_model
+from ..services.action_mailbox import action_mailbox
 from ..managers.autosave_manager import autosave_manager
 from ..workflows.game_loop import game_loop
 from ..core.logging import get_logger
@@ -80,7 +82,8 @@ async def websocket_gameplay_endpoint(
                     session_id,
                     player_id,
                     action_content,
-                    websocket
+                    websocket,
+                    action_id=data.get("action_id")
                 )
 
             elif event_type == "typing_indicator":
@@ -745,7 +748,8 @@ async def list_player_sessions(player_id: str) -> Dict[str, Any]:
         for key in all_session_keys:
             # Redis configured with decode_responses=True, so keys are already strings
             session_id = key.replace("session:state:", "")
-            state = await redis_manager.load_state(session_id)
+            # Only scalar fields are listed - skip reading history lists
+            state = await redis_manager.load_state(session_id, history_window=0)
 
             if state:
                 # Check if player is in this session
@@ -863,6 +867,17 @@ async def delete_session(session_id: str) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail="Failed to delete session")
 
 
+@router.get("/session/{session_id}/action-queue")
+async def get_action_queue(session_id: str) -> Dict[str, Any]:
+    """Get depth, throughput and latency of the session's player action mailbox"""
+    try:
+        return await action_mailbox.get_metrics(session_id)
+
+    except Exception as e:
+        logger.error("get_action_queue_failed", session_id=session_id, error=str(e))
+        raise HTTPException(status_code=500, detail="Failed to get action queue")
+
+
 @router.get("/session/{session_id}/chat-history")
 async def get_chat_history(
     session_id: str,
@@ -1258,8 +1273,10 @@ async def transcribe_player_action(
 @router.get("/session/{session_id}/objectives")
 async def get_session_objectives(
     session_id: str,
+    response: Response,
     player_id: str = Query(..., description="Player ID"),
-    child_objectives: bool = Query(False, description="Include child objectives (discovery, challenge, event, conversation)")
+    child_objectives: bool = Query(False, description="Include child objectives (discovery, challenge, event, conversation)"),
+    if_none_match: Optional[str] = Header(None)
 ) -> Dict[str, Any]:
     """
     Get all objective progress for a player in a session.
@@ -1278,27 +1295,32 @@ async def get_session_objectives(
         child_objectives: Include hierarchical child objectives
 
     Returns:
-        Comprehensive objective progress data
+        Comprehensive objective progress data (304 if the ETag still matches)
     """
     try:
-        # Load session state
-        state = await redis_manager.load_state(session_id)
+        state = await redis_manager.load_state_fields(session_id, ["campaign_id", "current_scene_id"])
 
-        if not state:
+        if state is None:
             raise HTTPException(status_code=404, detail="Session not found")
 
         campaign_id = state.get("campaign_id")
         current_scene_id = state.get("current_scene_id")
 
+        # Stored response, current until the player's progress version moves
+        view = f"objectives:{current_scene_id}:{child_objectives}"
+        cached, version = await objective_read_model.get_view(player_id, campaign_id, view)
+        if cached:
+            if if_none_match == cached["etag"]:
+                return Response(status_code=304, headers={"ETag": cached["etag"]})
+            response.headers["ETag"] = cached["etag"]
+            return cached["payload"]
+
+        # Objective progress from the read model (Neo4j only if it is missing)
+        progress = await objective_read_model.get_progress(player_id, campaign_id)
+
         # Import neo4j_graph here to avoid circular import
         from ..services.neo4j_graph import neo4j_graph
 
-        # Get objective progress from Neo4j
-        progress = await neo4j_graph.get_player_objective_progress(
-            player_id,
-            campaign_id
-        )
-
         # Get scene objectives and resources
         scene_data = {}
         if current_scene_id:
@@ -1310,6 +1332,15 @@ async def get_session_objectives(
             campaign_id
         )
 
+        # Objectives each scene resource counts toward (campaign-static)
+        from ..services.requirement_index import requirement_index
+        index = await requirement_index.get_index(campaign_id)
+
+        def required_for(resource_type: str, resource_id: str) -> List[str]:
+            if index is None:
+                return []
+            return sorted(index.objectives_requiring(resource_type, resource_id))
+
         # Get available acquisition paths for scene resources
         scene_knowledge = []
         for knowledge in scene_data.get("provides_knowledge", []):
@@ -1321,7 +1352,8 @@ async def get_session_objectives(
             scene_knowledge.append({
                 **knowledge,
                 "acquisition_paths": paths,
-                "redundancy_level": paths[0]["redundancy_level"] if paths else "low"
+                "redundancy_level": paths[0]["redundancy_level"] if paths else "low",
+                "required_for_objectives": required_for("knowledge", knowledge["id"])
             })
 
         scene_items = []
@@ -1334,7 +1366,8 @@ async def get_session_objectives(
             scene_items.append({
                 **item,
                 "acquisition_paths": paths,
-                "redundancy_level": paths[0]["redundancy_level"] if paths else "low"
+                "redundancy_level": paths[0]["redundancy_level"] if paths else "low",
+                "required_for_objectives": required_for("item", item["id"])
             })
 
         # NEW: Get child objectives if requested
@@ -1439,7 +1472,7 @@ async def get_session_objectives(
             total_quest_objectives=len(all_quest_objectives)
         )
 
-        response = {
+        objectives = {
             "campaign_objectives": progress["campaign_objectives"],
             "active_objectives": active_objectives,  # NEW: Progressive disclosure (1-3 only)
             "all_quest_objectives": all_quest_objectives,  # Full list for quest log
@@ -1453,9 +1486,14 @@ async def get_session_objectives(
 
         # Add child objectives flag for UI
         if child_objectives:
-            response["hierarchical_objectives_enabled"] = True
+            objectives["hierarchical_objectives_enabled"] = True
+
+        etag = await objective_read_model.store_view(player_id, campaign_id, view, version, objectives)
+        if if_none_match == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
 
-        return response
+        return objectives
 
     except HTTPException:
         raise
@@ -1471,7 +1509,9 @@ async def get_session_objectives(
 @router.get("/session/{session_id}/hints")
 async def get_contextual_hints(
     session_id: str,
-    player_id: str = Query(..., description="Player ID")
+    response: Response,
+    player_id: str = Query(..., description="Player ID"),
+    if_none_match: Optional[str] = Header(None)
 ) -> Dict[str, Any]:
     """
     Get contextual hints for the player based on current scene and objectives.
@@ -1486,22 +1526,30 @@ async def get_contextual_hints(
         player_id: Player ID
 
     Returns:
-        Contextual hints and suggested actions
+        Contextual hints and suggested actions (304 if the ETag still matches)
     """
     try:
-        # Load session state
-        state = await redis_manager.load_state(session_id)
+        state = await redis_manager.load_state_fields(session_id, ["campaign_id", "current_scene_id"])
 
-        if not state:
+        if state is None:
             raise HTTPException(status_code=404, detail="Session not found")
 
         campaign_id = state.get("campaign_id")
         current_scene_id = state.get("current_scene_id")
 
-        from ..services.neo4j_graph import neo4j_graph
+        # Stored response, current until the player's progress version moves
+        view = f"hints:{current_scene_id}"
+        cached, version = await objective_read_model.get_view(player_id, campaign_id, view)
+        if cached:
+            if if_none_match == cached["etag"]:
+                return Response(status_code=304, headers={"ETag": cached["etag"]})
+            response.headers["ETag"] = cached["etag"]
+            return cached["payload"]
 
         # Get current objectives
-        progress = await neo4j_graph.get_player_objective_progress(player_id, campaign_id)
+        progress = await objective_read_model.get_progress(player_id, campaign_id)
+
+        from ..services.neo4j_graph import neo4j_graph
 
         # Get active objectives (in progress)
         active_objs = [
@@ -1576,12 +1624,19 @@ async def get_contextual_hints(
             "action": None
         })
 
-        return {
+        result = {
             "hints": hints[:3],  # Limit to 3 hints
             "current_scene": scene_data.get("name", "Unknown location"),
             "active_objectives_count": len(active_objs)
         }
 
+        etag = await objective_read_model.store_view(player_id, campaign_id, view, version, result)
+        if if_none_match == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+
+        return result
+
     except HTTPException:
         raise
     except Exception as e:
@@ -1590,7 +1645,11 @@ async def get_contextual_hints(
 
 
 @router.get("/session/{session_id}/quest-progress")
-async def get_quest_progress(session_id: str) -> Dict[str, Any]:
+async def get_quest_progress(
+    session_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None)
+) -> Dict[str, Any]:
     """
     Get formatted quest progress for UI display.
 
@@ -1601,15 +1660,32 @@ async def get_quest_progress(session_id: str) -> Dict[str, Any]:
         session_id: Session ID
 
     Returns:
-        Formatted quest progress data
+        Formatted quest progress data (304 if the ETag still matches)
     """
     try:
-        # Load session state
-        state = await redis_manager.load_state(session_id)
+        # Only the fields quest progress is computed from, not the histories
+        state = await redis_manager.load_state_fields(session_id, [
+            "campaign_id", "current_quest_id", "quest_name", "campaign_name", "campaign_plot",
+            "players", "player_knowledge", "player_inventories"
+        ])
 
-        if not state:
+        if state is None:
             raise HTTPException(status_code=404, detail="Session not found")
 
+        # Stored response, current until the player's progress version moves
+        # or the session fields it was computed from change
+        players = state.get("players", [])
+        player_id = players[0].get("player_id") if players else None
+        campaign_id = state.get("campaign_id")
+        cached, version = await objective_read_model.get_view(
+            player_id, campaign_id, "quest_progress", state
+        )
+        if cached:
+            if if_none_match == cached["etag"]:
+                return Response(status_code=304, headers={"ETag": cached["etag"]})
+            response.headers["ETag"] = cached["etag"]
+            return cached["payload"]
+
         # Import here to avoid circular imports
         from ..workflows.game_loop import calculate_complete_quest_progress
 
@@ -1631,9 +1707,7 @@ async def get_quest_progress(session_id: str) -> Dict[str, Any]:
         quest_progress["campaign_plot"] = state.get("campaign_plot", "")
 
         # Count knowledge and items for progress badges
-        players = state.get("players", [])
         if players:
-            player_id = players[0].get("player_id")
             player_knowledge = state.get("player_knowledge", {})
             player_inventories = state.get("player_inventories", {})
 
@@ -1646,6 +1720,13 @@ async def get_quest_progress(session_id: str) -> Dict[str, Any]:
             quest_progress["knowledge_count"] = 0
             quest_progress["items_count"] = 0
 
+        etag = await objective_read_model.store_view(
+            player_id, campaign_id, "quest_progress", version, quest_progress, state
+        )
+        if if_none_match == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+
         return quest_progress
 
     except HTTPException:
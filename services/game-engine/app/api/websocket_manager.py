@@ -8,8 +8,12 @@ from datetime import datetime
 import json
 import asyncio
 
+from ..core.config import settings
 from ..core.logging import get_logger
+from .connection_outbox import ConnectionOutbox
 from ..services.redis_manager import redis_manager
+from ..services.session_bus import session_bus
+from ..services.action_mailbox import action_mailbox
 from ..workflows.game_loop import game_loop
 from ..models.state import GameSessionState
 
@@ -20,6 +24,9 @@ class ConnectionManager:
     """
     Manages WebSocket connections for game sessions
     Handles message routing and player presence
+
+    Only this replica's sockets are tracked here; broadcasts reach sockets
+    on other replicas through the session bus.
     """
 
     def __init__(self):
@@ -32,6 +39,9 @@ class ConnectionManager:
         # Map of session_id -> typing players
         self.typing_players: Dict[str, Set[str]] = {}
 
+        # Map of websocket -> outbound queue and writer task
+        self.outboxes: Dict[WebSocket, ConnectionOutbox] = {}
+
     async def connect(
         self,
         websocket: WebSocket,
@@ -51,9 +61,19 @@ class ConnectionManager:
         # Add to active connections
         if session_id not in self.active_connections:
             self.active_connections[session_id] = set()
+            await session_bus.subscribe(session_id)
+            # Resume actions left queued by a replica that went away
+            await action_mailbox.ensure_consumer(session_id)
 
         self.active_connections[session_id].add(websocket)
         self.websocket_to_player[websocket] = player_id
+        self.outboxes[websocket] = ConnectionOutbox(
+            websocket,
+            max_queue_size=settings.WS_OUTBOX_MAX_MESSAGES,
+            send_timeout=settings.WS_SEND_TIMEOUT_SECONDS,
+            overflow_policy=settings.WS_SLOW_CONSUMER_POLICY,
+            on_close=lambda ws: self.disconnect(ws, session_id)
+        )
 
         logger.info(
             "websocket_connected",
@@ -161,11 +181,17 @@ class ConnectionManager:
 
             if not self.active_connections[session_id]:
                 del self.active_connections[session_id]
+                asyncio.create_task(self._release_session(session_id))
 
         # Remove from websocket mapping
         if websocket in self.websocket_to_player:
             del self.websocket_to_player[websocket]
 
+        # Stop the writer task
+        outbox = self.outboxes.pop(websocket, None)
+        if outbox:
+            outbox.close()
+
         # Remove from typing indicators
         if session_id in self.typing_players and player_id:
             self.typing_players[session_id].discard(player_id)
@@ -176,6 +202,17 @@ class ConnectionManager:
             player_id=player_id
         )
 
+    async def _release_session(self, session_id: str):
+        """Unsubscribe from a session's bus channel once its last local socket is gone"""
+        # A socket may have reconnected before this ran
+        if session_id not in self.active_connections:
+            await session_bus.unsubscribe(session_id)
+
+    @staticmethod
+    def _serialize(message: Dict[str, Any]) -> str:
+        """Serialize a message once for every recipient (same encoding as send_json)"""
+        return json.dumps(message, separators=(",", ":"), ensure_ascii=False, default=str)
+
     async def send_personal_message(self, message: Dict[str, Any], websocket: WebSocket):
         """
         Send message to specific WebSocket connection
@@ -185,7 +222,12 @@ class ConnectionManager:
             websocket: Target WebSocket
         """
         try:
-            await websocket.send_json(message)
+            outbox = self.outboxes.get(websocket)
+            if outbox:
+                # Queued behind earlier broadcasts so per-socket ordering holds
+                outbox.enqueue(self._serialize(message))
+            else:
+                await websocket.send_json(message)
         except Exception as e:
             logger.error(
                 "send_message_failed",
@@ -201,14 +243,23 @@ class ConnectionManager:
         """
         Broadcast message to all connections in session
 
+        The message is serialized once and queued on every connection's
+        outbox; each connection's writer task sends it independently, so a
+        slow client cannot hold up the rest of the party. The same payload
+        is published once on the session bus for sockets on other replicas.
+
         Args:
             session_id: Game session ID
             message: Message data
             exclude_websocket: Optional WebSocket to exclude from broadcast
         """
         event_type = message.get("event", "unknown")
+        payload = self._serialize(message)
 
-        if session_id not in self.active_connections:
+        sent_count = self._deliver_local(session_id, payload, event_type, exclude_websocket)
+        replicas = await session_bus.publish(session_id, payload)
+
+        if session_id not in self.active_connections and replicas == 0:
             logger.warning(
                 "broadcast_no_connections",
                 session_id=session_id,
@@ -217,39 +268,52 @@ class ConnectionManager:
             )
             return
 
-        total_connections = len(self.active_connections[session_id])
+        # Log successful broadcasts
+        if sent_count > 0 or replicas > 0:
+            logger.info(
+                "broadcast_sent",
+                session_id=session_id,
+                event_type=event_type,
+                recipients=sent_count,
+                total_connections=len(self.active_connections.get(session_id, ())),
+                replicas=replicas
+            )
+
+    def deliver_from_bus(self, session_id: str, payload: str):
+        """Deliver a broadcast published by another replica to local sockets"""
+        self._deliver_local(session_id, payload, "remote")
+
+    def _deliver_local(
+        self,
+        session_id: str,
+        payload: str,
+        event_type: str,
+        exclude_websocket: Optional[WebSocket] = None
+    ) -> int:
+        """Queue a serialized message on this replica's sockets for a session"""
+        if session_id not in self.active_connections:
+            return 0
+
         sent_count = 0
-        disconnected = []
 
-        for websocket in self.active_connections[session_id]:
+        # Copy: a full outbox may disconnect its socket while we iterate
+        for websocket in list(self.active_connections[session_id]):
             if websocket == exclude_websocket:
                 continue
 
-            try:
-                await websocket.send_json(message)
+            outbox = self.outboxes.get(websocket)
+            if outbox and outbox.enqueue(payload):
                 sent_count += 1
-            except Exception as e:
+            elif not outbox:
                 logger.error(
                     "broadcast_failed",
                     session_id=session_id,
                     event_type=event_type,
-                    error=str(e)
+                    error="no outbox for connection"
                 )
-                disconnected.append(websocket)
-
-        # Clean up disconnected WebSockets
-        for websocket in disconnected:
-            self.disconnect(websocket, session_id)
+                self.disconnect(websocket, session_id)
 
-        # Log successful broadcasts
-        if sent_count > 0:
-            logger.info(
-                "broadcast_sent",
-                session_id=session_id,
-                event_type=event_type,
-                recipients=sent_count,
-                total_connections=total_connections
-            )
+        return sent_count
 
     async def handle_typing_indicator(
         self,
@@ -289,16 +353,21 @@ class ConnectionManager:
         session_id: str,
         player_id: str,
         action_content: str,
-        websocket: WebSocket
+        websocket: WebSocket,
+        action_id: Optional[str] = None
     ):
         """
-        Process player action and inject into game loop workflow
+        Queue a player action in the session's action mailbox
+
+        Actions sent while a turn is still running wait in the mailbox and
+        are applied in order by the session's consumer (run_player_action).
 
         Args:
             session_id: Game session ID
             player_id: Player ID
             action_content: Player's action text
             websocket: WebSocket connection
+            action_id: Client-generated ID; resending it does not queue the action twice
         """
         try:
             logger.info(
@@ -308,85 +377,41 @@ class ConnectionManager:
                 content_length=len(action_content)
             )
 
-            # Acquire lock for session state
-            lock_acquired = await redis_manager.acquire_lock(session_id, timeout=30)
-
-            if not lock_acquired:
-                await self.send_personal_message(
-                    {
-                        "event": "error",
-                        "message": "Session is currently being processed. Please try again.",
-                        "timestamp": datetime.utcnow().isoformat()
-                    },
-                    websocket
-                )
-                return
-
-            try:
-                # Load current state from Redis
-                state = await redis_manager.load_state(session_id)
-
-                if not state:
-                    await self.send_personal_message(
-                        {
-                            "event": "error",
-                            "message": "Session not found.",
-                            "timestamp": datetime.utcnow().isoformat()
-                        },
-                        websocket
-                    )
-                    return
-
-                # Check if session is awaiting player input
-                if not state.get("awaiting_player_input"):
-                    await self.send_personal_message(
-                        {
-                            "event": "error",
-                            "message": "Session is not ready for input.",
-                            "timestamp": datetime.utcnow().isoformat()
-                        },
-                        websocket
-                    )
-                    return
-
-                # Inject player action into state
-                state["pending_action"] = {
+            result = await action_mailbox.enqueue(
+                session_id,
+                {
+                    "action_id": action_id,
                     "player_id": player_id,
                     "player_input": action_content,
                     "timestamp": datetime.utcnow().isoformat()
                 }
+            )
 
-                # Add player action to conversation history
-                if "conversation_history" not in state:
-                    state["conversation_history"] = []
-
-                state["conversation_history"].append({
-                    "type": "player",
-                    "role": "player",
-                    "player_id": player_id,
-                    "message": action_content,
-                    "content": action_content,
-                    "timestamp": datetime.utcnow().isoformat()
-                })
-
-                state["awaiting_player_input"] = False
-                state["current_node"] = "interpret_action"
-
-                # Note: Don't clear scene_just_generated here - let the workflow handle it
-                # The workflow will set it to True when a new scene is generated
-
-                # Save updated state
-                await redis_manager.save_state(session_id, state)
-
-                # Send acknowledgment
+            if result["status"] == "full":
                 await self.send_personal_message(
                     {
-                        "event": "action_received",
+                        "event": "error",
+                        "message": "Too many actions are queued for this session. Please wait for the current turn.",
+                        "action_id": result["action_id"],
                         "timestamp": datetime.utcnow().isoformat()
                     },
                     websocket
                 )
+                return
 
+            # Send acknowledgment (repeated for duplicates so client retries settle)
+            await self.send_personal_message(
+                {
+                    "event": "action_received",
+                    "action_id": result["action_id"],
+                    "queue_depth": result["depth"],
+                    "duplicate": result["status"] == "duplicate",
+                    "timestamp": datetime.utcnow().isoformat()
+                },
+                websocket
+            )
+
+            if result["status"] == "queued":
                 # Broadcast action to other players (for multiplayer)
                 await self.broadcast_to_session(
                     session_id,
@@ -399,13 +424,6 @@ class ConnectionManager:
                     exclude_websocket=websocket
                 )
 
-                # Continue workflow execution in background
-                asyncio.create_task(self._continue_workflow(session_id, state))
-
-            finally:
-                # Release lock
-                await redis_manager.release_lock(session_id)
-
         except Exception as e:
             logger.error(
                 "player_action_processing_failed",
@@ -423,13 +441,141 @@ class ConnectionManager:
                 websocket
             )
 
-    async def _continue_workflow(self, session_id: str, state: GameSessionState):
+    async def run_player_action(self, session_id: str, action: Dict[str, Any]):
+        """
+        Apply a queued player action and run the workflow to completion
+
+        Called by the action mailbox, one action at a time per session, on
+        whichever replica consumes the session. The acting player may be
+        connected elsewhere, so rejections are broadcast with their player_id.
+
+        Idempotent per action_id: the state records the action being applied
+        (current_action_id) and the last one whose workflow finished
+        (completed_action_id), or whose workflow failed (failed_action_id).
+        An action handed over by a consumer that went away mid-turn resumes
+        its workflow instead of being applied again. A failed action is not
+        marked completed; the session is told and the error is re-raised so
+        the mailbox counts it as failed.
+
+        Args:
+            session_id: Game session ID
+            action: Queued action (action_id, player_id, player_input, timestamp)
+        """
+        player_id = action["player_id"]
+        action_id = action["action_id"]
+
+        # Load current state from Redis
+        state = await redis_manager.load_state(session_id)
+
+        if not state:
+            await self._reject_action(session_id, action, "Session not found.")
+            return
+
+        if action_id in (state.get("completed_action_id"), state.get("failed_action_id")):
+            logger.info("player_action_already_applied", session_id=session_id, action_id=action_id)
+            return
+
+        if state.get("current_action_id") == action_id:
+            # Applied by a consumer that stopped before the workflow finished
+            succeeded = True
+            if not state.get("awaiting_player_input"):
+                logger.info("player_action_resumed", session_id=session_id, action_id=action_id)
+                succeeded = await self._continue_workflow(session_id, state)
+            await self._finish_action(session_id, action, succeeded)
+            return
+
+        # Check if session is awaiting player input
+        if not state.get("awaiting_player_input"):
+            await self._reject_action(session_id, action, "Session is not ready for input.")
+            return
+
+        # Inject player action into state
+        state["current_action_id"] = action_id
+        state["pending_action"] = {
+            "action_id": action_id,
+            "player_id": player_id,
+            "player_input": action["player_input"],
+            "timestamp": action["timestamp"]
+        }
+
+        # Add player action to conversation history
+        if "conversation_history" not in state:
+            state["conversation_history"] = []
+
+        state["conversation_history"].append({
+            "type": "player",
+            "role": "player",
+            "player_id": player_id,
+            "message": action["player_input"],
+            "content": action["player_input"],
+            "timestamp": action["timestamp"]
+        })
+
+        state["awaiting_player_input"] = False
+        state["current_node"] = "interpret_action"
+
+        # Note: Don't clear scene_just_generated here - let the workflow handle it
+        # The workflow will set it to True when a new scene is generated
+
+        # Save updated state
+        await redis_manager.save_state(session_id, state)
+
+        # Awaited so the next queued action sees this turn's result
+        succeeded = await self._continue_workflow(session_id, state)
+        await self._finish_action(session_id, action, succeeded)
+
+    async def _finish_action(self, session_id: str, action: Dict[str, Any], succeeded: bool):
+        """Record how a mailbox action's workflow ended; raise if it failed"""
+        action_id = action["action_id"]
+
+        if succeeded:
+            await redis_manager.update_state_fields(session_id, {"completed_action_id": action_id})
+            return
+
+        await redis_manager.update_state_fields(session_id, {"failed_action_id": action_id})
+        await self.broadcast_to_session(
+            session_id,
+            {
+                "event": "action_failed",
+                "player_id": action["player_id"],
+                "action_id": action_id,
+                "message": "Failed to process action. Please try again.",
+                "timestamp": datetime.utcnow().isoformat()
+            }
+        )
+        raise RuntimeError(f"Workflow failed for action {action_id}")
+
+    async def _reject_action(self, session_id: str, action: Dict[str, Any], reason: str):
+        """Tell the session a queued action was dropped"""
+        logger.info(
+            "player_action_rejected",
+            session_id=session_id,
+            player_id=action["player_id"],
+            action_id=action["action_id"],
+            reason=reason
+        )
+
+        await self.broadcast_to_session(
+            session_id,
+            {
+                "event": "action_rejected",
+                "player_id": action["player_id"],
+                "action_id": action["action_id"],
+                "message": reason,
+                "timestamp": datetime.utcnow().isoformat()
+            }
+        )
+
+    async def _continue_workflow(self, session_id: str, state: GameSessionState) -> bool:
         """
         Continue workflow execution after player input
 
         Args:
             session_id: Game session ID
             state: Current game state
+
+        Returns:
+            False if the workflow raised (the error is logged)
         """
         try:
             logger.info(
@@ -447,6 +593,7 @@ class ConnectionManager:
 
             # Broadcast state updates to all players
             await self._broadcast_state_updates(session_id, result)
+            return True
 
         except Exception as e:
             logger.error(
@@ -454,6 +601,7 @@ class ConnectionManager:
                 session_id=session_id,
                 error=str(e)
             )
+            return False
 
     async def _broadcast_state_updates(
         self,
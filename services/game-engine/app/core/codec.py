@@ -0,0 +1,123 @@
+"""
+Payload codec for game state and cache entries
+Pluggable serializer (orjson, msgpack or stdlib json) with optional zstd
+compression once a payload passes a size threshold.
+
+Wire format:
+- Plain JSON text (no header) - what older builds wrote, and what the codec
+  still writes for uncompressed JSON so other services can read it
+- Otherwise a single format-version byte followed by the body:
+    0x01  msgpack
+    0x02  JSON, zstd-compressed
+    0x03  msgpack, zstd-compressed
+
+JSON text never starts with a control byte, so the header is unambiguous.
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+FORMAT_MSGPACK = 0x01
+FORMAT_JSON_ZSTD = 0x02
+FORMAT_MSGPACK_ZSTD = 0x03
+
+_HEADERS = (FORMAT_MSGPACK, FORMAT_JSON_ZSTD, FORMAT_MSGPACK_ZSTD)
+
+
+class CodecError(ValueError):
+    """Raised when a payload cannot be decoded"""
+
+
+class StateCodec:
+    """
+    Encodes/decodes JSON-compatible payloads to bytes.
+
+    Args:
+        serializer: "orjson", "msgpack" or "json"
+        compression_threshold: Compress payloads at least this many bytes
+            long (0 disables compression)
+        compression_level: zstd compression level
+    """
+
+    def __init__(
+        self,
+        serializer: str = "orjson",
+        compression_threshold: int = 16384,
+        compression_level: int = 3
+    ):
+        if serializer == "orjson" and orjson is None:
+            serializer = "json"
+        if serializer == "msgpack" and msgpack is None:
+            raise ValueError("msgpack serializer requested but msgpack is not installed")
+        if serializer not in ("orjson", "msgpack", "json"):
+            raise ValueError(f"Unknown serializer: {serializer}")
+
+        self.serializer = serializer
+        self.compression_threshold = compression_threshold if zstandard else 0
+        self._compressor = zstandard.ZstdCompressor(level=compression_level) if zstandard else None
+        self._decompressor = zstandard.ZstdDecompressor() if zstandard else None
+
+    def _serialize(self, obj: Any) -> bytes:
+        if self.serializer == "msgpack":
+            return msgpack.packb(obj, default=str, use_bin_type=True)
+        if self.serializer == "orjson":
+            return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(obj, default=str).encode("utf-8")
+
+    def encode(self, obj: Any) -> bytes:
+        """Serialize obj, compressing it if it passes the size threshold"""
+        body = self._serialize(obj)
+        is_msgpack = self.serializer == "msgpack"
+
+        if self.compression_threshold and len(body) >= self.compression_threshold:
+            header = FORMAT_MSGPACK_ZSTD if is_msgpack else FORMAT_JSON_ZSTD
+            return bytes((header,)) + self._compressor.compress(body)
+
+        if is_msgpack:
+            return bytes((FORMAT_MSGPACK,)) + body
+        return body
+
+    def decode(self, data: Union[bytes, str]) -> Any:
+        """Deserialize a payload written by encode() or plain JSON text"""
+        if isinstance(data, str):
+            return self._loads_json(data)
+        if not data:
+            raise CodecError("Empty payload")
+
+        header = data[0]
+        if header not in _HEADERS:
+            return self._loads_json(data)
+
+        body = data[1:]
+        if header in (FORMAT_JSON_ZSTD, FORMAT_MSGPACK_ZSTD):
+            if self._decompressor is None:
+                raise CodecError("zstd-compressed payload but zstandard is not installed")
+            body = self._decompressor.decompress(body)
+
+        if header == FORMAT_JSON_ZSTD:
+            return self._loads_json(body)
+
+        if msgpack is None:
+            raise CodecError("msgpack payload but msgpack is not installed")
+        return msgpack.unpackb(body, raw=False, strict_map_key=False)
+
+    @staticmethod
+    def _loads_json(data: Union[bytes, str]) -> Any:
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
@@ -3,7 +3,7 @@ Configuration management for Game Engine
 """
 from pydantic_settings import BaseSettings
 from pydantic import Field
-from typing import Optional
+from typing import Dict, Optional
 
 
 class Settings(BaseSettings):
@@ -42,14 +42,78 @@ class Settings(BaseSettings):
     MCP_QUEST_MISSION_URL: str = Field(..., env="MCP_QUEST_MISSION_URL")
     MCP_ITEM_EQUIPMENT_URL: str = Field(..., env="MCP_ITEM_EQUIPMENT_URL")
     MCP_AUTH_TOKEN: str = Field(..., env="MCP_AUTH_TOKEN")
+    # Pooled MCP HTTP clients (one per server, shared for the app lifetime)
+    MCP_MAX_CONNECTIONS: int = 50
+    MCP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    MCP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    MCP_HTTP2: bool = False  # Requires the h2 package
+    MCP_TIMEOUT_SECONDS: float = 30.0
+    MCP_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    # Per-server timeout overrides, e.g. {"npc_personality": 10.0}
+    MCP_SERVER_TIMEOUTS: Dict[str, float] = {}
+    # MCP GET response cache (single-flight + in-process LRU + Redis)
+    MCP_CACHE_ENABLED: bool = True
+    MCP_CACHE_MAX_ENTRIES: int = 2048
+    # Caps the in-process tier; other replicas only see Redis invalidations
+    MCP_CACHE_LOCAL_TTL_SECONDS: int = 15
+    # Redis TTL per endpoint family; families missing here are not cached
+    MCP_CACHE_TTLS: Dict[str, int] = {
+        "npc": 300,
+        "npc_context": 60,
+        "world": 1800,
+        "location": 600,
+        "character_info": 120,
+        "player_inventory": 30
+    }
 
     # Session Config
     SESSION_STATE_TTL_SECONDS: int = 86400  # 24 hours
+    # "split": scalar fields in a hash, append-only histories in Redis lists
+    # "blob": whole state as one JSON string (legacy)
+    SESSION_STATE_STORAGE: str = "split"
+    # Payload codec for session state and cache entries: orjson, msgpack or json
+    SESSION_CODEC: str = "orjson"
+    CODEC_COMPRESSION_THRESHOLD_BYTES: int = 16384  # zstd above this size, 0 disables
+    CODEC_COMPRESSION_LEVEL: int = 3
     AUTOSAVE_INTERVAL_SECONDS: int = 900  # 15 minutes
+    # MongoDB session checkpoints: "incremental" pushes new history entries and
+    # changed fields only, "full" rewrites the whole document every save
+    SESSION_PERSISTENCE_MODE: str = "incremental"
+    # Materialized objective progress served to the polling endpoints;
+    # rebuilt from Neo4j when missing or expired
+    OBJECTIVE_READ_MODEL_TTL_SECONDS: int = 86400
 
     # WebSocket Config
     WS_HEARTBEAT_INTERVAL: int = 30
     WS_MAX_CONNECTIONS: int = 1000
+    # Per-connection outbound queue; when it fills up the slow consumer is
+    # either disconnected ("disconnect") or loses its oldest messages ("drop_oldest")
+    WS_OUTBOX_MAX_MESSAGES: int = 256
+    WS_SEND_TIMEOUT_SECONDS: float = 10.0
+    WS_SLOW_CONSUMER_POLICY: str = "disconnect"
+    # Redis pub/sub fan-out of session broadcasts between game-engine replicas
+    WS_BUS_ENABLED: bool = True
+    WS_BUS_CHANNEL_PREFIX: str = "session:bus:"
+
+    # Multiplayer turn timeouts (Redis sorted set, polled by every replica)
+    TURN_SCHEDULER_POLL_INTERVAL_MS: int = 250
+    TURN_SCHEDULER_BATCH_SIZE: int = 200
+    # Claimed timeouts not finished within the lease are claimed again
+    TURN_SCHEDULER_LEASE_SECONDS: int = 30
+
+    # Per-session player action mailbox (Redis stream, one consumer per session)
+    SESSION_ACTION_QUEUE_MAX_DEPTH: int = 10
+    # Repeated action ids within this window are acknowledged, not re-queued
+    SESSION_ACTION_DEDUPE_TTL_SECONDS: int = 600
+    # A consumer that stops renewing its lease is replaced after this long
+    SESSION_ACTION_LEASE_SECONDS: int = 30
+
+    # Narration streaming: LLM chunks are coalesced for up to MAX_DELAY_MS or
+    # MAX_BYTES before publishing (0 ms publishes every chunk)
+    STREAM_BATCH_MAX_DELAY_MS: int = 50
+    STREAM_BATCH_MAX_BYTES: int = 512
+    # Publish scene chunks as non-persistent RabbitMQ messages
+    STREAM_CHUNKS_TRANSIENT: bool = True
 
     # Game Engine Config
     MAX_CONCURRENT_SESSIONS: int = 100
@@ -14,7 +14,14 @@ from .services.rabbitmq_client import rabbitmq_client
 from .services.rabbitmq_consumer import rabbitmq_consumer
 from .services.mongo_persistence import mongo_persistence
 from .services.neo4j_graph import neo4j_graph
+from .services.mcp_client import mcp_client
+from .services.stream_batcher import stream_metrics
+from .services.session_bus import session_bus
+from .services.turn_scheduler import turn_scheduler
+from .services.action_mailbox import action_mailbox
 from .api.routes import router
+from .api.websocket_manager import connection_manager
+from .managers.multiplayer_manager import multiplayer_manager
 
 # Setup logging
 setup_logging(debug=settings.DEBUG)
@@ -51,10 +58,23 @@ async def lifespan(app: FastAPI):
         await neo4j_graph.connect()
         logger.info("neo4j_connected")
 
+        # Open pooled MCP server clients
+        await mcp_client.connect()
+        logger.info("mcp_clients_connected")
+
         # Connect RabbitMQ consumer and start consuming
         await rabbitmq_consumer.connect()
         logger.info("rabbitmq_consumer_connected")
 
+        # Deliver other replicas' session broadcasts to local sockets
+        await session_bus.start(connection_manager.deliver_from_bus)
+
+        # Claim due multiplayer turn timeouts (shared with the other replicas)
+        await turn_scheduler.start(multiplayer_manager.handle_turn_timeout)
+
+        # Apply queued player actions, one consumer per session
+        action_mailbox.start(connection_manager.run_player_action)
+
         # Start consuming player actions in background
         import asyncio
         asyncio.create_task(rabbitmq_consumer.start_consuming())
@@ -72,6 +92,10 @@ async def lifespan(app: FastAPI):
     logger.info("game_engine_shutting_down")
 
     try:
+        await action_mailbox.stop()
+        await turn_scheduler.stop()
+        await session_bus.stop()
+
         # Disconnect from Redis
         await redis_manager.disconnect()
         logger.info("redis_disconnected")
@@ -92,6 +116,10 @@ async def lifespan(app: FastAPI):
         await neo4j_graph.disconnect()
         logger.info("neo4j_disconnected")
 
+        # Close pooled MCP server clients
+        await mcp_client.disconnect()
+        logger.info("mcp_clients_disconnected")
+
         logger.info("game_engine_shutdown_complete")
 
     except Exception as e:
@@ -152,7 +180,12 @@ async def health_check():
             "redis": "connected" if redis_healthy else "disconnected",
             "rabbitmq": "connected" if rabbitmq_healthy else "disconnected",
             "mongodb": "connected" if mongodb_healthy else "disconnected",
-            "neo4j": "connected" if neo4j_healthy else "disconnected"
+            "neo4j": "connected" if neo4j_healthy else "disconnected",
+            "mcp": mcp_client.get_metrics(),
+            "streaming": stream_metrics.snapshot(),
+            "session_bus": session_bus.stats(),
+            "turn_scheduler": turn_scheduler.stats(),
+            "action_mailbox": action_mailbox.stats()
         }
 
     except Exception as e:
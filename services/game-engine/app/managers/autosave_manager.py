@@ -132,12 +132,10 @@ class AutoSaveManager:
             success = await mongo_persistence.save_session(state)
 
             if success:
-                # Save chat messages batch
+                # Save chat messages added since the last checkpoint
                 chat_messages = state.get("chat_messages", [])
                 if chat_messages:
-                    # Only save new messages since last save
-                    # For simplicity, save all for now (could optimize with tracking)
-                    await mongo_persistence.save_chat_messages_batch(
+                    await mongo_persistence.append_chat_messages(
                         session_id,
                         chat_messages
                     )
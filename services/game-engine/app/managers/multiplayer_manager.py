@@ -4,12 +4,15 @@ Handles turn management, player synchronization, and party coordination
 """
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-import asyncio
+from uuid import uuid4
+import json
 
+from ..core.config import settings
 from ..core.logging import get_logger
 from ..models.state import GameSessionState, SessionStatus
 from ..services.redis_manager import redis_manager
 from ..services.rabbitmq_client import rabbitmq_client
+from ..services.turn_scheduler import turn_scheduler
 from ..api.websocket_manager import connection_manager
 
 logger = get_logger(__name__)
@@ -18,14 +21,30 @@ logger = get_logger(__name__)
 class MultiplayerSessionManager:
     """
     Manages multiplayer game sessions with turn management and synchronization
-    """
 
-    def __init__(self):
-        # Track active party sessions
-        self.active_parties: Dict[str, Dict[str, Any]] = {}
+    Party tracking data lives in a Redis hash (party:{session_id}) so every
+    game-engine replica serving a member of the party sees the same party.
+    Turn timeouts are scheduled in Redis by the turn scheduler.
+    """
 
-        # Turn timers
-        self.turn_timers: Dict[str, asyncio.Task] = {}
+    @staticmethod
+    def _party_key(session_id: str) -> str:
+        return f"party:{session_id}"
+
+    async def _save_party(self, session_id: str, party: Dict[str, Any]):
+        """Write party tracking data (fields JSON-encoded)"""
+        key = self._party_key(session_id)
+        pipe = redis_manager.redis.pipeline(transaction=True)
+        pipe.hset(key, mapping={field: json.dumps(value) for field, value in party.items()})
+        pipe.expire(key, settings.SESSION_STATE_TTL_SECONDS)
+        await pipe.execute()
+
+    async def _load_party(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Read party tracking data, None if the session has no party"""
+        fields = await redis_manager.redis.hgetall(self._party_key(session_id))
+        if not fields:
+            return None
+        return {field: json.loads(value) for field, value in fields.items()}
 
     async def initialize_party_session(
         self,
@@ -52,7 +71,7 @@ class MultiplayerSessionManager:
             party_settings = state.get("party_settings", {})
 
             # Create party tracking data
-            self.active_parties[session_id] = {
+            party = {
                 "session_id": session_id,
                 "host_player_id": party_settings.get("host_player_id"),
                 "max_players": party_settings.get("max_players", 4),
@@ -62,6 +81,7 @@ class MultiplayerSessionManager:
                 "status": "active",
                 "created_at": datetime.utcnow().isoformat()
             }
+            await self._save_party(session_id, party)
 
             # If sequential turn mode, set first player
             if party_settings.get("turn_mode") == "sequential":
@@ -72,7 +92,7 @@ class MultiplayerSessionManager:
                 session_id,
                 {
                     "event": "party_initialized",
-                    "party_info": self.active_parties[session_id],
+                    "party_info": party,
                     "timestamp": datetime.utcnow().isoformat()
                 }
             )
@@ -110,20 +130,19 @@ class MultiplayerSessionManager:
             Success status
         """
         try:
-            if session_id not in self.active_parties:
+            party = await self._load_party(session_id)
+            if not party:
                 logger.warning("party_not_found", session_id=session_id)
                 return False
 
-            party = self.active_parties[session_id]
-
-            # Check if party is full
-            if party["current_players"] >= party["max_players"]:
+            # Update player count; roll back if a concurrent join filled the party
+            key = self._party_key(session_id)
+            party["current_players"] = await redis_manager.redis.hincrby(key, "current_players", 1)
+            if party["current_players"] > party["max_players"]:
+                await redis_manager.redis.hincrby(key, "current_players", -1)
                 logger.warning("party_full", session_id=session_id)
                 return False
 
-            # Update player count
-            party["current_players"] += 1
-
             # Broadcast player joined
             await connection_manager.broadcast_to_session(
                 session_id,
@@ -157,11 +176,15 @@ class MultiplayerSessionManager:
     ) -> bool:
         """Remove player from party"""
         try:
-            if session_id not in self.active_parties:
+            party = await self._load_party(session_id)
+            if not party:
                 return False
 
-            party = self.active_parties[session_id]
-            party["current_players"] = max(0, party["current_players"] - 1)
+            key = self._party_key(session_id)
+            party["current_players"] = await redis_manager.redis.hincrby(key, "current_players", -1)
+            if party["current_players"] < 0:
+                await redis_manager.redis.hset(key, "current_players", 0)
+                party["current_players"] = 0
 
             # If host leaves, transfer to another player
             if party["host_player_id"] == player_id:
@@ -180,7 +203,8 @@ class MultiplayerSessionManager:
 
             # If party empty, clean up
             if party["current_players"] == 0:
-                del self.active_parties[session_id]
+                await redis_manager.redis.delete(key)
+                await turn_scheduler.cancel(session_id)
 
             logger.info(
                 "player_removed_from_party",
@@ -202,7 +226,9 @@ class MultiplayerSessionManager:
 
             if state and state.get("players"):
                 new_host = state["players"][0]["player_id"]
-                self.active_parties[session_id]["host_player_id"] = new_host
+                await redis_manager.redis.hset(
+                    self._party_key(session_id), "host_player_id", json.dumps(new_host)
+                )
 
                 await connection_manager.broadcast_to_session(
                     session_id,
@@ -220,12 +246,34 @@ class MultiplayerSessionManager:
         self,
         session_id: str,
         state: GameSessionState
-    ):
+    ) -> bool:
         """Start next player's turn in sequential mode"""
+        next_turn = await self._advance_turn(session_id, state)
+        if not next_turn:
+            return False
+        await self._announce_turn(session_id, *next_turn)
+        return True
+
+    async def _advance_turn(
+        self,
+        session_id: str,
+        state: Dict[str, Any]
+    ) -> Optional[tuple]:
+        """
+        Hand the turn to the next player
+
+        The turn fields are compare-and-set against the turn the caller saw,
+        so when a timeout and an end_turn race on different replicas only one
+        of them advances the turn.
+
+        Returns:
+            (next_player, turn_id), or None if there is no next player or the
+            turn already moved on
+        """
         try:
             players = state.get("players", [])
             if not players:
-                return
+                return None
 
             current_turn_player_id = state.get("current_turn_player_id")
 
@@ -240,11 +288,34 @@ class MultiplayerSessionManager:
                 next_index = (current_index + 1) % len(players)
                 next_player = players[next_index]
 
-            # Update state
-            state["current_turn_player_id"] = next_player["player_id"]
-            state["turn_started_at"] = datetime.utcnow().isoformat()
+            turn_id = uuid4().hex
+            updates = {
+                "current_turn_player_id": next_player["player_id"],
+                "current_turn_id": turn_id,
+                "turn_started_at": datetime.utcnow().isoformat()
+            }
+
+            advanced = await redis_manager.update_state_fields(
+                session_id,
+                updates,
+                expected={"current_turn_id": state.get("current_turn_id")}
+            )
+            if not advanced:
+                logger.info("turn_already_advanced", session_id=session_id)
+                return None
+
+            state.update(updates)
+            return next_player, turn_id
+
+        except Exception as e:
+            logger.error("turn_start_failed", error=str(e))
+            return None
 
-            await redis_manager.save_state(session_id, state)
+    async def _announce_turn(self, session_id: str, next_player: Dict[str, Any], turn_id: str):
+        """Broadcast a new turn and schedule its timeout"""
+        try:
+            party = await self._load_party(session_id) or {}
+            turn_timeout = party.get("turn_timeout_seconds", 120)
 
             # Broadcast turn start
             await connection_manager.broadcast_to_session(
@@ -253,51 +324,50 @@ class MultiplayerSessionManager:
                     "event": "turn_started",
                     "player_id": next_player["player_id"],
                     "character_name": next_player.get("character_name"),
-                    "turn_timeout_seconds": self.active_parties[session_id]["turn_timeout_seconds"],
+                    "turn_timeout_seconds": turn_timeout,
                     "timestamp": datetime.utcnow().isoformat()
                 }
             )
 
-            # Start turn timer
-            await self._start_turn_timer(session_id, next_player["player_id"])
+            # Replaces the previous turn's pending timeout
+            await turn_scheduler.schedule(session_id, turn_id, next_player["player_id"], turn_timeout)
 
         except Exception as e:
             logger.error("turn_start_failed", error=str(e))
 
-    async def _start_turn_timer(self, session_id: str, player_id: str):
-        """Start countdown timer for player's turn"""
-        try:
-            # Cancel existing timer
-            if session_id in self.turn_timers:
-                self.turn_timers[session_id].cancel()
-
-            # Create new timer
-            timeout = self.active_parties[session_id]["turn_timeout_seconds"]
-
-            async def turn_timeout():
-                await asyncio.sleep(timeout)
-
-                # Load state
-                state = await redis_manager.load_state(session_id)
-
-                if state and state.get("current_turn_player_id") == player_id:
-                    # Timeout - skip to next player
-                    await connection_manager.broadcast_to_session(
-                        session_id,
-                        {
-                            "event": "turn_timeout",
-                            "player_id": player_id,
-                            "timestamp": datetime.utcnow().isoformat()
-                        }
-                    )
-
-                    # Move to next player
-                    await self._start_next_turn(session_id, state)
+    async def handle_turn_timeout(self, session_id: str, entry: Dict[str, Any]):
+        """
+        Skip to the next player when a turn times out (called by the turn
+        scheduler on whichever replica claimed the timeout)
 
-            self.turn_timers[session_id] = asyncio.create_task(turn_timeout())
+        Args:
+            session_id: Session ID
+            entry: Scheduled timeout (turn_id, player_id, deadline)
+        """
+        state = await redis_manager.load_state_fields(
+            session_id,
+            ["players", "current_turn_player_id", "current_turn_id"]
+        )
+
+        # The turn was ended (or the session removed) before the deadline
+        if state is None or state.get("current_turn_id") != entry["turn_id"]:
+            return
+
+        next_turn = await self._advance_turn(session_id, state)
+        if not next_turn:
+            return
+
+        await connection_manager.broadcast_to_session(
+            session_id,
+            {
+                "event": "turn_timeout",
+                "player_id": entry["player_id"],
+                "timestamp": datetime.utcnow().isoformat()
+            }
+        )
 
-        except Exception as e:
-            logger.error("turn_timer_failed", error=str(e))
+        # Move to next player
+        await self._announce_turn(session_id, *next_turn)
 
     async def end_turn(
         self,
@@ -315,9 +385,12 @@ class MultiplayerSessionManager:
             Success status
         """
         try:
-            state = await redis_manager.load_state(session_id)
+            state = await redis_manager.load_state_fields(
+                session_id,
+                ["players", "current_turn_player_id", "current_turn_id"]
+            )
 
-            if not state:
+            if state is None:
                 return False
 
             # Verify it's this player's turn
@@ -329,9 +402,10 @@ class MultiplayerSessionManager:
                 )
                 return False
 
-            # Cancel turn timer
-            if session_id in self.turn_timers:
-                self.turn_timers[session_id].cancel()
+            # Start next turn (fails if the turn timed out meanwhile)
+            next_turn = await self._advance_turn(session_id, state)
+            if not next_turn:
+                return False
 
             # Broadcast turn ended
             await connection_manager.broadcast_to_session(
@@ -343,8 +417,7 @@ class MultiplayerSessionManager:
                 }
             )
 
-            # Start next turn
-            await self._start_next_turn(session_id, state)
+            await self._announce_turn(session_id, *next_turn)
 
             return True
 
@@ -417,9 +490,11 @@ class MultiplayerSessionManager:
 
     async def get_party_status(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get current party status"""
-        if session_id in self.active_parties:
-            return self.active_parties[session_id]
-        return None
+        try:
+            return await self._load_party(session_id)
+        except Exception as e:
+            logger.error("party_status_failed", session_id=session_id, error=str(e))
+            return None
 
 
 # Global instance
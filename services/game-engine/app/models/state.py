@@ -294,6 +294,9 @@ class GameSessionState(TypedDict, total=False):
     # Workflow state
     current_node: str
     pending_action: Optional[Dict[str, Any]]
+    current_action_id: Optional[str]  # Mailbox action being applied
+    completed_action_id: Optional[str]  # Last mailbox action whose workflow finished
+    failed_action_id: Optional[str]  # Last mailbox action whose workflow failed
     awaiting_player_input: bool
     requires_assessment: bool
     assessment_context: Optional[Dict[str, Any]]
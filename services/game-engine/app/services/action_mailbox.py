@@ -0,0 +1,338 @@
+"""
+Session Action Mailbox
+Ordered per-session queue of player actions with a single consumer.
+
+Actions are appended to a Redis stream per session
+(session:actions:{session_id}). Whichever replica holds the session's
+consumer lease processes them one at a time, oldest first, and deletes each
+entry once it has been handled, so the stream length is the queue depth.
+Enqueueing is one Lua call that rejects duplicates (by action id) and
+actions beyond the maximum depth.
+
+Ordering holds across replicas because only the lease holder consumes. A
+consumer that loses its lease mid-action cancels the action and leaves it
+in the stream. If a replica dies mid-action, the lease expires and the next
+enqueue (or reconnect) starts a consumer elsewhere, which hands the
+unfinished action to the handler again; the handler must be idempotent per
+action_id.
+"""
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+from uuid import uuid4
+
+from ..core.config import settings
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# handler(session_id, action) processes one action
+ActionHandler = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+# KEYS: stream, dedupe key  ARGV: action json, max_depth, dedupe_ttl, stream_ttl
+ENQUEUE_SCRIPT = """
+local existing = redis.call('GET', KEYS[2])
+if existing then
+    return {'duplicate', existing, redis.call('XLEN', KEYS[1])}
+end
+local depth = redis.call('XLEN', KEYS[1])
+if depth >= tonumber(ARGV[2]) then
+    return {'full', '', depth}
+end
+local entry_id = redis.call('XADD', KEYS[1], '*', 'action', ARGV[1])
+redis.call('SET', KEYS[2], entry_id, 'EX', ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return {'queued', entry_id, depth + 1}
+"""
+
+# KEYS: lease  ARGV: token, lease_ms
+RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# KEYS: lease  ARGV: token
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class SessionActionMailbox:
+    """
+    Redis stream mailbox and consumer leases for session actions
+    """
+
+    def __init__(
+        self,
+        max_depth: int = 10,
+        dedupe_ttl_seconds: int = 600,
+        lease_seconds: int = 30
+    ):
+        self.max_depth = max_depth
+        self.dedupe_ttl_seconds = dedupe_ttl_seconds
+        self.lease_ms = lease_seconds * 1000
+        self._handler: Optional[ActionHandler] = None
+        self._consumers: Dict[str, asyncio.Task] = {}
+        self._scripts: Dict[str, Any] = {}
+
+    @staticmethod
+    def _stream_key(session_id: str) -> str:
+        return f"session:actions:{session_id}"
+
+    @staticmethod
+    def _dedupe_key(session_id: str, action_id: str) -> str:
+        return f"session:actions:{session_id}:seen:{action_id}"
+
+    @staticmethod
+    def _lease_key(session_id: str) -> str:
+        return f"session:actions:{session_id}:consumer"
+
+    @staticmethod
+    def _metrics_key(session_id: str) -> str:
+        return f"session:actions:{session_id}:metrics"
+
+    def _script(self, name: str, source: str):
+        from .redis_manager import redis_manager
+
+        if name not in self._scripts:
+            self._scripts[name] = redis_manager.redis.register_script(source)
+        return self._scripts[name]
+
+    def start(self, handler: ActionHandler):
+        """Set the function that processes dequeued actions"""
+        self._handler = handler
+
+    async def stop(self):
+        """Cancel local consumers; their leases are released for other replicas"""
+        consumers = list(self._consumers.values())
+        for task in consumers:
+            task.cancel()
+        if consumers:
+            await asyncio.gather(*consumers, return_exceptions=True)
+
+    async def enqueue(self, session_id: str, action: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Append an action to the session's mailbox and make sure a consumer runs
+
+        Args:
+            session_id: Session ID
+            action: Action payload; action_id is generated if missing
+
+        Returns:
+            Dict with status ("queued", "duplicate" or "full"), action_id,
+            entry_id and depth (queued actions including this one)
+        """
+        from .redis_manager import redis_manager
+
+        action_id = action.get("action_id") or uuid4().hex
+        action = {**action, "action_id": action_id}
+
+        status, entry_id, depth = await self._script("enqueue", ENQUEUE_SCRIPT)(
+            keys=[self._stream_key(session_id), self._dedupe_key(session_id, action_id)],
+            args=[
+                json.dumps(action, default=str),
+                self.max_depth,
+                self.dedupe_ttl_seconds,
+                settings.SESSION_STATE_TTL_SECONDS
+            ]
+        )
+
+        metric = {"queued": "enqueued", "duplicate": "duplicates", "full": "rejected"}[status]
+        await redis_manager.redis.hincrby(self._metrics_key(session_id), metric, 1)
+
+        logger.info(
+            "session_action_enqueued",
+            session_id=session_id,
+            action_id=action_id,
+            status=status,
+            depth=depth
+        )
+
+        if status != "full":
+            await self.ensure_consumer(session_id)
+
+        return {"status": status, "action_id": action_id, "entry_id": entry_id, "depth": depth}
+
+    async def ensure_consumer(self, session_id: str):
+        """Start consuming the session's mailbox here unless a consumer already runs"""
+        from .redis_manager import redis_manager
+
+        task = self._consumers.get(session_id)
+        if task and not task.done():
+            return
+
+        token = uuid4().hex
+        acquired = await redis_manager.redis.set(
+            self._lease_key(session_id), token, px=self.lease_ms, nx=True
+        )
+        if not acquired:
+            # Another replica (or a consumer about to exit) owns the mailbox
+            return
+
+        self._consumers[session_id] = asyncio.create_task(self._consume(session_id, token))
+
+    async def _consume(self, session_id: str, token: str):
+        from .redis_manager import redis_manager
+
+        stream_key = self._stream_key(session_id)
+        lease_key = self._lease_key(session_id)
+        renewer = asyncio.create_task(self._renew(lease_key, token))
+        processing = None
+
+        try:
+            while True:
+                entries = await redis_manager.redis.xrange(stream_key, count=1)
+                if not entries:
+                    await self._script("release", RELEASE_SCRIPT)(keys=[lease_key], args=[token])
+
+                    # An action may have been queued while we held the lease
+                    if await redis_manager.redis.xlen(stream_key) and await redis_manager.redis.set(
+                        lease_key, token, px=self.lease_ms, nx=True
+                    ):
+                        continue
+                    break
+
+                if renewer.done():
+                    logger.warning("session_action_lease_lost", session_id=session_id)
+                    break
+
+                entry_id, fields = entries[0]
+                processing = asyncio.create_task(self._process(session_id, entry_id, fields))
+                await asyncio.wait([processing, renewer], return_when=asyncio.FIRST_COMPLETED)
+
+                if not processing.done():
+                    # Another replica may own the mailbox now; it resumes the action
+                    processing.cancel()
+                    await asyncio.gather(processing, return_exceptions=True)
+                    logger.warning("session_action_lease_lost", session_id=session_id, entry_id=entry_id)
+                    break
+                processing.result()
+
+                # Only the lease holder removes the entry
+                if not await self._script("renew", RENEW_SCRIPT)(keys=[lease_key], args=[token, self.lease_ms]):
+                    logger.warning("session_action_lease_lost", session_id=session_id, entry_id=entry_id)
+                    break
+                await redis_manager.redis.xdel(stream_key, entry_id)
+
+        except asyncio.CancelledError:
+            if processing and not processing.done():
+                processing.cancel()
+                await asyncio.gather(processing, return_exceptions=True)
+            await self._script("release", RELEASE_SCRIPT)(keys=[lease_key], args=[token])
+            raise
+        except Exception as e:
+            logger.error("session_action_consumer_failed", session_id=session_id, error=str(e))
+            await self._script("release", RELEASE_SCRIPT)(keys=[lease_key], args=[token])
+        finally:
+            renewer.cancel()
+            if self._consumers.get(session_id) is asyncio.current_task():
+                del self._consumers[session_id]
+
+    async def _renew(self, lease_key: str, token: str):
+        """Keep the lease while the consumer runs; returns once it is lost"""
+        while True:
+            await asyncio.sleep(self.lease_ms / 3000)
+            try:
+                renewed = await self._script("renew", RENEW_SCRIPT)(keys=[lease_key], args=[token, self.lease_ms])
+                if not renewed:
+                    return
+            except Exception as e:
+                logger.error("session_action_lease_renew_failed", error=str(e))
+
+    async def _process(self, session_id: str, entry_id: str, fields: Dict[str, str]):
+        from .redis_manager import redis_manager
+
+        # Stream ids start with the enqueue time in ms (Redis clock)
+        enqueued_ms = int(entry_id.split("-")[0])
+        started = time.time()
+        wait_ms = max(0, int(started * 1000) - enqueued_ms)
+
+        succeeded = True
+        try:
+            await self._handler(session_id, json.loads(fields["action"]))
+        except Exception as e:
+            succeeded = False
+            logger.error("session_action_failed", session_id=session_id, entry_id=entry_id, error=str(e))
+
+        process_ms = int((time.time() - started) * 1000)
+
+        pipe = redis_manager.redis.pipeline(transaction=False)
+        metrics_key = self._metrics_key(session_id)
+        pipe.hincrby(metrics_key, "processed" if succeeded else "failed", 1)
+        pipe.hincrby(metrics_key, "wait_ms_total", wait_ms)
+        pipe.hincrby(metrics_key, "process_ms_total", process_ms)
+        pipe.hset(metrics_key, mapping={"last_wait_ms": wait_ms, "last_process_ms": process_ms})
+        pipe.hsetnx(metrics_key, "first_processed_ms", int(started * 1000))
+        pipe.expire(metrics_key, settings.SESSION_STATE_TTL_SECONDS)
+        await pipe.execute()
+
+        logger.info(
+            "session_action_processed",
+            session_id=session_id,
+            entry_id=entry_id,
+            succeeded=succeeded,
+            wait_ms=wait_ms,
+            process_ms=process_ms
+        )
+
+    async def get_metrics(self, session_id: str) -> Dict[str, Any]:
+        """
+        Queue depth, throughput and latency for a session's mailbox
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Counters, actions per minute and average wait/processing time
+            per action
+        """
+        from .redis_manager import redis_manager
+
+        pipe = redis_manager.redis.pipeline(transaction=False)
+        pipe.xlen(self._stream_key(session_id))
+        pipe.hgetall(self._metrics_key(session_id))
+        pipe.exists(self._lease_key(session_id))
+        depth, raw, consuming = await pipe.execute()
+
+        counters = {field: int(value) for field, value in raw.items()}
+        handled = counters.get("processed", 0) + counters.get("failed", 0)
+
+        # Actions handled per minute since the first one was picked up
+        throughput = None
+        if handled and "first_processed_ms" in counters:
+            elapsed_minutes = (time.time() * 1000 - counters["first_processed_ms"]) / 60000
+            throughput = round(handled / max(elapsed_minutes, 1 / 60), 2)
+
+        return {
+            "session_id": session_id,
+            "depth": depth,
+            "max_depth": self.max_depth,
+            "consumer_active": bool(consuming),
+            "enqueued": counters.get("enqueued", 0),
+            "duplicates": counters.get("duplicates", 0),
+            "rejected": counters.get("rejected", 0),
+            "processed": counters.get("processed", 0),
+            "failed": counters.get("failed", 0),
+            "actions_per_minute": throughput,
+            "avg_wait_ms": round(counters.get("wait_ms_total", 0) / handled, 1) if handled else None,
+            "avg_process_ms": round(counters.get("process_ms_total", 0) / handled, 1) if handled else None,
+            "last_wait_ms": counters.get("last_wait_ms"),
+            "last_process_ms": counters.get("last_process_ms")
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {"local_consumers": len(self._consumers)}
+
+
+# Global instance
+action_mailbox = SessionActionMailbox(
+    max_depth=settings.SESSION_ACTION_QUEUE_MAX_DEPTH,
+    dedupe_ttl_seconds=settings.SESSION_ACTION_DEDUPE_TTL_SECONDS,
+    lease_seconds=settings.SESSION_ACTION_LEASE_SECONDS
+)
@@ -0,0 +1,205 @@
+"""
+MCP Response Cache
+Single-flight request coalescing plus a two-tier (in-process LRU + Redis)
+read-through cache for MCP GET endpoints.
+
+Entries are tagged with the entities they describe (npc:{id},
+inventory:{player_id}, ...) so write calls can invalidate every cached
+response about an entity. Redis entries are removed on invalidation; other
+replicas' in-process copies expire after at most MCP_CACHE_LOCAL_TTL_SECONDS.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple
+
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# A fetch returns (data, cacheable); fallback/error responses are not cached
+Fetch = Callable[[], Awaitable[Tuple[Optional[Any], bool]]]
+
+
+class MCPResponseCache:
+    """
+    Coalesces identical in-flight GETs and caches their responses.
+
+    Local entries hold codec-encoded bytes, so every hit decodes a fresh
+    object and callers can mutate what they get back.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        local_ttl_seconds: int = 15,
+        tag_ttl_seconds: int = 3600,
+        enabled: bool = True
+    ):
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.local_ttl_seconds = local_ttl_seconds
+        # Redis tag sets must outlive every entry they point at
+        self.tag_ttl_seconds = tag_ttl_seconds
+        # key -> (expires_at, encoded payload, tags)
+        self._entries: "OrderedDict[str, Tuple[float, bytes, Tuple[str, ...]]]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        # Bumped by invalidate() so fetches that started earlier aren't cached
+        self._generation = 0
+        self.stats = {
+            "local_hits": 0,
+            "redis_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "invalidations": 0
+        }
+
+    @staticmethod
+    def _tag_key(tag: str) -> str:
+        return f"mcp:tag:{tag}"
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        tags: Iterable[str],
+        ttl_seconds: int,
+        fetch: Fetch
+    ) -> Optional[Any]:
+        """
+        Return a cached response or fetch it, sharing one fetch per key.
+
+        Args:
+            key: Cache key (unique per server + endpoint)
+            tags: Entity tags used for invalidation
+            ttl_seconds: TTL for the Redis tier
+            fetch: Coroutine factory performing the MCP request
+
+        Returns:
+            Response data
+        """
+        from .redis_manager import redis_manager
+
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.stats["local_hits"] += 1
+            return redis_manager.codec.decode(entry[1])
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, tuple(tags), ttl_seconds, fetch))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._release(key, done))
+        else:
+            self.stats["coalesced"] += 1
+
+        # Shielded so one cancelled caller doesn't cancel the shared fetch
+        payload = await asyncio.shield(task)
+        return redis_manager.codec.decode(payload) if payload is not None else None
+
+    def _release(self, key: str, task: asyncio.Future) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+    async def _load(
+        self,
+        key: str,
+        tags: Tuple[str, ...],
+        ttl_seconds: int,
+        fetch: Fetch
+    ) -> Optional[bytes]:
+        from .redis_manager import redis_manager
+
+        if redis_manager.redis_binary:
+            try:
+                payload = await redis_manager.redis_binary.get(key)
+                if payload:
+                    self.stats["redis_hits"] += 1
+                    self._store_local(key, tags, ttl_seconds, payload)
+                    return payload
+            except Exception as e:
+                logger.warning("mcp_cache_redis_get_failed", key=key, error=str(e))
+
+        self.stats["misses"] += 1
+        generation = self._generation
+        data, cacheable = await fetch()
+        if data is None:
+            return None
+
+        payload = redis_manager.codec.encode(data)
+        if cacheable and generation == self._generation:
+            self._store_local(key, tags, ttl_seconds, payload)
+            await self._store_redis(key, tags, ttl_seconds, payload)
+        return payload
+
+    def _store_local(self, key: str, tags: Tuple[str, ...], ttl_seconds: int, payload: bytes) -> None:
+        ttl = min(ttl_seconds, self.local_ttl_seconds)
+        self._entries[key] = (time.monotonic() + ttl, payload, tags)
+        self._entries.move_to_end(key)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            evicted_key, (_, _, evicted_tags) = self._entries.popitem(last=False)
+            self._untag(evicted_key, evicted_tags)
+
+    def _untag(self, key: str, tags: Tuple[str, ...]) -> None:
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    async def _store_redis(self, key: str, tags: Tuple[str, ...], ttl_seconds: int, payload: bytes) -> None:
+        from .redis_manager import redis_manager
+
+        if not redis_manager.redis_binary:
+            return
+        try:
+            pipe = redis_manager.redis_binary.pipeline(transaction=False)
+            pipe.setex(key, ttl_seconds, payload)
+            for tag in tags:
+                pipe.sadd(self._tag_key(tag), key)
+                pipe.expire(self._tag_key(tag), self.tag_ttl_seconds)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("mcp_cache_redis_set_failed", key=key, error=str(e))
+
+    async def invalidate(self, *tags: str) -> None:
+        """
+        Drop every cached response carrying one of the tags.
+
+        Args:
+            tags: Entity tags, e.g. "npc:{npc_id}"
+        """
+        from .redis_manager import redis_manager
+
+        self._generation += 1
+        for tag in tags:
+            for key in list(self._tags.get(tag, ())):
+                entry = self._entries.pop(key, None)
+                if entry:
+                    self._untag(key, entry[2])
+            self._tags.pop(tag, None)
+        self.stats["invalidations"] += 1
+
+        if not redis_manager.redis_binary:
+            return
+        try:
+            pipe = redis_manager.redis_binary.pipeline(transaction=False)
+            for tag in tags:
+                pipe.smembers(self._tag_key(tag))
+            members = await pipe.execute()
+
+            keys = [self._tag_key(tag) for tag in tags]
+            for tag_members in members:
+                keys.extend(tag_members)
+            await redis_manager.redis_binary.delete(*keys)
+        except Exception as e:
+            logger.warning("mcp_cache_invalidate_failed", tags=list(tags), error=str(e))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for the health endpoint"""
+        return {**self.stats, "local_entries": len(self._entries), "in_flight": len(self._in_flight)}
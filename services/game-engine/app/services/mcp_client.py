@@ -2,8 +2,12 @@
 MCP (Model Context Protocol) Client
 Integrates with MCP servers for player data, NPCs, world info, etc.
 """
+import time
+from collections import deque
+from typing import Dict, Any, Iterable, Optional, List, Tuple
+
 import httpx
-from typing import Dict, Any, Optional, List
+
 from ..core.config import settings
 from ..core.logging import get_logger
 from ..core.error_handling import (
@@ -13,13 +17,75 @@ from ..core.error_handling import (
     GracefulDegradation,
     circuit_breakers
 )
+from .mcp_cache import MCPResponseCache
+
+try:
+    import h2  # noqa: F401  (httpx needs it for HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 logger = get_logger(__name__)
 
 
+class MCPServerMetrics:
+    """
+    Request latency and connection-pool usage for one MCP server
+    """
+
+    def __init__(self, max_connections: int, sample_size: int = 500):
+        self.max_connections = max_connections
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.saturated_requests = 0
+        self._latencies_ms = deque(maxlen=sample_size)
+
+    def request_started(self) -> float:
+        self.requests += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        if self.in_flight > self.max_connections:
+            # Request has to wait for a pooled connection
+            self.saturated_requests += 1
+        return time.perf_counter()
+
+    def request_finished(self, started_at: float, failed: bool = False) -> None:
+        self.in_flight -= 1
+        self._latencies_ms.append((time.perf_counter() - started_at) * 1000)
+        if failed:
+            self.errors += 1
+
+    def _percentile(self, sorted_latencies: List[float], percentile: float) -> float:
+        index = min(int(len(sorted_latencies) * percentile), len(sorted_latencies) - 1)
+        return round(sorted_latencies[index], 2)
+
+    def snapshot(self) -> Dict[str, Any]:
+        latencies = sorted(self._latencies_ms)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "max_connections": self.max_connections,
+            "pool_utilization": round(self.in_flight / self.max_connections, 2) if self.max_connections else 0,
+            "saturated_requests": self.saturated_requests,
+            "latency_ms": {
+                "p50": self._percentile(latencies, 0.50),
+                "p95": self._percentile(latencies, 0.95),
+                "max": round(latencies[-1], 2)
+            } if latencies else None
+        }
+
+
 class MCPClient:
     """
     Client for communicating with MCP servers
+
+    Each server gets one long-lived httpx.AsyncClient (keep-alive connection
+    pool, optional HTTP/2), opened by connect() from the app lifespan and
+    closed by disconnect().
     """
 
     def __init__(self):
@@ -31,7 +97,25 @@ class MCPClient:
             "item_equipment": settings.MCP_ITEM_EQUIPMENT_URL,
         }
         self.auth_token = settings.MCP_AUTH_TOKEN
-        self.timeout = httpx.Timeout(30.0)
+        self.limits = httpx.Limits(
+            max_connections=settings.MCP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.MCP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.MCP_KEEPALIVE_EXPIRY_SECONDS
+        )
+        self.http2 = settings.MCP_HTTP2 and HTTP2_AVAILABLE
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self.metrics: Dict[str, MCPServerMetrics] = {
+            server: MCPServerMetrics(settings.MCP_MAX_CONNECTIONS)
+            for server in self.urls
+        }
+        # Read-through cache for GET endpoint families in MCP_CACHE_TTLS
+        self.cache_ttls: Dict[str, int] = settings.MCP_CACHE_TTLS
+        self.cache = MCPResponseCache(
+            max_entries=settings.MCP_CACHE_MAX_ENTRIES,
+            local_ttl_seconds=settings.MCP_CACHE_LOCAL_TTL_SECONDS,
+            tag_ttl_seconds=max(self.cache_ttls.values(), default=3600),
+            enabled=settings.MCP_CACHE_ENABLED
+        )
 
     def _get_headers(self) -> Dict[str, str]:
         """Get request headers with auth token"""
@@ -40,15 +124,101 @@ class MCPClient:
             "Content-Type": "application/json"
         }
 
+    def _get_timeout(self, server: str) -> httpx.Timeout:
+        """Per-server request timeout (MCP_SERVER_TIMEOUTS overrides the default)"""
+        return httpx.Timeout(
+            settings.MCP_SERVER_TIMEOUTS.get(server, settings.MCP_TIMEOUT_SECONDS),
+            connect=settings.MCP_CONNECT_TIMEOUT_SECONDS
+        )
+
+    async def connect(self):
+        """Open the pooled HTTP client for every MCP server"""
+        if settings.MCP_HTTP2 and not HTTP2_AVAILABLE:
+            logger.warning("mcp_http2_unavailable", reason="h2 package not installed")
+
+        for server in self.urls:
+            self._get_client(server)
+
+        logger.info(
+            "mcp_clients_opened",
+            servers=list(self._clients),
+            http2=self.http2,
+            max_connections=self.limits.max_connections,
+            max_keepalive_connections=self.limits.max_keepalive_connections
+        )
+
+    async def disconnect(self):
+        """Close all pooled HTTP clients"""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+        logger.info("mcp_clients_closed")
+
+    def _get_client(self, server: str) -> httpx.AsyncClient:
+        """Pooled client for a server, opened on first use if connect() was not called"""
+        client = self._clients.get(server)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=self.urls[server],
+                headers=self._get_headers(),
+                timeout=self._get_timeout(server),
+                limits=self.limits,
+                http2=self.http2
+            )
+            self._clients[server] = client
+        return client
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-server latency and pool metrics (plus response cache stats) for the health endpoint"""
+        metrics = {server: server_metrics.snapshot() for server, server_metrics in self.metrics.items()}
+        metrics["cache"] = self.cache.get_stats()
+        return metrics
+
+    async def _get(
+        self,
+        server: str,
+        endpoint: str,
+        cache_family: Optional[str] = None,
+        tags: Iterable[str] = ()
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Make GET request to MCP server, through the response cache when the
+        endpoint belongs to a cached family
+
+        Args:
+            server: MCP server name
+            endpoint: Endpoint path
+            cache_family: Key into MCP_CACHE_TTLS, or None to bypass the cache
+            tags: Entity tags that invalidate this response
+        """
+        ttl_seconds = self.cache_ttls.get(cache_family) if cache_family else None
+        if not ttl_seconds or not self.cache.enabled:
+            data, _ = await self._fetch(server, endpoint)
+            return data
+
+        return await self.cache.get_or_fetch(
+            f"mcp:{server}:{endpoint}",
+            tags,
+            ttl_seconds,
+            lambda: self._fetch(server, endpoint)
+        )
+
     @async_with_retry(max_attempts=3, delay=0.5, exceptions=(httpx.TimeoutException, httpx.ConnectError))
-    async def _get(self, server: str, endpoint: str) -> Optional[Dict[str, Any]]:
-        """Make GET request to MCP server with retry logic"""
+    async def _fetch(self, server: str, endpoint: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Make GET request to MCP server with retry logic
+
+        Returns:
+            (data, True) on success, (fallback data, False) on failure
+        """
+        metrics = self.metrics[server]
+        started_at = metrics.request_started()
+        failed = True
         try:
-            url = f"{self.urls[server]}{endpoint}"
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=self._get_headers())
-                response.raise_for_status()
-                return response.json()
+            response = await self._get_client(server).get(endpoint)
+            response.raise_for_status()
+            failed = False
+            return response.json(), True
         except httpx.HTTPStatusError as e:
             logger.error(
                 "mcp_get_http_error",
@@ -62,7 +232,7 @@ class MCPClient:
                 service_name=server,
                 error=e,
                 fallback_data=self._get_fallback_data(server, endpoint)
-            )
+            ), False
         except Exception as e:
             logger.error(
                 "mcp_get_failed",
@@ -74,7 +244,9 @@ class MCPClient:
                 service_name=server,
                 error=e,
                 fallback_data=self._get_fallback_data(server, endpoint)
-            )
+            ), False
+        finally:
+            metrics.request_finished(started_at, failed=failed)
 
     @async_with_retry(max_attempts=3, delay=0.5, exceptions=(httpx.TimeoutException, httpx.ConnectError))
     async def _post(
@@ -84,16 +256,14 @@ class MCPClient:
         data: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
         """Make POST request to MCP server with retry logic"""
+        metrics = self.metrics[server]
+        started_at = metrics.request_started()
+        failed = True
         try:
-            url = f"{self.urls[server]}{endpoint}"
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    url,
-                    headers=self._get_headers(),
-                    json=data
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self._get_client(server).post(endpoint, json=data)
+            response.raise_for_status()
+            failed = False
+            return response.json()
         except httpx.HTTPStatusError as e:
             logger.error(
                 "mcp_post_http_error",
@@ -119,6 +289,8 @@ class MCPClient:
                 error=e,
                 fallback_data=None
             )
+        finally:
+            metrics.request_finished(started_at, failed=failed)
 
     def _get_fallback_data(self, server: str, endpoint: str) -> Optional[Dict[str, Any]]:
         """
@@ -156,7 +328,9 @@ class MCPClient:
         """Get character information"""
         return await self._get(
             "player_data",
-            f"/mcp/character-info/{character_id}"
+            f"/mcp/character-info/{character_id}",
+            cache_family="character_info",
+            tags=(f"character:{character_id}",)
         )
 
     # ============================================
@@ -167,7 +341,9 @@ class MCPClient:
         """Get NPC details"""
         return await self._get(
             "npc_personality",
-            f"/mcp/npc/{npc_id}"
+            f"/mcp/npc/{npc_id}",
+            cache_family="npc",
+            tags=(f"npc:{npc_id}",)
         )
 
     async def get_npc_context(
@@ -178,7 +354,9 @@ class MCPClient:
         """Get NPC context including relationship with player"""
         return await self._get(
             "npc_personality",
-            f"/mcp/npc-context/{npc_id}/{profile_id}"
+            f"/mcp/npc-context/{npc_id}/{profile_id}",
+            cache_family="npc_context",
+            tags=(f"npc:{npc_id}",)
         )
 
     async def get_location_npcs(
@@ -207,11 +385,15 @@ class MCPClient:
         interaction_data: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
         """Record player-NPC interaction"""
-        return await self._post(
+        result = await self._post(
             "npc_personality",
             "/mcp/record-interaction",
             interaction_data
         )
+        # NPC details and relationship context change with every interaction
+        if interaction_data.get("npc_id"):
+            await self.cache.invalidate(f"npc:{interaction_data['npc_id']}")
+        return result
 
     # ============================================
     # World/Universe MCP
@@ -221,7 +403,9 @@ class MCPClient:
         """Get world details"""
         return await self._get(
             "world_universe",
-            f"/mcp/world/{world_id}"
+            f"/mcp/world/{world_id}",
+            cache_family="world",
+            tags=(f"world:{world_id}",)
         )
 
     async def get_region(
@@ -243,7 +427,9 @@ class MCPClient:
         """Get location/scene details"""
         return await self._get(
             "world_universe",
-            f"/mcp/world/{world_id}/location/{location_id}"
+            f"/mcp/world/{world_id}/location/{location_id}",
+            cache_family="location",
+            tags=(f"world:{world_id}", f"location:{location_id}")
         )
 
     # ============================================
@@ -298,7 +484,9 @@ class MCPClient:
         """Get player's inventory"""
         return await self._get(
             "item_equipment",
-            f"/mcp/player/{player_id}/inventory"
+            f"/mcp/player/{player_id}/inventory",
+            cache_family="player_inventory",
+            tags=(f"inventory:{player_id}",)
         )
 
     async def add_item_to_inventory(
@@ -308,11 +496,13 @@ class MCPClient:
         quantity: int = 1
     ) -> Optional[Dict[str, Any]]:
         """Add item to player inventory"""
-        return await self._post(
+        result = await self._post(
             "item_equipment",
             f"/mcp/player/{player_id}/inventory/add",
             {"item_id": item_id, "quantity": quantity}
         )
+        await self.cache.invalidate(f"inventory:{player_id}")
+        return result
 
 
 # Global instance
@@ -5,6 +5,7 @@ Handles long-term storage of game sessions, chat history, and assessments
 from typing import Dict, Any, List, Optional
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from datetime import datetime
+import hashlib
 import json
 
 from ..core.config import settings
@@ -19,9 +20,21 @@ class MongoPersistence:
     MongoDB persistence manager for game engine
     """
 
+    # Append-only history lists stored on the session document
+    HISTORY_FIELDS = (
+        "action_history",
+        "conversation_history",
+        "event_log",
+        "world_changes"
+    )
+
     def __init__(self):
         self.client: Optional[AsyncIOMotorClient] = None
         self.db: Optional[AsyncIOMotorDatabase] = None
+        # session_id -> {"counts": persisted list lengths, "digests": scalar field hashes,
+        #                "history_digests": chain digests of the persisted lists,
+        #                "tails": digests of each persisted list's last entry}
+        self._persisted_sessions: Dict[str, Dict[str, Any]] = {}
 
     async def connect(self):
         """Connect to MongoDB"""
@@ -106,7 +119,12 @@ class MongoPersistence:
 
     async def save_session(self, state: GameSessionState) -> bool:
         """
-        Save complete game session to MongoDB
+        Save game session to MongoDB
+
+        In "incremental" mode (SESSION_PERSISTENCE_MODE) only new history
+        entries and changed scalar fields are written; the full document is
+        rewritten on the first save in this process or when a history list
+        no longer extends what was persisted.
 
         Args:
             state: Game session state
@@ -114,59 +132,249 @@ class MongoPersistence:
         Returns:
             Success status
         """
+        session_id = state.get("session_id")
         try:
-            session_id = state.get("session_id")
+            if settings.SESSION_PERSISTENCE_MODE == "incremental":
+                saved = await self._save_session_incremental(state)
+                if saved:
+                    return True
 
-            # Prepare document
-            session_doc = {
-                "session_id": session_id,
-                "campaign_id": state.get("campaign_id"),
-                "status": state.get("status"),
-                "started_at": state.get("started_at"),
-                "last_updated": datetime.utcnow().isoformat(),
-                "players": state.get("players", []),
-                "current_quest_id": state.get("current_quest_id"),
-                "current_scene_id": state.get("current_scene_id"),
-                "completed_quest_ids": state.get("completed_quest_ids", []),
-                "completed_scene_ids": state.get("completed_scene_ids", []),
-                "action_history": state.get("action_history", []),
-                "conversation_history": state.get("conversation_history", []),
-                "event_log": state.get("event_log", []),
-                "world_changes": state.get("world_changes", []),
-                "elapsed_game_time": state.get("elapsed_game_time", 0),
-                "time_of_day": state.get("time_of_day"),
-                "party_settings": state.get("party_settings"),
-                "metadata": {
-                    "action_count": len(state.get("action_history", [])),
-                    "quest_count": len(state.get("completed_quest_ids", [])),
-                    "total_chat_messages": len(state.get("chat_messages", [])),
-                    "conversation_turns": len(state.get("conversation_history", []))
-                }
-            }
-
-            # Upsert session
-            await self.db.game_sessions.update_one(
-                {"session_id": session_id},
-                {"$set": session_doc},
-                upsert=True
-            )
-
-            logger.info(
-                "session_saved_to_mongodb",
-                session_id=session_id,
-                action_count=len(state.get("action_history", []))
-            )
-
-            return True
+            return await self._save_session_full(state)
 
         except Exception as e:
+            self._persisted_sessions.pop(session_id, None)
             logger.error(
                 "session_save_failed",
-                session_id=state.get("session_id"),
+                session_id=session_id,
                 error=str(e)
             )
             return False
 
+    def _session_fields(self, state: GameSessionState) -> Dict[str, Any]:
+        """Scalar (non-history) fields mirrored into the session document"""
+        return {
+            "session_id": state.get("session_id"),
+            "campaign_id": state.get("campaign_id"),
+            "status": state.get("status"),
+            "started_at": state.get("started_at"),
+            "players": state.get("players", []),
+            "current_quest_id": state.get("current_quest_id"),
+            "current_scene_id": state.get("current_scene_id"),
+            "completed_quest_ids": state.get("completed_quest_ids", []),
+            "completed_scene_ids": state.get("completed_scene_ids", []),
+            "elapsed_game_time": state.get("elapsed_game_time", 0),
+            "time_of_day": state.get("time_of_day"),
+            "party_settings": state.get("party_settings")
+        }
+
+    @staticmethod
+    def _session_metadata(state: GameSessionState) -> Dict[str, Any]:
+        return {
+            "action_count": len(state.get("action_history", [])),
+            "quest_count": len(state.get("completed_quest_ids", [])),
+            "total_chat_messages": len(state.get("chat_messages", [])),
+            "conversation_turns": len(state.get("conversation_history", []))
+        }
+
+    @staticmethod
+    def _field_digest(value: Any) -> str:
+        """Digest of a value or history entry (stable across processes)"""
+        encoded = json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+    @staticmethod
+    def _history_digest(entries: List[Any], digest: str = "") -> str:
+        """Digest of a history list, extendable with appended entries"""
+        for entry in entries:
+            encoded = json.dumps(entry, sort_keys=True, default=str).encode("utf-8")
+            digest = hashlib.blake2b(digest.encode() + encoded, digest_size=8).hexdigest()
+        return digest
+
+    def _history_extends(self, persisted: Dict[str, Any], field: str, entries: List[Any]) -> bool:
+        """
+        True if entries still start with the persisted list. Checks the last
+        persisted entry only; the whole prefix is digested just once, when
+        the bookkeeping was seeded from the stored document.
+        """
+        stored_count = persisted["counts"].get(field, 0)
+        if len(entries) < stored_count:
+            return False
+        if not stored_count:
+            return True
+
+        tail = persisted["tails"].get(field)
+        if tail is None:
+            if self._history_digest(entries[:stored_count]) != persisted["history_digests"].get(field, ""):
+                return False
+            persisted["tails"][field] = self._field_digest(entries[stored_count - 1])
+            return True
+        return self._field_digest(entries[stored_count - 1]) == tail
+
+    async def _save_session_full(self, state: GameSessionState) -> bool:
+        """Rewrite the whole session document"""
+        session_id = state.get("session_id")
+        fields = self._session_fields(state)
+
+        session_doc = {
+            **fields,
+            "last_updated": datetime.utcnow().isoformat(),
+            "metadata": self._session_metadata(state)
+        }
+        history_digests = {}
+        tails = {}
+        for field in self.HISTORY_FIELDS:
+            entries = state.get(field, [])
+            history_digests[field] = self._history_digest(entries)
+            if entries:
+                tails[field] = self._field_digest(entries[-1])
+            session_doc[field] = entries
+            session_doc[f"history_counts.{field}"] = len(entries)
+            session_doc[f"history_digests.{field}"] = history_digests[field]
+
+        # Upsert session
+        await self.db.game_sessions.update_one(
+            {"session_id": session_id},
+            {"$set": session_doc},
+            upsert=True
+        )
+
+        # history_counts.chat_messages is owned by append_chat_messages
+        persisted = self._persisted_sessions.get(session_id, {})
+        counts = {
+            field: len(state.get(field, []))
+            for field in self.HISTORY_FIELDS
+        }
+        if "chat_messages" in persisted.get("counts", {}):
+            counts["chat_messages"] = persisted["counts"]["chat_messages"]
+        if "chat_messages" in persisted.get("history_digests", {}):
+            history_digests["chat_messages"] = persisted["history_digests"]["chat_messages"]
+        if "chat_messages" in persisted.get("tails", {}):
+            tails["chat_messages"] = persisted["tails"]["chat_messages"]
+        self._persisted_sessions[session_id] = {
+            "counts": counts,
+            "history_digests": history_digests,
+            "tails": tails,
+            "digests": {
+                field: self._field_digest(value)
+                for field, value in fields.items()
+            }
+        }
+
+        logger.info(
+            "session_saved_to_mongodb",
+            session_id=session_id,
+            mode="full",
+            action_count=len(state.get("action_history", []))
+        )
+
+        return True
+
+    async def _load_persisted_counts(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Per-process persistence bookkeeping, seeded from the stored history_counts"""
+        persisted = self._persisted_sessions.get(session_id)
+        if persisted is not None:
+            return persisted
+
+        doc = await self.db.game_sessions.find_one(
+            {"session_id": session_id},
+            {"history_counts": 1, "history_digests": 1}
+        )
+        if not doc or "history_counts" not in doc:
+            return None
+
+        # Scalar digests are unknown, so the next save rewrites every scalar
+        # field; tails are unknown, so each list's prefix is checked once
+        persisted = {
+            "counts": dict(doc["history_counts"]),
+            "digests": {},
+            "history_digests": dict(doc.get("history_digests", {})),
+            "tails": {}
+        }
+        self._persisted_sessions[session_id] = persisted
+        return persisted
+
+    async def _save_session_incremental(self, state: GameSessionState) -> bool:
+        """
+        Push new history entries and set changed scalar fields.
+
+        Returns:
+            False if the document has to be rewritten in full instead
+        """
+        session_id = state.get("session_id")
+        persisted = await self._load_persisted_counts(session_id)
+        if persisted is None:
+            return False
+
+        counts = persisted["counts"]
+        digests = persisted["digests"]
+        history_digests = persisted["history_digests"]
+
+        set_fields: Dict[str, Any] = {}
+        new_digests: Dict[str, str] = {}
+        for field, value in self._session_fields(state).items():
+            new_digests[field] = self._field_digest(value)
+            if digests.get(field) != new_digests[field]:
+                set_fields[field] = value
+
+        push_fields: Dict[str, Any] = {}
+        new_counts = dict(counts)
+        new_history_digests = dict(history_digests)
+        new_tails: Dict[str, str] = {}
+        # Guard on the stored high-water marks and digests so a concurrent
+        # writer can't make us push the same entries twice
+        query: Dict[str, Any] = {"session_id": session_id}
+        for field in self.HISTORY_FIELDS:
+            entries = state.get(field, [])
+            stored_count = counts.get(field, 0)
+            stored_digest = history_digests.get(field, "")
+
+            if not self._history_extends(persisted, field, entries):
+                # History was replaced (e.g. a save point was loaded), even if
+                # it has since grown past the stored length
+                return False
+
+            if len(entries) > stored_count:
+                # Only the new entries are digested, chained onto the stored digest
+                push_fields[field] = {"$each": entries[stored_count:]}
+                new_counts[field] = len(entries)
+                new_history_digests[field] = self._history_digest(entries[stored_count:], stored_digest)
+                new_tails[field] = self._field_digest(entries[-1])
+                set_fields[f"history_counts.{field}"] = new_counts[field]
+                set_fields[f"history_digests.{field}"] = new_history_digests[field]
+                query[f"history_counts.{field}"] = stored_count
+                if stored_count:
+                    query[f"history_digests.{field}"] = stored_digest
+
+        set_fields["last_updated"] = datetime.utcnow().isoformat()
+        set_fields["metadata"] = self._session_metadata(state)
+
+        update: Dict[str, Any] = {"$set": set_fields}
+        if push_fields:
+            update["$push"] = push_fields
+
+        result = await self.db.game_sessions.update_one(query, update)
+        if result.matched_count == 0:
+            # Document is missing or another writer moved the high-water marks
+            self._persisted_sessions.pop(session_id, None)
+            return False
+
+        self._persisted_sessions[session_id] = {
+            "counts": new_counts,
+            "digests": new_digests,
+            "history_digests": new_history_digests,
+            "tails": {**persisted["tails"], **new_tails}
+        }
+
+        logger.info(
+            "session_saved_to_mongodb",
+            session_id=session_id,
+            mode="incremental",
+            fields_written=len(set_fields),
+            history_entries_appended=sum(len(p["$each"]) for p in push_fields.values())
+        )
+
+        return True
+
     async def load_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
         Load game session from MongoDB
@@ -229,6 +437,8 @@ class MongoPersistence:
     async def delete_session(self, session_id: str) -> bool:
         """Delete a game session and all related data"""
         try:
+            self._persisted_sessions.pop(session_id, None)
+
             # Delete session document
             result = await self.db.game_sessions.delete_one({"session_id": session_id})
 
@@ -322,6 +532,70 @@ class MongoPersistence:
             logger.error("chat_batch_save_failed", error=str(e))
             return False
 
+    async def append_chat_messages(
+        self,
+        session_id: str,
+        messages: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        Save only the chat messages past the session's persisted high-water mark
+
+        Args:
+            session_id: Session ID
+            messages: Full chat message list from the session state
+
+        Returns:
+            Success status
+        """
+        try:
+            persisted = await self._load_persisted_counts(session_id)
+            stored_count = persisted["counts"].get("chat_messages", 0) if persisted else 0
+            stored_digest = persisted["history_digests"].get("chat_messages") if persisted else ""
+
+            if persisted is not None and not self._history_extends(persisted, "chat_messages", messages):
+                # Chat list was replaced (save point load), possibly grown
+                # since: store the messages that aren't stored yet
+                new_messages = await self._unsaved_chat_messages(session_id, messages)
+                digest = self._history_digest(messages)
+            else:
+                new_messages = messages[stored_count:]
+                digest = self._history_digest(new_messages, stored_digest or "")
+
+            if new_messages and not await self.save_chat_messages_batch(session_id, new_messages):
+                return False
+
+            await self.db.game_sessions.update_one(
+                {"session_id": session_id},
+                {"$set": {
+                    "history_counts.chat_messages": len(messages),
+                    "history_digests.chat_messages": digest
+                }}
+            )
+            if persisted is not None:
+                persisted["counts"]["chat_messages"] = len(messages)
+                persisted["history_digests"]["chat_messages"] = digest
+                if messages:
+                    persisted["tails"]["chat_messages"] = self._field_digest(messages[-1])
+
+            return True
+
+        except Exception as e:
+            logger.error("chat_append_failed", session_id=session_id, error=str(e))
+            return False
+
+    async def _unsaved_chat_messages(
+        self,
+        session_id: str,
+        messages: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Messages whose message_id is not in the chat_messages collection yet"""
+        message_ids = [msg["message_id"] for msg in messages if msg.get("message_id")]
+        stored_ids = set(await self.db.chat_messages.distinct(
+            "message_id",
+            {"session_id": session_id, "message_id": {"$in": message_ids}}
+        ))
+        return [msg for msg in messages if msg.get("message_id") not in stored_ids]
+
     async def get_chat_history(
         self,
         session_id: str,
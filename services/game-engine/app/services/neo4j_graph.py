@@ -8,6 +8,7 @@ from datetime import datetime
 
 from ..core.config import settings
 from ..core.logging import get_logger
+from .objective_read_model import objective_read_model
 
 logger = get_logger(__name__)
 
@@ -545,7 +546,10 @@ class Neo4jGraphService:
                     knowledge_id=knowledge_id,
                     source_type=source_type
                 )
-                return True
+
+            # Acquisition paths shown next to objectives changed
+            await objective_read_model.touch(player_id)
+            return True
 
         except Exception as e:
             logger.error("knowledge_acquisition_recording_failed", error=str(e))
@@ -630,7 +634,9 @@ class Neo4jGraphService:
                     item_id=item_id,
                     source_type=source_type
                 )
-                return True
+
+            await objective_read_model.touch(player_id)
+            return True
 
         except Exception as e:
             logger.error("item_acquisition_recording_failed", error=str(e))
@@ -837,7 +843,8 @@ class Neo4jGraphService:
                     count=count
                 )
 
-                return count
+            await objective_read_model.invalidate(player_id)
+            return count
 
         except Exception as e:
             logger.error(
@@ -945,6 +952,178 @@ class Neo4jGraphService:
             logger.error("objective_progress_retrieval_failed", error=str(e))
             return {"campaign_objectives": [], "overall_progress": 0}
 
+    async def get_objective_requirements(
+        self,
+        objective_ids: List[str],
+        quest_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get required knowledge and item ids for a batch of quest objectives
+        in a single round-trip.
+
+        Replaces the per-objective REQUIRES_KNOWLEDGE/REQUIRES_ITEM lookups
+        (plus the separate quest number lookup) with one UNWIND query.
+
+        Args:
+            objective_ids: Quest objective IDs to resolve
+            quest_id: Optional quest ID whose order_sequence should be returned
+
+        Returns:
+            Dict containing:
+            - quest_number: order_sequence of quest_id (None if not found)
+            - requirements: {objective_id: {required_knowledge, required_items, criteria}}
+        """
+        try:
+            async with self.driver.session() as session:
+                query = """
+                OPTIONAL MATCH (q:Quest {id: $quest_id})
+                WITH q.order_sequence as quest_number
+                UNWIND CASE WHEN size($objective_ids) = 0 THEN [null] ELSE $objective_ids END as obj_id
+                OPTIONAL MATCH (qo:QuestObjective {id: obj_id})
+                OPTIONAL MATCH (qo)-[:REQUIRES_KNOWLEDGE]->(k:Knowledge)
+                OPTIONAL MATCH (qo)-[:REQUIRES_ITEM]->(i:Item)
+                RETURN quest_number,
+                       qo.id as id,
+                       collect(DISTINCT k.id) as required_knowledge,
+                       collect(DISTINCT i.id) as required_items,
+                       qo.success_criteria as criteria
+                """
+
+                result = await session.run(
+                    query,
+                    objective_ids=list(objective_ids),
+                    quest_id=quest_id
+                )
+
+                quest_number = None
+                requirements = {}
+                async for record in result:
+                    quest_number = record["quest_number"]
+                    if record["id"] is None:
+                        continue
+
+                    requirements[record["id"]] = {
+                        "required_knowledge": [k for k in record["required_knowledge"] if k],
+                        "required_items": [i for i in record["required_items"] if i],
+                        "criteria": record["criteria"] or []
+                    }
+
+                logger.info(
+                    "objective_requirements_retrieved",
+                    quest_id=quest_id,
+                    requested=len(objective_ids),
+                    resolved=len(requirements)
+                )
+
+                return {
+                    "quest_number": quest_number,
+                    "requirements": requirements
+                }
+
+        except Exception as e:
+            logger.error("objective_requirements_retrieval_failed", error=str(e))
+            return {"quest_number": None, "requirements": {}}
+
+    async def get_campaign_objective_requirements(
+        self,
+        campaign_id: str
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Get required knowledge and item ids for every quest objective in a
+        campaign. Used to build the CampaignRequirementIndex.
+
+        Args:
+            campaign_id: Campaign ID
+
+        Returns:
+            {objective_id: {required_knowledge, required_items, quest_id, quest_number}},
+            or None if the query failed
+        """
+        try:
+            async with self.driver.session() as session:
+                query = """
+                MATCH (qo:QuestObjective {campaign_id: $campaign_id})
+                OPTIONAL MATCH (qo)-[:REQUIRES_KNOWLEDGE]->(k:Knowledge)
+                OPTIONAL MATCH (qo)-[:REQUIRES_ITEM]->(i:Item)
+                OPTIONAL MATCH (q:Quest)-[:ACHIEVES]->(qo)
+                RETURN qo.id as id,
+                       q.id as quest_id,
+                       q.order_sequence as quest_number,
+                       collect(DISTINCT k.id) as required_knowledge,
+                       collect(DISTINCT COALESCE(i.id, i.item_id)) as required_items
+                """
+
+                result = await session.run(query, campaign_id=campaign_id)
+
+                objectives = {}
+                async for record in result:
+                    objectives[record["id"]] = {
+                        "required_knowledge": [k for k in record["required_knowledge"] if k],
+                        "required_items": [i for i in record["required_items"] if i],
+                        "quest_id": record["quest_id"],
+                        "quest_number": record["quest_number"]
+                    }
+
+                return objectives
+
+        except Exception as e:
+            logger.error(
+                "campaign_objective_requirements_retrieval_failed",
+                campaign_id=campaign_id,
+                error=str(e)
+            )
+            return None
+
+    async def get_player_acquired_ids(
+        self,
+        player_id: str,
+        knowledge_ids: List[str],
+        item_ids: List[str]
+    ) -> Dict[str, List[str]]:
+        """
+        Get which of the given knowledge and item ids a player has acquired.
+
+        Args:
+            player_id: Player ID
+            knowledge_ids: Candidate knowledge IDs
+            item_ids: Candidate item IDs
+
+        Returns:
+            Dict with acquired knowledge and items id lists
+        """
+        try:
+            async with self.driver.session() as session:
+                query = """
+                MATCH (p:Player {player_id: $player_id})
+                OPTIONAL MATCH (p)-[:ACQUIRED_KNOWLEDGE]->(k:Knowledge)
+                WHERE k.id IN $knowledge_ids
+                WITH p, collect(DISTINCT k.id) as knowledge
+                OPTIONAL MATCH (p)-[:ACQUIRED_ITEM]->(i:Item)
+                WHERE COALESCE(i.id, i.item_id) IN $item_ids
+                RETURN knowledge,
+                       collect(DISTINCT COALESCE(i.id, i.item_id)) as items
+                """
+
+                result = await session.run(
+                    query,
+                    player_id=player_id,
+                    knowledge_ids=list(knowledge_ids),
+                    item_ids=list(item_ids)
+                )
+
+                record = await result.single()
+                if not record:
+                    return {"knowledge": [], "items": []}
+
+                return {
+                    "knowledge": [k for k in record["knowledge"] if k],
+                    "items": [i for i in record["items"] if i]
+                }
+
+        except Exception as e:
+            logger.error("player_acquired_ids_retrieval_failed", player_id=player_id, error=str(e))
+            return {"knowledge": [], "items": []}
+
     async def get_available_acquisition_paths(
         self,
         player_id: str,
@@ -1337,7 +1516,8 @@ class Neo4jGraphService:
                     campaign_id=campaign_id
                 )
 
-                return True
+            await objective_read_model.invalidate(player_id)
+            return True
 
         except Exception as e:
             logger.error("player_progress_initialization_failed", error=str(e))
@@ -1408,7 +1588,20 @@ class Neo4jGraphService:
                     percentage=completion_percentage
                 )
 
-                return True
+            status = (
+                "completed" if completion_percentage >= 100
+                else "in_progress" if completion_percentage > 0
+                else "not_started"
+            )
+            if objective_type == "campaign":
+                await objective_read_model.apply_campaign_objective_progress(
+                    player_id, objective_id, percentage=completion_percentage, status=status
+                )
+            else:
+                await objective_read_model.apply_quest_objective_progress(
+                    player_id, objective_id, percentage=completion_percentage, status=status
+                )
+            return True
 
         except Exception as e:
             logger.error("objective_progress_recording_failed", error=str(e))
@@ -1484,6 +1677,12 @@ class Neo4jGraphService:
                         percentage=record["campaign_percentage"],
                         status=record["status"]
                     )
+                    await objective_read_model.apply_campaign_objective_progress(
+                        player_id,
+                        campaign_objective_id,
+                        percentage=record["campaign_percentage"],
+                        status=record["status"]
+                    )
                     return True
                 else:
                     logger.warning(
@@ -0,0 +1,550 @@
+"""
+Objective Progress Read Model
+Materialized per-player, per-campaign objective progress for the polling
+endpoints (objectives, hints, quest progress).
+
+The document has the shape of neo4j_graph.get_player_objective_progress plus
+a version. Progress writers patch it in place, so a poll is one Redis read;
+Neo4j is only queried when the document is missing (never built, expired or
+invalidated).
+
+The endpoint responses built on top of it are stored as views, stamped with
+the player's version: a poll whose view is still current is answered (or
+304'd) without recomputing anything.
+"""
+import hashlib
+import json
+from datetime import datetime
+from typing import Dict, Any, Callable, Optional, Tuple
+
+from redis.exceptions import WatchError
+
+from ..core.config import settings
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def _isoformat(value: Any) -> Optional[str]:
+    """Neo4j DateTime / datetime / string -> ISO string"""
+    if value is None or isinstance(value, str):
+        return value
+    if hasattr(value, "iso_format"):
+        return value.iso_format()
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _overall_progress(doc: Dict[str, Any]) -> int:
+    """Same average as get_player_objective_progress"""
+    campaign_objectives = doc.get("campaign_objectives", [])
+    if not campaign_objectives:
+        return 0
+    total = sum(co.get("completion_percentage", 0) for co in campaign_objectives)
+    return int(total / len(campaign_objectives))
+
+
+class ObjectiveReadModelService:
+    """
+    Keeps objective_progress:{campaign_id}:{player_id} documents in Redis.
+
+    Every write for a player increments objective_progress:version:{player_id}
+    and stamps it on the player's documents, so touching a document changes
+    its ETag even when progress did not change. A rebuild from Neo4j is only
+    stored if the version did not move while the graph was being read, so a
+    rebuild that raced a progress write never overwrites the newer state.
+
+    Progress percentages are per player, but objective status is shared by
+    everyone in the campaign. Rebuilds record which campaign each objective
+    belongs to and which players hold a document for it, so a status change
+    is patched into every member's document.
+    """
+
+    def __init__(self, ttl_seconds: int = 86400, max_retries: int = 5):
+        self.ttl_seconds = ttl_seconds
+        self.max_retries = max_retries
+
+    @staticmethod
+    def _doc_key(player_id: str, campaign_id: str) -> str:
+        return f"objective_progress:{campaign_id}:{player_id}"
+
+    @staticmethod
+    def _version_key(player_id: str) -> str:
+        return f"objective_progress:version:{player_id}"
+
+    @staticmethod
+    def _campaigns_key(player_id: str) -> str:
+        """Campaigns with a stored document for the player"""
+        return f"objective_progress:campaigns:{player_id}"
+
+    @staticmethod
+    def _players_key(campaign_id: str) -> str:
+        """Players with a stored document for the campaign"""
+        return f"objective_progress:players:{campaign_id}"
+
+    @staticmethod
+    def _views_key(player_id: str, campaign_id: str) -> str:
+        """Hash of view name -> stored endpoint response"""
+        return f"objective_progress:views:{campaign_id}:{player_id}"
+
+    # Hash of campaign/quest objective id -> campaign id
+    OBJECTIVES_KEY = "objective_progress:objective_campaigns"
+
+    async def get_progress(self, player_id: str, campaign_id: Optional[str]) -> Dict[str, Any]:
+        """
+        Get a player's objective progress for a campaign.
+
+        Args:
+            player_id: Player ID
+            campaign_id: Campaign ID
+
+        Returns:
+            Dict with campaign_objectives, overall_progress and version
+        """
+        from .redis_manager import redis_manager
+
+        if not player_id or not campaign_id:
+            return {"campaign_objectives": [], "overall_progress": 0, "version": 0}
+
+        doc = await redis_manager.cache_get(self._doc_key(player_id, campaign_id))
+        if doc:
+            return doc
+
+        return await self.rebuild(player_id, campaign_id)
+
+    async def rebuild(self, player_id: str, campaign_id: str) -> Dict[str, Any]:
+        """
+        Read progress from Neo4j and store it as the player's document.
+
+        Args:
+            player_id: Player ID
+            campaign_id: Campaign ID
+
+        Returns:
+            Progress dict with version
+        """
+        from .neo4j_graph import neo4j_graph
+        from .redis_manager import redis_manager
+
+        version_key = self._version_key(player_id)
+        version = 0
+        try:
+            version = int(await redis_manager.redis.get(version_key) or 0)
+        except Exception as e:
+            logger.error("objective_read_model_version_failed", player_id=player_id, error=str(e))
+
+        progress = await neo4j_graph.get_player_objective_progress(player_id, campaign_id)
+        for co in progress.get("campaign_objectives", []):
+            for qo in co.get("quest_objectives", []):
+                qo["completed_at"] = _isoformat(qo.get("completed_at"))
+
+        doc = {**progress, "version": version}
+
+        # An empty result is also what a failed Neo4j read returns; don't pin it
+        if not progress.get("campaign_objectives"):
+            return doc
+
+        try:
+            async with redis_manager.redis_binary.pipeline(transaction=True) as pipe:
+                await pipe.watch(version_key)
+                current = await pipe.get(version_key)
+                if int(current or 0) != version:
+                    logger.info("objective_read_model_rebuild_superseded", player_id=player_id, campaign_id=campaign_id)
+                    return doc
+
+                objective_campaigns = {}
+                for co in doc["campaign_objectives"]:
+                    for objective in [co, *co.get("quest_objectives", [])]:
+                        if objective.get("id"):
+                            objective_campaigns[objective["id"]] = campaign_id
+
+                pipe.multi()
+                pipe.setex(self._doc_key(player_id, campaign_id), self.ttl_seconds, redis_manager.codec.encode(doc))
+                pipe.sadd(self._campaigns_key(player_id), campaign_id)
+                pipe.expire(self._campaigns_key(player_id), self.ttl_seconds)
+                pipe.sadd(self._players_key(campaign_id), player_id)
+                pipe.expire(self._players_key(campaign_id), self.ttl_seconds)
+                if objective_campaigns:
+                    pipe.hset(self.OBJECTIVES_KEY, mapping=objective_campaigns)
+                    pipe.expire(self.OBJECTIVES_KEY, self.ttl_seconds)
+                await pipe.execute()
+
+            logger.info(
+                "objective_read_model_built",
+                player_id=player_id,
+                campaign_id=campaign_id,
+                version=version,
+                campaign_objectives=len(doc["campaign_objectives"])
+            )
+        except WatchError:
+            logger.info("objective_read_model_rebuild_superseded", player_id=player_id, campaign_id=campaign_id)
+        except Exception as e:
+            logger.error("objective_read_model_store_failed", player_id=player_id, campaign_id=campaign_id, error=str(e))
+
+        return doc
+
+    async def _patch(
+        self,
+        player_id: str,
+        mutate: Callable[[Dict[str, Any]], bool]
+    ) -> bool:
+        """
+        Bump the player's version and apply mutate to each stored document.
+
+        mutate returns True when it found what it was patching; documents it
+        does not match are still re-stamped with the new version.
+
+        Returns:
+            True if any document matched
+        """
+        from .redis_manager import redis_manager
+
+        if not player_id or not redis_manager.redis_binary:
+            return False
+
+        version_key = self._version_key(player_id)
+        version = await redis_manager.redis_binary.incr(version_key)
+        await redis_manager.redis_binary.expire(version_key, self.ttl_seconds * 2)
+
+        campaign_ids = await redis_manager.redis.smembers(self._campaigns_key(player_id))
+
+        matched = False
+        for campaign_id in campaign_ids:
+            doc_key = self._doc_key(player_id, campaign_id)
+            for _ in range(self.max_retries):
+                try:
+                    async with redis_manager.redis_binary.pipeline(transaction=True) as pipe:
+                        await pipe.watch(doc_key)
+                        payload = await pipe.get(doc_key)
+                        if not payload:
+                            break
+
+                        doc = redis_manager.codec.decode(payload)
+                        matched = mutate(doc) or matched
+                        doc["overall_progress"] = _overall_progress(doc)
+                        doc["version"] = max(doc.get("version", 0), version)
+
+                        pipe.multi()
+                        pipe.set(doc_key, redis_manager.codec.encode(doc), keepttl=True)
+                        await pipe.execute()
+                    break
+                except WatchError:
+                    continue
+            else:
+                # Could not win the race; let the next read rebuild it
+                await redis_manager.redis_binary.delete(doc_key)
+
+        return matched
+
+    async def apply_quest_objective_progress(
+        self,
+        player_id: str,
+        objective_id: str,
+        percentage: Optional[int] = None,
+        status: Optional[str] = None
+    ) -> None:
+        """
+        Patch one QuestObjective after its PROGRESS changed.
+
+        Args:
+            player_id: Player ID
+            objective_id: QuestObjective id (or objective_id property)
+            percentage: New prog.percentage, if it changed
+            status: New qo.status, if it changed
+        """
+        def mutate(doc: Dict[str, Any]) -> bool:
+            found = False
+            for co in doc.get("campaign_objectives", []):
+                for qo in co.get("quest_objectives", []):
+                    if qo.get("id") != objective_id:
+                        continue
+                    found = True
+                    if percentage is not None:
+                        qo["progress"] = percentage
+                    if status is not None:
+                        qo["status"] = status
+                    if status == "completed" and not qo.get("completed_at"):
+                        qo["completed_at"] = datetime.utcnow().isoformat()
+            return found
+
+        def mutate_shared(doc: Dict[str, Any]) -> bool:
+            found = False
+            for co in doc.get("campaign_objectives", []):
+                for qo in co.get("quest_objectives", []):
+                    if qo.get("id") == objective_id:
+                        found = True
+                        qo["status"] = status
+            return found
+
+        await self._apply(player_id, mutate, "quest", objective_id)
+        if status is not None:
+            await self._apply_to_campaign_members(player_id, mutate_shared, objective_id)
+
+    async def apply_campaign_objective_progress(
+        self,
+        player_id: str,
+        objective_id: str,
+        percentage: Optional[int] = None,
+        status: Optional[str] = None
+    ) -> None:
+        """
+        Patch one CampaignObjective after its PROGRESS changed.
+
+        Args:
+            player_id: Player ID
+            objective_id: CampaignObjective id (or objective_id property)
+            percentage: New co_prog.percentage, if it changed
+            status: New co.status, if it changed
+        """
+        def mutate(doc: Dict[str, Any]) -> bool:
+            found = False
+            for co in doc.get("campaign_objectives", []):
+                if co.get("id") != objective_id:
+                    continue
+                found = True
+                if percentage is not None:
+                    co["completion_percentage"] = percentage
+                if status is not None:
+                    co["status"] = status
+            return found
+
+        def mutate_shared(doc: Dict[str, Any]) -> bool:
+            found = False
+            for co in doc.get("campaign_objectives", []):
+                if co.get("id") == objective_id:
+                    found = True
+                    co["status"] = status
+            return found
+
+        await self._apply(player_id, mutate, "campaign", objective_id)
+        if status is not None:
+            await self._apply_to_campaign_members(player_id, mutate_shared, objective_id)
+
+    async def _apply(
+        self,
+        player_id: str,
+        mutate: Callable[[Dict[str, Any]], bool],
+        objective_type: str,
+        objective_id: str
+    ) -> None:
+        try:
+            matched = await self._patch(player_id, mutate)
+            if not matched:
+                # The objective is not in any stored document (new campaign
+                # content, or addressed by a different id): rebuild on next read
+                await self.invalidate(player_id)
+            logger.debug(
+                "objective_read_model_patched",
+                player_id=player_id,
+                objective_type=objective_type,
+                objective_id=objective_id,
+                matched=matched
+            )
+        except Exception as e:
+            logger.error(
+                "objective_read_model_patch_failed",
+                player_id=player_id,
+                objective_id=objective_id,
+                error=str(e)
+            )
+            await self.invalidate(player_id)
+
+    async def _apply_to_campaign_members(
+        self,
+        player_id: str,
+        mutate: Callable[[Dict[str, Any]], bool],
+        objective_id: str
+    ) -> None:
+        """Patch a shared objective status into the other campaign members' documents"""
+        from .redis_manager import redis_manager
+
+        if not redis_manager.redis:
+            return
+
+        try:
+            campaign_id = await redis_manager.redis.hget(self.OBJECTIVES_KEY, objective_id)
+            if not campaign_id:
+                # No document anywhere mentions the objective
+                return
+            members = await redis_manager.redis.smembers(self._players_key(campaign_id))
+        except Exception as e:
+            logger.error("objective_read_model_members_failed", objective_id=objective_id, error=str(e))
+            return
+
+        for member_id in members:
+            if member_id == player_id:
+                continue
+            try:
+                if not await self._patch(member_id, mutate):
+                    await self.invalidate(member_id)
+            except Exception as e:
+                logger.error(
+                    "objective_read_model_patch_failed",
+                    player_id=member_id,
+                    objective_id=objective_id,
+                    error=str(e)
+                )
+                await self.invalidate(member_id)
+
+        logger.debug(
+            "objective_read_model_members_patched",
+            objective_id=objective_id,
+            campaign_id=campaign_id,
+            members=len(members)
+        )
+
+    async def get_view(
+        self,
+        player_id: str,
+        campaign_id: Optional[str],
+        view: str,
+        inputs: Any = None
+    ) -> Tuple[Optional[Dict[str, Any]], int]:
+        """
+        Get a stored endpoint response if it is still current.
+
+        A view is current while the player's version has not moved since it
+        was computed (every progress, acquisition and child objective write
+        bumps it) and it was computed from the same inputs.
+
+        Args:
+            player_id: Player ID
+            campaign_id: Campaign ID
+            view: View name (endpoint plus anything in its key, e.g. scene id)
+            inputs: Session fields the response was computed from
+
+        Returns:
+            ({"etag", "payload"} or None, current version to pass to store_view)
+        """
+        from .redis_manager import redis_manager
+
+        if not player_id or not campaign_id:
+            return None, 0
+
+        try:
+            pipe = redis_manager.redis_binary.pipeline(transaction=True)
+            pipe.get(self._version_key(player_id))
+            pipe.hget(self._views_key(player_id, campaign_id), view)
+            version, payload = await pipe.execute()
+            version = int(version or 0)
+        except Exception as e:
+            logger.error("objective_read_model_view_failed", player_id=player_id, view=view, error=str(e))
+            return None, 0
+
+        if not payload:
+            return None, version
+
+        entry = redis_manager.codec.decode(payload)
+        if entry.get("version") != version or entry.get("inputs") != self._digest(inputs):
+            return None, version
+        return entry, version
+
+    async def store_view(
+        self,
+        player_id: str,
+        campaign_id: Optional[str],
+        view: str,
+        version: int,
+        payload: Dict[str, Any],
+        inputs: Any = None
+    ) -> str:
+        """
+        Store an endpoint response computed at version.
+
+        Not stored if the version moved while it was being computed, so a
+        response that raced a write is recomputed on the next poll.
+
+        Returns:
+            The response's ETag
+        """
+        from .redis_manager import redis_manager
+
+        etag = self.etag(payload)
+        if not player_id or not campaign_id:
+            return etag
+
+        version_key = self._version_key(player_id)
+        views_key = self._views_key(player_id, campaign_id)
+        entry = {"version": version, "inputs": self._digest(inputs), "etag": etag, "payload": payload}
+
+        try:
+            async with redis_manager.redis_binary.pipeline(transaction=True) as pipe:
+                await pipe.watch(version_key)
+                if int(await pipe.get(version_key) or 0) != version:
+                    return etag
+
+                pipe.multi()
+                pipe.hset(views_key, view, redis_manager.codec.encode(entry))
+                pipe.expire(views_key, self.ttl_seconds)
+                pipe.sadd(self._campaigns_key(player_id), campaign_id)
+                pipe.expire(self._campaigns_key(player_id), self.ttl_seconds)
+                await pipe.execute()
+        except WatchError:
+            pass
+        except Exception as e:
+            logger.error("objective_read_model_view_store_failed", player_id=player_id, view=view, error=str(e))
+
+        return etag
+
+    async def touch(self, player_id: str) -> None:
+        """
+        Bump the version of a player's documents without changing progress.
+
+        Used after writes that change what the polling endpoints return
+        (acquisitions, child objectives) but not the progress itself.
+        """
+        try:
+            await self._patch(player_id, lambda doc: True)
+        except Exception as e:
+            logger.error("objective_read_model_touch_failed", player_id=player_id, error=str(e))
+            await self.invalidate(player_id)
+
+    async def invalidate(self, player_id: str) -> None:
+        """
+        Drop a player's documents; the next read rebuilds them from Neo4j.
+
+        Args:
+            player_id: Player ID
+        """
+        from .redis_manager import redis_manager
+
+        if not player_id or not redis_manager.redis:
+            return
+
+        try:
+            campaigns_key = self._campaigns_key(player_id)
+            campaign_ids = await redis_manager.redis.smembers(campaigns_key)
+
+            pipe = redis_manager.redis.pipeline(transaction=True)
+            pipe.incr(self._version_key(player_id))
+            pipe.expire(self._version_key(player_id), self.ttl_seconds * 2)
+            for campaign_id in campaign_ids:
+                pipe.delete(self._doc_key(player_id, campaign_id), self._views_key(player_id, campaign_id))
+                pipe.srem(self._players_key(campaign_id), player_id)
+            pipe.delete(campaigns_key)
+            await pipe.execute()
+
+            logger.info("objective_read_model_invalidated", player_id=player_id, documents=len(campaign_ids))
+        except Exception as e:
+            logger.error("objective_read_model_invalidate_failed", player_id=player_id, error=str(e))
+
+    @staticmethod
+    def _digest(value: Any) -> str:
+        return hashlib.sha1(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+    @classmethod
+    def etag(cls, payload: Dict[str, Any]) -> str:
+        """
+        Weak ETag for an endpoint response.
+
+        Args:
+            payload: The whole response body
+        """
+        return f'W/"{cls._digest(payload)}"'
+
+
+# Global instance
+objective_read_model = ObjectiveReadModelService(
+    ttl_seconds=settings.OBJECTIVE_READ_MODEL_TTL_SECONDS
+)
@@ -3,6 +3,7 @@ RabbitMQ Client for Game Engine
 Handles publishing game events and managing message queues
 """
 import json
+from datetime import datetime
 from typing import Dict, Any, Optional
 import aio_pika
 from aio_pika import ExchangeType
@@ -70,7 +71,8 @@ class RabbitMQClient:
         self,
         exchange: str,
         routing_key: str,
-        message: Dict[str, Any]
+        message: Dict[str, Any],
+        persistent: bool = True
     ) -> bool:
         """
         Publish event to RabbitMQ
@@ -79,6 +81,7 @@ class RabbitMQClient:
             exchange: Exchange name
             routing_key: Routing key
             message: Message payload
+            persistent: Persist to disk (False for ephemeral stream chunks)
 
         Returns:
             True if published successfully
@@ -94,7 +97,10 @@ class RabbitMQClient:
                 aio_pika.Message(
                     body=message_body,
                     content_type="application/json",
-                    delivery_mode=aio_pika.DeliveryMode.PERSISTENT
+                    delivery_mode=(
+                        aio_pika.DeliveryMode.PERSISTENT if persistent
+                        else aio_pika.DeliveryMode.NOT_PERSISTENT
+                    )
                 ),
                 routing_key=routing_key
             )
@@ -140,25 +146,32 @@ class RabbitMQClient:
         self,
         session_id: str,
         chunk: str,
-        is_complete: bool = False
+        is_complete: bool = False,
+        persistent: bool = True
     ):
         """
-        Publish streaming chunk for scene description
+        Publish streaming chunk for scene/action narration
 
         Args:
             session_id: Session ID
             chunk: Text chunk to stream
             is_complete: Whether this is the final chunk
+            persistent: Persist to disk (see STREAM_CHUNKS_TRANSIENT)
         """
         await self.publish_event(
             exchange="game.events",
             routing_key=f"session.{session_id}.scene_chunk",
             message={
-                "event": "scene_chunk",
+                "type": "event",
+                "event_type": "scene_chunk",
                 "session_id": session_id,
-                "chunk": chunk,
-                "is_complete": is_complete
-            }
+                "payload": {
+                    "chunk": chunk,
+                    "is_complete": is_complete,
+                    "timestamp": datetime.utcnow().isoformat()
+                }
+            },
+            persistent=persistent
         )
 
     async def publish_npc_response(
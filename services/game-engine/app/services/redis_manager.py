@@ -2,9 +2,11 @@
 Redis Session State Manager
 Handles session state caching and persistence
 """
-import json
+import hashlib
 from typing import Optional, Dict, Any
 from redis.asyncio import Redis
+from redis.exceptions import WatchError
+from ..core.codec import StateCodec
 from ..core.config import settings
 from ..core.logging import get_logger
 from ..models.state import GameSessionState
@@ -17,9 +19,35 @@ class RedisSessionManager:
     Manages game session state in Redis for fast access
     """
 
+    # History fields stored as Redis lists in "split" storage mode; usually
+    # only appended to, so saves RPUSH the new tail
+    HISTORY_FIELDS = (
+        "chat_messages",
+        "team_chat_messages",
+        "conversation_history",
+        "action_history",
+        "event_log",
+        "world_changes"
+    )
+
+    # State key describing the part of each history list held in memory, so
+    # saves only encode entries past it:
+    # {field: {"offset": stored entries before the window (0 = whole list),
+    #          "length": entries loaded or saved, "tail": digest of the last
+    #          of them, "stored": h:{field} meta value they were read/written as}}
+    HISTORY_WINDOW_KEY = "_history_window"
+
     def __init__(self):
         self.redis: Optional[Redis] = None
+        # Binary-safe client for codec-encoded payloads (state and cache entries)
+        self.redis_binary: Optional[Redis] = None
+        self.codec = StateCodec(
+            serializer=settings.SESSION_CODEC,
+            compression_threshold=settings.CODEC_COMPRESSION_THRESHOLD_BYTES,
+            compression_level=settings.CODEC_COMPRESSION_LEVEL
+        )
         self.ttl_seconds = settings.SESSION_STATE_TTL_SECONDS
+        self.storage_mode = settings.SESSION_STATE_STORAGE
 
     async def connect(self):
         """Connect to Redis"""
@@ -30,7 +58,8 @@ class RedisSessionManager:
                 encoding="utf-8"
             )
             await self.redis.ping()
-            logger.info("redis_connected", url=settings.REDIS_URL)
+            self.redis_binary = Redis.from_url(settings.REDIS_URL)
+            logger.info("redis_connected", url=settings.REDIS_URL, codec=self.codec.serializer)
         except Exception as e:
             logger.error("redis_connection_failed", error=str(e))
             raise
@@ -39,12 +68,26 @@ class RedisSessionManager:
         """Disconnect from Redis"""
         if self.redis:
             await self.redis.close()
-            logger.info("redis_disconnected")
+        if self.redis_binary:
+            await self.redis_binary.close()
+        logger.info("redis_disconnected")
 
     def _session_key(self, session_id: str) -> str:
         """Generate Redis key for session"""
         return f"session:state:{session_id}"
 
+    def _history_key(self, session_id: str, field: str) -> str:
+        """Generate Redis list key for a history field"""
+        return f"session:history:{session_id}:{field}"
+
+    def _meta_key(self, session_id: str) -> str:
+        """
+        Generate Redis key for the split-state meta hash: f:{field} holds the
+        digest of each stored scalar field, h:{field} "length:chain digest"
+        of each stored history list
+        """
+        return f"session:meta:{session_id}"
+
     def _session_lock_key(self, session_id: str) -> str:
         """Generate Redis lock key for session"""
         return f"session:lock:{session_id}"
@@ -57,6 +100,11 @@ class RedisSessionManager:
         """
         Save session state to Redis
 
+        In split storage mode only scalar fields whose stored value differs
+        are written, and history lists are appended with RPUSH. A whole
+        history that was reset or replaced is rewritten in full; a state
+        loaded with a history window whose list was replaced is not saved.
+
         Args:
             session_id: Session ID
             state: Complete session state
@@ -65,19 +113,22 @@ class RedisSessionManager:
             True if saved successfully
         """
         try:
+            if self.storage_mode == "split":
+                return await self._save_split_state(session_id, state)
+
             key = self._session_key(session_id)
-            state_json = json.dumps(state, default=str)
+            payload = self.codec.encode(state)
 
-            await self.redis.setex(
+            await self.redis_binary.setex(
                 key,
                 self.ttl_seconds,
-                state_json
+                payload
             )
 
             logger.info(
                 "session_state_saved",
                 session_id=session_id,
-                state_size_bytes=len(state_json)
+                state_size_bytes=len(payload)
             )
             return True
 
@@ -89,34 +140,307 @@ class RedisSessionManager:
             )
             return False
 
+    async def _save_split_state(
+        self,
+        session_id: str,
+        state: GameSessionState,
+        max_retries: int = 5
+    ) -> bool:
+        """
+        Write changed scalar fields to the state hash and append new history entries
+
+        What changed is decided against the digests in the session's meta
+        hash, read under WATCH in the same transaction as the writes, so a
+        field or list another replica wrote since this state was loaded is
+        never skipped as unchanged. History entries already loaded or saved
+        (per HISTORY_WINDOW_KEY) are not encoded again.
+        """
+        key = self._session_key(session_id)
+        meta_key = self._meta_key(session_id)
+        windows = state.get(self.HISTORY_WINDOW_KEY)
+        if windows is None:
+            windows = state[self.HISTORY_WINDOW_KEY] = {}
+
+        encoded_fields = {
+            field: self.codec.encode(value)
+            for field, value in state.items()
+            if field not in self.HISTORY_FIELDS and field != self.HISTORY_WINDOW_KEY
+        }
+        digests = {field: self._digest(encoded) for field, encoded in encoded_fields.items()}
+        tails = {
+            field: self._history_tail(state.get(field) or [], windows.get(field))
+            for field in self.HISTORY_FIELDS
+        }
+        whole_lists: Dict[str, list] = {}
+
+        for _ in range(max_retries):
+            try:
+                async with self.redis_binary.pipeline(transaction=True) as pipe:
+                    await pipe.watch(key, meta_key)
+                    stored_meta = {
+                        name.decode(): value.decode()
+                        for name, value in (await pipe.hgetall(meta_key)).items()
+                    }
+
+                    histories = {}
+                    for field in self.HISTORY_FIELDS:
+                        window = windows.get(field)
+                        stored = stored_meta.get(f"h:{field}", "")
+                        if window and window["offset"]:
+                            # Only a window is in memory, so the list can't be
+                            # rewritten from it: append after the stored tail
+                            # (replicas' appends are kept) or refuse the save
+                            if (
+                                tails[field] is None
+                                or not stored
+                                or self._parse_history_meta(stored)[0]
+                                < self._parse_history_meta(window["stored"])[0]
+                            ):
+                                logger.warning(
+                                    "session_state_save_refused",
+                                    session_id=session_id,
+                                    field=field,
+                                    reason="history window no longer matches the stored list"
+                                )
+                                return False
+                            histories[field] = (True, tails[field])
+                        elif tails[field] is not None and window["stored"] == stored:
+                            histories[field] = (True, tails[field])
+                        else:
+                            # Not tracked, replaced in memory, or changed by
+                            # another replica: compare the whole list
+                            if field not in whole_lists:
+                                whole_lists[field] = [
+                                    self.codec.encode(entry) for entry in state.get(field) or []
+                                ]
+                            histories[field] = (False, whole_lists[field])
+
+                    pipe.multi()
+                    stats, new_windows = self._queue_split_writes(
+                        pipe, session_id, encoded_fields, digests, histories, windows, stored_meta
+                    )
+                    await pipe.execute()
+                break
+            except WatchError:
+                continue
+        else:
+            logger.warning("session_state_save_contended", session_id=session_id)
+            return False
+
+        # The next save only encodes entries past what was written now
+        windows.update(new_windows)
+
+        logger.info("session_state_saved", session_id=session_id, **stats)
+        return True
+
+    def _history_tail(self, entries: list, window: Optional[Dict[str, Any]]) -> Optional[list]:
+        """
+        Encoded entries past the loaded/saved part of a history list, or None
+        if that part isn't known or the list no longer ends it where it did
+        (reset or replaced since)
+        """
+        if not window:
+            return None
+        loaded = window["length"]
+        if len(entries) < loaded:
+            return None
+        if loaded and self._digest(self.codec.encode(entries[loaded - 1])) != window["tail"]:
+            return None
+        return [self.codec.encode(entry) for entry in entries[loaded:]]
+
+    def _queue_split_writes(
+        self,
+        pipe,
+        session_id: str,
+        encoded_fields: Dict[str, bytes],
+        digests: Dict[str, str],
+        histories: Dict[str, tuple],
+        windows: Dict[str, Dict[str, Any]],
+        stored_meta: Dict[str, str]
+    ):
+        """
+        Queue the split-state writes on a MULTI pipeline; returns (stats, window updates)
+
+        histories maps each field to (True, entries to append) or (False,
+        the whole encoded list, appended to or rewritten by its stored digest).
+        """
+        key = self._session_key(session_id)
+        meta_key = self._meta_key(session_id)
+
+        # No meta hash: nothing is known about what is stored (new session,
+        # legacy single-string key or pre-meta hash), so rewrite everything
+        known = bool(stored_meta)
+        if not known:
+            pipe.delete(key, meta_key)
+
+        changed_fields = {
+            field: encoded for field, encoded in encoded_fields.items()
+            if stored_meta.get(f"f:{field}") != digests[field]
+        }
+        removed_fields = [
+            name[2:] for name in stored_meta
+            if name.startswith("f:") and name[2:] not in encoded_fields
+        ]
+
+        meta_updates = {f"f:{field}": digests[field] for field in changed_fields}
+        if changed_fields:
+            pipe.hset(key, mapping=changed_fields)
+        if removed_fields:
+            pipe.hdel(key, *removed_fields)
+            pipe.hdel(meta_key, *[f"f:{field}" for field in removed_fields])
+        pipe.expire(key, self.ttl_seconds)
+
+        bytes_written = sum(len(v) for v in changed_fields.values())
+        entries_appended = 0
+        histories_rewritten = 0
+        new_windows = {}
+
+        for field in self.HISTORY_FIELDS:
+            history_key = self._history_key(session_id, field)
+            append, encoded = histories[field]
+            stored_length, stored_digest = self._parse_history_meta(stored_meta.get(f"h:{field}"))
+
+            if append:
+                window = windows[field]
+                new_entries = encoded
+                offset, length, tail = window["offset"], window["length"], window["tail"]
+            else:
+                offset, length, tail = 0, 0, ""
+                if known and len(encoded) >= stored_length and self._chain_digest(encoded[:stored_length]) == stored_digest:
+                    # The in-memory list still starts with the stored list
+                    new_entries = encoded[stored_length:]
+                    length = stored_length
+                    if stored_length:
+                        tail = self._digest(encoded[stored_length - 1])
+                else:
+                    # Reset, replaced or edited: the in-memory list is the whole history now
+                    pipe.delete(history_key)
+                    new_entries = encoded
+                    stored_length, stored_digest = 0, ""
+                    if known and f"h:{field}" in stored_meta:
+                        histories_rewritten += 1
+
+            if new_entries:
+                pipe.rpush(history_key, *new_entries)
+                bytes_written += sum(len(e) for e in new_entries)
+                entries_appended += len(new_entries)
+                tail = self._digest(new_entries[-1])
+            meta_updates[f"h:{field}"] = (
+                f"{stored_length + len(new_entries)}:{self._chain_digest(new_entries, stored_digest)}"
+            )
+            pipe.expire(history_key, self.ttl_seconds)
+
+            new_windows[field] = {
+                "offset": offset,
+                "length": length + len(new_entries),
+                "tail": tail,
+                "stored": meta_updates[f"h:{field}"]
+            }
+
+        pipe.hset(meta_key, mapping=meta_updates)
+        pipe.expire(meta_key, self.ttl_seconds)
+
+        stats = {
+            "fields_written": len(changed_fields),
+            "history_entries_appended": entries_appended,
+            "histories_rewritten": histories_rewritten,
+            "bytes_written": bytes_written
+        }
+        return stats, new_windows
+
+    @staticmethod
+    def _digest(encoded: bytes) -> str:
+        """Stable digest of an encoded value (same on every replica)"""
+        return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+    @staticmethod
+    def _chain_digest(encoded_entries: list, digest: str = "") -> str:
+        """Digest of a list, extendable with appended entries without rereading it"""
+        for entry in encoded_entries:
+            digest = hashlib.blake2b(digest.encode() + entry, digest_size=8).hexdigest()
+        return digest
+
+    @staticmethod
+    def _parse_history_meta(value: Optional[str]) -> tuple:
+        """Stored (length, chain digest) of a history list"""
+        if not value:
+            return 0, ""
+        length, digest = value.split(":", 1)
+        return int(length), digest
+
     async def load_state(
         self,
-        session_id: str
+        session_id: str,
+        history_window: Optional[int] = None
     ) -> Optional[GameSessionState]:
         """
         Load session state from Redis
 
         Args:
             session_id: Session ID
+            history_window: If set, only the last N entries of each history
+                list are loaded (split storage only). The returned state can
+                still be saved; new entries are appended after the stored tail.
 
         Returns:
             Session state or None if not found
         """
         try:
             key = self._session_key(session_id)
-            state_json = await self.redis.get(key)
 
-            if not state_json:
+            # MULTI so the lists and their stored digests are read consistently
+            pipe = self.redis_binary.pipeline(transaction=True)
+            pipe.hgetall(key)
+            pipe.hmget(self._meta_key(session_id), [f"h:{field}" for field in self.HISTORY_FIELDS])
+            for field in self.HISTORY_FIELDS:
+                history_key = self._history_key(session_id, field)
+                if history_window is None:
+                    pipe.lrange(history_key, 0, -1)
+                else:
+                    if history_window > 0:
+                        pipe.lrange(history_key, -history_window, -1)
+                    else:
+                        pipe.lrange(history_key, 1, 0)  # always empty
+                    pipe.llen(history_key)
+            results = await pipe.execute(raise_on_error=False)
+
+            fields = results[0]
+            if isinstance(fields, Exception):
+                # Legacy single JSON string state
+                return await self._load_blob_state(session_id)
+
+            if not fields:
                 logger.warning(
                     "session_state_not_found",
                     session_id=session_id
                 )
                 return None
 
-            state = json.loads(state_json)
+            state = {field.decode(): self.codec.decode(value) for field, value in fields.items()}
+
+            history_meta = results[1]
+            history_results = results[2:]
+            windows = {}
+            for i, field in enumerate(self.HISTORY_FIELDS):
+                if history_window is None:
+                    entries = history_results[i]
+                    total = len(entries)
+                else:
+                    entries, total = history_results[2 * i], history_results[2 * i + 1]
+                state[field] = [self.codec.decode(entry) for entry in entries]
+                stored = history_meta[i]
+                windows[field] = {
+                    "offset": total - len(entries),
+                    "length": len(entries),
+                    "tail": self._digest(entries[-1]) if entries else "",
+                    "stored": stored.decode() if stored is not None else ""
+                }
+            state[self.HISTORY_WINDOW_KEY] = windows
+
             logger.info(
                 "session_state_loaded",
-                session_id=session_id
+                session_id=session_id,
+                history_window=history_window
             )
             return state
 
@@ -128,11 +452,195 @@ class RedisSessionManager:
             )
             return None
 
+    async def _load_blob_state(self, session_id: str) -> Optional[GameSessionState]:
+        """Load state stored as a single JSON string (blob storage / pre-split keys)"""
+        payload = await self.redis_binary.get(self._session_key(session_id))
+
+        if not payload:
+            logger.warning(
+                "session_state_not_found",
+                session_id=session_id
+            )
+            return None
+
+        state = self.codec.decode(payload)
+        logger.info(
+            "session_state_loaded",
+            session_id=session_id,
+            storage="blob"
+        )
+        return state
+
+    async def load_state_fields(
+        self,
+        session_id: str,
+        fields: list[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load selected top-level state fields without reading the whole state.
+
+        Read-only: the result must not be passed to save_state.
+
+        Args:
+            session_id: Session ID
+            fields: Top-level state fields (not history fields)
+
+        Returns:
+            Dict of the requested fields that are set (missing or None ones
+            are left out, as in a full state) or None if the session does
+            not exist
+        """
+        try:
+            key = self._session_key(session_id)
+            pipe = self.redis_binary.pipeline(transaction=False)
+            pipe.hmget(key, fields)
+            pipe.exists(key)
+            values, exists = await pipe.execute(raise_on_error=False)
+
+            if isinstance(values, Exception):
+                # Legacy single JSON string state
+                payload = await self.redis_binary.get(key)
+                if not payload:
+                    return None
+                state = self.codec.decode(payload)
+                return {field: state[field] for field in fields if state.get(field) is not None}
+
+            if not exists:
+                return None
+
+            loaded = {}
+            for field, value in zip(fields, values):
+                if value is None:
+                    continue
+                decoded = self.codec.decode(value)
+                if decoded is not None:
+                    loaded[field] = decoded
+            return loaded
+
+        except Exception as e:
+            logger.error(
+                "session_state_fields_load_failed",
+                session_id=session_id,
+                error=str(e)
+            )
+            return None
+
+    async def update_state_fields(
+        self,
+        session_id: str,
+        updates: Dict[str, Any],
+        expected: Optional[Dict[str, Any]] = None,
+        max_retries: int = 5
+    ) -> bool:
+        """
+        Write selected top-level state fields without saving the whole state
+
+        With expected, this is a compare-and-set: the write only happens if
+        those fields currently hold the expected values (None = unset).
+
+        Args:
+            session_id: Session ID
+            updates: Fields to write
+            expected: Fields that must match before writing
+            max_retries: Attempts when the state changes concurrently
+
+        Returns:
+            True if written, False if the session is missing or expected
+            did not match
+        """
+        key = self._session_key(session_id)
+        meta_key = self._meta_key(session_id)
+        expected = expected or {}
+
+        try:
+            for _ in range(max_retries):
+                try:
+                    async with self.redis_binary.pipeline(transaction=True) as pipe:
+                        await pipe.watch(key, meta_key)
+                        key_type = await pipe.type(key)
+
+                        if key_type == b"hash":
+                            if expected:
+                                current = await pipe.hmget(key, list(expected))
+                                for (field, value), stored in zip(expected.items(), current):
+                                    if (self.codec.decode(stored) if stored is not None else None) != value:
+                                        return False
+                            # Keep the stored digests in step so save_state sees the new values
+                            meta_exists = await pipe.exists(meta_key)
+                            encoded = {field: self.codec.encode(value) for field, value in updates.items()}
+                            pipe.multi()
+                            pipe.hset(key, mapping=encoded)
+                            if meta_exists:
+                                pipe.hset(meta_key, mapping={
+                                    f"f:{field}": self._digest(value) for field, value in encoded.items()
+                                })
+
+                        elif key_type == b"string":
+                            # Legacy single JSON string state
+                            state = self.codec.decode(await pipe.get(key))
+                            if any(state.get(field) != value for field, value in expected.items()):
+                                return False
+                            state.update(updates)
+                            pipe.multi()
+                            pipe.set(key, self.codec.encode(state), keepttl=True)
+
+                        else:
+                            return False
+
+                        await pipe.execute()
+                        return True
+
+                except WatchError:
+                    continue
+
+            logger.warning("session_state_fields_update_contended", session_id=session_id)
+            return False
+
+        except Exception as e:
+            logger.error(
+                "session_state_fields_update_failed",
+                session_id=session_id,
+                error=str(e)
+            )
+            return False
+
+    async def get_history(
+        self,
+        session_id: str,
+        field: str,
+        start: int = 0,
+        end: int = -1
+    ) -> list:
+        """
+        Read a window of a session history list (split storage only)
+
+        Args:
+            session_id: Session ID
+            field: History field name (e.g. "chat_messages")
+            start: First index (negative counts from the end)
+            end: Last index, inclusive (negative counts from the end)
+
+        Returns:
+            List of decoded history entries
+        """
+        try:
+            entries = await self.redis_binary.lrange(self._history_key(session_id, field), start, end)
+            return [self.codec.decode(entry) for entry in entries]
+        except Exception as e:
+            logger.error(
+                "session_history_read_failed",
+                session_id=session_id,
+                field=field,
+                error=str(e)
+            )
+            return []
+
     async def delete_state(self, session_id: str) -> bool:
         """Delete session state from Redis"""
         try:
             key = self._session_key(session_id)
-            await self.redis.delete(key)
+            history_keys = [self._history_key(session_id, field) for field in self.HISTORY_FIELDS]
+            await self.redis.delete(key, self._meta_key(session_id), *history_keys)
             logger.info("session_state_deleted", session_id=session_id)
             return True
         except Exception as e:
@@ -192,8 +700,12 @@ class RedisSessionManager:
     async def extend_ttl(self, session_id: str) -> bool:
         """Extend session state TTL"""
         try:
-            key = self._session_key(session_id)
-            await self.redis.expire(key, self.ttl_seconds)
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.expire(self._session_key(session_id), self.ttl_seconds)
+            pipe.expire(self._meta_key(session_id), self.ttl_seconds)
+            for field in self.HISTORY_FIELDS:
+                pipe.expire(self._history_key(session_id, field), self.ttl_seconds)
+            await pipe.execute()
             return True
         except Exception as e:
             logger.error(
@@ -229,10 +741,10 @@ class RedisSessionManager:
             Cached data or None if not found
         """
         try:
-            cached = await self.redis.get(key)
+            cached = await self.redis_binary.get(key)
             if cached:
                 logger.debug("cache_hit", key=key)
-                return json.loads(cached)
+                return self.codec.decode(cached)
             logger.debug("cache_miss", key=key)
             return None
         except Exception as e:
@@ -252,9 +764,9 @@ class RedisSessionManager:
             True if cached successfully
         """
         try:
-            data_json = json.dumps(data, default=str)
-            await self.redis.setex(key, ttl_seconds, data_json)
-            logger.debug("cache_set", key=key, ttl_seconds=ttl_seconds, size_bytes=len(data_json))
+            payload = self.codec.encode(data)
+            await self.redis_binary.setex(key, ttl_seconds, payload)
+            logger.debug("cache_set", key=key, ttl_seconds=ttl_seconds, size_bytes=len(payload))
             return True
         except Exception as e:
             logger.error("cache_set_failed", key=key, error=str(e))
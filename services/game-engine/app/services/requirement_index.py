@@ -0,0 +1,268 @@
+"""
+Campaign Requirement Index
+Caches which knowledge and items each QuestObjective requires.
+
+Objective requirements are fixed once the campaign factory finalizes a
+campaign, so they are read from Neo4j once per campaign version and then
+served from process memory (and Redis, for other replicas). Progress math
+becomes set intersections against the index instead of Cypher calls.
+"""
+import asyncio
+from typing import Dict, Any, Iterable, Optional, FrozenSet
+
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+EMPTY: FrozenSet[str] = frozenset()
+
+
+class CampaignRequirementIndex:
+    """
+    Immutable per-campaign requirement maps:
+    objective -> required knowledge/item ids, and required id -> objectives
+    """
+
+    def __init__(
+        self,
+        campaign_id: str,
+        version: int,
+        objectives: Dict[str, Dict[str, Any]]
+    ):
+        self.campaign_id = campaign_id
+        self.version = version
+
+        self.objective_knowledge: Dict[str, FrozenSet[str]] = {}
+        self.objective_items: Dict[str, FrozenSet[str]] = {}
+        self.objective_quests: Dict[str, Optional[str]] = {}
+        self.quest_numbers: Dict[str, int] = {}
+        self.knowledge_objectives: Dict[str, FrozenSet[str]] = {}
+        self.item_objectives: Dict[str, FrozenSet[str]] = {}
+
+        knowledge_objectives: Dict[str, set] = {}
+        item_objectives: Dict[str, set] = {}
+
+        for objective_id, entry in objectives.items():
+            knowledge = frozenset(k for k in entry.get("required_knowledge", []) if k)
+            items = frozenset(i for i in entry.get("required_items", []) if i)
+
+            self.objective_knowledge[objective_id] = knowledge
+            self.objective_items[objective_id] = items
+            self.objective_quests[objective_id] = entry.get("quest_id")
+
+            if entry.get("quest_id") and entry.get("quest_number") is not None:
+                self.quest_numbers[entry["quest_id"]] = entry["quest_number"]
+
+            for knowledge_id in knowledge:
+                knowledge_objectives.setdefault(knowledge_id, set()).add(objective_id)
+            for item_id in items:
+                item_objectives.setdefault(item_id, set()).add(objective_id)
+
+        self.knowledge_objectives = {k: frozenset(v) for k, v in knowledge_objectives.items()}
+        self.item_objectives = {i: frozenset(v) for i, v in item_objectives.items()}
+
+    def __contains__(self, objective_id: str) -> bool:
+        return objective_id in self.objective_knowledge
+
+    def required_knowledge(self, objective_id: str) -> FrozenSet[str]:
+        """Knowledge ids required by an objective"""
+        return self.objective_knowledge.get(objective_id, EMPTY)
+
+    def required_items(self, objective_id: str) -> FrozenSet[str]:
+        """Item ids required by an objective"""
+        return self.objective_items.get(objective_id, EMPTY)
+
+    def objectives_requiring(self, acquisition_type: str, acquisition_id: str) -> FrozenSet[str]:
+        """Objective ids that require a knowledge or item id"""
+        if acquisition_type == "knowledge":
+            return self.knowledge_objectives.get(acquisition_id, EMPTY)
+        if acquisition_type == "item":
+            return self.item_objectives.get(acquisition_id, EMPTY)
+        return EMPTY
+
+    def quest_number(self, quest_id: Optional[str]) -> Optional[int]:
+        """Order sequence of a quest, if known"""
+        return self.quest_numbers.get(quest_id) if quest_id else None
+
+    def count_acquired(
+        self,
+        objective_id: str,
+        knowledge_ids: Iterable[str],
+        item_ids: Iterable[str]
+    ) -> Dict[str, int]:
+        """
+        Count how many of an objective's requirements the player holds.
+
+        Returns:
+            Dict with total_required and total_acquired
+        """
+        knowledge = self.required_knowledge(objective_id)
+        items = self.required_items(objective_id)
+
+        return {
+            "total_required": len(knowledge) + len(items),
+            "total_acquired": len(knowledge.intersection(knowledge_ids)) + len(items.intersection(item_ids))
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for Redis"""
+        quest_numbers = self.quest_numbers
+        return {
+            "campaign_id": self.campaign_id,
+            "version": self.version,
+            "objectives": {
+                objective_id: {
+                    "required_knowledge": sorted(self.objective_knowledge[objective_id]),
+                    "required_items": sorted(self.objective_items[objective_id]),
+                    "quest_id": self.objective_quests.get(objective_id),
+                    "quest_number": quest_numbers.get(self.objective_quests.get(objective_id))
+                }
+                for objective_id in self.objective_knowledge
+            }
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CampaignRequirementIndex":
+        """Deserialize from Redis"""
+        return cls(
+            campaign_id=data["campaign_id"],
+            version=data.get("version", 0),
+            objectives=data.get("objectives", {})
+        )
+
+
+class RequirementIndexService:
+    """
+    Builds, caches and invalidates CampaignRequirementIndex instances.
+
+    Each campaign carries a version counter in Redis (campaign:version:{id}).
+    The campaign factory bumps it when a campaign is finalized or deleted;
+    a bumped version makes both the in-process and Redis copies stale.
+    """
+
+    def __init__(self, ttl_seconds: int = 86400):
+        self.ttl_seconds = ttl_seconds
+        self._indexes: Dict[str, CampaignRequirementIndex] = {}
+        self._build_locks: Dict[str, asyncio.Lock] = {}
+
+    @staticmethod
+    def _version_key(campaign_id: str) -> str:
+        return f"campaign:version:{campaign_id}"
+
+    @staticmethod
+    def _index_key(campaign_id: str, version: int) -> str:
+        return f"campaign:requirement_index:{campaign_id}:{version}"
+
+    async def _current_version(self, campaign_id: str) -> int:
+        from .redis_manager import redis_manager
+
+        if not redis_manager.redis:
+            return 0
+        version = await redis_manager.redis.get(self._version_key(campaign_id))
+        return int(version) if version else 0
+
+    async def get_index(self, campaign_id: Optional[str]) -> Optional[CampaignRequirementIndex]:
+        """
+        Get the requirement index for a campaign, building it on first use.
+
+        Args:
+            campaign_id: Campaign ID
+
+        Returns:
+            CampaignRequirementIndex or None if it could not be built
+        """
+        if not campaign_id:
+            return None
+
+        try:
+            version = await self._current_version(campaign_id)
+
+            index = self._indexes.get(campaign_id)
+            if index and index.version == version:
+                return index
+
+            lock = self._build_locks.setdefault(campaign_id, asyncio.Lock())
+            async with lock:
+                # Another coroutine may have built it while we waited
+                index = self._indexes.get(campaign_id)
+                if index and index.version == version:
+                    return index
+
+                index = await self._load_from_redis(campaign_id, version)
+                if not index:
+                    index = await self._build(campaign_id, version)
+                    if index is None:
+                        return None
+                    await self._store_in_redis(index)
+
+                self._indexes[campaign_id] = index
+                return index
+
+        except Exception as e:
+            logger.error("requirement_index_get_failed", campaign_id=campaign_id, error=str(e))
+            return None
+
+    async def invalidate(self, campaign_id: str) -> None:
+        """
+        Invalidate a campaign's index on every replica by bumping its version.
+
+        Args:
+            campaign_id: Campaign ID
+        """
+        from .redis_manager import redis_manager
+
+        self._indexes.pop(campaign_id, None)
+        try:
+            if redis_manager.redis:
+                await redis_manager.redis.incr(self._version_key(campaign_id))
+            logger.info("requirement_index_invalidated", campaign_id=campaign_id)
+        except Exception as e:
+            logger.error("requirement_index_invalidate_failed", campaign_id=campaign_id, error=str(e))
+
+    async def _load_from_redis(
+        self,
+        campaign_id: str,
+        version: int
+    ) -> Optional[CampaignRequirementIndex]:
+        from .redis_manager import redis_manager
+
+        data = await redis_manager.cache_get(self._index_key(campaign_id, version))
+        if not data:
+            return None
+        return CampaignRequirementIndex.from_dict(data)
+
+    async def _store_in_redis(self, index: CampaignRequirementIndex) -> None:
+        from .redis_manager import redis_manager
+
+        await redis_manager.cache_set(
+            self._index_key(index.campaign_id, index.version),
+            index.to_dict(),
+            ttl_seconds=self.ttl_seconds
+        )
+
+    async def _build(
+        self,
+        campaign_id: str,
+        version: int
+    ) -> Optional[CampaignRequirementIndex]:
+        from .neo4j_graph import neo4j_graph
+
+        objectives = await neo4j_graph.get_campaign_objective_requirements(campaign_id)
+        if objectives is None:
+            return None
+
+        index = CampaignRequirementIndex(campaign_id, version, objectives)
+
+        logger.info(
+            "requirement_index_built",
+            campaign_id=campaign_id,
+            version=version,
+            objectives=len(objectives),
+            knowledge=len(index.knowledge_objectives),
+            items=len(index.item_objectives)
+        )
+        return index
+
+
+# Global instance
+requirement_index = RequirementIndexService()
@@ -0,0 +1,187 @@
+"""
+Session Broadcast Bus
+Fans WebSocket broadcasts out across game-engine replicas over Redis pub/sub.
+
+Every replica subscribes to {WS_BUS_CHANNEL_PREFIX}{session_id} for the
+sessions it holds local sockets for. A broadcast is delivered to the local
+sockets directly and published once, already serialized; the other replicas
+deliver it to their own sockets. Each published message is prefixed with the
+origin node id so a replica skips its own messages.
+"""
+import asyncio
+from typing import Callable, Optional, Set
+from uuid import uuid4
+
+from ..core.config import settings
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# deliver(session_id, payload) hands a serialized message to local sockets
+Deliver = Callable[[str, str], None]
+
+
+class SessionBroadcastBus:
+    """
+    Redis pub/sub transport for session broadcasts
+    """
+
+    def __init__(self, channel_prefix: str = "session:bus:", enabled: bool = True):
+        self.channel_prefix = channel_prefix
+        self.enabled = enabled
+        self.node_id = uuid4().hex
+        self._deliver: Optional[Deliver] = None
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+        self._sessions: Set[str] = set()
+        self.published = 0
+        self.received = 0
+
+    def _channel(self, session_id: str) -> str:
+        return f"{self.channel_prefix}{session_id}"
+
+    @property
+    def _node_channel(self) -> str:
+        # Always subscribed, so the listener keeps running with no sessions
+        return f"{self.channel_prefix}node:{self.node_id}"
+
+    async def start(self, deliver: Deliver):
+        """
+        Open the pub/sub connection and start delivering remote broadcasts
+
+        Args:
+            deliver: Called with (session_id, payload) for every message
+                published by another replica
+        """
+        from .redis_manager import redis_manager
+
+        if not self.enabled:
+            logger.info("session_bus_disabled")
+            return
+
+        self._deliver = deliver
+        self._pubsub = redis_manager.redis.pubsub(ignore_subscribe_messages=True)
+        await self._pubsub.subscribe(self._node_channel)
+        if self._sessions:
+            await self._pubsub.subscribe(*[self._channel(s) for s in self._sessions])
+
+        self._listener = asyncio.create_task(self._listen())
+        logger.info("session_bus_started", node_id=self.node_id, sessions=len(self._sessions))
+
+    async def stop(self):
+        """Stop the listener and close the pub/sub connection"""
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+        if self._pubsub:
+            try:
+                await self._pubsub.reset()
+            except Exception as e:
+                logger.error("session_bus_close_failed", error=str(e))
+            self._pubsub = None
+
+        logger.info("session_bus_stopped", node_id=self.node_id)
+
+    async def subscribe(self, session_id: str):
+        """Receive other replicas' broadcasts for a session"""
+        if session_id in self._sessions:
+            return
+        self._sessions.add(session_id)
+
+        if self._pubsub:
+            try:
+                await self._pubsub.subscribe(self._channel(session_id))
+                logger.debug("session_bus_subscribed", session_id=session_id)
+            except Exception as e:
+                logger.error("session_bus_subscribe_failed", session_id=session_id, error=str(e))
+
+    async def unsubscribe(self, session_id: str):
+        """Stop receiving broadcasts for a session with no local sockets"""
+        if session_id not in self._sessions:
+            return
+        self._sessions.discard(session_id)
+
+        if self._pubsub:
+            try:
+                await self._pubsub.unsubscribe(self._channel(session_id))
+                logger.debug("session_bus_unsubscribed", session_id=session_id)
+            except Exception as e:
+                logger.error("session_bus_unsubscribe_failed", session_id=session_id, error=str(e))
+
+    async def publish(self, session_id: str, payload: str) -> int:
+        """
+        Publish a serialized message to every replica subscribed to the session
+
+        Args:
+            session_id: Game session ID
+            payload: Message already serialized for the WebSocket
+
+        Returns:
+            Number of replicas that received it (including this one), or 0
+        """
+        from .redis_manager import redis_manager
+
+        if not self._pubsub:
+            return 0
+
+        try:
+            receivers = await redis_manager.redis.publish(
+                self._channel(session_id),
+                f"{self.node_id}|{payload}"
+            )
+            self.published += 1
+            return receivers
+        except Exception as e:
+            logger.error("session_bus_publish_failed", session_id=session_id, error=str(e))
+            return 0
+
+    async def _listen(self):
+        prefix_length = len(self.channel_prefix)
+
+        while True:
+            try:
+                async for message in self._pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+
+                    origin, _, payload = message["data"].partition("|")
+                    if origin == self.node_id:
+                        continue
+
+                    session_id = message["channel"][prefix_length:]
+                    self.received += 1
+                    try:
+                        self._deliver(session_id, payload)
+                    except Exception as e:
+                        logger.error("session_bus_deliver_failed", session_id=session_id, error=str(e))
+
+                # listen() returns once nothing is subscribed
+                await asyncio.sleep(1.0)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # The pub/sub connection resubscribes its channels on reconnect
+                logger.error("session_bus_listen_failed", error=str(e))
+                await asyncio.sleep(1.0)
+
+    def stats(self) -> dict:
+        return {
+            "node_id": self.node_id,
+            "enabled": self.enabled,
+            "sessions": len(self._sessions),
+            "published": self.published,
+            "received": self.received
+        }
+
+
+# Global instance
+session_bus = SessionBroadcastBus(
+    channel_prefix=settings.WS_BUS_CHANNEL_PREFIX,
+    enabled=settings.WS_BUS_ENABLED
+)
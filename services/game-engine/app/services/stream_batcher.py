@@ -0,0 +1,206 @@
+"""
+Narration Stream Batcher
+Coalesces LLM token chunks into fewer, larger stream messages.
+
+The first chunk of a narration is sent immediately (so time-to-first-token
+is unchanged); after that chunks are buffered until STREAM_BATCH_MAX_DELAY_MS
+has passed or STREAM_BATCH_MAX_BYTES have accumulated. Leaving the batcher's
+context always flushes the buffer and sends the is_complete marker.
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ..core.config import settings
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# emit(text, is_complete) publishes one stream message
+Emit = Callable[[str, bool], Awaitable[Any]]
+
+
+class StreamMetrics:
+    """
+    Aggregate streaming metrics over the most recent narrations
+    """
+
+    def __init__(self, sample_size: int = 200):
+        self.narrations = 0
+        self.chunks = 0
+        self.messages = 0
+        self._recent: deque = deque(maxlen=sample_size)
+
+    def record(self, stream: str, chunks: int, messages: int, ttft_ms: Optional[float], duration_s: float):
+        self.narrations += 1
+        self.chunks += chunks
+        self.messages += messages
+        self._recent.append({
+            "stream": stream,
+            "chunks": chunks,
+            "messages": messages,
+            "ttft_ms": ttft_ms,
+            "chunks_per_second": chunks / duration_s if duration_s > 0 else 0.0
+        })
+
+    @staticmethod
+    def _average(values: List[float]) -> Optional[float]:
+        return round(sum(values) / len(values), 2) if values else None
+
+    def snapshot(self) -> Dict[str, Any]:
+        recent = list(self._recent)
+        return {
+            "narrations": self.narrations,
+            "chunks": self.chunks,
+            "messages": self.messages,
+            "recent": {
+                "narrations": len(recent),
+                "avg_messages_per_narration": self._average([r["messages"] for r in recent]),
+                "avg_chunks_per_narration": self._average([r["chunks"] for r in recent]),
+                "avg_chunks_per_second": self._average([r["chunks_per_second"] for r in recent]),
+                "avg_ttft_ms": self._average([r["ttft_ms"] for r in recent if r["ttft_ms"] is not None])
+            }
+        }
+
+
+stream_metrics = StreamMetrics()
+
+
+class StreamBatcher:
+    """
+    Buffers chunks from a stream_callback and emits them in batches.
+
+    Usage:
+        async with StreamBatcher(emit, session_id=..., stream="scene") as stream:
+            text = await gm_agent.generate_scene_description(state, stream_callback=stream.add)
+
+    Args:
+        emit: Coroutine publishing (text, is_complete)
+        session_id: Session ID (for logging)
+        stream: Narration kind (for logging/metrics)
+        max_delay_ms: Longest a chunk may wait in the buffer
+        max_bytes: Flush as soon as the buffer reaches this size
+    """
+
+    def __init__(
+        self,
+        emit: Emit,
+        session_id: Optional[str] = None,
+        stream: str = "narration",
+        max_delay_ms: Optional[int] = None,
+        max_bytes: Optional[int] = None
+    ):
+        self.emit = emit
+        self.session_id = session_id
+        self.stream = stream
+        self.max_delay = (settings.STREAM_BATCH_MAX_DELAY_MS if max_delay_ms is None else max_delay_ms) / 1000
+        self.max_bytes = settings.STREAM_BATCH_MAX_BYTES if max_bytes is None else max_bytes
+
+        self._buffer: List[str] = []
+        self._buffered_bytes = 0
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+        self._started_at = time.perf_counter()
+        self._first_emit_at: Optional[float] = None
+        self.chunks = 0
+        self.messages = 0
+
+    async def __aenter__(self) -> "StreamBatcher":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def add(self, chunk: str) -> None:
+        """stream_callback: buffer one chunk, flushing when a limit is hit"""
+        if not chunk:
+            return
+
+        self.chunks += 1
+        self._buffer.append(chunk)
+        self._buffered_bytes += len(chunk.encode("utf-8"))
+
+        if self._first_emit_at is None or self._buffered_bytes >= self.max_bytes or self.max_delay <= 0:
+            await self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after_delay())
+
+    async def _flush_after_delay(self) -> None:
+        await asyncio.sleep(self.max_delay)
+        self._timer = None
+        await self._flush()
+
+    async def _flush(self, is_complete: bool = False) -> None:
+        async with self._lock:
+            if self._timer is not None and self._timer is not asyncio.current_task():
+                self._timer.cancel()
+                self._timer = None
+
+            if not self._buffer and not is_complete:
+                return
+
+            text = "".join(self._buffer)
+            self._buffer = []
+            self._buffered_bytes = 0
+
+            if text:
+                await self.emit(text, False)
+                self.messages += 1
+                if self._first_emit_at is None:
+                    self._first_emit_at = time.perf_counter()
+
+            if is_complete:
+                await self.emit("", True)
+                self.messages += 1
+
+    async def close(self) -> None:
+        """Flush what is buffered and send the completion marker"""
+        await self._flush(is_complete=True)
+
+        duration_s = time.perf_counter() - self._started_at
+        ttft_ms = (self._first_emit_at - self._started_at) * 1000 if self._first_emit_at else None
+        stream_metrics.record(self.stream, self.chunks, self.messages, ttft_ms, duration_s)
+
+        logger.info(
+            "narration_stream_completed",
+            session_id=self.session_id,
+            stream=self.stream,
+            chunks=self.chunks,
+            messages=self.messages,
+            ttft_ms=round(ttft_ms, 1) if ttft_ms is not None else None,
+            chunks_per_second=round(self.chunks / duration_s, 1) if duration_s > 0 else None
+        )
+
+
+def scene_chunk_stream(session_id: str, stream: str = "scene") -> StreamBatcher:
+    """Batcher publishing scene_chunk events to RabbitMQ (game.events)"""
+    from .rabbitmq_client import rabbitmq_client
+
+    async def emit(text: str, is_complete: bool):
+        await rabbitmq_client.publish_scene_chunk(
+            session_id,
+            text,
+            is_complete=is_complete,
+            # The completion marker stays persistent so a stream always ends
+            persistent=is_complete or not settings.STREAM_CHUNKS_TRANSIENT
+        )
+
+    return StreamBatcher(emit, session_id=session_id, stream=stream)
+
+
+def websocket_chunk_stream(session_id: str, event: str) -> StreamBatcher:
+    """Batcher broadcasting {event, chunk, is_complete} to the session's WebSockets"""
+    from ..api.websocket_manager import connection_manager
+
+    async def emit(text: str, is_complete: bool):
+        await connection_manager.broadcast_to_session(
+            session_id,
+            {
+                "event": event,
+                "chunk": text,
+                "is_complete": is_complete
+            }
+        )
+
+    return StreamBatcher(emit, session_id=session_id, stream=event)
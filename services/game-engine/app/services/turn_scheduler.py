@@ -0,0 +1,240 @@
+"""
+Turn Scheduler
+Durable turn timeouts for multiplayer parties, shared by all game-engine
+replicas.
+
+Pending timeouts live in Redis: a sorted set of session_id -> deadline plus a
+hash holding each session's pending entry (turn id, player, deadline). One
+polling loop per replica claims due entries with a Lua script, which moves
+them to a claimed set scored by a lease expiry. A claimed entry is removed
+once its handler has run; if the replica dies first, the lease runs out and
+any replica claims it again. Deadlines use the Redis server clock, so
+replicas with skewed clocks agree on when a turn is due.
+"""
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ..core.config import settings
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# handler(session_id, entry) runs when a turn times out
+TimeoutHandler = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+# KEYS: deadlines, entries  ARGV: session_id, entry (without deadline), timeout_seconds
+SCHEDULE_SCRIPT = """
+local time = redis.call('TIME')
+local deadline = tonumber(time[1]) + tonumber(time[2]) / 1000000 + tonumber(ARGV[3])
+local entry = cjson.decode(ARGV[2])
+entry['deadline'] = deadline
+redis.call('HSET', KEYS[2], ARGV[1], cjson.encode(entry))
+redis.call('ZADD', KEYS[1], deadline, ARGV[1])
+return tostring(deadline)
+"""
+
+# KEYS: deadlines, entries  ARGV: session_id, turn_id ('' cancels any turn)
+CANCEL_SCRIPT = """
+local entry = redis.call('HGET', KEYS[2], ARGV[1])
+if not entry then
+    return 0
+end
+if ARGV[2] ~= '' and cjson.decode(entry)['turn_id'] ~= ARGV[2] then
+    return 0
+end
+redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('HDEL', KEYS[2], ARGV[1])
+return 1
+"""
+
+# KEYS: deadlines, entries, claimed  ARGV: limit, lease_seconds
+CLAIM_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local lease_until = now + tonumber(ARGV[2])
+local claimed = {}
+
+-- Entries whose claimer died before finishing
+local stale = redis.call('ZRANGEBYSCORE', KEYS[3], '-inf', now, 'LIMIT', 0, ARGV[1])
+for _, entry in ipairs(stale) do
+    redis.call('ZADD', KEYS[3], lease_until, entry)
+    table.insert(claimed, entry)
+end
+
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', now, 'LIMIT', 0, ARGV[1])
+for _, session_id in ipairs(due) do
+    local entry = redis.call('HGET', KEYS[2], session_id)
+    redis.call('ZREM', KEYS[1], session_id)
+    redis.call('HDEL', KEYS[2], session_id)
+    if entry then
+        redis.call('ZADD', KEYS[3], lease_until, entry)
+        table.insert(claimed, entry)
+    end
+end
+
+return claimed
+"""
+
+
+class TurnScheduler:
+    """
+    Redis sorted-set scheduler for turn timeouts
+    """
+
+    DEADLINES_KEY = "turns:deadlines"
+    ENTRIES_KEY = "turns:entries"
+    CLAIMED_KEY = "turns:claimed"
+
+    def __init__(
+        self,
+        poll_interval_ms: int = 250,
+        batch_size: int = 200,
+        lease_seconds: int = 30
+    ):
+        self.poll_interval = poll_interval_ms / 1000
+        self.batch_size = max(1, batch_size)
+        self.lease_seconds = lease_seconds
+        self._handler: Optional[TimeoutHandler] = None
+        self._poller: Optional[asyncio.Task] = None
+        self._scripts: Dict[str, Any] = {}
+        self.claimed = 0
+        self.handled = 0
+        self.failed = 0
+
+    def _script(self, name: str, source: str):
+        from .redis_manager import redis_manager
+
+        if name not in self._scripts:
+            self._scripts[name] = redis_manager.redis.register_script(source)
+        return self._scripts[name]
+
+    async def schedule(
+        self,
+        session_id: str,
+        turn_id: str,
+        player_id: str,
+        timeout_seconds: float
+    ) -> bool:
+        """
+        Schedule the timeout of a session's current turn, replacing any
+        pending timeout for the session
+
+        Args:
+            session_id: Session ID
+            turn_id: Turn ID (current_turn_id in the session state)
+            player_id: Player whose turn it is
+            timeout_seconds: Seconds until the turn times out
+
+        Returns:
+            True if scheduled
+        """
+        try:
+            entry = {"session_id": session_id, "turn_id": turn_id, "player_id": player_id}
+            await self._script("schedule", SCHEDULE_SCRIPT)(
+                keys=[self.DEADLINES_KEY, self.ENTRIES_KEY],
+                args=[session_id, json.dumps(entry), timeout_seconds]
+            )
+            logger.debug("turn_timeout_scheduled", session_id=session_id, turn_id=turn_id, timeout=timeout_seconds)
+            return True
+        except Exception as e:
+            logger.error("turn_timeout_schedule_failed", session_id=session_id, error=str(e))
+            return False
+
+    async def cancel(self, session_id: str, turn_id: Optional[str] = None) -> bool:
+        """
+        Cancel a session's pending turn timeout
+
+        Args:
+            session_id: Session ID
+            turn_id: Only cancel if the pending timeout is for this turn
+
+        Returns:
+            True if a pending timeout was removed
+        """
+        try:
+            removed = await self._script("cancel", CANCEL_SCRIPT)(
+                keys=[self.DEADLINES_KEY, self.ENTRIES_KEY],
+                args=[session_id, turn_id or ""]
+            )
+            return bool(removed)
+        except Exception as e:
+            logger.error("turn_timeout_cancel_failed", session_id=session_id, error=str(e))
+            return False
+
+    async def start(self, handler: TimeoutHandler):
+        """Start this replica's polling loop"""
+        self._handler = handler
+        self._poller = asyncio.create_task(self._poll())
+        logger.info(
+            "turn_scheduler_started",
+            poll_interval_ms=int(self.poll_interval * 1000),
+            batch_size=self.batch_size
+        )
+
+    async def stop(self):
+        """Stop polling; claimed entries still running are re-claimed after their lease"""
+        if self._poller:
+            self._poller.cancel()
+            try:
+                await self._poller
+            except asyncio.CancelledError:
+                pass
+            self._poller = None
+        logger.info("turn_scheduler_stopped")
+
+    async def _claim(self) -> List[str]:
+        return await self._script("claim", CLAIM_SCRIPT)(
+            keys=[self.DEADLINES_KEY, self.ENTRIES_KEY, self.CLAIMED_KEY],
+            args=[self.batch_size, self.lease_seconds]
+        )
+
+    async def _poll(self):
+        while True:
+            try:
+                claimed = await self._claim()
+                if claimed:
+                    self.claimed += len(claimed)
+                    await asyncio.gather(*(self._dispatch(raw) for raw in claimed))
+
+                # A full batch means more may be due already
+                if len(claimed) < self.batch_size:
+                    await asyncio.sleep(self.poll_interval)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("turn_scheduler_poll_failed", error=str(e))
+                await asyncio.sleep(self.poll_interval)
+
+    async def _dispatch(self, raw: str):
+        from .redis_manager import redis_manager
+
+        try:
+            entry = json.loads(raw)
+            await self._handler(entry["session_id"], entry)
+            self.handled += 1
+        except Exception as e:
+            # Not retried: a handler that raises would fail the same way again
+            self.failed += 1
+            logger.error("turn_timeout_handler_failed", entry=raw, error=str(e))
+        finally:
+            try:
+                await redis_manager.redis.zrem(self.CLAIMED_KEY, raw)
+            except Exception as e:
+                logger.error("turn_timeout_ack_failed", entry=raw, error=str(e))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "claimed": self.claimed,
+            "handled": self.handled,
+            "failed": self.failed
+        }
+
+
+# Global instance
+turn_scheduler = TurnScheduler(
+    poll_interval_ms=settings.TURN_SCHEDULER_POLL_INTERVAL_MS,
+    batch_size=settings.TURN_SCHEDULER_BATCH_SIZE,
+    lease_seconds=settings.TURN_SCHEDULER_LEASE_SECONDS
+)
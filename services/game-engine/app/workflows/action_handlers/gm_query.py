@@ -10,6 +10,7 @@ Extract from game_loop.py lines 1457-1517
 from typing import Dict, Any, Optional
 from .base import ActionHandler, ActionResult
 from ...services.game_master import gm_agent
+from ...services.stream_batcher import websocket_chunk_stream
 from ...services.websocket_manager import connection_manager
 from ...core.logging import get_logger
 from datetime import datetime
@@ -60,34 +61,13 @@ class GMQueryHandler(ActionHandler):
 
             logger.info("handling_ask_gm_question", question=question[:100])
 
-            # Define streaming callback to broadcast chunks via WebSocket
-            async def stream_answer_chunk(chunk: str):
-                """Callback to broadcast streaming answer chunks"""
-                await connection_manager.broadcast_to_session(
-                    state["session_id"],
-                    {
-                        "event": "gm_answer_chunk",
-                        "chunk": chunk,
-                        "is_complete": False
-                    }
-                )
-
             # Call GM agent to answer the question with streaming
-            answer = await gm_agent.answer_player_question(
-                question,
-                state,
-                stream_callback=stream_answer_chunk
-            )
-
-            # Broadcast final completion chunk
-            await connection_manager.broadcast_to_session(
-                state["session_id"],
-                {
-                    "event": "gm_answer_chunk",
-                    "chunk": "",
-                    "is_complete": True
-                }
-            )
+            async with websocket_chunk_stream(state["session_id"], "gm_answer_chunk") as stream:
+                answer = await gm_agent.answer_player_question(
+                    question,
+                    state,
+                    stream_callback=stream.add
+                )
 
             # Add GM answer to chat
             chat_message = {
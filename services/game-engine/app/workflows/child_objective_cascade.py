@@ -9,6 +9,7 @@ from uuid import UUID
 
 from ..core.logging import get_logger
 from ..services.neo4j_graph import neo4j_graph
+from ..services.objective_read_model import objective_read_model
 from ..services.rabbitmq_client import rabbitmq_client
 
 logger = get_logger(__name__)
@@ -425,6 +426,9 @@ async def mark_child_objective_complete(
             rubric_score=rubric_score
         )
 
+        # Child objectives are listed under their quest objective
+        await objective_read_model.touch(player_id)
+
         # Check quest objective cascade
         cascade_updates = await check_quest_objective_cascade(player_id, child_objective_id)
 
@@ -558,6 +562,10 @@ async def mark_quest_objective_complete(
             objective_id=quest_objective_id
         )
 
+        await objective_read_model.apply_quest_objective_progress(
+            player_id, quest_objective_id, status="completed"
+        )
+
     except Exception as e:
         logger.error("mark_quest_objective_complete_failed", error=str(e))
 
@@ -673,6 +681,10 @@ async def mark_campaign_objective_complete(
             objective_id=campaign_objective_id
         )
 
+        await objective_read_model.apply_campaign_objective_progress(
+            player_id, campaign_objective_id, status="completed"
+        )
+
     except Exception as e:
         logger.error("mark_campaign_objective_complete_failed", error=str(e))
 
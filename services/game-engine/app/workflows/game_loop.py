@@ -20,6 +20,7 @@ from ..services.game_master import gm_agent
 from ..services.mcp_client import mcp_client
 from ..services.redis_manager import redis_manager
 from ..services.rabbitmq_client import rabbitmq_client
+from ..services.stream_batcher import scene_chunk_stream, websocket_chunk_stream
 from ..core.logging import get_logger
 from .objective_tracker import process_acquisitions, process_player_action_and_narrative
 
@@ -248,6 +249,8 @@ async def calculate_complete_quest_progress(state: GameSessionState) -> dict:
         from ..managers.quest_tracker import quest_tracker
         from ..services.mongo_persistence import mongo_persistence
         from ..services.neo4j_graph import neo4j_graph
+        from ..services.objective_read_model import objective_read_model
+        from ..services.requirement_index import requirement_index
 
         current_quest_id = state.get("current_quest_id")
         campaign_id = state.get("campaign_id")
@@ -263,8 +266,8 @@ async def calculate_complete_quest_progress(state: GameSessionState) -> dict:
         quest_data = await mongo_persistence.get_quest(current_quest_id)
         quest_name = quest_data.get("name", "Current Quest") if quest_data else "Current Quest"
 
-        # Get Neo4j objective progress (this is the source of truth)
-        progress_data = await neo4j_graph.get_player_objective_progress(player_id, campaign_id)
+        # Neo4j objective progress, served from the materialized read model
+        progress_data = await objective_read_model.get_progress(player_id, campaign_id)
 
         if not progress_data or not progress_data.get("campaign_objectives"):
             logger.info("no_neo4j_objectives_found")
@@ -275,14 +278,32 @@ async def calculate_complete_quest_progress(state: GameSessionState) -> dict:
                 "objectives": []
             }
 
-        # Get quest number from Neo4j
-        async with neo4j_graph.driver.session() as session:
-            result = await session.run("""
-                MATCH (q:Quest {id: $quest_id})
-                RETURN q.order_sequence as quest_number
-            """, quest_id=current_quest_id)
-            record = await result.single()
-            current_quest_number = record["quest_number"] if record else 1
+        objective_ids = [
+            quest_obj["id"]
+            for campaign_obj in progress_data.get("campaign_objectives", [])
+            for quest_obj in campaign_obj.get("quest_objectives", [])
+        ]
+
+        # Objective requirements are campaign-static: serve them from the
+        # requirement index, falling back to a single batched graph read
+        index = await requirement_index.get_index(campaign_id)
+        if index is not None and index.quest_number(current_quest_id) is not None:
+            objective_requirements = {
+                obj_id: {
+                    "required_knowledge": index.required_knowledge(obj_id),
+                    "required_items": index.required_items(obj_id)
+                }
+                for obj_id in objective_ids
+                if obj_id in index
+            }
+            current_quest_number = index.quest_number(current_quest_id)
+        else:
+            requirements_data = await neo4j_graph.get_objective_requirements(
+                objective_ids,
+                quest_id=current_quest_id
+            )
+            objective_requirements = requirements_data["requirements"]
+            current_quest_number = requirements_data["quest_number"] or 1
 
         # Get player's acquired knowledge and items from state
         player_knowledge = state.get("player_knowledge", {}).get(player_id, {})
@@ -329,50 +350,37 @@ async def calculate_complete_quest_progress(state: GameSessionState) -> dict:
                     }
 
                 # Process this objective
-                if True:  # Changed from quest number filter - now processes ALL quests
-                    # Get required knowledge and items for this objective from Neo4j
-                    async with neo4j_graph.driver.session() as session:
-                        result = await session.run("""
-                            MATCH (qo:QuestObjective {id: $obj_id})
-                            OPTIONAL MATCH (qo)-[:REQUIRES_KNOWLEDGE]->(k:Knowledge)
-                            OPTIONAL MATCH (qo)-[:REQUIRES_ITEM]->(i:Item)
-                            RETURN collect(DISTINCT k.id) as required_knowledge,
-                                   collect(DISTINCT i.id) as required_items,
-                                   qo.success_criteria as criteria
-                        """, obj_id=quest_obj["id"])
-                        record = await result.single()
-
-                    if not record:
-                        continue
-
-                    required_knowledge = [k for k in record["required_knowledge"] if k]
-                    required_items = [i for i in record["required_items"] if i]
-                    criteria = record["criteria"] or []
-
-                    # Calculate progress based on knowledge/items acquired
-                    knowledge_acquired = len(set(required_knowledge) & player_knowledge_ids) if required_knowledge else 0
-                    items_acquired = len(set(required_items) & player_item_ids) if required_items else 0
-
-                    total_required = len(required_knowledge) + len(required_items)
-                    total_acquired = knowledge_acquired + items_acquired
-
-                    # Use percentage from Neo4j PROGRESS relationship (maintained by objective tracker)
-                    # Don't recalculate - the objective tracker sets this based on acquisition logic
-                    percent = quest_obj.get("progress", 0)
-
-                    # Add objective to its quest
-                    quests_map[quest_number]["objectives"].append({
-                        "description": quest_obj.get("description", "Quest Objective"),
-                        "type": "",  # Not used in UI, kept for compatibility
-                        "current": total_acquired,
-                        "total": total_required,
-                        "progress": f"{total_acquired}/{total_required}",
-                        "percent": percent,
-                        "completed": percent >= 100
-                    })
+                requirements = objective_requirements.get(quest_obj["id"])
+                if not requirements:
+                    continue
+
+                required_knowledge = requirements["required_knowledge"]
+                required_items = requirements["required_items"]
+
+                # Calculate progress based on knowledge/items acquired
+                knowledge_acquired = len(set(required_knowledge) & player_knowledge_ids) if required_knowledge else 0
+                items_acquired = len(set(required_items) & player_item_ids) if required_items else 0
+
+                total_required = len(required_knowledge) + len(required_items)
+                total_acquired = knowledge_acquired + items_acquired
+
+                # Use percentage from Neo4j PROGRESS relationship (maintained by objective tracker)
+                # Don't recalculate - the objective tracker sets this based on acquisition logic
+                percent = quest_obj.get("progress", 0)
+
+                # Add objective to its quest
+                quests_map[quest_number]["objectives"].append({
+                    "description": quest_obj.get("description", "Quest Objective"),
+                    "type": "",  # Not used in UI, kept for compatibility
+                    "current": total_acquired,
+                    "total": total_required,
+                    "progress": f"{total_acquired}/{total_required}",
+                    "percent": percent,
+                    "completed": percent >= 100
+                })
 
-                    quests_map[quest_number]["total_progress"] += percent
-                    quests_map[quest_number]["objective_count"] += 1
+                quests_map[quest_number]["total_progress"] += percent
+                quests_map[quest_number]["objective_count"] += 1
 
         # Convert quests_map to a sorted list
         quests_list = []
@@ -840,47 +848,14 @@ async def generate_scene_node(state: GameSessionState) -> GameSessionState:
             scene_id=state["current_scene_id"]
         )
 
-        # Define streaming callback to publish chunks via RabbitMQ
-        async def stream_chunk(chunk: str):
-            """Callback to publish streaming chunks to RabbitMQ"""
-            await rabbitmq_client.publish_event(
-                exchange="game.events",
-                routing_key=f"session.{state['session_id']}.scene_chunk",
-                message={
-                    "type": "event",
-                    "event_type": "scene_chunk",
-                    "session_id": state["session_id"],
-                    "payload": {
-                        "chunk": chunk,
-                        "is_complete": False,
-                        "timestamp": datetime.utcnow().isoformat()
-                    }
-                }
-            )
-
         # Generate scene description via Game Master with streaming
-        scene_description = await gm_agent.generate_scene_description(
-            state,
-            stream_callback=stream_chunk
-        )
+        async with scene_chunk_stream(state["session_id"], "scene") as stream:
+            scene_description = await gm_agent.generate_scene_description(
+                state,
+                stream_callback=stream.add
+            )
         state["scene_description"] = scene_description
 
-        # Publish final completion chunk
-        await rabbitmq_client.publish_event(
-            exchange="game.events",
-            routing_key=f"session.{state['session_id']}.scene_chunk",
-            message={
-                "type": "event",
-                "event_type": "scene_chunk",
-                "session_id": state["session_id"],
-                "payload": {
-                    "chunk": "",
-                    "is_complete": True,
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-            }
-        )
-
         # Load scene data from MongoDB
         from ..services.mongo_persistence import mongo_persistence
         import asyncio
@@ -1479,32 +1454,8 @@ async def execute_action_node(state: GameSessionState) -> GameSessionState:
             # Player is asking the Game Master a question
             question = parameters.get("question", pending_action.get("player_input", ""))
 
-            # Import connection manager for streaming
-            from ..api.websocket_manager import connection_manager
-
-            # Define streaming callback to broadcast chunks via WebSocket
-            async def stream_answer_chunk(chunk: str):
-                """Callback to broadcast streaming answer chunks"""
-                await connection_manager.broadcast_to_session(
-                    state["session_id"],
-                    {
-                        "event": "gm_answer_chunk",
-                        "chunk": chunk,
-                        "is_complete": False
-                    }
-                )
-
-            answer = await gm_agent.answer_player_question(question, state, stream_callback=stream_answer_chunk)
-
-            # Broadcast final completion chunk
-            await connection_manager.broadcast_to_session(
-                state["session_id"],
-                {
-                    "event": "gm_answer_chunk",
-                    "chunk": "",
-                    "is_complete": True
-                }
-            )
+            async with websocket_chunk_stream(state["session_id"], "gm_answer_chunk") as stream:
+                answer = await gm_agent.answer_player_question(question, state, stream_callback=stream.add)
 
             # Add GM answer to chat
             chat_message = {
@@ -1947,49 +1898,13 @@ What would you like to do?"""
             # Generate examination description using Game Master
             query = parameters.get("query", pending_action.get("player_input", ""))
 
-            # Import connection manager for streaming
-            from ..api.websocket_manager import connection_manager
-
-            # Define streaming callback to broadcast chunks via RabbitMQ
-            async def stream_action_chunk(chunk: str):
-                """Callback to broadcast streaming action outcome chunks"""
-                await rabbitmq_client.publish_event(
-                    exchange="game.events",
-                    routing_key=f"session.{state['session_id']}.scene_chunk",
-                    message={
-                        "type": "event",
-                        "event_type": "scene_chunk",
-                        "session_id": state["session_id"],
-                        "payload": {
-                            "chunk": chunk,
-                            "is_complete": False,
-                            "timestamp": datetime.utcnow().isoformat()
-                        }
-                    }
-                )
-
             # Use Game Master to generate detailed examination outcome with streaming
-            examination_text = await gm_agent.generate_generic_action_outcome(
-                f"look around and examine {query}" if query else "look around and observe the surroundings",
-                state,
-                stream_callback=stream_action_chunk
-            )
-
-            # Publish final completion chunk via RabbitMQ
-            await rabbitmq_client.publish_event(
-                exchange="game.events",
-                routing_key=f"session.{state['session_id']}.scene_chunk",
-                message={
-                    "type": "event",
-                    "event_type": "scene_chunk",
-                    "session_id": state["session_id"],
-                    "payload": {
-                        "chunk": "",
-                        "is_complete": True,
-                        "timestamp": datetime.utcnow().isoformat()
-                    }
-                }
-            )
+            async with scene_chunk_stream(state["session_id"], "examine_object") as stream:
+                examination_text = await gm_agent.generate_generic_action_outcome(
+                    f"look around and examine {query}" if query else "look around and observe the surroundings",
+                    state,
+                    stream_callback=stream.add
+                )
 
             chat_message = {
                 "message_id": f"msg_{datetime.utcnow().timestamp()}",
@@ -2045,49 +1960,13 @@ What would you like to do?"""
             # Handle generic/creative freeform action
             action_description = parameters.get("action_description", pending_action.get("player_input", ""))
 
-            # Import connection manager for streaming
-            from ..api.websocket_manager import connection_manager
-
-            # Define streaming callback to broadcast chunks via RabbitMQ
-            async def stream_action_chunk(chunk: str):
-                """Callback to broadcast streaming action outcome chunks"""
-                await rabbitmq_client.publish_event(
-                    exchange="game.events",
-                    routing_key=f"session.{state['session_id']}.scene_chunk",
-                    message={
-                        "type": "event",
-                        "event_type": "scene_chunk",
-                        "session_id": state["session_id"],
-                        "payload": {
-                            "chunk": chunk,
-                            "is_complete": False,
-                            "timestamp": datetime.utcnow().isoformat()
-                        }
-                    }
-                )
-
             # Use Game Master to generate narrative outcome for this creative action with streaming
-            outcome_text = await gm_agent.generate_generic_action_outcome(
-                action_description,
-                state,
-                stream_callback=stream_action_chunk
-            )
-
-            # Publish final completion chunk via RabbitMQ
-            await rabbitmq_client.publish_event(
-                exchange="game.events",
-                routing_key=f"session.{state['session_id']}.scene_chunk",
-                message={
-                    "type": "event",
-                    "event_type": "scene_chunk",
-                    "session_id": state["session_id"],
-                    "payload": {
-                        "chunk": "",
-                        "is_complete": True,
-                        "timestamp": datetime.utcnow().isoformat()
-                    }
-                }
-            )
+            async with scene_chunk_stream(state["session_id"], "creative_action") as stream:
+                outcome_text = await gm_agent.generate_generic_action_outcome(
+                    action_description,
+                    state,
+                    stream_callback=stream.add
+                )
 
             chat_message = {
                 "message_id": f"msg_{datetime.utcnow().timestamp()}",
@@ -2149,38 +2028,14 @@ What would you like to do?"""
             has_item = any(item.get("item_id") == item_id or item.get("name") == item_name for item in player_inventory) if isinstance(player_inventory, list) else False
 
             if has_item:
-                # Import connection manager for streaming
-                from ..api.websocket_manager import connection_manager
-
-                # Define streaming callback to broadcast chunks via WebSocket
-                async def stream_action_chunk(chunk: str):
-                    """Callback to broadcast streaming action outcome chunks"""
-                    await connection_manager.broadcast_to_session(
-                        state["session_id"],
-                        {
-                            "event": "action_outcome_chunk",
-                            "chunk": chunk,
-                            "is_complete": False
-                        }
-                    )
-
                 # Player has the item - generate outcome narrative with streaming
                 usage_context = parameters.get("usage_context", f"using {item_name}")
-                outcome_text = await gm_agent.generate_generic_action_outcome(
-                    f"use the {item_name} - {usage_context}",
-                    state,
-                    stream_callback=stream_action_chunk
-                )
-
-                # Broadcast final completion chunk
-                await connection_manager.broadcast_to_session(
-                    state["session_id"],
-                    {
-                        "event": "action_outcome_chunk",
-                        "chunk": "",
-                        "is_complete": True
-                    }
-                )
+                async with websocket_chunk_stream(state["session_id"], "action_outcome_chunk") as stream:
+                    outcome_text = await gm_agent.generate_generic_action_outcome(
+                        f"use the {item_name} - {usage_context}",
+                        state,
+                        stream_callback=stream.add
+                    )
             else:
                 # Player doesn't have the item - provide helpful guidance
                 outcome_text = f"""You reach for the {item_name}, but you don't currently have that item in your inventory.
@@ -2291,34 +2146,13 @@ Would you like to look around for items, or try something else?"""
                 except Exception as e:
                     logger.error(f"Error checking objective cascade after take_item: {e}")
 
-                # Define streaming callback to broadcast chunks via WebSocket
-                async def stream_action_chunk(chunk: str):
-                    """Callback to broadcast streaming action outcome chunks"""
-                    await connection_manager.broadcast_to_session(
-                        state["session_id"],
-                        {
-                            "event": "action_outcome_chunk",
-                            "chunk": chunk,
-                            "is_complete": False
-                        }
-                    )
-
                 # Generate narrative about taking the item with streaming
-                take_text = await gm_agent.generate_generic_action_outcome(
-                    f"pick up and take the {item_data.get('name', item_name)}",
-                    state,
-                    stream_callback=stream_action_chunk
-                )
-
-                # Broadcast final completion chunk
-                await connection_manager.broadcast_to_session(
-                    state["session_id"],
-                    {
-                        "event": "action_outcome_chunk",
-                        "chunk": "",
-                        "is_complete": True
-                    }
-                )
+                async with websocket_chunk_stream(state["session_id"], "action_outcome_chunk") as stream:
+                    take_text = await gm_agent.generate_generic_action_outcome(
+                        f"pick up and take the {item_data.get('name', item_name)}",
+                        state,
+                        stream_callback=stream.add
+                    )
 
                 # Create chat message
                 chat_message = {
@@ -2384,37 +2218,13 @@ What would you like to do?"""
                     break
 
             if discovery:
-                # Import connection manager for streaming
-                from ..api.websocket_manager import connection_manager
-
-                # Define streaming callback to broadcast chunks via WebSocket
-                async def stream_action_chunk(chunk: str):
-                    """Callback to broadcast streaming action outcome chunks"""
-                    await connection_manager.broadcast_to_session(
-                        state["session_id"],
-                        {
-                            "event": "action_outcome_chunk",
-                            "chunk": chunk,
-                            "is_complete": False
-                        }
-                    )
-
                 # Discovery found - generate investigation narrative with streaming
-                investigation_text = await gm_agent.generate_generic_action_outcome(
-                    f"investigate and examine the {discovery.get('name', discovery_name)}: {discovery.get('description', '')}",
-                    state,
-                    stream_callback=stream_action_chunk
-                )
-
-                # Broadcast final completion chunk
-                await connection_manager.broadcast_to_session(
-                    state["session_id"],
-                    {
-                        "event": "action_outcome_chunk",
-                        "chunk": "",
-                        "is_complete": True
-                    }
-                )
+                async with websocket_chunk_stream(state["session_id"], "action_outcome_chunk") as stream:
+                    investigation_text = await gm_agent.generate_generic_action_outcome(
+                        f"investigate and examine the {discovery.get('name', discovery_name)}: {discovery.get('description', '')}",
+                        state,
+                        stream_callback=stream.add
+                    )
 
                 # Extract acquisitions from the narrative (for AI-generated campaigns without pre-defined knowledge)
                 from .objective_tracker import detect_acquisitions_from_narrative
@@ -2657,39 +2467,18 @@ Try examining your surroundings or asking what you can investigate."""
                     break
 
             if challenge:
-                # Import connection manager for streaming
+                # Import connection manager for the encounter broadcast
                 from ..api.websocket_manager import connection_manager
 
-                # Define streaming callback to broadcast chunks via WebSocket
-                async def stream_action_chunk(chunk: str):
-                    """Callback to broadcast streaming action outcome chunks"""
-                    await connection_manager.broadcast_to_session(
-                        state["session_id"],
-                        {
-                            "event": "action_outcome_chunk",
-                            "chunk": chunk,
-                            "is_complete": False
-                        }
-                    )
-
                 # Challenge exists - generate attempt narrative with streaming
                 challenge_name = challenge.get("name", "challenge")
                 challenge_description = challenge.get("description", "")
-                attempt_text = await gm_agent.generate_generic_action_outcome(
-                    f"attempt the challenge: {challenge_name}. {challenge_description}",
-                    state,
-                    stream_callback=stream_action_chunk
-                )
-
-                # Broadcast final completion chunk
-                await connection_manager.broadcast_to_session(
-                    state["session_id"],
-                    {
-                        "event": "action_outcome_chunk",
-                        "chunk": "",
-                        "is_complete": True
-                    }
-                )
+                async with websocket_chunk_stream(state["session_id"], "action_outcome_chunk") as stream:
+                    attempt_text = await gm_agent.generate_generic_action_outcome(
+                        f"attempt the challenge: {challenge_name}. {challenge_description}",
+                        state,
+                        stream_callback=stream.add
+                    )
 
                 # Track challenge encounter
                 encounter_metadata = create_encounter_metadata(state, player_id)
@@ -9,7 +9,9 @@ from datetime import datetime
 
 from ..core.logging import get_logger
 from ..services.neo4j_graph import neo4j_graph
+from ..services.objective_read_model import objective_read_model
 from ..services.rabbitmq_client import rabbitmq_client
+from ..services.requirement_index import requirement_index
 from .child_objective_cascade import process_player_action_for_objectives
 
 logger = get_logger(__name__)
@@ -279,6 +281,16 @@ async def link_acquisition_to_objectives(
     try:
         affected_objectives = []
 
+        # Skip the graph query when the requirement index says nothing needs this
+        index = await requirement_index.get_index(campaign_id)
+        if index is not None and not index.objectives_requiring(acquisition_type, acquisition_id):
+            logger.info(
+                "acquisition_not_required_by_objectives",
+                acquisition_type=acquisition_type,
+                acquisition_id=acquisition_id
+            )
+            return affected_objectives
+
         # Query based on acquisition type
         if acquisition_type == "knowledge":
             # Find objectives that this knowledge advances
@@ -370,7 +382,8 @@ async def link_acquisition_to_objectives(
 
 async def calculate_objective_progress(
     player_id: str,
-    objective_id: str
+    objective_id: str,
+    campaign_id: Optional[str] = None
 ) -> int:
     """
     Calculate completion percentage for a specific objective.
@@ -381,6 +394,9 @@ async def calculate_objective_progress(
     - Required events (player completed it?)
     - Required challenges (player completed it?)
 
+    When campaign_id is given, requirements come from the campaign
+    requirement index and only the player's acquisitions are queried.
+
     Returns percentage 0-100
     """
     if not player_id or not objective_id:
@@ -392,6 +408,33 @@ async def calculate_objective_progress(
         return 0
 
     try:
+        index = await requirement_index.get_index(campaign_id)
+        if index is not None and objective_id in index:
+            required_knowledge = index.required_knowledge(objective_id)
+            required_items = index.required_items(objective_id)
+            if not required_knowledge and not required_items:
+                return 0
+
+            acquired = await neo4j_graph.get_player_acquired_ids(
+                player_id, list(required_knowledge), list(required_items)
+            )
+            counts = index.count_acquired(objective_id, acquired["knowledge"], acquired["items"])
+
+            total_required = counts["total_required"]
+            total_acquired = counts["total_acquired"]
+            percentage = int((total_acquired / total_required) * 100) if total_required else 0
+
+            logger.info(
+                "objective_progress_calculated_detailed",
+                objective_id=objective_id,
+                player_id=player_id,
+                percentage=percentage,
+                total_required=total_required,
+                total_acquired=total_acquired,
+                source="requirement_index"
+            )
+            return percentage
+
         query = """
         MATCH (qo:QuestObjective {id: $objective_id})
         OPTIONAL MATCH (qo)-[:REQUIRES_KNOWLEDGE]->(k:Knowledge)
@@ -515,24 +558,33 @@ async def update_objective_progress(
             )
 
             record = await result.single()
-            if record:
-                logger.info(
-                    "objective_progress_updated_neo4j",
-                    player_id=player_id,
-                    objective_id=objective_id,
-                    percentage=new_percentage,
-                    status=record.get("status")
-                )
-                return True
-            else:
-                logger.error(
-                    "CRITICAL_ERROR_update_progress_no_record",
-                    player_id=player_id,
-                    objective_id=objective_id,
-                    percentage=new_percentage,
-                    reason="Query returned no record - Player or Objective may not exist"
-                )
-                return False
+
+        # The percentage is written even when the completion step matches no row
+        await objective_read_model.apply_quest_objective_progress(
+            player_id,
+            objective_id,
+            percentage=new_percentage,
+            status="completed" if new_percentage >= 100 else None
+        )
+
+        if record:
+            logger.info(
+                "objective_progress_updated_neo4j",
+                player_id=player_id,
+                objective_id=objective_id,
+                percentage=new_percentage,
+                status=record.get("status")
+            )
+            return True
+        else:
+            logger.error(
+                "CRITICAL_ERROR_update_progress_no_record",
+                player_id=player_id,
+                objective_id=objective_id,
+                percentage=new_percentage,
+                reason="Query returned no record - Player or Objective may not exist"
+            )
+            return False
 
     except Exception as e:
         logger.error(
@@ -741,7 +793,7 @@ async def process_acquisitions(
             for obj in affected:
                 try:
                     new_progress = await calculate_objective_progress(
-                        player_id, obj["objective_id"]
+                        player_id, obj["objective_id"], campaign_id
                     )
                     obj["new_progress"] = new_progress
                     logger.info(
@@ -814,7 +866,7 @@ async def process_acquisitions(
 
             for obj in affected:
                 new_progress = await calculate_objective_progress(
-                    player_id, obj["objective_id"]
+                    player_id, obj["objective_id"], campaign_id
                 )
                 obj["new_progress"] = new_progress
 
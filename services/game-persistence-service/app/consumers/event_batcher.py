@@ -0,0 +1,162 @@
+"""
+Micro-batching for the persistence consumer
+"""
+import asyncio
+import json
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+
+from aio_pika import DeliveryMode, Message
+from aio_pika.abc import AbstractChannel, AbstractIncomingMessage
+
+logger = logging.getLogger(__name__)
+
+
+class EventBatcher:
+    """
+    Buffers RabbitMQ messages per session and hands them to the
+    PersistenceConsumer in batches of up to max_events, or whatever has
+    arrived after max_delay_ms.
+
+    Messages are acked only after their batch has been written. If the
+    events could not be saved, each message is republished to retry_queue
+    with an exponential per-message TTL (the queue dead-letters back to the
+    persistence queue) and acked; after max_retries attempts it goes to
+    dead_letter_queue instead. Batches for the same session are flushed one
+    after another so sequence numbers and handler order follow arrival order;
+    a retried message is written after whatever arrived in the meantime.
+    """
+
+    def __init__(
+        self,
+        consumer,
+        channel: Optional[AbstractChannel] = None,
+        max_events: int = 50,
+        max_delay_ms: int = 50,
+        retry_queue: str = 'game.persistence.retry',
+        dead_letter_queue: str = 'game.dead_letter.queue',
+        max_retries: int = 10,
+        retry_base_ms: int = 1000,
+        retry_max_ms: int = 60000
+    ):
+        self.consumer = consumer
+        self.channel = channel
+        self.max_events = max(1, max_events)
+        self.max_delay = max_delay_ms / 1000
+        self.retry_queue = retry_queue
+        self.dead_letter_queue = dead_letter_queue
+        self.max_retries = max_retries
+        self.retry_base_ms = retry_base_ms
+        self.retry_max_ms = retry_max_ms
+        self._buffers: Dict[str, List[Tuple[AbstractIncomingMessage, Dict[str, Any]]]] = {}
+        self._timers: Dict[str, asyncio.Task] = {}
+        self._tails: Dict[str, asyncio.Task] = {}
+
+    async def add(self, message: AbstractIncomingMessage):
+        """Buffer a message, flushing its session's batch once it is full"""
+        try:
+            event = json.loads(message.body.decode())
+            session_id = str(event['session_id'])
+        except Exception as e:
+            logger.error(f"Error processing message: {e}")
+            await message.ack()
+            return
+
+        buffer = self._buffers.setdefault(session_id, [])
+        buffer.append((message, event))
+
+        if len(buffer) >= self.max_events:
+            self._schedule_flush(session_id)
+        elif session_id not in self._timers:
+            self._timers[session_id] = asyncio.create_task(self._flush_after_delay(session_id))
+
+    async def drain(self):
+        """Flush everything buffered and wait for in-flight batches"""
+        for session_id in list(self._buffers):
+            self._schedule_flush(session_id)
+        tails = list(self._tails.values())
+        if tails:
+            await asyncio.wait(tails)
+
+    async def _flush_after_delay(self, session_id: str):
+        await asyncio.sleep(self.max_delay)
+        self._timers.pop(session_id, None)
+        self._schedule_flush(session_id)
+
+    def _schedule_flush(self, session_id: str):
+        """Take the session's buffer and queue it behind the session's previous batch"""
+        timer = self._timers.pop(session_id, None)
+        if timer and timer is not asyncio.current_task():
+            timer.cancel()
+
+        entries = self._buffers.pop(session_id, [])
+        if not entries:
+            return
+
+        previous = self._tails.get(session_id)
+        task = asyncio.create_task(self._flush(entries, previous))
+        self._tails[session_id] = task
+
+        def _release(done: asyncio.Task):
+            if self._tails.get(session_id) is done:
+                del self._tails[session_id]
+
+        task.add_done_callback(_release)
+
+    async def _flush(self, entries, previous):
+        if previous:
+            await asyncio.wait([previous])
+
+        try:
+            saved = await self.consumer.process_batch([event for _, event in entries])
+        except Exception as e:
+            logger.error(f"Error processing batch of {len(entries)} events: {e}")
+            saved = False
+
+        for message, _ in entries:
+            try:
+                if saved:
+                    await message.ack()
+                else:
+                    await self._retry(message)
+            except Exception as e:
+                logger.error(f"Error settling message: {e}")
+
+        logger.debug(f"{'Acked' if saved else 'Scheduled retry for'} batch of {len(entries)} events")
+
+    async def _retry(self, message: AbstractIncomingMessage):
+        """Republish a message that could not be saved with a backoff delay"""
+        if self.channel is None:
+            await message.nack(requeue=True)
+            return
+
+        headers = dict(message.headers or {})
+        attempt = int(headers.get('x-persistence-attempt', 0)) + 1
+        headers['x-persistence-attempt'] = attempt
+
+        if attempt > self.max_retries:
+            logger.error(f"Giving up on event after {self.max_retries} retries, moving it to {self.dead_letter_queue}")
+            routing_key = self.dead_letter_queue
+            expiration = None
+        else:
+            routing_key = self.retry_queue
+            expiration = min(self.retry_base_ms * 2 ** (attempt - 1), self.retry_max_ms) / 1000
+
+        try:
+            await self.channel.default_exchange.publish(
+                Message(
+                    body=message.body,
+                    headers=headers,
+                    content_type=message.content_type,
+                    delivery_mode=DeliveryMode.PERSISTENT,
+                    expiration=expiration
+                ),
+                routing_key=routing_key
+            )
+        except Exception as e:
+            # Could not park it; leave it to the broker rather than lose it
+            logger.error(f"Error scheduling event retry: {e}")
+            await message.nack(requeue=True)
+            return
+
+        await message.ack()
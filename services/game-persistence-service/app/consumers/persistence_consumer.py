@@ -2,7 +2,8 @@
 RabbitMQ consumer for persistence
 """
 import logging
-from typing import Dict, Any
+from collections import defaultdict
+from typing import Dict, Any, List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime
 
@@ -20,57 +21,100 @@ class PersistenceConsumer:
 
     async def process_event(self, event: Dict[str, Any]):
         """Process an event from RabbitMQ"""
-        try:
-            event_type = event.get('event_type', '')
-
-            # Always save the event
-            await self._save_event(event)
+        await self.process_batch([event])
+
+    async def process_batch(self, events: List[Dict[str, Any]]) -> bool:
+        """
+        Process a batch of events from RabbitMQ.
+
+        All events are saved with one insert per batch, then the type
+        handlers run in arrival order and each session's counters are
+        bumped with a single combined $inc. Handlers and counters only run
+        for events stored by this batch (or stored earlier but never
+        handled), so a redelivered batch doesn't apply them twice. Returns
+        False if the events could not be saved, in which case nothing else
+        was applied and the batch can be redelivered.
+        """
+        # Always save the events
+        saved = await self._save_events(events)
+        if saved is None:
+            return False
+
+        counters: Dict[str, Dict[str, int]] = {}
+        for event, _ in saved:
+            session_counters = counters.setdefault(event.get('session_id'), defaultdict(int))
 
             # Handle specific event types
-            if event_type == 'session.created':
-                await self._handle_session_created(event)
-            elif event_type == 'session.started':
-                await self._handle_session_started(event)
-            elif event_type == 'session.ended':
-                await self._handle_session_ended(event)
-            elif event_type == 'conversation.message':
-                await self._handle_conversation_message(event)
-            elif event_type == 'item.acquired':
-                await self._handle_item_acquired(event)
-            elif event_type == 'knowledge.gained':
-                await self._handle_knowledge_gained(event)
-            elif event_type == 'quest.objective_completed':
-                await self._handle_quest_objective(event)
-            elif event_type == 'scene.changed':
-                await self._handle_scene_changed(event)
-
-            # Increment event counter
-            await self.session_repo.increment_index(
-                UUID(event['session_id']),
-                'event_count'
-            )
+            if await self._handle_event(event):
+                session_counters['conversation_count'] += 1
+            session_counters['event_count'] += 1
 
-        except Exception as e:
-            logger.error(f"Error processing event: {e}")
+        # Increment event counters
+        for session_id, increments in counters.items():
+            try:
+                await self.session_repo.increment_indices(UUID(session_id), increments)
+            except Exception as e:
+                logger.error(f"Error processing events for session {session_id}: {e}")
 
-    async def _save_event(self, event: Dict[str, Any]):
-        """Save event to game_events collection"""
         try:
-            event_data = {
-                'session_id': event['session_id'],
-                'event_id': event.get('message_id', event.get('event_id')),
-                'timestamp': event.get('timestamp', datetime.utcnow()),
-                'event_type': event['event_type'],
-                'source': event.get('source', {'type': 'system'}),
-                'data': event.get('payload', {}),
-                'state_changes': event.get('state_changes'),
-                'ai_context': event.get('ai_context')
-            }
-
-            await self.event_repo.create_event(event_data)
-
+            await self.event_repo.mark_events_handled([event_id for _, event_id in saved])
         except Exception as e:
-            logger.error(f"Error saving event: {e}")
+            logger.error(f"Error marking events handled: {e}")
+
+        return True
+
+    async def _handle_event(self, event: Dict[str, Any]) -> bool:
+        """Dispatch an event to its type handler, True if a conversation message was stored"""
+        event_type = event.get('event_type', '')
+
+        if event_type == 'session.created':
+            await self._handle_session_created(event)
+        elif event_type == 'session.started':
+            await self._handle_session_started(event)
+        elif event_type == 'session.ended':
+            await self._handle_session_ended(event)
+        elif event_type == 'conversation.message':
+            return await self._handle_conversation_message(event)
+        elif event_type == 'item.acquired':
+            await self._handle_item_acquired(event)
+        elif event_type == 'knowledge.gained':
+            await self._handle_knowledge_gained(event)
+        elif event_type == 'quest.objective_completed':
+            await self._handle_quest_objective(event)
+        elif event_type == 'scene.changed':
+            await self._handle_scene_changed(event)
+
+        return False
+
+    async def _save_events(self, events: List[Dict[str, Any]]) -> Optional[List[Tuple[Dict[str, Any], Any]]]:
+        """
+        Save events to game_events collection.
+
+        Returns (event, stored event_id) for each event whose handlers still
+        have to run, or None if the batch could not be saved.
+        """
+        sources = []
+        events_data = []
+        for event in events:
+            try:
+                events_data.append({
+                    'session_id': event['session_id'],
+                    'event_id': event.get('message_id', event.get('event_id')),
+                    'timestamp': event.get('timestamp', datetime.utcnow()),
+                    'event_type': event['event_type'],
+                    'source': event.get('source', {'type': 'system'}),
+                    'data': event.get('payload', {}),
+                    'state_changes': event.get('state_changes'),
+                    'ai_context': event.get('ai_context')
+                })
+                sources.append(event)
+            except Exception as e:
+                logger.error(f"Error saving event: {e}")
+
+        positions = await self.event_repo.create_events(events_data)
+        if positions is None:
+            return None
+        return [(sources[i], events_data[i].get('event_id')) for i in positions]
 
     async def _handle_session_created(self, event: Dict[str, Any]):
         """Handle session created event"""
@@ -127,8 +171,8 @@ class PersistenceConsumer:
         except Exception as e:
             logger.error(f"Error handling session ended: {e}")
 
-    async def _handle_conversation_message(self, event: Dict[str, Any]):
-        """Handle conversation message event"""
+    async def _handle_conversation_message(self, event: Dict[str, Any]) -> bool:
+        """Handle conversation message event, the caller bumps conversation_count"""
         try:
             payload = event['payload']
 
@@ -146,13 +190,11 @@ class PersistenceConsumer:
             }
 
             await self.conversation_repo.create_message(message_data)
-            await self.session_repo.increment_index(
-                UUID(event['session_id']),
-                'conversation_count'
-            )
+            return True
 
         except Exception as e:
             logger.error(f"Error handling conversation message: {e}")
+            return False
 
     async def _handle_item_acquired(self, event: Dict[str, Any]):
         """Handle item acquired event"""
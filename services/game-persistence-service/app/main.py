@@ -18,6 +18,7 @@ from .repositories.event_repository import EventRepository
 from .repositories.conversation_repository import ConversationRepository
 from .repositories.inventory_repository import InventoryRepository
 from .consumers.persistence_consumer import PersistenceConsumer
+from .consumers.event_batcher import EventBatcher
 
 # Configure logging
 logging.basicConfig(
@@ -35,11 +36,26 @@ event_repository = None
 conversation_repository = None
 inventory_repository = None
 persistence_consumer = None
+event_batcher = None
+
+# Micro-batching: events are written per session in batches of up to
+# PERSISTENCE_BATCH_MAX_EVENTS or after PERSISTENCE_BATCH_MAX_DELAY_MS
+PERSISTENCE_PREFETCH_COUNT = int(os.getenv('PERSISTENCE_PREFETCH_COUNT', '200'))
+PERSISTENCE_BATCH_MAX_EVENTS = int(os.getenv('PERSISTENCE_BATCH_MAX_EVENTS', '50'))
+PERSISTENCE_BATCH_MAX_DELAY_MS = int(os.getenv('PERSISTENCE_BATCH_MAX_DELAY_MS', '50'))
+
+# Batches that could not be saved wait in the retry queue (exponential
+# per-message TTL) and dead-letter back onto the persistence queue
+PERSISTENCE_QUEUE = 'game.persistence.queue'
+PERSISTENCE_RETRY_QUEUE = 'game.persistence.retry'
+PERSISTENCE_MAX_RETRIES = int(os.getenv('PERSISTENCE_MAX_RETRIES', '10'))
+PERSISTENCE_RETRY_BASE_MS = int(os.getenv('PERSISTENCE_RETRY_BASE_MS', '1000'))
+PERSISTENCE_RETRY_MAX_MS = int(os.getenv('PERSISTENCE_RETRY_MAX_MS', '60000'))
 
 
 async def start_rabbitmq_consumer():
     """Start consuming events from RabbitMQ"""
-    global rabbitmq_connection, rabbitmq_channel, persistence_consumer
+    global rabbitmq_connection, rabbitmq_channel, persistence_consumer, event_batcher
 
     try:
         # Get RabbitMQ connection details
@@ -54,30 +70,41 @@ async def start_rabbitmq_consumer():
         rabbitmq_connection = await aio_pika.connect_robust(connection_string)
         rabbitmq_channel = await rabbitmq_connection.channel()
 
-        # Set QoS
-        await rabbitmq_channel.set_qos(prefetch_count=10)
+        # Set QoS - unacked messages wait in the batcher, so prefetch bounds the batch sizes
+        await rabbitmq_channel.set_qos(prefetch_count=PERSISTENCE_PREFETCH_COUNT)
 
         # Get the queue (it should already exist from init)
         queue = await rabbitmq_channel.get_queue(
-            'game.persistence.queue',
+            PERSISTENCE_QUEUE,
             ensure=False
         )
 
+        await rabbitmq_channel.declare_queue(
+            PERSISTENCE_RETRY_QUEUE,
+            durable=True,
+            arguments={
+                'x-dead-letter-exchange': '',
+                'x-dead-letter-routing-key': PERSISTENCE_QUEUE
+            }
+        )
+
         logger.info("✓ Connected to RabbitMQ, starting to consume events...")
 
-        # Consume messages
+        event_batcher = EventBatcher(
+            persistence_consumer,
+            rabbitmq_channel,
+            max_events=PERSISTENCE_BATCH_MAX_EVENTS,
+            max_delay_ms=PERSISTENCE_BATCH_MAX_DELAY_MS,
+            retry_queue=PERSISTENCE_RETRY_QUEUE,
+            max_retries=PERSISTENCE_MAX_RETRIES,
+            retry_base_ms=PERSISTENCE_RETRY_BASE_MS,
+            retry_max_ms=PERSISTENCE_RETRY_MAX_MS
+        )
+
+        # Consume messages, acked by the batcher once their batch is written
         async with queue.iterator() as queue_iter:
             async for message in queue_iter:
-                async with message.process():
-                    try:
-                        import json
-                        event = json.loads(message.body.decode())
-
-                        # Process event
-                        await persistence_consumer.process_event(event)
-
-                    except Exception as e:
-                        logger.error(f"Error processing message: {e}")
+                await event_batcher.add(message)
 
     except Exception as e:
         logger.error(f"Error in RabbitMQ consumer: {e}")
@@ -108,6 +135,7 @@ async def lifespan(app: FastAPI):
     # Initialize repositories
     session_repository = SessionRepository(db)
     event_repository = EventRepository(db)
+    await event_repository.ensure_indexes()
     conversation_repository = ConversationRepository(db)
     inventory_repository = InventoryRepository(db)
 
@@ -131,6 +159,9 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down Game Persistence Service...")
 
+    if event_batcher:
+        await event_batcher.drain()
+
     if rabbitmq_connection:
         await rabbitmq_connection.close()
 
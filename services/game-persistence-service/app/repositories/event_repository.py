@@ -2,12 +2,16 @@
 Event repository for MongoDB operations
 """
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 import logging
 
 logger = logging.getLogger(__name__)
 
+# MongoDB duplicate key error
+DUPLICATE_KEY_ERROR = 11000
+
 
 class EventRepository:
     """Repository for event operations"""
@@ -17,6 +21,50 @@ class EventRepository:
         self.collection = db['game_events']
         self.sequence_collection = db['event_sequences']
 
+    async def ensure_indexes(self):
+        """
+        Create the indexes event writes and reads rely on.
+
+        create_events relies on the unique event_id index for idempotent
+        retries, so startup fails if it can't be built. Duplicates left by
+        writes made before the index existed are removed first.
+        """
+        try:
+            await self._create_event_id_index()
+        except OperationFailure as e:
+            if e.code != DUPLICATE_KEY_ERROR:
+                raise
+            removed = await self.remove_duplicate_events()
+            logger.warning(f"Removed {removed} duplicate events before indexing event_id")
+            await self._create_event_id_index()
+
+        await self.collection.create_index([('session_id', 1), ('sequence_number', 1)])
+        logger.info("✓ Event indexes ready")
+
+    async def _create_event_id_index(self):
+        # Redelivered events are rejected instead of stored twice;
+        # events without an id are not constrained
+        await self.collection.create_index(
+            'event_id',
+            unique=True,
+            partialFilterExpression={'event_id': {'$type': 'string'}}
+        )
+
+    async def remove_duplicate_events(self) -> int:
+        """Delete all but the first stored copy of each event_id, returns the number deleted"""
+        pipeline = [
+            {'$match': {'event_id': {'$type': 'string'}}},
+            {'$sort': {'_id': 1}},
+            {'$group': {'_id': '$event_id', 'ids': {'$push': '$_id'}, 'count': {'$sum': 1}}},
+            {'$match': {'count': {'$gt': 1}}}
+        ]
+
+        removed = 0
+        async for group in self.collection.aggregate(pipeline, allowDiskUse=True):
+            result = await self.collection.delete_many({'_id': {'$in': group['ids'][1:]}})
+            removed += result.deleted_count
+        return removed
+
     async def get_next_sequence_number(self, session_id: UUID) -> int:
         """Get the next sequence number for a session"""
         try:
@@ -33,13 +81,29 @@ class EventRepository:
             logger.error(f"Error getting sequence number: {e}")
             return 1
 
+    async def reserve_sequence_numbers(self, session_id: UUID, count: int) -> Optional[int]:
+        """Reserve a block of sequence numbers for a session, returns the first one"""
+        try:
+            result = await self.sequence_collection.find_one_and_update(
+                {'session_id': str(session_id)},
+                {'$inc': {'sequence': count}},
+                upsert=True,
+                return_document=True
+            )
+
+            return result['sequence'] - count + 1
+
+        except Exception as e:
+            logger.error(f"Error reserving {count} sequence numbers: {e}")
+            return None
+
     async def create_event(self, event_data: Dict[str, Any]) -> bool:
         """Create a new event"""
         try:
             # Convert UUIDs to strings
             if 'session_id' in event_data:
                 event_data['session_id'] = str(event_data['session_id'])
-            if 'event_id' in event_data:
+            if event_data.get('event_id') is not None:
                 event_data['event_id'] = str(event_data['event_id'])
 
             # Get sequence number if not provided
@@ -54,10 +118,118 @@ class EventRepository:
             logger.debug(f"Created event: {event_data.get('event_id')}")
             return True
 
+        except DuplicateKeyError:
+            logger.debug(f"Event already stored: {event_data.get('event_id')}")
+            return True
+
         except Exception as e:
             logger.error(f"Error creating event: {e}")
             return False
 
+    async def create_events(self, events: List[Dict[str, Any]]) -> Optional[List[int]]:
+        """
+        Create a batch of events with one sequence reservation per session
+        and a single unordered insert_many.
+
+        New events are stored with handled=False; call mark_events_handled
+        once their handlers have run.
+
+        Returns the positions (in events) of the events whose handlers still
+        have to run: the ones inserted now, and ones already stored by an
+        earlier attempt that never got marked handled. Returns None if the
+        batch may not have been written (sequence reservation or connection
+        failure), so the caller can retry it. Retrying is safe: events
+        already stored are rejected by the unique event_id index. Documents
+        rejected for other reasons are logged and left out.
+        """
+        if not events:
+            return []
+
+        positions = {id(event_data): position for position, event_data in enumerate(events)}
+        documents: List[Dict[str, Any]] = []
+
+        try:
+            by_session: Dict[str, List[Dict[str, Any]]] = {}
+            for event_data in events:
+                event_data['session_id'] = str(event_data['session_id'])
+                if event_data.get('event_id') is not None:
+                    event_data['event_id'] = str(event_data['event_id'])
+                event_data['handled'] = False
+                by_session.setdefault(event_data['session_id'], []).append(event_data)
+
+            for session_id, session_events in list(by_session.items()):
+                try:
+                    session_uuid = UUID(session_id)
+                except ValueError:
+                    logger.error(f"Error creating events: invalid session_id {session_id!r}")
+                    del by_session[session_id]
+                    continue
+
+                pending = [e for e in session_events if 'sequence_number' not in e]
+                if not pending:
+                    continue
+                first = await self.reserve_sequence_numbers(session_uuid, len(pending))
+                if first is None:
+                    return None
+                for offset, event_data in enumerate(pending):
+                    event_data['sequence_number'] = first + offset
+
+            documents = [e for session_events in by_session.values() for e in session_events]
+            if documents:
+                await self.collection.insert_many(documents, ordered=False)
+
+            logger.debug(f"Created {len(documents)} events for {len(by_session)} session(s)")
+            return sorted(positions[id(document)] for document in documents)
+
+        except BulkWriteError as e:
+            details = e.details or {}
+            write_errors = details.get('writeErrors', [])
+            duplicates = [
+                documents[error['index']] for error in write_errors
+                if error.get('code') == DUPLICATE_KEY_ERROR
+            ]
+            failed = {error['index'] for error in write_errors}
+            rejected = len(write_errors) - len(duplicates)
+
+            if duplicates:
+                logger.info(f"Skipped {len(duplicates)} already stored event(s)")
+            if rejected:
+                logger.error(
+                    f"Error creating events: {rejected} of {len(documents)} rejected, "
+                    f"{details.get('nInserted', 0)} inserted"
+                )
+
+            inserted = [document for index, document in enumerate(documents) if index not in failed]
+            try:
+                unhandled = await self._unhandled_event_ids([d['event_id'] for d in duplicates])
+            except Exception as lookup_error:
+                logger.error(f"Error checking stored events: {lookup_error}")
+                return None
+            inserted.extend(d for d in duplicates if d['event_id'] in unhandled)
+            return sorted(positions[id(document)] for document in inserted)
+
+        except Exception as e:
+            logger.error(f"Error creating events: {e}")
+            return None
+
+    async def _unhandled_event_ids(self, event_ids: List[str]) -> set:
+        """Stored event ids whose handlers have not been marked as run"""
+        if not event_ids:
+            return set()
+        return set(await self.collection.distinct(
+            'event_id',
+            {'event_id': {'$in': event_ids}, 'handled': False}
+        ))
+
+    async def mark_events_handled(self, event_ids: List[str]):
+        """Record that the handlers for these events have run"""
+        event_ids = [event_id for event_id in event_ids if event_id is not None]
+        if event_ids:
+            await self.collection.update_many(
+                {'event_id': {'$in': event_ids}, 'handled': False},
+                {'$set': {'handled': True}}
+            )
+
     async def get_events(
         self,
         session_id: UUID,
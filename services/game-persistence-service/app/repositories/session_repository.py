@@ -96,6 +96,26 @@ class SessionRepository:
             logger.error(f"Error incrementing index: {e}")
             return False
 
+    async def increment_indices(self, session_id: UUID, increments: Dict[str, int]) -> bool:
+        """Increment several index counters in one update"""
+        if not increments:
+            return True
+
+        try:
+            result = await self.collection.update_one(
+                {'session_id': str(session_id)},
+                {
+                    '$inc': {f'indices.{name}': amount for name, amount in increments.items()},
+                    '$set': {'updated_at': datetime.utcnow()}
+                }
+            )
+
+            return result.modified_count > 0
+
+        except Exception as e:
+            logger.error(f"Error incrementing indices: {e}")
+            return False
+
     async def get_active_sessions_for_player(self, player_id: UUID) -> List[Dict[str, Any]]:
         """Get all active sessions for a player"""
         try:
@@ -2,11 +2,14 @@
 WebSocket Connection Manager
 """
 import logging
+import os
 from typing import Dict, Set
 from uuid import UUID
 from fastapi import WebSocket
 import json
 
+from .connection_outbox import ConnectionOutbox
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,6 +23,15 @@ class ConnectionManager:
         # websocket -> (session_id, player_id)
         self.connection_info: Dict[WebSocket, tuple[str, str]] = {}
 
+        # websocket -> outbound queue drained by its own writer task
+        self.outboxes: Dict[WebSocket, ConnectionOutbox] = {}
+
+        # Slow consumers are disconnected ("disconnect") or lose their
+        # oldest queued messages ("drop_oldest") once the outbox is full
+        self.outbox_max_messages = int(os.getenv('WS_OUTBOX_MAX_MESSAGES', '256'))
+        self.send_timeout = float(os.getenv('WS_SEND_TIMEOUT_SECONDS', '10'))
+        self.slow_consumer_policy = os.getenv('WS_SLOW_CONSUMER_POLICY', 'disconnect')
+
     async def connect(self, websocket: WebSocket, session_id: UUID, player_id: UUID):
         """Connect a WebSocket to a session"""
         await websocket.accept()
@@ -35,6 +47,13 @@ class ConnectionManager:
 
         # Store connection info
         self.connection_info[websocket] = (session_key, player_key)
+        self.outboxes[websocket] = ConnectionOutbox(
+            websocket,
+            max_queue_size=self.outbox_max_messages,
+            send_timeout=self.send_timeout,
+            overflow_policy=self.slow_consumer_policy,
+            on_close=self.disconnect
+        )
 
         logger.info(f"Player {player_id} connected to session {session_id}")
 
@@ -56,31 +75,29 @@ class ConnectionManager:
         # Remove connection info
         del self.connection_info[websocket]
 
-        logger.info(f"Player {player_key} disconnected from session {session_key}")
-
-    async def send_to_session(self, session_id: UUID, message: dict):
-        """Send a message to all connections in a session"""
-        session_key = str(session_id)
+        # Stop the writer task
+        outbox = self.outboxes.pop(websocket, None)
+        if outbox:
+            outbox.close()
 
-        if session_key not in self.active_connections:
-            return
+        logger.info(f"Player {player_key} disconnected from session {session_key}")
 
-        # Convert message to JSON
-        message_json = json.dumps(message)
+    def _enqueue(self, connection: WebSocket, message_json: str) -> bool:
+        """Queue an already-serialized message on a connection's outbox"""
+        outbox = self.outboxes.get(connection)
+        if outbox is None:
+            self.disconnect(connection)
+            return False
+        return outbox.enqueue(message_json)
 
-        # Send to all connections
-        disconnected = []
+    async def send_to_session(self, session_id: UUID, message: dict):
+        """
+        Send a message to all connections in a session
 
-        for connection in self.active_connections[session_key]:
-            try:
-                await connection.send_text(message_json)
-            except Exception as e:
-                logger.error(f"Error sending to connection: {e}")
-                disconnected.append(connection)
-
-        # Clean up disconnected
-        for connection in disconnected:
-            self.disconnect(connection)
+        The message is serialized once and queued per connection; each
+        connection's writer task sends it, so a slow client only delays itself.
+        """
+        await self.broadcast_to_session(str(session_id), message)
 
     async def send_to_player(self, session_id: UUID, player_id: UUID, message: dict):
         """Send a message to a specific player"""
@@ -93,16 +110,12 @@ class ConnectionManager:
         # Convert message to JSON
         message_json = json.dumps(message)
 
-        # Find player's connection
-        for connection in self.active_connections[session_key]:
+        # Find player's connection(s)
+        for connection in list(self.active_connections[session_key]):
             if connection in self.connection_info:
                 conn_session, conn_player = self.connection_info[connection]
                 if conn_player == player_key:
-                    try:
-                        await connection.send_text(message_json)
-                    except Exception as e:
-                        logger.error(f"Error sending to player: {e}")
-                        self.disconnect(connection)
+                    self._enqueue(connection, message_json)
 
     def get_connected_players(self, session_id: UUID) -> Set[str]:
         """Get set of connected player IDs for a session"""
@@ -137,19 +150,9 @@ class ConnectionManager:
             logger.debug(f"No active connections for session {session_id}")
             return
 
-        # Convert message to JSON
+        # Convert message to JSON once for every recipient
         message_json = json.dumps(message)
 
-        # Send to all connections
-        disconnected = []
-
-        for connection in self.active_connections[session_id]:
-            try:
-                await connection.send_text(message_json)
-            except Exception as e:
-                logger.error(f"Error broadcasting to connection: {e}")
-                disconnected.append(connection)
-
-        # Clean up disconnected
-        for connection in disconnected:
-            self.disconnect(connection)
+        # Copy: a full outbox may disconnect its connection while we iterate
+        for connection in list(self.active_connections[session_id]):
+            self._enqueue(connection, message_json)
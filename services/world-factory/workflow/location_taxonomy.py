@@ -1,8 +1,16 @@
 """
 Hierarchical Location Taxonomy System
 Defines valid location types at each level and their parent-child relationships
+
+The tables below are compiled at import into frozen lookup structures (type
+sets per level, a parent -> children adjacency map and a trigram index for
+fuzzy matching), so validation does no list scans.
 """
-from typing import List, Dict, Optional, Tuple
+import re
+from collections import Counter
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Optional, Tuple, FrozenSet
 from enum import Enum
 
 
@@ -409,6 +417,107 @@ LEVEL_3_LOCATION_TYPES = {
 }
 
 
+# =============================================================================
+# COMPILED LOOKUP TABLES
+# =============================================================================
+
+# Category lists making up each level (in the order get_all_types_by_level returns them)
+_LEVEL_CATEGORIES = {
+    LocationLevel.REGION: (REGION_TYPES, ("geographic_features",)),
+    LocationLevel.LEVEL_1: (LEVEL_1_LOCATION_TYPES, ("settlements", "natural_features", "constructed_features")),
+    LocationLevel.LEVEL_2: (LEVEL_2_LOCATION_TYPES, ("buildings", "outdoor_spaces", "natural_features", "landmarks")),
+    LocationLevel.LEVEL_3: (LEVEL_3_LOCATION_TYPES, (
+        "residential_rooms", "commercial_spaces", "tavern_inn_rooms", "religious_spaces",
+        "civic_government", "military_spaces", "utility_spaces", "natural_spaces", "special_spaces"
+    ))
+}
+
+# Table holding the parent -> children map for children of each level
+_COMPATIBILITY_TABLES = {
+    LocationLevel.LEVEL_1: LEVEL_1_LOCATION_TYPES,
+    LocationLevel.LEVEL_2: LEVEL_2_LOCATION_TYPES,
+    LocationLevel.LEVEL_3: LEVEL_3_LOCATION_TYPES
+}
+
+_CHILD_LEVEL = {
+    LocationLevel.REGION: LocationLevel.LEVEL_1,
+    LocationLevel.LEVEL_1: LocationLevel.LEVEL_2,
+    LocationLevel.LEVEL_2: LocationLevel.LEVEL_3
+}
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def _normalize_type_name(location_type: str) -> str:
+    """Case/punctuation-insensitive lookup key ("The  Bar" -> "bar")"""
+    normalized = _NON_ALNUM.sub(" ", location_type.lower()).strip()
+    if normalized.startswith("the "):
+        normalized = normalized[4:]
+    return normalized
+
+
+def _trigrams(normalized: str) -> FrozenSet[str]:
+    padded = f"  {normalized} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def _compile_taxonomy():
+    types_by_level = {}
+    type_sets = {}
+    canonical_by_level = {}
+    type_levels: Dict[str, set] = {}
+    for level, (table, categories) in _LEVEL_CATEGORIES.items():
+        types = tuple(location_type for category in categories for location_type in table[category])
+        types_by_level[level] = types
+        type_sets[level] = frozenset(types)
+        canonical_by_level[level] = MappingProxyType({_normalize_type_name(t): t for t in types})
+        for location_type in types:
+            type_levels.setdefault(_normalize_type_name(location_type), set()).add(level)
+
+    children = {}
+    child_sets = {}
+    for child_level, table in _COMPATIBILITY_TABLES.items():
+        compatibility = table["parent_compatibility"]
+        children[child_level] = MappingProxyType({parent: tuple(kids) for parent, kids in compatibility.items()})
+        child_sets[child_level] = MappingProxyType({parent: frozenset(kids) for parent, kids in compatibility.items()})
+
+    # Trigram -> canonical types, over every name a match may resolve to
+    # (level types plus names only listed as compatible children)
+    trigram_index: Dict[str, set] = {}
+    name_trigrams = {}
+    all_names = set().union(*type_sets.values())
+    for kids in child_sets.values():
+        all_names.update(*kids.values())
+    for name in all_names:
+        grams = _trigrams(_normalize_type_name(name))
+        name_trigrams[name] = grams
+        for gram in grams:
+            trigram_index.setdefault(gram, set()).add(name)
+
+    return (
+        MappingProxyType(types_by_level),
+        MappingProxyType(type_sets),
+        MappingProxyType(canonical_by_level),
+        MappingProxyType({name: frozenset(levels) for name, levels in type_levels.items()}),
+        MappingProxyType(children),
+        MappingProxyType(child_sets),
+        MappingProxyType({gram: frozenset(names) for gram, names in trigram_index.items()}),
+        MappingProxyType(name_trigrams)
+    )
+
+
+(
+    _TYPES_BY_LEVEL,      # level -> canonical types, in table order
+    _TYPE_SETS,           # level -> frozenset of canonical types
+    _CANONICAL_BY_LEVEL,  # level -> normalized name -> canonical type
+    _TYPE_LEVELS,         # normalized name -> levels it is valid at
+    _CHILDREN,            # child level -> parent type -> compatible child types
+    _CHILD_SETS,          # child level -> parent type -> frozenset of child types
+    _TRIGRAM_INDEX,       # trigram -> canonical types containing it
+    _NAME_TRIGRAMS        # canonical type -> its trigrams
+) = _compile_taxonomy()
+
+
 # =============================================================================
 # VALIDATION FUNCTIONS
 # =============================================================================
@@ -430,59 +539,23 @@ def validate_location_type(
         (is_valid: bool, error_message: str)
     """
     if level == LocationLevel.REGION:
-        if location_type not in REGION_TYPES["geographic_features"]:
-            valid_types = ", ".join(REGION_TYPES["geographic_features"][:10]) + "..."
+        if location_type not in _TYPE_SETS[level]:
+            valid_types = ", ".join(_TYPES_BY_LEVEL[level][:10]) + "..."
             return False, f"Invalid region type '{location_type}'. Must be one of: {valid_types}"
+        return True, ""
+
+    if level not in _CHILD_SETS:
+        return True, ""
 
-    elif level == LocationLevel.LEVEL_1:
-        all_level1_types = (
-            LEVEL_1_LOCATION_TYPES["settlements"] +
-            LEVEL_1_LOCATION_TYPES["natural_features"] +
-            LEVEL_1_LOCATION_TYPES["constructed_features"]
-        )
-        if location_type not in all_level1_types:
-            return False, f"Invalid Level 1 location type: '{location_type}'"
-
-        # Check parent compatibility
-        if parent_type:
-            compatible = LEVEL_1_LOCATION_TYPES["parent_compatibility"].get(parent_type, [])
-            if location_type not in compatible:
-                return False, f"Location type '{location_type}' cannot be a child of region type '{parent_type}'. Valid types: {', '.join(compatible[:5])}..."
-
-    elif level == LocationLevel.LEVEL_2:
-        all_level2_types = (
-            LEVEL_2_LOCATION_TYPES["buildings"] +
-            LEVEL_2_LOCATION_TYPES["outdoor_spaces"] +
-            LEVEL_2_LOCATION_TYPES["natural_features"] +
-            LEVEL_2_LOCATION_TYPES["landmarks"]
-        )
-        if location_type not in all_level2_types:
-            return False, f"Invalid Level 2 location type: '{location_type}'"
-
-        if parent_type:
-            compatible = LEVEL_2_LOCATION_TYPES["parent_compatibility"].get(parent_type, [])
-            if location_type not in compatible:
-                return False, f"Location type '{location_type}' cannot be a child of '{parent_type}'. Valid types: {', '.join(compatible[:5])}..."
-
-    elif level == LocationLevel.LEVEL_3:
-        all_level3_types = (
-            LEVEL_3_LOCATION_TYPES["residential_rooms"] +
-            LEVEL_3_LOCATION_TYPES["commercial_spaces"] +
-            LEVEL_3_LOCATION_TYPES["tavern_inn_rooms"] +
-            LEVEL_3_LOCATION_TYPES["religious_spaces"] +
-            LEVEL_3_LOCATION_TYPES["civic_government"] +
-            LEVEL_3_LOCATION_TYPES["military_spaces"] +
-            LEVEL_3_LOCATION_TYPES["utility_spaces"] +
-            LEVEL_3_LOCATION_TYPES["natural_spaces"] +
-            LEVEL_3_LOCATION_TYPES["special_spaces"]
-        )
-        if location_type not in all_level3_types:
-            return False, f"Invalid Level 3 location type: '{location_type}'"
-
-        if parent_type:
-            compatible = LEVEL_3_LOCATION_TYPES["parent_compatibility"].get(parent_type, [])
-            if location_type not in compatible:
-                return False, f"Location type '{location_type}' cannot be a child of '{parent_type}'. Valid types: {', '.join(compatible[:5])}..."
+    if location_type not in _TYPE_SETS[level]:
+        return False, f"Invalid Level {level.value} location type: '{location_type}'"
+
+    # Check parent compatibility
+    if parent_type:
+        if location_type not in _CHILD_SETS[level].get(parent_type, ()):
+            compatible = _CHILDREN[level].get(parent_type, ())
+            parent_label = "region type " if level == LocationLevel.LEVEL_1 else ""
+            return False, f"Location type '{location_type}' cannot be a child of {parent_label}'{parent_type}'. Valid types: {', '.join(compatible[:5])}..."
 
     return True, ""
 
@@ -498,13 +571,85 @@ def get_valid_child_types(parent_type: str, parent_level: LocationLevel) -> List
     Returns:
         List of valid child location types
     """
-    if parent_level == LocationLevel.REGION:
-        return LEVEL_1_LOCATION_TYPES["parent_compatibility"].get(parent_type, [])
-    elif parent_level == LocationLevel.LEVEL_1:
-        return LEVEL_2_LOCATION_TYPES["parent_compatibility"].get(parent_type, [])
-    elif parent_level == LocationLevel.LEVEL_2:
-        return LEVEL_3_LOCATION_TYPES["parent_compatibility"].get(parent_type, [])
-    return []
+    child_level = _CHILD_LEVEL.get(parent_level)
+    if child_level is None:
+        return []
+    return list(_CHILDREN[child_level].get(parent_type, ()))
+
+
+def resolve_location_type(
+    location_type: str,
+    level: LocationLevel,
+    parent_type: Optional[str] = None,
+    min_similarity: float = 0.6
+) -> Optional[str]:
+    """
+    Map an LLM-produced type name to the canonical type it most likely means
+    ("tavern", "The Taverns", "Smithy Shop" -> "Tavern", ..., "Smithy").
+
+    Tries the case/punctuation-normalized name (and its singular) first, then
+    scores only the candidates sharing trigrams with it.
+
+    Args:
+        location_type: Type name as generated
+        level: The location level
+        parent_type: Optional parent type; restricts matches to compatible types
+        min_similarity: Minimum trigram (Dice) similarity for a fuzzy match
+
+    Returns:
+        A canonical type that passes validate_location_type, or None
+    """
+    if not location_type:
+        return None
+    return _resolve_location_type(location_type, level, parent_type, min_similarity)
+
+
+@lru_cache(maxsize=4096)
+def _resolve_location_type(
+    location_type: str,
+    level: LocationLevel,
+    parent_type: Optional[str],
+    min_similarity: float
+) -> Optional[str]:
+    allowed = _TYPE_SETS.get(level, frozenset())
+    if parent_type and level in _CHILD_SETS:
+        allowed = allowed & _CHILD_SETS[level].get(parent_type, frozenset())
+    if not allowed:
+        return None
+
+    normalized = _normalize_type_name(location_type)
+    canonical_names = _CANONICAL_BY_LEVEL[level]
+    for candidate in (normalized, normalized[:-1] if normalized.endswith("s") else None):
+        if candidate and canonical_names.get(candidate) in allowed:
+            return canonical_names[candidate]
+
+    grams = _trigrams(normalized)
+    shared = Counter()
+    for gram in grams:
+        for name in _TRIGRAM_INDEX.get(gram, ()):
+            if name in allowed:
+                shared[name] += 1
+
+    best_type, best_score = None, 0.0
+    for name, count in shared.items():
+        score = 2 * count / (len(grams) + len(_NAME_TRIGRAMS[name]))
+        if score > best_score or (score == best_score and best_type is not None and name < best_type):
+            best_type, best_score = name, score
+
+    return best_type if best_score >= min_similarity else None
+
+
+def get_type_levels(location_type: str) -> FrozenSet[LocationLevel]:
+    """
+    Levels at which a type name (case-insensitive) is a valid location type
+
+    Args:
+        location_type: The location type
+
+    Returns:
+        Frozen set of LocationLevel values (empty if unknown)
+    """
+    return _TYPE_LEVELS.get(_normalize_type_name(location_type), frozenset())
 
 
 def get_location_type_description(location_type: str, level: LocationLevel) -> str:
@@ -556,31 +701,4 @@ def get_all_types_by_level(level: LocationLevel) -> List[str]:
     Returns:
         List of all valid types for that level
     """
-    if level == LocationLevel.REGION:
-        return REGION_TYPES["geographic_features"]
-    elif level == LocationLevel.LEVEL_1:
-        return (
-            LEVEL_1_LOCATION_TYPES["settlements"] +
-            LEVEL_1_LOCATION_TYPES["natural_features"] +
-            LEVEL_1_LOCATION_TYPES["constructed_features"]
-        )
-    elif level == LocationLevel.LEVEL_2:
-        return (
-            LEVEL_2_LOCATION_TYPES["buildings"] +
-            LEVEL_2_LOCATION_TYPES["outdoor_spaces"] +
-            LEVEL_2_LOCATION_TYPES["natural_features"] +
-            LEVEL_2_LOCATION_TYPES["landmarks"]
-        )
-    elif level == LocationLevel.LEVEL_3:
-        return (
-            LEVEL_3_LOCATION_TYPES["residential_rooms"] +
-            LEVEL_3_LOCATION_TYPES["commercial_spaces"] +
-            LEVEL_3_LOCATION_TYPES["tavern_inn_rooms"] +
-            LEVEL_3_LOCATION_TYPES["religious_spaces"] +
-            LEVEL_3_LOCATION_TYPES["civic_government"] +
-            LEVEL_3_LOCATION_TYPES["military_spaces"] +
-            LEVEL_3_LOCATION_TYPES["utility_spaces"] +
-            LEVEL_3_LOCATION_TYPES["natural_spaces"] +
-            LEVEL_3_LOCATION_TYPES["special_spaces"]
-        )
-    return []
+    return list(_TYPES_BY_LEVEL.get(level, ()))
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Campaign Neo4j Write Benchmark for SkillForge Campaign Factory
+Writes a synthetic 10-quest campaign graph two ways and compares round-trips
+and latency:
+
+  per-row  one query per entity/relationship (the previous write pattern)
+  bulk     one UNWIND query per node/relationship type in a single
+           transaction (write_graph_rows)
+
+Both modes run the same Cypher, so node/relationship counts must match.
+All nodes are written under a scratch world/campaign id and deleted after
+each run.
+
+Usage:
+    python tests/benchmark_campaign_neo4j_writes.py [--quests 10] [--iterations 3] [--dry-run]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+
+CAMPAIGN_FACTORY_DIR = os.path.join(os.path.dirname(__file__), "..", "services", "campaign-factory")
+sys.path.insert(0, os.path.abspath(CAMPAIGN_FACTORY_DIR))
+
+os.environ.setdefault("NEO4J_URI", "bolt://localhost:7687")
+os.environ.setdefault("NEO4J_USER", "neo4j")
+os.environ.setdefault("NEO4J_PASSWORD", "password")
+
+from workflow.neo4j_bulk_writer import (  # noqa: E402
+    CAMPAIGN_GRAPH_STATEMENTS,
+    ELEMENT_RESOURCE_STATEMENTS,
+    build_campaign_graph_rows,
+    build_element_resource_rows,
+    write_graph_rows
+)
+
+
+class Colors:
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    BLUE = '\033[94m'
+    CYAN = '\033[96m'
+    END = '\033[0m'
+
+
+def build_synthetic_campaign(quests: int, places_per_quest: int, scenes_per_place: int) -> dict:
+    """Campaign state shaped like the finalize node's input"""
+    run_id = uuid.uuid4().hex[:10]
+    world_id = f"bench_world_{run_id}"
+    state = {
+        "request_id": f"bench_{run_id}",
+        "world_id": world_id,
+        "region_id": f"bench_region_{run_id}",
+        "character_id": f"bench_character_{run_id}",
+        "created_at": "2026-01-01T00:00:00",
+        "campaign_core": {"name": f"Benchmark Campaign {run_id}"},
+        "quests": [], "places": [], "scenes": [], "npcs": [],
+        "knowledge_entities": [], "item_entities": [],
+        "challenges": [], "discoveries": [], "events": [], "rubrics": []
+    }
+
+    for q in range(quests):
+        quest_id = f"{run_id}_quest_{q}"
+        state["quests"].append({
+            "quest_id": quest_id, "name": f"Quest {q}", "order_sequence": q,
+            "level_1_location_id": f"{run_id}_l1_{q}", "level_1_location_name": f"Town {q}"
+        })
+        for p in range(places_per_quest):
+            place_id = f"{quest_id}_place_{p}"
+            state["places"].append({
+                "place_id": place_id, "parent_quest_id": quest_id, "name": f"Place {q}.{p}", "order_sequence": p,
+                "level_2_location_id": f"{place_id}_l2", "level_2_location_name": f"Building {q}.{p}"
+            })
+            for s in range(scenes_per_place):
+                scene_id = f"{place_id}_scene_{s}"
+                npc_id = f"{scene_id}_npc"
+                knowledge_id = f"{scene_id}_knowledge"
+                item_id = f"{scene_id}_item"
+                state["scenes"].append({
+                    "scene_id": scene_id, "parent_place_id": place_id, "name": f"Scene {q}.{p}.{s}",
+                    "order_sequence": s, "npc_ids": [npc_id],
+                    "level_3_location_id": f"{scene_id}_l3", "level_3_location_name": f"Room {q}.{p}.{s}"
+                })
+                state["npcs"].append({
+                    "npc_id": npc_id, "name": f"NPC {q}.{p}.{s}", "role": {"type": "mentor"},
+                    "backstory": "A benchmark resident.", "species_id": f"{run_id}_species_{s}",
+                    "species_name": f"Species {s}", "level_3_location_id": f"{scene_id}_l3",
+                    "level_3_location_name": f"Room {q}.{p}.{s}",
+                    "provides_knowledge_ids": [knowledge_id], "provides_item_ids": []
+                })
+                state["knowledge_entities"].append({
+                    "knowledge_id": knowledge_id, "name": f"Knowledge {q}.{p}.{s}", "scene_id": scene_id,
+                    "description": "Benchmark knowledge", "acquisition_methods": [{"entity_id": npc_id}]
+                })
+                state["item_entities"].append({
+                    "item_id": item_id, "name": f"Item {q}.{p}.{s}", "scene_id": scene_id,
+                    "description": "Benchmark item", "acquisition_methods": [{"entity_id": npc_id}]
+                })
+                for kind in ("challenge", "discovery", "event"):
+                    element_id = f"{scene_id}_{kind}"
+                    element = {f"{kind}_id": element_id, "name": f"{kind} {q}.{p}.{s}",
+                               "scene_id": scene_id, "description": f"Benchmark {kind}"}
+                    if kind != "event":
+                        element["provides_knowledge_ids"] = [knowledge_id]
+                        element["provides_item_ids"] = [item_id]
+                    state["challenges" if kind == "challenge" else "discoveries" if kind == "discovery" else "events"].append(element)
+                    state["rubrics"].append({
+                        "rubric_id": f"{element_id}_rubric", "entity_id": element_id,
+                        "interaction_name": f"Evaluate {kind}"
+                    })
+
+    state["final_campaign_id"] = f"bench_campaign_{run_id}"
+    return state
+
+
+def write_per_row(driver, statements, rows) -> dict:
+    """Previous pattern: one auto-commit query per row"""
+    totals = {"queries": 0, "nodes_created": 0, "relationships_created": 0}
+    with driver.session() as session:
+        for name, query in statements:
+            for row in rows.get(name, []):
+                counters = session.run(query, rows=[row]).consume().counters
+                totals["queries"] += 1
+                totals["nodes_created"] += counters.nodes_created
+                totals["relationships_created"] += counters.relationships_created
+    return totals
+
+
+def write_bulk(driver, statements, rows) -> dict:
+    stats = write_graph_rows(driver, statements, rows)
+    return {
+        "queries": len(stats),
+        "nodes_created": sum(s["nodes_created"] for s in stats.values()),
+        "relationships_created": sum(s["relationships_created"] for s in stats.values())
+    }
+
+
+def setup_fixture(driver, state):
+    """World and Region the campaign links to"""
+    with driver.session() as session:
+        session.run(
+            "MERGE (w:World {id: $world_id}) MERGE (r:Region {id: $region_id}) MERGE (r)-[:PART_OF]->(w)",
+            world_id=state["world_id"], region_id=state["region_id"]
+        ).consume()
+
+
+def cleanup(driver, state, campaign_id):
+    with driver.session() as session:
+        session.run(
+            """
+            MATCH (n)
+            WHERE n.campaign_id = $campaign_id OR n.world_id = $world_id
+               OR n.id IN [$campaign_id, $character_id, $world_id, $region_id]
+            DETACH DELETE n
+            """,
+            campaign_id=campaign_id, world_id=state["world_id"],
+            character_id=state["character_id"], region_id=state["region_id"]
+        ).consume()
+
+
+def run_mode(driver, writer, state, campaign_id, rows) -> tuple:
+    setup_fixture(driver, state)
+    start = time.perf_counter()
+    totals = writer(driver, CAMPAIGN_GRAPH_STATEMENTS, rows["graph"])
+    resource_totals = writer(driver, ELEMENT_RESOURCE_STATEMENTS, rows["resources"])
+    elapsed = time.perf_counter() - start
+    cleanup(driver, state, campaign_id)
+    for key in totals:
+        totals[key] += resource_totals[key]
+    return elapsed, totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--quests", type=int, default=10)
+    parser.add_argument("--places", type=int, default=3, help="Places per quest")
+    parser.add_argument("--scenes", type=int, default=3, help="Scenes per place")
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--dry-run", action="store_true", help="Only build rows and count round-trips")
+    args = parser.parse_args()
+
+    print(f"{Colors.CYAN}{'=' * 70}{Colors.END}")
+    print(f"{Colors.CYAN}{'Campaign Neo4j Write Benchmark':^70}{Colors.END}")
+    print(f"{Colors.CYAN}{'=' * 70}{Colors.END}")
+
+    state = build_synthetic_campaign(args.quests, args.places, args.scenes)
+    campaign_id = state["final_campaign_id"]
+    rows = {
+        "graph": build_campaign_graph_rows(state, campaign_id),
+        "resources": build_element_resource_rows(state)
+    }
+
+    print(f"\n{Colors.BLUE}Synthetic campaign: {len(state['quests'])} quests, {len(state['places'])} places, "
+          f"{len(state['scenes'])} scenes, {len(state['npcs'])} NPCs{Colors.END}")
+    print(f"  {'statement':26s} {'rows':>6s}")
+    for group in ("graph", "resources"):
+        for name, batch in rows[group].items():
+            print(f"  {name:26s} {len(batch):6d}")
+    per_row_queries = sum(len(batch) for group in rows.values() for batch in group.values())
+    bulk_queries = sum(len(group) for group in rows.values())
+    print(f"  round-trips: per-row {per_row_queries:,d}, bulk {bulk_queries:,d}")
+
+    if args.dry_run:
+        print(f"\n{Colors.GREEN}  Done{Colors.END}")
+        return 0
+
+    from neo4j import GraphDatabase
+    driver = GraphDatabase.driver(
+        os.environ["NEO4J_URI"], auth=(os.environ["NEO4J_USER"], os.environ["NEO4J_PASSWORD"])
+    )
+
+    try:
+        timings = {"per-row": [], "bulk": []}
+        results = {}
+        for _ in range(args.iterations):
+            for mode, writer in (("per-row", write_per_row), ("bulk", write_bulk)):
+                elapsed, totals = run_mode(driver, writer, state, campaign_id, rows)
+                timings[mode].append(elapsed)
+                results[mode] = totals
+    finally:
+        cleanup(driver, state, campaign_id)
+        driver.close()
+
+    print(f"\n{Colors.BLUE}{args.iterations} iteration(s), median wall-clock{Colors.END}")
+    print(f"  {'mode':10s} {'queries':>8s} {'nodes':>7s} {'rels':>7s} {'median ms':>10s}")
+    for mode in ("per-row", "bulk"):
+        totals = results[mode]
+        print(f"  {mode:10s} {totals['queries']:8d} {totals['nodes_created']:7d} "
+              f"{totals['relationships_created']:7d} {statistics.median(timings[mode]) * 1000:10.1f}")
+    speedup = statistics.median(timings["per-row"]) / statistics.median(timings["bulk"])
+    print(f"  speedup: {speedup:.1f}x")
+
+    same_graph = all(
+        results["per-row"][key] == results["bulk"][key] for key in ("nodes_created", "relationships_created")
+    )
+    color = Colors.GREEN if same_graph else Colors.RED
+    print(f"{color}  identical graph: {same_graph}{Colors.END}")
+
+    print(f"\n{Colors.GREEN}  Done{Colors.END}")
+    return 0 if same_graph else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Location Taxonomy Benchmark for SkillForge World Factory
+Runs 100k validate_location_type checks (with and without a parent type)
+through the compiled lookup tables and through the previous list-scanning
+implementation, checks that both give identical results, and times the
+fuzzy resolver on near-miss type names.
+
+Usage:
+    python tests/benchmark_location_taxonomy.py [--checks N] [--seed N]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+WORLD_FACTORY_DIR = os.path.join(os.path.dirname(__file__), "..", "services", "world-factory")
+sys.path.insert(0, os.path.abspath(WORLD_FACTORY_DIR))
+
+from workflow.location_taxonomy import (  # noqa: E402
+    LocationLevel,
+    REGION_TYPES,
+    LEVEL_1_LOCATION_TYPES,
+    LEVEL_2_LOCATION_TYPES,
+    LEVEL_3_LOCATION_TYPES,
+    validate_location_type,
+    get_valid_child_types,
+    get_all_types_by_level,
+    resolve_location_type
+)
+
+
+class Colors:
+    GREEN = '\033[92m'
+    RED = '\033[91m'
+    BLUE = '\033[94m'
+    CYAN = '\033[96m'
+    END = '\033[0m'
+
+
+# Previous implementation: concatenates and scans the category lists per call
+_LEGACY_TABLES = {
+    LocationLevel.LEVEL_1: (LEVEL_1_LOCATION_TYPES, ("settlements", "natural_features", "constructed_features")),
+    LocationLevel.LEVEL_2: (LEVEL_2_LOCATION_TYPES, ("buildings", "outdoor_spaces", "natural_features", "landmarks")),
+    LocationLevel.LEVEL_3: (LEVEL_3_LOCATION_TYPES, (
+        "residential_rooms", "commercial_spaces", "tavern_inn_rooms", "religious_spaces",
+        "civic_government", "military_spaces", "utility_spaces", "natural_spaces", "special_spaces"
+    ))
+}
+
+
+def legacy_validate_location_type(location_type, level, parent_type=None):
+    if level == LocationLevel.REGION:
+        if location_type not in REGION_TYPES["geographic_features"]:
+            valid_types = ", ".join(REGION_TYPES["geographic_features"][:10]) + "..."
+            return False, f"Invalid region type '{location_type}'. Must be one of: {valid_types}"
+        return True, ""
+
+    table, categories = _LEGACY_TABLES[level]
+    all_types = []
+    for category in categories:
+        all_types = all_types + table[category]
+    if location_type not in all_types:
+        return False, f"Invalid Level {level.value} location type: '{location_type}'"
+
+    if parent_type:
+        compatible = table["parent_compatibility"].get(parent_type, [])
+        if location_type not in compatible:
+            parent_label = "region type " if level == LocationLevel.LEVEL_1 else ""
+            return False, f"Location type '{location_type}' cannot be a child of {parent_label}'{parent_type}'. Valid types: {', '.join(compatible[:5])}..."
+    return True, ""
+
+
+def near_miss(name: str, rng: random.Random) -> str:
+    """Mangle a type name the way LLM output tends to"""
+    variant = rng.randrange(4)
+    if variant == 0:
+        return name.lower()
+    if variant == 1:
+        return f"The {name}s"
+    if variant == 2 and len(name) > 4:
+        index = rng.randrange(1, len(name) - 1)
+        return name[:index] + name[index + 1:]
+    return name.upper().replace(" ", "-")
+
+
+def build_checks(count: int, rng: random.Random):
+    """Mix of valid, incompatible and unknown (type, level, parent) checks"""
+    levels = [LocationLevel.LEVEL_1, LocationLevel.LEVEL_2, LocationLevel.LEVEL_3, LocationLevel.REGION]
+    parents = {
+        LocationLevel.LEVEL_1: get_all_types_by_level(LocationLevel.REGION),
+        LocationLevel.LEVEL_2: get_all_types_by_level(LocationLevel.LEVEL_1),
+        LocationLevel.LEVEL_3: get_all_types_by_level(LocationLevel.LEVEL_2),
+        LocationLevel.REGION: [None]
+    }
+    checks = []
+    for _ in range(count):
+        level = rng.choice(levels)
+        parent_type = rng.choice(parents[level]) if rng.random() < 0.8 else None
+        children = get_valid_child_types(parent_type, LocationLevel(level.value - 1)) if parent_type else []
+        roll = rng.random()
+        if children and roll < 0.5:
+            location_type = rng.choice(children)
+        elif roll < 0.85:
+            location_type = rng.choice(get_all_types_by_level(level))
+        else:
+            location_type = near_miss(rng.choice(get_all_types_by_level(level)), rng)
+        checks.append((location_type, level, parent_type))
+    return checks
+
+
+def time_validation(validate, checks):
+    start = time.perf_counter()
+    results = [validate(location_type, level, parent_type) for location_type, level, parent_type in checks]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--checks", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    print(f"{Colors.CYAN}{'=' * 70}{Colors.END}")
+    print(f"{Colors.CYAN}{'Location Taxonomy Benchmark':^70}{Colors.END}")
+    print(f"{Colors.CYAN}{'=' * 70}{Colors.END}")
+
+    checks = build_checks(args.checks, rng)
+    legacy_s, legacy_results = time_validation(legacy_validate_location_type, checks)
+    compiled_s, compiled_results = time_validation(validate_location_type, checks)
+
+    mismatches = sum(1 for a, b in zip(legacy_results, compiled_results) if a != b)
+    valid = sum(1 for is_valid, _ in compiled_results if is_valid)
+
+    print(f"\n{Colors.BLUE}{len(checks):,d} type checks ({valid:,d} valid){Colors.END}")
+    print(f"  {'implementation':18s} {'total ms':>10s} {'us/check':>10s}")
+    print(f"  {'list scans':18s} {legacy_s * 1000:10.1f} {legacy_s / len(checks) * 1e6:10.2f}")
+    print(f"  {'compiled':18s} {compiled_s * 1000:10.1f} {compiled_s / len(checks) * 1e6:10.2f}")
+    print(f"  speedup: {legacy_s / compiled_s:.1f}x")
+
+    color = Colors.GREEN if mismatches == 0 else Colors.RED
+    print(f"{color}  result mismatches: {mismatches}{Colors.END}")
+
+    # Fuzzy resolution of near-miss names
+    names = [(near_miss(rng.choice(get_all_types_by_level(level)), rng), level)
+             for level in LocationLevel for _ in range(250)]
+    start = time.perf_counter()
+    resolved = [resolve_location_type(name, level) for name, level in names]
+    resolve_s = time.perf_counter() - start
+    matched = [r for r in resolved if r]
+    still_valid = all(validate_location_type(r, level)[0] for r, (_, level) in zip(resolved, names) if r)
+
+    print(f"\n{Colors.BLUE}{len(names):,d} near-miss names through resolve_location_type{Colors.END}")
+    print(f"  matched: {len(matched):,d} ({len(matched) / len(names):.0%}), all valid: {still_valid}")
+    print(f"  {resolve_s * 1000:.1f} ms total, {resolve_s / len(names) * 1e6:.2f} us/name")
+    for name, level in names[:5]:
+        print(f"    {name!r:32s} -> {resolve_location_type(name, level)!r}")
+
+    print(f"\n{Colors.GREEN}  Done{Colors.END}")
+    return 0 if mismatches == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
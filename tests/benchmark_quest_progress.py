@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Quest Progress Benchmark for SkillForge Game Engine
+Compares Neo4j round-trips and latency of the legacy per-objective
+requirement lookups against the batched get_objective_requirements query.
+
+Usage:
+    python tests/benchmark_quest_progress.py <campaign_id> <player_id> [quest_id] [--iterations N]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+GAME_ENGINE_DIR = os.path.join(os.path.dirname(__file__), "..", "services", "game-engine")
+sys.path.insert(0, os.path.abspath(GAME_ENGINE_DIR))
+
+# Only Neo4j is used, but the game engine settings require every URL to be present
+for _key in (
+    "ANTHROPIC_API_KEY", "MONGODB_URL", "POSTGRES_URL", "REDIS_URL", "RABBITMQ_URL",
+    "MCP_PLAYER_DATA_URL", "MCP_NPC_PERSONALITY_URL", "MCP_WORLD_UNIVERSE_URL",
+    "MCP_QUEST_MISSION_URL", "MCP_ITEM_EQUIPMENT_URL", "MCP_AUTH_TOKEN"
+):
+    os.environ.setdefault(_key, "unused")
+os.environ.setdefault("NEO4J_URI", "bolt://localhost:7687")
+os.environ.setdefault("NEO4J_USER", "neo4j")
+os.environ.setdefault("NEO4J_PASSWORD", "password")
+
+from neo4j import AsyncSession  # noqa: E402
+
+from app.services.neo4j_graph import neo4j_graph  # noqa: E402
+
+
+class Colors:
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    BLUE = '\033[94m'
+    CYAN = '\033[96m'
+    END = '\033[0m'
+
+
+class RoundTripCounter:
+    """Counts AsyncSession.run calls (one Bolt round-trip each)"""
+
+    def __init__(self):
+        self.count = 0
+        self._original_run = AsyncSession.run
+
+    def __enter__(self):
+        counter = self
+        original_run = self._original_run
+
+        async def counting_run(session, *args, **kwargs):
+            counter.count += 1
+            return await original_run(session, *args, **kwargs)
+
+        AsyncSession.run = counting_run
+        return self
+
+    def __exit__(self, *exc):
+        AsyncSession.run = self._original_run
+
+
+async def legacy_requirements(objective_ids, quest_id):
+    """Per-objective lookups as previously done in calculate_complete_quest_progress"""
+    async with neo4j_graph.driver.session() as session:
+        result = await session.run("""
+            MATCH (q:Quest {id: $quest_id})
+            RETURN q.order_sequence as quest_number
+        """, quest_id=quest_id)
+        await result.single()
+
+    for obj_id in objective_ids:
+        async with neo4j_graph.driver.session() as session:
+            result = await session.run("""
+                MATCH (qo:QuestObjective {id: $obj_id})
+                OPTIONAL MATCH (qo)-[:REQUIRES_KNOWLEDGE]->(k:Knowledge)
+                OPTIONAL MATCH (qo)-[:REQUIRES_ITEM]->(i:Item)
+                RETURN collect(DISTINCT k.id) as required_knowledge,
+                       collect(DISTINCT i.id) as required_items,
+                       qo.success_criteria as criteria
+            """, obj_id=obj_id)
+            await result.single()
+
+
+async def batched_requirements(objective_ids, quest_id):
+    """Single UNWIND query used by calculate_complete_quest_progress"""
+    await neo4j_graph.get_objective_requirements(objective_ids, quest_id=quest_id)
+
+
+async def measure(name, fn, objective_ids, quest_id, iterations):
+    timings = []
+    with RoundTripCounter() as counter:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            await fn(objective_ids, quest_id)
+            timings.append((time.perf_counter() - start) * 1000)
+
+    print(f"\n{Colors.BLUE}{name}{Colors.END}")
+    print(f"  Round-trips per call:  {counter.count / iterations:.1f}")
+    print(f"  Avg latency:           {statistics.mean(timings):.2f}ms")
+    print(f"  Median latency:        {statistics.median(timings):.2f}ms")
+    print(f"  Max latency:           {max(timings):.2f}ms")
+    return statistics.mean(timings)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("campaign_id")
+    parser.add_argument("player_id")
+    parser.add_argument("quest_id", nargs="?")
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    await neo4j_graph.connect()
+    try:
+        progress = await neo4j_graph.get_player_objective_progress(args.player_id, args.campaign_id)
+        objective_ids = [
+            qo["id"]
+            for co in progress.get("campaign_objectives", [])
+            for qo in co.get("quest_objectives", [])
+        ]
+
+        print(f"{Colors.CYAN}{'=' * 70}{Colors.END}")
+        print(f"{Colors.CYAN}{'Quest Progress Requirement Lookups':^70}{Colors.END}")
+        print(f"{Colors.CYAN}{'=' * 70}{Colors.END}")
+        print(f"  Campaign objectives tree: {len(objective_ids)} quest objectives")
+
+        legacy_ms = await measure(
+            "Legacy (one query per objective)", legacy_requirements,
+            objective_ids, args.quest_id, args.iterations
+        )
+        batched_ms = await measure(
+            "Batched (single UNWIND query)", batched_requirements,
+            objective_ids, args.quest_id, args.iterations
+        )
+
+        speedup = legacy_ms / batched_ms if batched_ms else 0
+        print(f"\n{Colors.GREEN}  Speedup: {speedup:.1f}x{Colors.END}")
+    finally:
+        await neo4j_graph.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Session Codec Benchmark for SkillForge Game Engine
+Encodes/decodes realistic 50-, 200- and 1000-turn session states with every
+available codec configuration and reports time and payload bytes.
+
+Usage:
+    python tests/benchmark_session_codec.py [--iterations N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+GAME_ENGINE_DIR = os.path.join(os.path.dirname(__file__), "..", "services", "game-engine")
+sys.path.insert(0, os.path.abspath(GAME_ENGINE_DIR))
+
+# The codec needs no services, but importing app.core loads the settings
+for _key in (
+    "ANTHROPIC_API_KEY", "MONGODB_URL", "NEO4J_URI", "NEO4J_USER", "NEO4J_PASSWORD",
+    "POSTGRES_URL", "REDIS_URL", "RABBITMQ_URL", "MCP_PLAYER_DATA_URL",
+    "MCP_NPC_PERSONALITY_URL", "MCP_WORLD_UNIVERSE_URL", "MCP_QUEST_MISSION_URL",
+    "MCP_ITEM_EQUIPMENT_URL", "MCP_AUTH_TOKEN"
+):
+    os.environ.setdefault(_key, "unused")
+
+from app.core import codec as codec_module  # noqa: E402
+from app.core.codec import StateCodec  # noqa: E402
+
+
+class Colors:
+    GREEN = '\033[92m'
+    BLUE = '\033[94m'
+    CYAN = '\033[96m'
+    END = '\033[0m'
+
+
+NARRATIVE = (
+    "The lantern light flickers across the damp stone as the archivist leans closer, "
+    "her voice dropping to a whisper. 'The seal on the eastern vault was broken three "
+    "nights ago,' she says, tapping a ledger filled with cramped handwriting. 'Whoever "
+    "did it knew the old cipher - and only four people in the city still remember it.' "
+)
+
+
+def build_session_state(turns: int) -> dict:
+    """Build a GameSessionState shaped like a real session after N turns"""
+    start = datetime(2025, 1, 1, 12, 0, 0)
+    player_id = "player_0001"
+
+    state = {
+        "session_id": f"session_bench_{turns}",
+        "campaign_id": "campaign_bench",
+        "started_at": start.isoformat(),
+        "status": "active",
+        "players": [{
+            "player_id": player_id,
+            "character_id": "character_0001",
+            "character_name": "Mira Thornwood",
+            "current_blooms_levels": {"intellectual": 3, "social": 2, "emotional": 2},
+            "session_interactions": turns,
+            "is_connected": True,
+            "last_action_timestamp": start.isoformat()
+        }],
+        "current_quest_id": "quest_3",
+        "current_place_id": "place_7",
+        "current_scene_id": "scene_21",
+        "scene_name": "The Sunken Archive",
+        "completed_quest_ids": ["quest_1", "quest_2"],
+        "completed_scene_ids": [f"scene_{i}" for i in range(20)],
+        "scene_description": NARRATIVE * 4,
+        "available_npcs": [
+            {"npc_id": f"npc_{i}", "name": f"NPC {i}", "current_mood": "wary",
+             "personality_traits": {"openness": 60, "agreeableness": 40}}
+            for i in range(4)
+        ],
+        "available_actions": ["talk", "examine", "move", "use_item"],
+        "player_knowledge": {player_id: {f"knowledge_{i}": 1 for i in range(turns // 10)}},
+        "player_inventories": {player_id: [{"item_id": f"item_{i}", "name": f"Item {i}"} for i in range(turns // 20)]},
+        "npc_states": {
+            f"npc_{i}": {"npc_id": f"npc_{i}", "affinity_with_players": {player_id: i * 5}}
+            for i in range(4)
+        },
+        "time_of_day": "evening",
+        "elapsed_game_time": turns * 5,
+        "chat_messages": [],
+        "conversation_history": [],
+        "action_history": [],
+        "event_log": [],
+        "world_changes": []
+    }
+
+    for turn in range(turns):
+        timestamp = (start + timedelta(minutes=turn)).isoformat()
+        state["chat_messages"].append({
+            "message_id": f"msg_player_{turn}",
+            "session_id": state["session_id"],
+            "timestamp": timestamp,
+            "message_type": "player_action",
+            "sender": player_id,
+            "sender_display_name": "Mira Thornwood",
+            "content": f"I ask the archivist about the broken seal (turn {turn})",
+            "importance": "normal"
+        })
+        state["chat_messages"].append({
+            "message_id": f"msg_gm_{turn}",
+            "session_id": state["session_id"],
+            "timestamp": timestamp,
+            "message_type": "gm_narrative",
+            "sender": "gm",
+            "sender_display_name": "Game Master",
+            "content": NARRATIVE * 3,
+            "scene_id": state["current_scene_id"],
+            "importance": "normal"
+        })
+        state["action_history"].append({
+            "action_id": f"action_{turn}",
+            "player_id": player_id,
+            "action_type": "talk",
+            "target_id": "npc_1",
+            "parameters": {"message": "Tell me about the seal"},
+            "timestamp": timestamp,
+            "success": True,
+            "result": NARRATIVE
+        })
+        if turn % 2 == 0:
+            state["conversation_history"].append({
+                "type": "gm",
+                "role": "assistant",
+                "message": NARRATIVE,
+                "timestamp": timestamp
+            })
+        if turn % 5 == 0:
+            state["event_log"].append({
+                "event_id": f"event_{turn}",
+                "event_type": "knowledge_acquired",
+                "triggered_by": player_id,
+                "description": "Learned about the eastern vault cipher",
+                "timestamp": timestamp,
+                "affected_entities": ["npc_1", f"knowledge_{turn // 10}"]
+            })
+
+    return state
+
+
+def codec_configurations():
+    """All codec configurations available in this environment"""
+    configurations = [("json", "json", 0)]
+    if codec_module.orjson is not None:
+        configurations.append(("orjson", "orjson", 0))
+    if codec_module.msgpack is not None:
+        configurations.append(("msgpack", "msgpack", 0))
+    if codec_module.zstandard is not None:
+        configurations.append(("json+zstd", "json", 1))
+        if codec_module.orjson is not None:
+            configurations.append(("orjson+zstd", "orjson", 1))
+        if codec_module.msgpack is not None:
+            configurations.append(("msgpack+zstd", "msgpack", 1))
+    return configurations
+
+
+def measure(codec: StateCodec, state: dict, iterations: int):
+    encode_times = []
+    decode_times = []
+    payload = b""
+
+    for _ in range(iterations):
+        start = time.perf_counter()
+        payload = codec.encode(state)
+        encode_times.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        codec.decode(payload)
+        decode_times.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(encode_times), statistics.median(decode_times), len(payload)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{Colors.CYAN}{'=' * 70}{Colors.END}")
+    print(f"{Colors.CYAN}{'Session State Codec Benchmark':^70}{Colors.END}")
+    print(f"{Colors.CYAN}{'=' * 70}{Colors.END}")
+
+    for turns in (50, 200, 1000):
+        state = build_session_state(turns)
+        print(f"\n{Colors.BLUE}{turns}-turn session{Colors.END}")
+        print(f"  {'codec':15s} {'encode ms':>10s} {'decode ms':>10s} {'bytes':>12s}")
+
+        for name, serializer, threshold in codec_configurations():
+            codec = StateCodec(serializer=serializer, compression_threshold=threshold)
+            encode_ms, decode_ms, size = measure(codec, state, args.iterations)
+            print(f"  {name:15s} {encode_ms:10.2f} {decode_ms:10.2f} {size:12,d}")
+
+    print(f"\n{Colors.GREEN}  Done{Colors.END}")
+
+
+if __name__ == "__main__":
+    main()
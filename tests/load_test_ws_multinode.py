@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Multi-Node WebSocket Load Test for SkillForge Game Engine
+Splits the sockets of every party session across two (or more) game-engine
+processes and checks that broadcasts reach all party members through the
+Redis session bus.
+
+Each player connects to node (player_index % nodes), then sends --messages
+team chat messages. Every socket in the session must receive every message,
+including those sent by players on the other node. The report shows
+delivery counts, how many deliveries crossed nodes, and send-to-receive
+latency.
+
+With --spawn the script starts the engine processes itself (uvicorn on
+--base-port, --base-port + 1, ...) using the current environment, so Redis,
+MongoDB, Neo4j and RabbitMQ must be reachable. Otherwise point --nodes at
+running replicas.
+
+Usage:
+    python tests/load_test_ws_multinode.py --spawn [--sessions 20] [--players 4] [--messages 20]
+    python tests/load_test_ws_multinode.py --nodes ws://localhost:9501,ws://localhost:9502
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+import uuid
+
+import websockets
+
+GAME_ENGINE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "services", "game-engine"))
+
+
+class Colors:
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    BLUE = '\033[94m'
+    CYAN = '\033[96m'
+    END = '\033[0m'
+
+
+def spawn_nodes(count: int, base_port: int) -> list:
+    """Start engine processes; returns (process, ws_base_url) pairs"""
+    nodes = []
+    for i in range(count):
+        port = base_port + i
+        process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+            cwd=GAME_ENGINE_DIR,
+            stdout=subprocess.DEVNULL
+        )
+        nodes.append((process, f"ws://localhost:{port}", f"http://localhost:{port}"))
+    return nodes
+
+
+def wait_healthy(http_urls: list, timeout: float = 60.0):
+    deadline = time.time() + timeout
+    pending = list(http_urls)
+    while pending and time.time() < deadline:
+        for url in list(pending):
+            try:
+                with urllib.request.urlopen(f"{url}/health", timeout=2) as response:
+                    if response.status == 200:
+                        pending.remove(url)
+            except Exception:
+                pass
+        if pending:
+            time.sleep(0.5)
+    if pending:
+        raise RuntimeError(f"Nodes not healthy after {timeout:.0f}s: {pending}")
+
+
+class Player:
+    def __init__(self, session_id: str, player_id: str, node: int, url: str):
+        self.session_id = session_id
+        self.player_id = player_id
+        self.node = node
+        self.url = f"{url}/api/v1/ws/session/{session_id}/player/{player_id}"
+        self.websocket = None
+        self.received = []  # (sender_node, latency_ms)
+        self.expected = 0
+        self.done = asyncio.Event()
+
+    async def connect(self):
+        self.websocket = await websockets.connect(self.url, max_size=None)
+
+    async def receive(self, run_id: str):
+        async for raw in self.websocket:
+            message = json.loads(raw)
+            if message.get("event") != "team_chat_message":
+                continue
+            metadata = message.get("metadata") or {}
+            if metadata.get("run_id") != run_id:
+                continue
+            self.received.append((metadata["node"], (time.time() - metadata["sent_at"]) * 1000))
+            if len(self.received) >= self.expected:
+                self.done.set()
+
+    async def send(self, run_id: str, count: int, interval: float):
+        for seq in range(count):
+            await self.websocket.send(json.dumps({
+                "event": "team_chat",
+                "channel": "party",
+                "content": f"load test {seq}",
+                "metadata": {"run_id": run_id, "node": self.node, "seq": seq, "sent_at": time.time()}
+            }))
+            await asyncio.sleep(interval)
+
+
+async def run(args, urls: list) -> int:
+    run_id = uuid.uuid4().hex[:10]
+    sessions = {}
+    for s in range(args.sessions):
+        session_id = f"loadtest_{run_id}_{s}"
+        sessions[session_id] = [
+            Player(session_id, f"player_{s}_{p}", p % len(urls), urls[p % len(urls)])
+            for p in range(args.players)
+        ]
+    players = [player for party in sessions.values() for player in party]
+    for player in players:
+        player.expected = args.players * args.messages
+
+    await asyncio.gather(*(player.connect() for player in players))
+    # Let every replica subscribe before anyone broadcasts
+    await asyncio.sleep(args.settle)
+
+    receivers = [asyncio.create_task(player.receive(run_id)) for player in players]
+    started = time.perf_counter()
+    await asyncio.gather(*(player.send(run_id, args.messages, args.interval) for player in players))
+
+    try:
+        await asyncio.wait_for(asyncio.gather(*(player.done.wait() for player in players)), args.timeout)
+    except asyncio.TimeoutError:
+        pass
+    elapsed = time.perf_counter() - started
+
+    for task in receivers:
+        task.cancel()
+    await asyncio.gather(*(player.websocket.close() for player in players), return_exceptions=True)
+
+    expected = sum(player.expected for player in players)
+    delivered = sum(len(player.received) for player in players)
+    cross_node = [latency for player in players for node, latency in player.received if node != player.node]
+    same_node = [latency for player in players for node, latency in player.received if node == player.node]
+    incomplete = [player for player in players if len(player.received) < player.expected]
+
+    print(f"\n{Colors.BLUE}{len(urls)} nodes, {args.sessions} sessions x {args.players} players, "
+          f"{args.messages} messages per player{Colors.END}")
+    print(f"  {'deliveries':24s} {delivered:,d} / {expected:,d}")
+    print(f"  {'cross-node deliveries':24s} {len(cross_node):,d}")
+    print(f"  {'throughput':24s} {delivered / elapsed:,.0f} msg/s")
+    print(f"  {'latency':10s} {'p50 ms':>9s} {'p95 ms':>9s}")
+    for label, latencies in (("same-node", same_node), ("cross-node", cross_node)):
+        if latencies:
+            ordered = sorted(latencies)
+            p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+            print(f"  {label:10s} {statistics.median(ordered):9.1f} {p95:9.1f}")
+
+    color = Colors.GREEN if not incomplete else Colors.RED
+    print(f"{color}  sockets missing messages: {len(incomplete)}{Colors.END}")
+    return 0 if not incomplete else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", default="ws://localhost:9501,ws://localhost:9502",
+                        help="Comma-separated ws:// base URLs of running replicas")
+    parser.add_argument("--spawn", action="store_true", help="Start the engine processes")
+    parser.add_argument("--spawn-count", type=int, default=2)
+    parser.add_argument("--base-port", type=int, default=9601)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--players", type=int, default=4, help="Players per session")
+    parser.add_argument("--messages", type=int, default=20, help="Messages per player")
+    parser.add_argument("--interval", type=float, default=0.01, help="Seconds between a player's messages")
+    parser.add_argument("--settle", type=float, default=1.0, help="Seconds to wait after connecting")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+
+    print(f"{Colors.CYAN}{'=' * 70}{Colors.END}")
+    print(f"{Colors.CYAN}{'Multi-Node WebSocket Load Test':^70}{Colors.END}")
+    print(f"{Colors.CYAN}{'=' * 70}{Colors.END}")
+
+    processes = []
+    try:
+        if args.spawn:
+            spawned = spawn_nodes(args.spawn_count, args.base_port)
+            processes = [process for process, _, _ in spawned]
+            urls = [ws_url for _, ws_url, _ in spawned]
+            print(f"\n{Colors.YELLOW}Starting {len(processes)} game-engine processes...{Colors.END}")
+            wait_healthy([http_url for _, _, http_url in spawned])
+        else:
+            urls = [url.strip().rstrip("/") for url in args.nodes.split(",") if url.strip()]
+
+        result = asyncio.run(run(args, urls))
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    print(f"\n{Colors.GREEN}  Done{Colors.END}")
+    return result
+
+
+if __name__ == "__main__":
+    sys.exit(main())